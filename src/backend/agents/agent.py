@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from langgraph.prebuilt import create_react_agent
 from langchain_core.runnables import Runnable
 
@@ -14,13 +16,20 @@ from src.backend.tools.tool import (
     upsert_esg_report,
     fetch_company_metadata,
     get_peer_companies,
-    get_company_sustainability_report
+    get_company_sustainability_report,
+    extract_peer_reports,
+    get_extraction_status
 )
 from langgraph_supervisor import create_supervisor
 
 logger = get_logger()
 
-openai_llm = LLMFactory("openai").llm
+@lru_cache(maxsize=1)
+def get_orchestrator_llm():
+    """
+    Returns the LLM shared by all agents, created on first use.
+    """
+    return LLMFactory("openai").llm
 
 # ---------- Agent Initialization ----------
 
@@ -31,8 +40,8 @@ def initialize_extractor_agent() -> Runnable:
     """
     logger.info("Initializing Extractor Agent...")
     return create_react_agent(
-        model=openai_llm,
-        tools=[extract_emission_data_as_json, upsert_esg_report],
+        model=get_orchestrator_llm(),
+        tools=[extract_emission_data_as_json, upsert_esg_report, extract_peer_reports, get_extraction_status],
         prompt=EXTRACTOR_AGENT_PROMPT,
         name="extractor_agent",
         state_schema=AgentState
@@ -45,7 +54,7 @@ def initialize_scraper_agent() -> Runnable:
     """
     logger.info("Initializing Scraper Agent...")
     return create_react_agent(
-        model=openai_llm,
+        model=get_orchestrator_llm(),
         tools=[fetch_company_metadata, get_peer_companies, get_company_sustainability_report],
         prompt=SCRAPER_SYSTEM_PROMPT,
         name="scraper_agent",
@@ -59,13 +68,25 @@ def initialize_supervisor_agent(scraper_agent: Runnable, extractor_agent: Runnab
     logger.info("Initializing Supervisor Agent...")
     return create_supervisor(
         agents=[scraper_agent, extractor_agent],
-        model=openai_llm,
+        model=get_orchestrator_llm(),
         prompt=SUPERVISOR_SYSTEM_PROMPT,
         state_schema=AgentState,
         output_mode="full_history",
     ).compile()
 
-scraper_agent = initialize_scraper_agent()
-extractor_agent = initialize_extractor_agent()
-supervisor_graph = initialize_supervisor_agent(scraper_agent, extractor_agent)
+@lru_cache(maxsize=1)
+def get_supervisor_graph() -> Runnable:
+    """
+    Builds the agents and compiles the supervisor graph on first use.
+    """
+    scraper_agent = initialize_scraper_agent()
+    extractor_agent = initialize_extractor_agent()
+    return initialize_supervisor_agent(scraper_agent, extractor_agent)
+
+def __getattr__(name: str):
+    # `supervisor_graph` is the entry point referenced by langgraph.json; building it
+    # on attribute access keeps importing this module free of client construction.
+    if name == "supervisor_graph":
+        return get_supervisor_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
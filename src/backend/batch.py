@@ -0,0 +1,236 @@
+"""
+Batch ESG extraction without the supervisor agent.
+
+Reads a manifest of reports and runs upload -> extraction -> upsert for each of them
+on a worker pool, skipping the orchestrator LLM entirely.
+
+Usage:
+    python -m src.backend.batch manifest.csv [--workers 4] [--progress-file manifest.csv.progress.jsonl]
+
+The manifest is a CSV (with a header row) or JSONL file with the columns
+`company`, `year` and `source` (a report URL or local path; `url` and `path` are
+accepted as aliases). Extracted reports are stored with batched MongoDB bulk writes
+and appended to the progress file once their write is flushed, so an interrupted run
+resumes where it stopped.
+"""
+import os
+import csv
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set
+
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+from src.backend.services.extraction_service import prepare_report, extract_prepared_report
+from src.backend.services.mongo_db_service import ESGReportBulkWriter
+
+logger = get_logger()
+
+SUCCESS_STATUSES = {"inserted", "updated", "unchanged", "matched"}
+
+def load_manifest(path: str) -> List[Dict[str, str]]:
+    """
+    Loads a CSV or JSONL manifest into a list of {company, year, source} rows.
+
+    Raises:
+        ValueError: If a row has no report source.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+
+    manifest = []
+    for line_number, row in enumerate(rows, start=1):
+        source = row.get("source") or row.get("url") or row.get("path")
+        if not source:
+            raise ValueError(f"Manifest row {line_number} has no 'source', 'url' or 'path'.")
+        manifest.append({
+            "company": (row.get("company") or "").strip(),
+            "year": str(row.get("year") or "").strip(),
+            "source": source.strip()
+        })
+    return manifest
+
+def manifest_key(row: Dict[str, str]) -> str:
+    """Identifies a manifest row in the progress file."""
+    return f"{row['company']}|{row['year']}|{row['source']}"
+
+def load_completed(progress_file: str) -> Set[str]:
+    """Returns the keys of manifest rows that already finished successfully."""
+    if not os.path.exists(progress_file):
+        return set()
+
+    completed = set()
+    with open(progress_file, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("status") in SUCCESS_STATUSES:
+                completed.add(record["key"])
+    return completed
+
+class BatchRunner:
+    """
+    Runs the extraction pipeline for many reports with a bounded worker pool and
+    separate concurrency limits for the upload and extraction stages. Upserts are
+    buffered in an `ESGReportBulkWriter` shared by all workers.
+    """
+
+    def __init__(
+        self,
+        progress_file: str,
+        workers: int = config.BATCH_WORKERS,
+        upload_concurrency: int = config.BATCH_UPLOAD_CONCURRENCY,
+        extract_concurrency: int = config.BATCH_EXTRACT_CONCURRENCY,
+        writer: Optional[ESGReportBulkWriter] = None
+    ):
+        self.progress_file = progress_file
+        self.workers = workers
+        self._upload_slots = threading.BoundedSemaphore(upload_concurrency)
+        self._extract_slots = threading.BoundedSemaphore(extract_concurrency)
+        self._writer = writer or ESGReportBulkWriter()
+        self._progress_lock = threading.Lock()
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        with self._progress_lock:
+            with open(self.progress_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+    def _finish(self, record: Dict[str, Any], started: float) -> Dict[str, Any]:
+        record["elapsed_seconds"] = round(time.monotonic() - started, 3)
+        self._record(record)
+        return record
+
+    def _complete(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        record, started = result["context"]
+        if result.get("status") in SUCCESS_STATUSES:
+            record["status"] = result["status"]
+        else:
+            record.update({"status": "error", "error": result.get("message", "Upsert failed.")})
+        return self._finish(record, started)
+
+    def process(self, row: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Uploads and extracts a single report and queues it for the bulk upsert.
+
+        Returns:
+            List[Dict[str, Any]]: The progress records written by this call: the row's own
+            record if it failed before the upsert, plus the records of any reports whose
+            bulk write was flushed by it.
+        """
+        started = time.monotonic()
+        record: Dict[str, Any] = {"key": manifest_key(row), **row}
+
+        try:
+            with self._upload_slots:
+                prepared = prepare_report(row["source"])
+
+            with self._extract_slots:
+                document = extract_prepared_report(prepared)
+            if document is None:
+                raise ValueError("Extraction failed or report metadata is incomplete.")
+
+            record.update({
+                "company_id": document["_id"],
+                "report_year": document["year"],
+                "cache_hit": document.get("cache_hit", False),
+                "token_usage": document.get("token_usage")
+            })
+        except Exception as e:
+            logger.error(f"Batch extraction failed for '{row['source']}': {e}")
+            record.update({"status": "error", "error": str(e)})
+            return [self._finish(record, started)]
+
+        results = self._writer.add(document, context=(record, started))
+        return [self._complete(result) for result in results]
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        Writes the reports still buffered in the bulk writer.
+
+        Returns:
+            List[Dict[str, Any]]: The progress records of the flushed reports.
+        """
+        return [self._complete(result) for result in self._writer.flush()]
+
+    def flush_if_due(self) -> List[Dict[str, Any]]:
+        """
+        Writes the buffered reports if the oldest has waited `MONGO_BULK_MAX_DELAY_SECONDS`.
+
+        Returns:
+            List[Dict[str, Any]]: The progress records of the flushed reports.
+        """
+        return [self._complete(result) for result in self._writer.flush_if_due()]
+
+    def _log_progress(self, finished: List[Dict[str, Any]], records: List[Dict[str, Any]], total: int) -> None:
+        for record in finished:
+            records.append(record)
+            logger.info(f"[{len(records)}/{total}] {record['status']}: {record['source']}")
+
+    def run(self, manifest: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Processes every manifest row that is not already completed in the progress file.
+
+        Returns:
+            Dict[str, Any]: Run summary with counts, throughput, token usage and failures.
+        """
+        completed = load_completed(self.progress_file)
+        pending = [row for row in manifest if manifest_key(row) not in completed]
+        logger.info(f"Batch extraction: {len(pending)} pending, {len(manifest) - len(pending)} already completed")
+
+        started = time.monotonic()
+        records = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch") as executor:
+            futures = {executor.submit(self.process, row) for row in pending}
+            while futures:
+                # Wake up at least every max delay so a partial batch is written while workers are busy.
+                done, futures = wait(futures, timeout=self._writer.max_delay_seconds or None, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._log_progress(future.result(), records, len(pending))
+                self._log_progress(self.flush_if_due(), records, len(pending))
+        self._log_progress(self.flush(), records, len(pending))
+        elapsed = time.monotonic() - started
+
+        succeeded = [record for record in records if record["status"] in SUCCESS_STATUSES]
+        failed = [record for record in records if record["status"] not in SUCCESS_STATUSES]
+        total_tokens = sum((record.get("token_usage") or {}).get("total_tokens", 0) for record in succeeded)
+
+        return {
+            "total": len(manifest),
+            "skipped": len(manifest) - len(pending),
+            "processed": len(records),
+            "succeeded": len(succeeded),
+            "failed": len(failed),
+            "cache_hits": sum(1 for record in succeeded if record.get("cache_hit")),
+            "elapsed_seconds": round(elapsed, 3),
+            "reports_per_minute": round(len(records) / elapsed * 60, 2) if elapsed else 0.0,
+            "total_tokens": total_tokens,
+            "failures": [{"source": record["source"], "error": record.get("error")} for record in failed]
+        }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Extract and store ESG data for a manifest of reports.")
+    parser.add_argument("manifest", help="CSV or JSONL file with company, year and source columns.")
+    parser.add_argument("--workers", type=int, default=config.BATCH_WORKERS, help="Reports processed in parallel.")
+    parser.add_argument("--progress-file", help="Progress file used to resume (default: <manifest>.progress.jsonl).")
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.manifest)
+    runner = BatchRunner(
+        progress_file=args.progress_file or f"{args.manifest}.progress.jsonl",
+        workers=args.workers
+    )
+    summary = runner.run(manifest)
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+GICS pre-filter benchmark on labelled company descriptions.
+
+Ranks every GICS sub-industry against short web-style descriptions of companies whose
+sub-industry is known, the way `classification_schema_for` does before the
+classification prompt is built. For each `GICS_PREFILTER_TOP_K` it measures whether the
+right sub-industry is among the candidates kept (recall), how many are kept, how long
+ranking takes, and how large the classification prompt is compared with sending the
+full schema. No OpenAI request is made.
+
+Usage:
+    python -m src.backend.benchmarks.gics_prefilter_benchmark [--top-k 3 5 10 20] [--repeat 20]
+"""
+import sys
+import time
+import argparse
+from typing import List, Optional, Tuple
+
+from src.backend.config.config import config
+from src.backend.schemas.gics_schema import get_gics_classification_schema, normalize_gics_name
+from src.backend.utils.system_prompts import build_company_classification_prompt
+from src.backend.services.classification_service import (
+    build_gics_subset, get_sub_industry_index, select_sub_industry_candidates
+)
+
+# Rough size of an English token in characters, for prompt token estimates.
+CHARS_PER_TOKEN = 4
+
+# (expected sub-industry, snippets as returned by a company description search)
+LABELLED_COMPANIES: List[Tuple[str, List[str]]] = [
+    ("Integrated Oil & Gas", [
+        "The group explores for and produces crude oil and natural gas, refines it into fuels and markets them "
+        "through its retail stations, and runs petrochemical plants.",
+    ]),
+    ("Oil & Gas Drilling", [
+        "The company owns a fleet of offshore jack-up rigs and drillships contracted to oil majors for drilling wells.",
+    ]),
+    ("Steel", [
+        "A leading producer of flat and long steel products from blast furnaces and electric arc furnaces, "
+        "supplying automotive and construction customers.",
+    ]),
+    ("Gold", [
+        "The miner operates open-pit and underground gold mines in Ghana and Australia, producing 2.1 million ounces a year.",
+    ]),
+    ("Specialty Chemicals", [
+        "Manufacturer of specialty chemicals, high performance additives, coatings resins and adhesives for industrial customers.",
+    ]),
+    ("Aerospace & Defense", [
+        "Designs and builds commercial aircraft, military jets, missiles and defense electronics for governments worldwide.",
+    ]),
+    ("Construction & Engineering", [
+        "An engineering and construction contractor building highways, bridges, metro lines and power plants on large civil projects.",
+    ]),
+    ("Passenger Airlines", [
+        "The airline flies passengers to 120 destinations with a fleet of narrow-body and wide-body aircraft.",
+    ]),
+    ("Automobile Manufacturers", [
+        "The carmaker designs, manufactures and sells passenger cars, SUVs and electric vehicles under three brands.",
+    ]),
+    ("Restaurants", [
+        "Operates and franchises more than 3,000 quick service restaurants serving burgers, fries and coffee.",
+    ]),
+    ("Hotels, Resorts & Cruise Lines", [
+        "A hospitality group owning and managing hotels and resorts, with a cruise line operating ocean ships.",
+    ]),
+    ("Brewers", [
+        "The brewer produces and sells beer and malt beverages from breweries in 40 countries.",
+    ]),
+    ("Packaged Foods & Meats", [
+        "A food company making packaged foods, frozen meals, dairy products, snacks and processed meats sold in supermarkets.",
+    ]),
+    ("Pharmaceuticals", [
+        "Researches, develops and manufactures prescription drugs and generic pharmaceuticals for oncology and cardiology.",
+    ]),
+    ("Health Care Equipment", [
+        "Maker of medical devices and health care equipment including imaging systems, surgical robots and patient monitors.",
+    ]),
+    ("Diversified Banks", [
+        "A large commercial bank offering retail banking, corporate lending, deposits and wealth management across regions.",
+    ]),
+    ("Property & Casualty Insurance", [
+        "The insurer underwrites property and casualty insurance: motor, home, liability and commercial property cover.",
+    ]),
+    ("Application Software", [
+        "Develops cloud application software for enterprise resource planning, human resources and customer relationship management.",
+    ]),
+    ("Semiconductors", [
+        "Designs and manufactures semiconductors: microprocessors, memory chips and analog integrated circuits.",
+    ]),
+    ("Wireless Telecommunication Services", [
+        "A mobile network operator providing wireless voice and data services to 60 million cellular subscribers.",
+    ]),
+    ("Electric Utilities", [
+        "The utility generates, transmits and distributes electricity to residential and industrial customers under regulated tariffs.",
+    ]),
+    ("Renewable Electricity", [
+        "Develops and operates wind farms and solar parks, selling renewable electricity under long-term power purchase agreements.",
+    ]),
+    ("Water Utilities", [
+        "Supplies drinking water and wastewater services to 5 million people through its regulated water networks.",
+    ]),
+    ("Real Estate Development", [
+        "The developer acquires land and develops residential and commercial real estate projects for sale.",
+    ]),
+]
+
+def prompt_chars(content: List[str], schema) -> int:
+    return sum(len(message["content"]) for message in build_company_classification_prompt(content, schema))
+
+def run(top_ks: List[int], repeat: int) -> None:
+    get_sub_industry_index.cache_clear()
+    started = time.perf_counter()
+    paths, _ = get_sub_industry_index()
+    index_seconds = time.perf_counter() - started
+
+    full_schema = get_gics_classification_schema()
+    full_chars = sum(prompt_chars(content, full_schema) for _, content in LABELLED_COMPANIES) / len(LABELLED_COMPANIES)
+    print(f"{len(paths)} sub-industries indexed in {index_seconds:.3f}s; {len(LABELLED_COMPANIES)} labelled companies; "
+          f"confident_margin={config.GICS_CONFIDENT_MARGIN}")
+    print(f"full schema prompt: {full_chars:,.0f} chars (~{full_chars / CHARS_PER_TOKEN:,.0f} tokens)")
+
+    header = f"{'top_k':>6} {'recall@1':>9} {'recall':>7} {'candidates':>11} {'rank ms':>8} " \
+             f"{'prompt chars':>13} {'~tokens':>8} {'reduction':>10}"
+    print(header)
+    print("-" * len(header))
+
+    for top_k in top_ks:
+        first = found = kept = 0
+        chars = 0.0
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for _, content in LABELLED_COMPANIES:
+                select_sub_industry_candidates(content, top_k=top_k)
+        rank_ms = (time.perf_counter() - started) * 1000 / (repeat * len(LABELLED_COMPANIES))
+
+        for expected, content in LABELLED_COMPANIES:
+            candidates = select_sub_industry_candidates(content, top_k=top_k)
+            names = [normalize_gics_name(candidate.path.sub_industry) for candidate in candidates]
+            first += bool(names) and names[0] == normalize_gics_name(expected)
+            found += normalize_gics_name(expected) in names
+            kept += len(candidates)
+            schema = build_gics_subset([candidate.path.sub_industry for candidate in candidates]) if candidates else full_schema
+            chars += prompt_chars(content, schema)
+
+        count = len(LABELLED_COMPANIES)
+        chars /= count
+        print(
+            f"{top_k:>6} {first / count:>9.0%} {found / count:>7.0%} {kept / count:>11.1f} {rank_ms:>8.2f} "
+            f"{chars:>13,.0f} {chars / CHARS_PER_TOKEN:>8,.0f} {full_chars / chars:>9.1f}x"
+        )
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the GICS BM25 pre-filter on labelled companies.")
+    parser.add_argument("--top-k", type=int, nargs="+", default=[3, 5, 10, 20], help="GICS_PREFILTER_TOP_K values to test.")
+    parser.add_argument("--repeat", type=int, default=20, help="Rankings per company when timing.")
+    args = parser.parse_args(argv)
+    run(args.top_k, args.repeat)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Page routing benchmark on synthetic reports.
+
+Builds text PDFs of increasing length in which every RESPONSE_SCHEMA section is
+reported on a few known pages, among generic filler and pages that only mention the
+topics in passing. For each report it measures how long the page index takes to build,
+whether the planted pages are routed to their section (recall), and how many pages,
+and therefore document tokens, are sent compared with sending the whole report to
+every request. No Gemini request is made.
+
+Usage:
+    python -m src.backend.benchmarks.page_routing_benchmark [--pages 60 150 300] [--seed 7]
+"""
+import io
+import sys
+import time
+import random
+import argparse
+from typing import Dict, List, Optional, Tuple
+
+from src.backend.config.config import config
+from src.backend.services.extraction_service import RESPONSE_SCHEMA, schema_name_of
+from src.backend.services.schema_packing_service import pack_schemas
+from src.backend.services.page_routing_service import ReportPages
+
+# Gemini bills each PDF page as 258 document tokens, whatever its content.
+TOKENS_PER_PAGE = 258
+
+FILLER_WORDS = (
+    "strategy customers growth innovation products markets digital value chain partners quality "
+    "portfolio performance operations brand services technology investment teams culture future "
+    "leadership vision resilience excellence outlook region business model transformation platform"
+).split()
+
+# Sentences written the way the matching section is usually reported.
+SECTION_SENTENCES: Dict[str, List[str]] = {
+    "ReportMetadata": [
+        "Acme Industries Limited Sustainability Report 2023 covering the fiscal year April 2022 to March 2023.",
+        "About this report: the reporting period, boundary and scope follow the GRI Standards and SASB.",
+        "Company headquarters: Pune, India. This integrated ESG report is published annually.",
+    ],
+    "EnvironmentalEmissionsEnergy": [
+        "Scope 1 GHG emissions were 412,880 tCO2e and Scope 2 emissions 198,200 tCO2e in FY2023.",
+        "Scope 3 greenhouse gas emissions from purchased goods reached 1.2 million tCO2e.",
+        "Total energy consumption was 2,140,000 GJ, of which renewable electricity was 38 percent.",
+        "Emission intensity fell to 0.41 tCO2e per tonne; fuel use of diesel and natural gas declined.",
+    ],
+    "EnvironmentalWaterWaste": [
+        "Total water withdrawal was 5,320 megalitres from groundwater and surface water sources.",
+        "Water discharge to third-party effluent treatment was 1,870 megalitres.",
+        "Hazardous waste generated was 12,400 tonnes; non-hazardous waste 88,000 tonnes.",
+        "Waste recycled or recovered reached 91 percent, with 3 percent sent to landfill or incineration.",
+    ],
+    "SocialTrainingAndCSR": [
+        "Employees received 24 training hours on average, including human rights training for 96 percent.",
+        "The lost time injury frequency rate LTIFR was 0.18 with zero fatalities across sites.",
+        "Health and safety incidents and grievances were reviewed; third-party assessment covered 70 percent of suppliers.",
+        "CSR programmes reached 1.4 million community beneficiaries in education and health.",
+    ],
+    "SocialWorkforceAndWellBeing": [
+        "The workforce comprised 48,200 permanent employees and 61,000 workers; 14 percent are female.",
+        "Employee turnover was 9.2 percent for male and 11.4 percent for female employees; new hires 6,300.",
+        "Well-being measures include health insurance, accident insurance and parental leave for all employees.",
+        "Wages paid to female employees were 12 percent of total wages; minimum wage compliance was 100 percent.",
+    ],
+    "GovernanceEthicsAndComplaints": [
+        "There were no instances of non-compliance, fines or penalties related to corruption or bribery.",
+        "Disciplinary action was taken in 14 cases under the code of conduct and ethics policy.",
+        "Consumer complaints received: 2,310 on product quality, 18 on data privacy; 97 percent resolved.",
+        "There were no customer data breaches during the year.",
+    ],
+    "GovernanceStructureAndOpenness": [
+        "The board of directors has 12 members, of whom 3 are women; the governance committee met six times.",
+        "Purchases from trading houses were 22 percent of total purchases; concentration of the top ten was 61 percent.",
+        "Sales to dealers and distributors accounted for 74 percent of sales.",
+        "Related party transactions were 4.1 percent of total purchases and 2.6 percent of sales.",
+    ],
+    "MaterialityAssessment": [
+        "Our materiality assessment identified 18 material topics through stakeholder engagement.",
+        "The materiality matrix plots importance to stakeholders against impact on the business.",
+        "Priority material issues include climate change, water stewardship and occupational health.",
+    ],
+}
+
+# Pages that mention section topics in passing, as letters and strategy chapters do.
+DISTRACTOR_SENTENCES = [
+    "Our chairman reflects on climate change, our people and the communities we serve.",
+    "We remain committed to safety, ethics and long term value for stakeholders.",
+    "The energy transition creates new markets for our products and services.",
+]
+
+def escape_pdf_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def wrap(text: str, width: int = 95) -> List[str]:
+    lines, line = [], ""
+    for word in text.split():
+        if line and len(line) + len(word) + 1 > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}".strip()
+    return lines + ([line] if line else [])
+
+def build_pdf(pages: List[List[str]]) -> bytes:
+    """
+    Writes a minimal PDF with one text page (Helvetica, A4) per list of paragraphs.
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, written once the page objects are numbered
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for paragraphs in pages:
+        lines = [line for paragraph in paragraphs for line in wrap(paragraph) + [""]]
+        text = " T* ".join(f"({escape_pdf_text(line)}) Tj" for line in lines[:55])
+        content = f"BT /F1 10 Tf 13 TL 50 800 Td {text} ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode("latin-1")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(output)
+
+def synthetic_report(page_count: int, rng: random.Random) -> Tuple[bytes, Dict[str, List[int]]]:
+    """
+    Builds a synthetic report and returns its PDF bytes with the pages planted per section.
+    """
+    def filler(sentences: int) -> str:
+        return " ".join(
+            " ".join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(8, 16))).capitalize() + "."
+            for _ in range(sentences)
+        )
+
+    pages = [[filler(rng.randint(6, 12))] for _ in range(page_count)]
+    planted: Dict[str, List[int]] = {"ReportMetadata": [0, 1]}
+    free_pages = list(range(3, page_count))
+    rng.shuffle(free_pages)
+
+    for name, sentences in SECTION_SENTENCES.items():
+        if name == "ReportMetadata":
+            continue
+        planted[name] = sorted(free_pages.pop() for _ in range(3))
+        for page in planted[name]:
+            pages[page] = [filler(2)] + rng.sample(sentences, k=min(3, len(sentences))) + [filler(2)]
+
+    for page in planted["ReportMetadata"]:
+        pages[page] = SECTION_SENTENCES["ReportMetadata"] + [filler(2)]
+    for _ in range(max(1, page_count // 20)):
+        page = free_pages.pop()
+        pages[page] = [filler(3), rng.choice(DISTRACTOR_SENTENCES), filler(3)]
+
+    return build_pdf(pages), planted
+
+def selected_pages(report_pages: ReportPages, schemas) -> List[int]:
+    pages: Optional[List[int]] = report_pages.select_pages(schemas)
+    return pages if pages is not None else list(range(report_pages.page_count))
+
+def run(page_counts: List[int], seed: int) -> None:
+    rng = random.Random(seed)
+    print(f"top_k={config.PAGE_ROUTING_TOP_K} leading_pages={config.PAGE_ROUTING_LEADING_PAGES} "
+          f"max_fraction={config.PAGE_ROUTING_MAX_FRACTION}")
+    header = f"{'pages':>6} {'index s':>8} {'recall':>7} {'sent/section':>13} {'doc tokens (full)':>18} " \
+             f"{'doc tokens (routed)':>20} {'reduction':>10} {'packed calls':>13} {'packed tokens':>14}"
+    print(header)
+    print("-" * len(header))
+
+    for page_count in page_counts:
+        pdf_bytes, planted = synthetic_report(page_count, rng)
+
+        started = time.perf_counter()
+        report_pages = ReportPages(io.BytesIO(pdf_bytes), file_hash=f"synthetic-{page_count}", file_name="synthetic.pdf")
+        index_seconds = time.perf_counter() - started
+
+        found = total = pages_sent = 0
+        for schema in RESPONSE_SCHEMA:
+            pages = selected_pages(report_pages, [schema])
+            pages_sent += len(pages)
+            found += len(set(planted[schema_name_of(schema)]) & set(pages))
+            total += len(planted[schema_name_of(schema)])
+
+        groups = pack_schemas(RESPONSE_SCHEMA)
+        packed_pages = sum(len(selected_pages(report_pages, group)) for group in groups)
+
+        full_tokens = page_count * len(RESPONSE_SCHEMA) * TOKENS_PER_PAGE
+        routed_tokens = pages_sent * TOKENS_PER_PAGE
+        print(
+            f"{page_count:>6} {index_seconds:>8.2f} {found / total:>7.0%} {pages_sent / len(RESPONSE_SCHEMA):>13.1f} "
+            f"{full_tokens:>18,} {routed_tokens:>20,} {full_tokens / routed_tokens:>9.1f}x "
+            f"{len(groups):>13} {packed_pages * TOKENS_PER_PAGE:>14,}"
+        )
+
+        started = time.perf_counter()
+        with report_pages.subset_pdf(selected_pages(report_pages, RESPONSE_SCHEMA[1:2])) as subset:
+            subset_size = len(subset.read())
+        print(f"{'':>6} subset PDF for {schema_name_of(RESPONSE_SCHEMA[1])}: {subset_size:,} of {len(pdf_bytes):,} bytes "
+              f"in {time.perf_counter() - started:.3f}s")
+        report_pages.close()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark page routing on synthetic reports.")
+    parser.add_argument("--pages", type=int, nargs="+", default=[60, 150, 300], help="Report lengths to test.")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed of the synthetic reports.")
+    args = parser.parse_args(argv)
+    run(args.pages, args.seed)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,16 @@
 import os
-from typing import Optional
+import threading
+from typing import Optional, TYPE_CHECKING
 
 from dotenv import load_dotenv
-from pymongo import MongoClient
-from pymongo.collection import Collection
-from pymongo.database import Database
-from langchain_openai import ChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
-from tavily import TavilyClient
+
+if TYPE_CHECKING:
+    from pymongo import AsyncMongoClient, MongoClient
+    from pymongo.collection import Collection
+    from pymongo.database import Database
+    from langchain_openai import ChatOpenAI
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from tavily import AsyncTavilyClient, TavilyClient
 
 
 load_dotenv()
@@ -28,6 +31,11 @@ class Config:
     MONGODB_URI: str = os.getenv("MONGODB_URI")
     MONGODB_DB_NAME: str = os.getenv("MONGODB_DB_NAME", "esg_db")
     ESG_REPORT_COLLECTION_NAME: str = os.getenv("ESG_REPORT_COLLECTION_NAME", "esg_report_extracts")
+    EXTRACTION_CHECKPOINT_COLLECTION_NAME: str = os.getenv("EXTRACTION_CHECKPOINT_COLLECTION_NAME", "extraction_checkpoints")
+    EXTRACTION_CACHE_COLLECTION_NAME: str = os.getenv("EXTRACTION_CACHE_COLLECTION_NAME", "extraction_cache")
+    COMPANY_METADATA_COLLECTION_NAME: str = os.getenv("COMPANY_METADATA_COLLECTION_NAME", "company_metadata_cache")
+    PEER_CACHE_COLLECTION_NAME: str = os.getenv("PEER_CACHE_COLLECTION_NAME", "peer_cache")
+    EXTRACTION_JOB_COLLECTION_NAME: str = os.getenv("EXTRACTION_JOB_COLLECTION_NAME", "extraction_jobs")
 
     # === Model Names ===
     OPENAI_PEERS_TOOL_MODEL: str = os.getenv("OPENAI_PEERS_TOOL_MODEL", "gpt-4.1")
@@ -36,68 +44,224 @@ class Config:
 
     # === Retry Logic ===
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", 3))
-    RETRY_DELAY_SECONDS: int = int(os.getenv("RETRY_DELAY_SECONDS", 60))
+    RETRY_BASE_DELAY_SECONDS: float = float(os.getenv("RETRY_BASE_DELAY_SECONDS", 2))
+    RETRY_MAX_DELAY_SECONDS: float = float(os.getenv("RETRY_MAX_DELAY_SECONDS", 60))
+    RETRY_BUDGET_SECONDS: float = float(os.getenv("RETRY_BUDGET_SECONDS", 300))
+
+    # === Extraction ===
+    EXTRACTION_MAX_CONCURRENCY: int = int(os.getenv("EXTRACTION_MAX_CONCURRENCY", 4))
+    EXTRACTION_CHECKPOINT_BACKEND: str = os.getenv("EXTRACTION_CHECKPOINT_BACKEND", "local")
+    EXTRACTION_CHECKPOINT_DIR: str = os.getenv("EXTRACTION_CHECKPOINT_DIR", ".checkpoints/extraction")
+    # Expected output tokens per call when packing several schema sections into one request
+    # (e.g. 8192). Off by default: 0 requests every section separately.
+    SCHEMA_PACK_MAX_OUTPUT_TOKENS: int = int(os.getenv("SCHEMA_PACK_MAX_OUTPUT_TOKENS", 0))
+
+    # === Page Routing (send each schema section only the report pages that mention it) ===
+    PAGE_ROUTING_ENABLED: bool = os.getenv("PAGE_ROUTING_ENABLED", "false").lower() in ("1", "true", "yes")
+    PAGE_ROUTING_MIN_PAGES: int = int(os.getenv("PAGE_ROUTING_MIN_PAGES", 30))
+    PAGE_ROUTING_TOP_K: int = int(os.getenv("PAGE_ROUTING_TOP_K", 8))
+    PAGE_ROUTING_LEADING_PAGES: int = int(os.getenv("PAGE_ROUTING_LEADING_PAGES", 3))
+    PAGE_ROUTING_MAX_FRACTION: float = float(os.getenv("PAGE_ROUTING_MAX_FRACTION", 0.5))
+
+    # === PDF Preflight (local inspection before upload) ===
+    PREFLIGHT_MAX_PAGES: int = int(os.getenv("PREFLIGHT_MAX_PAGES", 1000))
+    PREFLIGHT_MAX_SCANNED_PAGES: int = int(os.getenv("PREFLIGHT_MAX_SCANNED_PAGES", 300))
+    PREFLIGHT_SAMPLE_PAGES: int = int(os.getenv("PREFLIGHT_SAMPLE_PAGES", 24))
+
+    # === Map-Reduce Extraction (page windows extracted concurrently, merged per field) ===
+    # Reports with at least this many pages are extracted in windows (0: only reports too long to send whole).
+    MAP_REDUCE_MIN_PAGES: int = int(os.getenv("MAP_REDUCE_MIN_PAGES", 0))
+    MAP_REDUCE_WINDOW_PAGES: int = int(os.getenv("MAP_REDUCE_WINDOW_PAGES", 50))
+    MAP_REDUCE_WINDOW_OVERLAP: int = int(os.getenv("MAP_REDUCE_WINDOW_OVERLAP", 2))
+
+    # === Gemini Context Cache (report + extractor prompt shared by the schema calls) ===
+    GEMINI_CONTEXT_CACHE_ENABLED: bool = os.getenv("GEMINI_CONTEXT_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS: int = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL_SECONDS", 900))
+
+    # === Gemini File Registry (local index of uploaded files) ===
+    # Age in seconds after which a lookup relists the index from Gemini (0: listed once).
+    GEMINI_FILE_REGISTRY_TTL_SECONDS: int = int(os.getenv("GEMINI_FILE_REGISTRY_TTL_SECONDS", 600))
+
+    # === Batch Extraction ===
+    BATCH_WORKERS: int = int(os.getenv("BATCH_WORKERS", 4))
+    BATCH_UPLOAD_CONCURRENCY: int = int(os.getenv("BATCH_UPLOAD_CONCURRENCY", 4))
+    BATCH_EXTRACT_CONCURRENCY: int = int(os.getenv("BATCH_EXTRACT_CONCURRENCY", 2))
+    PEER_FANOUT_CONCURRENCY: int = int(os.getenv("PEER_FANOUT_CONCURRENCY", 3))
+    PEER_MAX_REPORT_CANDIDATES: int = int(os.getenv("PEER_MAX_REPORT_CANDIDATES", 3))
+
+    # === Extraction Jobs ===
+    JOB_LEASE_SECONDS: float = float(os.getenv("JOB_LEASE_SECONDS", 120))
+    JOB_HEARTBEAT_SECONDS: float = float(os.getenv("JOB_HEARTBEAT_SECONDS", 30))
+    JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+    JOB_RETRY_DELAY_SECONDS: float = float(os.getenv("JOB_RETRY_DELAY_SECONDS", 60))
+    WORKER_CONCURRENCY: int = int(os.getenv("WORKER_CONCURRENCY", 2))
+    WORKER_POLL_INTERVAL_SECONDS: float = float(os.getenv("WORKER_POLL_INTERVAL_SECONDS", 5))
+
+    # === Report Downloads ===
+    DOWNLOAD_MAX_BYTES: int = int(os.getenv("DOWNLOAD_MAX_BYTES", 200 * 1024 * 1024))
+    DOWNLOAD_SPOOL_MAX_MEMORY_BYTES: int = int(os.getenv("DOWNLOAD_SPOOL_MAX_MEMORY_BYTES", 8 * 1024 * 1024))
+    DOWNLOAD_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("DOWNLOAD_CONNECT_TIMEOUT_SECONDS", 10))
+    DOWNLOAD_READ_TIMEOUT_SECONDS: float = float(os.getenv("DOWNLOAD_READ_TIMEOUT_SECONDS", 60))
+    HTTP_POOL_CONNECTIONS: int = int(os.getenv("HTTP_POOL_CONNECTIONS", 10))
+    HTTP_POOL_MAXSIZE: int = int(os.getenv("HTTP_POOL_MAXSIZE", 20))
+    HTTP_MAX_RETRIES: int = int(os.getenv("HTTP_MAX_RETRIES", 3))
+    HTTP_BACKOFF_FACTOR: float = float(os.getenv("HTTP_BACKOFF_FACTOR", 1.0))
+
+    # === Extraction Result Cache ===
+    EXTRACTION_CACHE_BACKEND: str = os.getenv("EXTRACTION_CACHE_BACKEND", "memory")
+    EXTRACTION_CACHE_DIR: str = os.getenv("EXTRACTION_CACHE_DIR", ".cache/extraction")
+    EXTRACTION_CACHE_MAX_ENTRIES: int = int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", 256))
+    EXTRACTION_CACHE_TTL_SECONDS: int = int(os.getenv("EXTRACTION_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+
+    # === MongoDB Bulk Writes ===
+    MONGO_BULK_MAX_OPERATIONS: int = int(os.getenv("MONGO_BULK_MAX_OPERATIONS", 100))
+    MONGO_BULK_MAX_DELAY_SECONDS: float = float(os.getenv("MONGO_BULK_MAX_DELAY_SECONDS", 5))
+
+    # === Rate Limits (per process; 0 disables a limit) ===
+    GEMINI_REQUESTS_PER_MINUTE: int = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", 60))
+    GEMINI_TOKENS_PER_MINUTE: int = int(os.getenv("GEMINI_TOKENS_PER_MINUTE", 1_000_000))
+    GEMINI_ESTIMATED_TOKENS_PER_REQUEST: int = int(os.getenv("GEMINI_ESTIMATED_TOKENS_PER_REQUEST", 30_000))
+    OPENAI_REQUESTS_PER_MINUTE: int = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", 500))
+    OPENAI_TOKENS_PER_MINUTE: int = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", 30_000))
+    OPENAI_ESTIMATED_TOKENS_PER_REQUEST: int = int(os.getenv("OPENAI_ESTIMATED_TOKENS_PER_REQUEST", 4_000))
+    TAVILY_REQUESTS_PER_MINUTE: int = int(os.getenv("TAVILY_REQUESTS_PER_MINUTE", 100))
+
+    # === Company Classification ===
+    GICS_PREFILTER_TOP_K: int = int(os.getenv("GICS_PREFILTER_TOP_K", 10))
+    GICS_CONFIDENT_MARGIN: float = float(os.getenv("GICS_CONFIDENT_MARGIN", 0.5))
+
+    # === Company Metadata Cache ===
+    COMPANY_METADATA_CACHE_BACKEND: str = os.getenv("COMPANY_METADATA_CACHE_BACKEND", "mongo")
+    COMPANY_METADATA_CACHE_MAX_ENTRIES: int = int(os.getenv("COMPANY_METADATA_CACHE_MAX_ENTRIES", 1024))
+    COMPANY_METADATA_CACHE_TTL_SECONDS: int = int(os.getenv("COMPANY_METADATA_CACHE_TTL_SECONDS", 30 * 24 * 3600))
+
+    # === Web Search Cache ===
+    TAVILY_CACHE_BACKEND: str = os.getenv("TAVILY_CACHE_BACKEND", "memory")
+    TAVILY_CACHE_MAX_ENTRIES: int = int(os.getenv("TAVILY_CACHE_MAX_ENTRIES", 512))
+    TAVILY_CACHE_TTL_SECONDS: int = int(os.getenv("TAVILY_CACHE_TTL_SECONDS", 24 * 3600))
+
+    # === Peer Set Cache ===
+    PEER_CACHE_BACKEND: str = os.getenv("PEER_CACHE_BACKEND", "mongo")
+    PEER_CACHE_MAX_ENTRIES: int = int(os.getenv("PEER_CACHE_MAX_ENTRIES", 512))
+    PEER_CACHE_TTL_SECONDS: int = int(os.getenv("PEER_CACHE_TTL_SECONDS", 30 * 24 * 3600))
 
     def __init__(self):
-        self._validate_essentials()
-        self._mongo_client: MongoClient = MongoClient(self.MONGODB_URI)
-        self._mongo_db: Database = self._mongo_client[self.MONGODB_DB_NAME]
-        self._esg_collection: Collection = self._mongo_db[self.ESG_REPORT_COLLECTION_NAME]
+        self._mongo_client: Optional["MongoClient"] = None
+        self._mongo_lock = threading.Lock()
+
+    def _validate_essentials(self, required: tuple = ("GEMINI_API_KEY", "OPENAI_API_KEY", "MONGODB_URI")) -> None:
+        """
+        Validates required environment variables.
 
-    def _validate_essentials(self) -> None:
-        """Validates required environment variables."""
+        Called lazily by the client accessors, so importing the config never fails
+        for settings the caller does not use.
+        """
         missing_vars = []
-        for var in ["GEMINI_API_KEY", "OPENAI_API_KEY", "MONGODB_URI"]:
+        for var in required:
             if not getattr(self, var):
                 missing_vars.append(var)
         if missing_vars:
             raise ConfigError(
                 f"Missing required environment variables: {', '.join(missing_vars)}"
             )
-        
+
     @property
-    def mongo_client(self) -> MongoClient:
+    def mongo_client(self) -> "MongoClient":
+        """The process-wide MongoDB client, created on first use."""
+        if self._mongo_client is None:
+            with self._mongo_lock:
+                if self._mongo_client is None:
+                    self._validate_essentials(("MONGODB_URI",))
+                    from pymongo import MongoClient
+                    self._mongo_client = MongoClient(self.MONGODB_URI)
         return self._mongo_client
 
     @property
-    def mongo_db(self) -> Database:
-        return self._mongo_db
+    def mongo_db(self) -> "Database":
+        return self.mongo_client[self.MONGODB_DB_NAME]
 
     @property
-    def ESG_REPORT_COLLECTION(self) -> Collection:
-        return self._esg_collection
+    def ESG_REPORT_COLLECTION(self) -> "Collection":
+        return self.mongo_db[self.ESG_REPORT_COLLECTION_NAME]
 
-    def get_openai_client(self) -> ChatOpenAI:
+    @property
+    def EXTRACTION_CHECKPOINT_COLLECTION(self) -> "Collection":
+        return self.mongo_db[self.EXTRACTION_CHECKPOINT_COLLECTION_NAME]
+
+    @property
+    def EXTRACTION_CACHE_COLLECTION(self) -> "Collection":
+        return self.mongo_db[self.EXTRACTION_CACHE_COLLECTION_NAME]
+
+    @property
+    def COMPANY_METADATA_COLLECTION(self) -> "Collection":
+        return self.mongo_db[self.COMPANY_METADATA_COLLECTION_NAME]
+
+    @property
+    def PEER_CACHE_COLLECTION(self) -> "Collection":
+        return self.mongo_db[self.PEER_CACHE_COLLECTION_NAME]
+
+    @property
+    def EXTRACTION_JOB_COLLECTION(self) -> "Collection":
+        return self.mongo_db[self.EXTRACTION_JOB_COLLECTION_NAME]
+
+    def get_openai_client(self) -> "ChatOpenAI":
         """
         Creates a configured OpenAI client using the global config.
 
         Returns:
             ChatOpenAI: OpenAI client instance.
         """
+        self._validate_essentials(("OPENAI_API_KEY",))
+        from langchain_openai import ChatOpenAI
         return ChatOpenAI(
             api_key=self.OPENAI_API_KEY,
             model=self.LANGCHAIN_ORCHESTRATOR_MODEL
         )
     
-    def get_gemini_client(self) -> ChatGoogleGenerativeAI:
+    def get_gemini_client(self) -> "ChatGoogleGenerativeAI":
         """
         Creates a configured Gemini (Google Generative AI) client.
 
         Returns:
             ChatGoogleGenerativeAI: Gemini client instance.
         """
+        self._validate_essentials(("GEMINI_API_KEY",))
+        from langchain_google_genai import ChatGoogleGenerativeAI
         return ChatGoogleGenerativeAI(
             model=self.GEMINI_EXTRACTION_MODEL,
             google_api_key=self.GEMINI_API_KEY
         )
     
-    def get_tavily_client(self) -> TavilyClient:
+    def get_tavily_client(self) -> "TavilyClient":
         """
         Creates a configured Tavily client using the global config.
 
         Returns:
             TavilyClient: Tavily client instance.
         """
+        from tavily import TavilyClient
         return TavilyClient(api_key=self.TAVILY_API_KEY)
 
+    def get_async_tavily_client(self) -> "AsyncTavilyClient":
+        """
+        Creates a configured async Tavily client using the global config.
+
+        Returns:
+            AsyncTavilyClient: Async Tavily client instance.
+        """
+        from tavily import AsyncTavilyClient
+        return AsyncTavilyClient(api_key=self.TAVILY_API_KEY)
+
+    def get_async_mongo_client(self) -> "AsyncMongoClient":
+        """
+        Creates an async MongoDB client. Unlike `mongo_client` it is not shared: an
+        async client is bound to the event loop it is first used on.
+
+        Returns:
+            AsyncMongoClient: Async MongoDB client instance.
+        """
+        self._validate_essentials(("MONGODB_URI",))
+        from pymongo import AsyncMongoClient
+        return AsyncMongoClient(self.MONGODB_URI)
+
 config = Config()
\ No newline at end of file
@@ -1,3924 +1,146 @@
-GICS_SCHEMA = {
-  "name": "Global Industry Classification Standard",
-  "sectors": [
-    {
-      "id": "10",
-      "name": "Energy",
-      "description": "Companies engaged in exploration & production, refining & marketing, storage & transportation of oil & gas, coal, and consumable fuels. Also includes oil & gas equipment and services.",
-      "industry groups": [
-        {
-          "id": "1010",
-          "name": "Energy",
-          "industries": [
-            {
-              "id": "101010",
-              "name": "Energy Equipment & Services",
-              "sub-industries": [
-                {
-                  "id": "10101010",
-                  "name": "Oil & Gas Drilling"
-                },
-                {
-                  "id": "10101020",
-                  "name": "Oil & Gas Equipment & Services"
-                }
-              ]
-            },
-            {
-              "id": "101020",
-              "name": "Oil, Gas & Consumable Fuels",
-              "sub-industries": [
-                {
-                  "id": "10102010",
-                  "name": "Integrated Oil & Gas"
-                },
-                {
-                  "id": "10102020",
-                  "name": "Oil & Gas Exploration & Production"
-                },
-                {
-                  "id": "10102030",
-                  "name": "Oil & Gas Refining & Marketing"
-                },
-                {
-                  "id": "10102040",
-                  "name": "Oil & Gas Storage & Transportation"
-                },
-                {
-                  "id": "10102050",
-                  "name": "Coal & Consumable Fuels"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "id": "15",
-      "name": "Materials",
-      "industry groups": [
-        {
-          "id": "1510",
-          "name": "Materials",
-          "industries": [
-            {
-              "id": "151010",
-              "name": "Chemicals",
-              "sub-industries": [
-                {
-                  "id": "15101010",
-                  "name": "Commodity Chemicals"
-                },
-                {
-                  "id": "15101020",
-                  "name": "Diversified Chemicals"
-                },
-                {
-                  "id": "15101030",
-                  "name": "Fertilizers & Agricultural Chemicals"
-                },
-                {
-                  "id": "15101040",
-                  "name": "Industrial Gases"
-                },
-                {
-                  "id": "15101050",
-                  "name": "Specialty Chemicals"
-                }
-              ]
-            },
-            {
-              "id": "151020",
-              "name": "Construction Materials",
-              "sub-industries": [
-                {
-                  "id": "15102010",
-                  "name": "Construction Materials"
-                }
-              ]
-            },
-            {
-              "id": "151030",
-              "name": "Containers & Packaging",
-              "sub-industries": [
-                {
-                  "id": "15103010",
-                  "name": "Metal & Glass Containers"
-                },
-                {
-                  "id": "15103020",
-                  "name": "Paper Packaging"
-                }
-              ]
-            },
-            {
-              "id": "151040",
-              "name": "Metals & Mining",
-              "sub-industries": [
-                {
-                  "id": "15104010",
-                  "name": "Aluminum"
-                },
-                {
-                  "id": "15104020",
-                  "name": "Diversified Metals & Mining"
-                },
-                {
-                  "id": "15104025",
-                  "name": "Copper"
-                },
-                {
-                  "id": "15104030",
-                  "name": "Gold"
-                },
-                {
-                  "id": "15104040",
-                  "name": "Precious Metals & Minerals"
-                },
-                {
-                  "id": "15104045",
-                  "name": "Silver"
-                },
-                {
-                  "id": "15104050",
-                  "name": "Steel"
-                }
-              ]
-            },
-            {
-              "id": "151050",
-              "name": "Paper & Forest Products",
-              "sub-industries": [
-                {
-                  "id": "15105010",
-                  "name": "Forest Products"
-                },
-                {
-                  "id": "15105020",
-                  "name": "Paper Products"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "id": "20",
-      "name": "Industrials",
-      "industry groups": [
-        {
-          "id": "2010",
-          "name": "Capital Goods",
-          "industries": [
-            {
-              "id": "201010",
-              "name": "Aerospace & Defense",
-              "sub-industries": [
-                {
-                  "id": "20101010",
-                  "name": "Aerospace & Defense"
-                }
-              ]
-            },
-            {
-              "id": "201020",
-              "name": "Building Products",
-              "sub-industries": [
-                {
-                  "id": "20102010",
-                  "name": "Building Products"
-                }
-              ]
-            },
-            {
-              "id": "201030",
-              "name": "Construction & Engineering",
-              "sub-industries": [
-                {
-                  "id": "20103010",
-                  "name": "Construction & Engineering"
-                }
-              ]
-            },
-            {
-              "id": "201040",
-              "name": "Electrical Equipment",
-              "sub-industries": [
-                {
-                  "id": "20104010",
-                  "name": "Electrical Components & Equipment"
-                },
-                {
-                  "id": "20104020",
-                  "name": "Heavy Electrical Equipment"
-                }
-              ]
-            },
-            {
-              "id": "201050",
-              "name": "Industrial Conglomerates",
-              "sub-industries": [
-                {
-                  "id": "20105010",
-                  "name": "Industrial Conglomerates"
-                }
-              ]
-            },
-            {
-              "id": "201060",
-              "name": "Machinery",
-              "sub-industries": [
-                {
-                  "id": "20106010",
-                  "name": "Construction Machinery & Heavy Trucks"
-                },
-                {
-                  "id": "20106015",
-                  "name": "Agricultural & Farm Machinery"
-                },
-                {
-                  "id": "20106020",
-                  "name": "Industrial Machinery"
-                }
-              ]
-            },
-            {
-              "id": "201070",
-              "name": "Trading Companies & Distributors",
-              "sub-industries": [
-                {
-                  "id": "20107010",
-                  "name": "Trading Companies & Distributors"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "2020",
-          "name": "Commercial & Professional Services",
-          "industries": [
-            {
-              "id": "202010",
-              "name": "Commercial Services & Supplies",
-              "sub-industries": [
-                {
-                  "id": "20201010",
-                  "name": "Commercial Printing"
-                },
-                {
-                  "id": "20201050",
-                  "name": "Environmental & Facilities Services"
-                },
-                {
-                  "id": "20201060",
-                  "name": "Office Services & Supplies"
-                },
-                {
-                  "id": "20201070",
-                  "name": "Diversified Support Services"
-                },
-                {
-                  "id": "20201080",
-                  "name": "Security & Alarm Services"
-                }
-              ]
-            },
-            {
-              "id": "202020",
-              "name": "Professional Services",
-              "sub-industries": [
-                {
-                  "id": "20202010",
-                  "name": "Human Resource & Employment Services"
-                },
-                {
-                  "id": "20202020",
-                  "name": "Research & Consulting Services"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "2030",
-          "name": "Transportation",
-          "industries": [
-            {
-              "id": "203010",
-              "name": "Air Freight & Logistics",
-              "sub-industries": [
-                {
-                  "id": "20301010",
-                  "name": "Air Freight & Logistics"
-                }
-              ]
-            },
-            {
-              "id": "203020",
-              "name": "Airlines",
-              "sub-industries": [
-                {
-                  "id": "20302010",
-                  "name": "Airlines"
-                }
-              ]
-            },
-            {
-              "id": "203030",
-              "name": "Marine",
-              "sub-industries": [
-                {
-                  "id": "20303010",
-                  "name": "Marine"
-                }
-              ]
-            },
-            {
-              "id": "203040",
-              "name": "Road & Rail",
-              "sub-industries": [
-                {
-                  "id": "20304010",
-                  "name": "Railroads"
-                },
-                {
-                  "id": "20304020",
-                  "name": "Trucking"
-                }
-              ]
-            },
-            {
-              "id": "203050",
-              "name": "Transportation Infrastructure",
-              "sub-industries": [
-                {
-                  "id": "20305010",
-                  "name": "Airport Services"
-                },
-                {
-                  "id": "20305020",
-                  "name": "Highways & Railtracks"
-                },
-                {
-                  "id": "20305030",
-                  "name": "Marine Ports & Services"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "id": "25",
-      "name": "Consumer Discretionary",
-      "description": "Goods and services sensitive to economic cycles, including autos, apparel, hotels, restaurants, leisure products, and discretionary retail.",
-      "industry groups": [
-        {
-          "id": "2510",
-          "name": "Automobiles & Components",
-          "industries": [
-            {
-              "id": "251010",
-              "name": "Auto Components",
-              "sub-industries": [
-                {
-                  "id": "25101010",
-                  "name": "Auto Parts & Equipment"
-                },
-                {
-                  "id": "25101020",
-                  "name": "Tires & Rubber"
-                }
-              ]
-            },
-            {
-              "id": "251020",
-              "name": "Automobiles",
-              "sub-industries": [
-                {
-                  "id": "25102010",
-                  "name": "Automobile Manufacturers"
-                },
-                {
-                  "id": "25102020",
-                  "name": "Motorcycle Manufacturers"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "2520",
-          "name": "Consumer Durables & Apparel",
-          "industries": [
-            {
-              "id": "252010",
-              "name": "Household Durables",
-              "sub-industries": [
-                {
-                  "id": "25201010",
-                  "name": "Consumer Electronics"
-                },
-                {
-                  "id": "25201020",
-                  "name": "Home Furnishings"
-                },
-                {
-                  "id": "25201030",
-                  "name": "Homebuilding"
-                },
-                {
-                  "id": "25201040",
-                  "name": "Household Appliances"
-                },
-                {
-                  "id": "25201050",
-                  "name": "Housewares & Specialties"
-                }
-              ]
-            },
-            {
-              "id": "252020",
-              "name": "Leisure Products",
-              "sub-industries": [
-                {
-                  "id": "25202010",
-                  "name": "Leisure Products"
-                }
-              ]
-            },
-            {
-              "id": "252030",
-              "name": "Textiles, Apparel & Luxury Goods",
-              "sub-industries": [
-                {
-                  "id": "25203010",
-                  "name": "Apparel, Accessories & Luxury Goods"
-                },
-                {
-                  "id": "25203020",
-                  "name": "Footwear"
-                },
-                {
-                  "id": "25203030",
-                  "name": "Textiles"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "2530",
-          "name": "Consumer Services",
-          "industries": [
-            {
-              "id": "253010",
-              "name": "Hotels, Restaurants & Leisure",
-              "sub-industries": [
-                {
-                  "id": "25301010",
-                  "name": "Casinos & Gaming"
-                },
-                {
-                  "id": "25301020",
-                  "name": "Hotels, Resorts & Cruise Lines"
-                },
-                {
-                  "id": "25301030",
-                  "name": "Leisure Facilities"
-                },
-                {
-                  "id": "25301040",
-                  "name": "Restaurants"
-                }
-              ]
-            },
-            {
-              "id": "253020",
-              "name": "Diversified Consumer Services",
-              "sub-industries": [
-                {
-                  "id": "25302010",
-                  "name": "Education Services"
-                },
-                {
-                  "id": "25302020",
-                  "name": "Specialized Consumer Services"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "2550",
-          "name": "Retailing",
-          "industries": [
-            {
-              "id": "255010",
-              "name": "Distributors",
-              "sub-industries": [
-                {
-                  "id": "25501010",
-                  "name": "Distributors"
-                }
-              ]
-            },
-            {
-              "id": "255020",
-              "name": "Internet & Direct Marketing Retail",
-              "sub-industries": [
-                {
-                  "id": "25502020",
-                  "name": "Internet & Direct Marketing Retail"
-                }
-              ]
-            },
-            {
-              "id": "255030",
-              "name": "Multiline Retail",
-              "sub-industries": [
-                {
-                  "id": "25503010",
-                  "name": "Department Stores"
-                },
-                {
-                  "id": "25503020",
-                  "name": "General Merchandise Stores"
-                }
-              ]
-            },
-            {
-              "id": "255040",
-              "name": "Specialty Retail",
-              "sub-industries": [
-                {
-                  "id": "25504010",
-                  "name": "Apparel Retail"
-                },
-                {
-                  "id": "25504020",
-                  "name": "Computer & Electronics Retail"
-                },
-                {
-                  "id": "25504030",
-                  "name": "Home Improvement Retail"
-                },
-                {
-                  "id": "25504040",
-                  "name": "Specialty Stores"
-                },
-                {
-                  "id": "25504050",
-                  "name": "Automotive Retail"
-                },
-                {
-                  "id": "25504060",
-                  "name": "Homefurnishing Retail"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "id": "30",
-      "name": "Consumer Staples",
-      "industry groups": [
-        {
-          "id": "3010",
-          "name": "Food & Staples Retailing",
-          "industries": [
-            {
-              "id": "301010",
-              "name": "Food & Staples Retailing",
-              "sub-industries": [
-                {
-                  "id": "30101010",
-                  "name": "Drug Retail"
-                },
-                {
-                  "id": "30101020",
-                  "name": "Food Distributors"
-                },
-                {
-                  "id": "30101030",
-                  "name": "Food Retail"
-                },
-                {
-                  "id": "30101040",
-                  "name": "Hypermarkets & Super Centers"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "3020",
-          "name": "Food, Beverage & Tobacco",
-          "industries": [
-            {
-              "id": "302010",
-              "name": "Beverages",
-              "sub-industries": [
-                {
-                  "id": "30201010",
-                  "name": "Brewers"
-                },
-                {
-                  "id": "30201020",
-                  "name": "Distillers & Vintners"
-                },
-                {
-                  "id": "30201030",
-                  "name": "Soft Drinks"
-                }
-              ]
-            },
-            {
-              "id": "302020",
-              "name": "Food Products",
-              "sub-industries": [
-                {
-                  "id": "30202010",
-                  "name": "Agricultural Products"
-                },
-                {
-                  "id": "30202030",
-                  "name": "Packaged Foods & Meats"
-                }
-              ]
-            },
-            {
-              "id": "302030",
-              "name": "Tobacco",
-              "sub-industries": [
-                {
-                  "id": "30203010",
-                  "name": "Tobacco"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "3030",
-          "name": "Household & Personal Products",
-          "industries": [
-            {
-              "id": "303010",
-              "name": "Household Products",
-              "sub-industries": [
-                {
-                  "id": "30301010",
-                  "name": "Household Products"
-                }
-              ]
-            },
-            {
-              "id": "303020",
-              "name": "Personal Products",
-              "sub-industries": [
-                {
-                  "id": "30302010",
-                  "name": "Personal Products"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "id": "35",
-      "name": "Health Care",
-      "industry groups": [
-        {
-          "id": "3510",
-          "name": "Health Care Equipment & Services",
-          "industries": [
-            {
-              "id": "351010",
-              "name": "Health Care Equipment & Supplies",
-              "sub-industries": [
-                {
-                  "id": "35101010",
-                  "name": "Health Care Equipment"
-                },
-                {
-                  "id": "35101020",
-                  "name": "Health Care Supplies"
-                }
-              ]
-            },
-            {
-              "id": "351020",
-              "name": "Health Care Providers & Services",
-              "sub-industries": [
-                {
-                  "id": "35102010",
-                  "name": "Health Care Distributors"
-                },
-                {
-                  "id": "35102015",
-                  "name": "Health Care Services"
-                },
-                {
-                  "id": "35102020",
-                  "name": "Health Care Facilities"
-                },
-                {
-                  "id": "35102030",
-                  "name": "Managed Health Care"
-                }
-              ]
-            },
-            {
-              "id": "351030",
-              "name": "Health Care Technology",
-              "sub-industries": [
-                {
-                  "id": "35103010",
-                  "name": "Health Care Technology"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "3520",
-          "name": "Pharmaceuticals, Biotechnology & Life Sciences",
-          "industries": [
-            {
-              "id": "352010",
-              "name": "Biotechnology",
-              "sub-industries": [
-                {
-                  "id": "35201010",
-                  "name": "Biotechnology"
-                }
-              ]
-            },
-            {
-              "id": "352020",
-              "name": "Pharmaceuticals",
-              "sub-industries": [
-                {
-                  "id": "35202010",
-                  "name": "Pharmaceuticals"
-                }
-              ]
-            },
-            {
-              "id": "352030",
-              "name": "Life Sciences Tools & Services",
-              "sub-industries": [
-                {
-                  "id": "35203010",
-                  "name": "Life Sciences Tools & Services"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "id": "40",
-      "name": "Financials",
-      "industry groups": [
-        {
-          "id": "4010",
-          "name": "Banks",
-          "industries": [
-            {
-              "id": "401010",
-              "name": "Banks",
-              "sub-industries": [
-                {
-                  "id": "40101010",
-                  "name": "Diversified Banks"
-                },
-                {
-                  "id": "40101015",
-                  "name": "Regional Banks"
-                }
-              ]
-            },
-            {
-              "id": "401020",
-              "name": "Thrifts & Mortgage Finance",
-              "sub-industries": [
-                {
-                  "id": "40102010",
-                  "name": "Thrifts & Mortgage Finance"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "4020",
-          "name": "Diversified Financials",
-          "industries": [
-            {
-              "id": "402010",
-              "name": "Diversified Financial Services",
-              "sub-industries": [
-                {
-                  "id": "40201020",
-                  "name": "Other Diversified Financial Services"
-                },
-                {
-                  "id": "40201030",
-                  "name": "Multi-Sector Holdings"
-                },
-                {
-                  "id": "40201040",
-                  "name": "Specialized Finance"
-                }
-              ]
-            },
-            {
-              "id": "402020",
-              "name": "Consumer Finance",
-              "sub-industries": [
-                {
-                  "id": "40202010",
-                  "name": "Consumer Finance"
-                }
-              ]
-            },
-            {
-              "id": "402030",
-              "name": "Capital Markets",
-              "sub-industries": [
-                {
-                  "id": "40203010",
-                  "name": "Asset Management & Custody Banks"
-                },
-                {
-                  "id": "40203020",
-                  "name": "Investment Banking & Brokerage"
-                },
-                {
-                  "id": "40203030",
-                  "name": "Diversified Capital Markets"
-                },
-                {
-                  "id": "40203040",
-                  "name": "Financial Exchanges & Data"
-                }
-              ]
-            },
-            {
-              "id": "402040",
-              "name": "Mortgage Real Estate Investment Trusts (REITs)",
-              "sub-industries": [
-                {
-                  "id": "40204010",
-                  "name": "Mortgage REITs"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "4030",
-          "name": "Insurance",
-          "industries": [
-            {
-              "id": "403010",
-              "name": "Insurance",
-              "sub-industries": [
-                {
-                  "id": "40301010",
-                  "name": "Insurance Brokers"
-                },
-                {
-                  "id": "40301020",
-                  "name": "Life & Health Insurance"
-                },
-                {
-                  "id": "40301030",
-                  "name": "Multi-line Insurance"
-                },
-                {
-                  "id": "40301040",
-                  "name": "Property & Casualty Insurance"
-                },
-                {
-                  "id": "40301050",
-                  "name": "Reinsurance"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "id": "45",
-      "name": "Information Technology",
-      "industry groups": [
-        {
-          "id": "4510",
-          "name": "Software & Services",
-          "industries": [
-            {
-              "id": "451020",
-              "name": "IT Services",
-              "sub-industries": [
-                {
-                  "id": "45102010",
-                  "name": "IT Consulting & Other Services"
-                },
-                {
-                  "id": "45102020",
-                  "name": "Data Processing & Outsourced Services"
-                },
-                {
-                  "id": "45102030",
-                  "name": "Internet Services & Infrastructure"
-                }
-              ]
-            },
-            {
-              "id": "451030",
-              "name": "Software",
-              "sub-industries": [
-                {
-                  "id": "45103010",
-                  "name": "Application Software"
-                },
-                {
-                  "id": "45103020",
-                  "name": "Systems Software"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "4520",
-          "name": "Technology Hardware & Equipment",
-          "industries": [
-            {
-              "id": "452010",
-              "name": "Communications Equipment",
-              "sub-industries": [
-                {
-                  "id": "45201020",
-                  "name": "Communications Equipment"
-                }
-              ]
-            },
-            {
-              "id": "452020",
-              "name": "Technology Hardware, Storage & Peripherals",
-              "sub-industries": [
-                {
-                  "id": "45202030",
-                  "name": "Technology Hardware, Storage & Peripherals"
-                }
-              ]
-            },
-            {
-              "id": "452030",
-              "name": "Electronic Equipment, Instruments & Components",
-              "sub-industries": [
-                {
-                  "id": "45203010",
-                  "name": "Electronic Equipment & Instruments"
-                },
-                {
-                  "id": "45203015",
-                  "name": "Electronic Components"
-                },
-                {
-                  "id": "45203020",
-                  "name": "Electronic Manufacturing Services"
-                },
-                {
-                  "id": "45203030",
-                  "name": "Technology Distributors"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "4530",
-          "name": "Semiconductors & Semiconductor Equipment",
-          "industries": [
-            {
-              "id": "453010",
-              "name": "Semiconductors & Semiconductor Equipment",
-              "sub-industries": [
-                {
-                  "id": "45301010",
-                  "name": "Semiconductor Equipment"
-                },
-                {
-                  "id": "45301020",
-                  "name": "Semiconductors"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "id": "50",
-      "name": "Communication Services",
-      "industry groups": [
-        {
-          "id": "5010",
-          "name": "Communication Services",
-          "industries": [
-            {
-              "id": "501010",
-              "name": "Diversified Telecommunication Services",
-              "sub-industries": [
-                {
-                  "id": "50101010",
-                  "name": "Alternative Carriers"
-                },
-                {
-                  "id": "50101020",
-                  "name": "Integrated Telecommunication Services"
-                }
-              ]
-            },
-            {
-              "id": "501020",
-              "name": "Wireless Telecommunication Services",
-              "sub-industries": [
-                {
-                  "id": "50102010",
-                  "name": "Wireless Telecommunication Services"
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "id": "5020",
-          "name": "Media & Entertainment",
-          "industries": [
-            {
-              "id": "502010",
-              "name": "Media",
-              "sub-industries": [
-                {
-                  "id": "50201010",
-                  "name": "Advertising"
-                },
-                {
-                  "id": "50201020",
-                  "name": "Broadcasting"
-                },
-                {
-                  "id": "50201030",
-                  "name": "Cable & Satellite"
-                },
-                {
-                  "id": "50201040",
-                  "name": "Publishing"
-                }
-              ]
-            },
-            {
-              "id": "502020",
-              "name": "Entertainment",
-              "sub-industries": [
-                {
-                  "id": "50202010",
-                  "name": "Movies & Entertainment"
-                },
-                {
-                  "id": "50202020",
-                  "name": "Interactive Home Entertainment"
-                }
-              ]
-            },
-            {
-              "id": "502030",
-              "name": "Interactive Media & Services",
-              "sub-industries": [
-                {
-                  "id": "50203010",
-                  "name": "Interactive Media & Services"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "id": "55",
-      "name": "Utilities",
-      "industry groups": [
-        {
-          "id": "5510",
-          "name": "Utilities",
-          "industries": [
-            {
-              "id": "551010",
-              "name": "Electric Utilities",
-              "sub-industries": [
-                {
-                  "id": "55101010",
-                  "name": "Electric Utilities"
-                }
-              ]
-            },
-            {
-              "id": "551020",
-              "name": "Gas Utilities",
-              "sub-industries": [
-                {
-                  "id": "55102010",
-                  "name": "Gas Utilities"
-                }
-              ]
-            },
-            {
-              "id": "551030",
-              "name": "Multi-Utilities",
-              "sub-industries": [
-                {
-                  "id": "55103010",
-                  "name": "Multi-Utilities"
-                }
-              ]
-            },
-            {
-              "id": "551040",
-              "name": "Water Utilities",
-              "sub-industries": [
-                {
-                  "id": "55104010",
-                  "name": "Water Utilities"
-                }
-              ]
-            },
-            {
-              "id": "551050",
-              "name": "Independent Power and Renewable Electricity Producers",
-              "sub-industries": [
-                {
-                  "id": "55105010",
-                  "name": "Independent Power Producers & Energy Traders"
-                },
-                {
-                  "id": "55105020",
-                  "name": "Renewable Electricity"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "id": "60",
-      "name": "Real Estate",
-      "industry groups": [
-        {
-          "id": "6010",
-          "name": "Real Estate",
-          "industries": [
-            {
-              "id": "601010",
-              "name": "Equity Real Estate Investment Trusts (REITs)",
-              "sub-industries": [
-                {
-                  "id": "60101010",
-                  "name": "Diversified REITs"
-                },
-                {
-                  "id": "60101020",
-                  "name": "Industrial REITs"
-                },
-                {
-                  "id": "60101030",
-                  "name": "Hotel & Resort REITs"
-                },
-                {
-                  "id": "60101040",
-                  "name": "Office REITs"
-                },
-                {
-                  "id": "60101050",
-                  "name": "Health Care REITs"
-                },
-                {
-                  "id": "60101060",
-                  "name": "Residential REITs"
-                },
-                {
-                  "id": "60101070",
-                  "name": "Retail REITs"
-                },
-                {
-                  "id": "60101080",
-                  "name": "Specialized REITs"
-                }
-              ]
-            },
-            {
-              "id": "601020",
-              "name": "Real Estate Management & Development",
-              "sub-industries": [
-                {
-                  "id": "60102010",
-                  "name": "Diversified Real Estate Activities"
-                },
-                {
-                  "id": "60102020",
-                  "name": "Real Estate Operating Companies"
-                },
-                {
-                  "id": "60102030",
-                  "name": "Real Estate Development"
-                },
-                {
-                  "id": "60102040",
-                  "name": "Real Estate Services"
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    }
-  ]
-}
+"""
+GICS taxonomy data.
 
-GICS_SECTOR_SCHEMA = {
-  "Energy": {
-    "description": "Companies engaged in exploration & production, refining & marketing, storage & transportation of oil & gas, coal, and consumable fuels. Also includes oil & gas equipment and services.",
-    "industry_groups": [
-      "Energy Equipment & Services",
-      "Oil, Gas & Consumable Fuels"
-    ]
-  },
-  "Materials": {
-    "description": "Companies manufacturing chemicals, construction materials, forest products, glass, paper, packaging, metals, minerals, and steel production.",
-    "industry_groups": [
-      "Chemicals",
-      "Construction Materials",
-      "Containers & Packaging",
-      "Metals & Mining",
-      "Paper & Forest Products"
-    ]
-  },
-  "Industrials": {
-    "description": "Manufacturers/distributors of capital goods and providers of commercial/professional and transportation services.",
-    "industry_groups": [
-      "Capital Goods",
-      "Commercial & Professional Services",
-      "Transportation"
-    ]
-  },
-  "Consumer Discretionary": {
-    "description": "Goods and services sensitive to economic cycles, including autos, apparel, hotels, restaurants, leisure products, and discretionary retail.",
-    "industry_groups": [
-      "Automobiles & Components",
-      "Consumer Durables & Apparel",
-      "Consumer Services",
-      "Retailing"
-    ]
-  },
-  "Consumer Staples": {
-    "description": "Products and services less sensitive to economic cycles: food, beverages, tobacco, household goods, and staples retail.",
-    "industry_groups": [
-      "Food & Staples Retailing",
-      "Food, Beverage & Tobacco",
-      "Household & Personal Products"
-    ]
-  },
-  "Health Care": {
-    "description": "Health care providers, equipment manufacturers, biotech, and pharmaceutical companies.",
-    "industry_groups": [
-      "Health Care Equipment & Services",
-      "Pharmaceuticals, Biotechnology & Life Sciences"
-    ]
-  },
-  "Financials": {
-    "description": "Companies offering banking, insurance, capital markets, REITs, and financial data services.",
-    "industry_groups": [
-      "Banks",
-      "Diversified Financials",
-      "Insurance"
-    ]
-  },
-  "Information Technology": {
-    "description": "Companies that develop or distribute software, hardware, semiconductors, IT services, and tech equipment.",
-    "industry_groups": [
-      "Software & Services",
-      "Technology Hardware & Equipment",
-      "Semiconductors & Semiconductor Equipment"
-    ]
-  },
-  "Communication Services": {
-    "description": "Telecommunication providers, media and entertainment companies, and interactive content producers.",
-    "industry_groups": [
-      "Telecommunication Services",
-      "Media & Entertainment"
-    ]
-  },
-  "Utilities": {
-    "description": "Electric, gas, water utilities, independent power producers, and renewable energy companies.",
-    "industry_groups": [
-      "Utilities"
-    ]
-  },
-  "Real Estate": {
-    "description": "Companies involved in real estate development, operations, REITs, and real estate services.",
-    "industry_groups": [
-      "Equity Real Estate Investment Trusts (REITs)",
-      "Real Estate Management & Development"
-    ]
-  }
-}
+The taxonomy is stored as compact JSON files under `schemas/data/` and parsed on
+first use, so importing this module costs nothing until a lookup is made. The
+original module-level names (`GICS_SCHEMA`, `GICS_SECTOR_SCHEMA`, `GICS` and
+`GICS_CLASSIFICATION_SCHEMA`) remain importable and resolve to the loaded data.
+"""
+import os
+import re
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
-GICS = {
-  "Sectors": [
-    {
-      "name": "Energy",
-      "description": "Companies engaged in exploration & production, refining & marketing, storage & transportation of oil & gas, coal, and consumable fuels. Also includes oil & gas equipment and services.",
-      "Industry Groups": [
-        {
-          "name": "Energy Equipment & Services",
-          "description": "Companies providing services and equipment to the oil and gas industry, including drilling, seismic data acquisition, and well maintenance.",
-          "Industries": [
-            {
-              "name": "Oil & Gas Drilling",
-              "description": "Companies engaged in drilling oil and gas wells for others on a contract or fee basis.",
-              "Sub-Industries": [
-                {
-                  "name": "Oil & Gas Drilling",
-                  "description": "Companies that specialize in drilling oil and gas wells for others on a contract or fee basis."
-                }
-              ]
-            },
-            {
-              "name": "Oil & Gas Equipment & Services",
-              "description": "Companies that manufacture oil and gas field machinery and equipment, including drilling rigs and equipment, and provide services such as seismic data acquisition and well maintenance.",
-              "Sub-Industries": [
-                {
-                  "name": "Oil & Gas Equipment & Services",
-                  "description": "Companies that manufacture oil and gas field machinery and equipment, including drilling rigs and equipment, and provide services such as seismic data acquisition and well maintenance."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Oil, Gas & Consumable Fuels",
-          "description": "Companies engaged in the exploration, production, marketing, refining, and/or transportation of oil and gas, coal, and consumable fuels.",
-          "Industries": [
-            {
-              "name": "Integrated Oil & Gas",
-              "description": "Companies engaged in the exploration, production, refining, and marketing of oil and gas.",
-              "Sub-Industries": [
-                {
-                  "name": "Integrated Oil & Gas",
-                  "description": "Companies engaged in the exploration, production, refining, and marketing of oil and gas."
-                }
-              ]
-            },
-            {
-              "name": "Oil & Gas Exploration & Production",
-              "description": "Companies engaged in the exploration and production of oil and gas not classified elsewhere.",
-              "Sub-Industries": [
-                {
-                  "name": "Oil & Gas Exploration & Production",
-                  "description": "Companies engaged in the exploration and production of oil and gas not classified elsewhere."
-                }
-              ]
-            },
-            {
-              "name": "Oil & Gas Refining & Marketing",
-              "description": "Companies engaged in the refining and marketing of oil and gas products.",
-              "Sub-Industries": [
-                {
-                  "name": "Oil & Gas Refining & Marketing",
-                  "description": "Companies engaged in the refining and marketing of oil and gas products."
-                }
-              ]
-            },
-            {
-              "name": "Oil & Gas Storage & Transportation",
-              "description": "Companies engaged in the storage and transportation of oil, gas, and other fuels.",
-              "Sub-Industries": [
-                {
-                  "name": "Oil & Gas Storage & Transportation",
-                  "description": "Companies engaged in the storage and transportation of oil, gas, and other fuels."
-                }
-              ]
-            },
-            {
-              "name": "Coal & Consumable Fuels",
-              "description": "Companies primarily involved in the production and mining of coal, related products, and other consumable fuels.",
-              "Sub-Industries": [
-                {
-                  "name": "Coal & Consumable Fuels",
-                  "description": "Companies primarily involved in the production and mining of coal, related products, and other consumable fuels."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Materials",
-      "description": "Companies manufacturing chemicals, construction materials, forest products, glass, paper, packaging, metals, minerals, and steel production.",
-      "Industry Groups": [
-        {
-          "name": "Chemicals",
-          "description": "Producers of commodity and specialty chemicals, fertilizers, and industrial gases, including diversified chemical companies.",
-          "Industries": [
-            {
-              "name": "Commodity Chemicals",
-              "description": "Producers of industrial chemicals and basic chemicals used in manufacturing and industrial processes.",
-              "Sub-Industries": [
-                {
-                  "name": "Commodity Chemicals",
-                  "description": "Manufacturers of industrial chemicals, including petrochemicals, plastics, and synthetic fibers."
-                }
-              ]
-            },
-            {
-              "name": "Diversified Chemicals",
-              "description": "Companies engaged in diversified chemical production across multiple end-markets.",
-              "Sub-Industries": [
-                {
-                  "name": "Diversified Chemicals",
-                  "description": "Producers of a wide range of chemicals used in different sectors such as agriculture, construction, and consumer goods."
-                }
-              ]
-            },
-            {
-              "name": "Fertilizers & Agricultural Chemicals",
-              "description": "Manufacturers of fertilizers, pesticides, and other agricultural chemicals.",
-              "Sub-Industries": [
-                {
-                  "name": "Fertilizers & Agricultural Chemicals",
-                  "description": "Producers of nitrogenous, phosphatic, and potassic fertilizers and agricultural pesticides."
-                }
-              ]
-            },
-            {
-              "name": "Industrial Gases",
-              "description": "Companies that produce and distribute industrial gases for various applications.",
-              "Sub-Industries": [
-                {
-                  "name": "Industrial Gases",
-                  "description": "Manufacturers and distributors of gases like oxygen, nitrogen, argon, and hydrogen for industrial use."
-                }
-              ]
-            },
-            {
-              "name": "Specialty Chemicals",
-              "description": "Producers of high-value chemicals used in specific end applications, including additives, adhesives, sealants, and coatings.",
-              "Sub-Industries": [
-                {
-                  "name": "Specialty Chemicals",
-                  "description": "Producers of performance-enhancing chemicals used in coatings, electronics, food, and construction industries."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Construction Materials",
-          "description": "Manufacturers of construction materials including cement, concrete, and glass.",
-          "Industries": [
-            {
-              "name": "Construction Materials",
-              "description": "Companies engaged in producing construction materials used in residential and non-residential building projects.",
-              "Sub-Industries": [
-                {
-                  "name": "Construction Materials",
-                  "description": "Manufacturers of construction aggregates, cement, concrete, and bricks used in building infrastructure."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Containers & Packaging",
-          "description": "Producers of metal, glass, and plastic containers and packaging products, including paper packaging.",
-          "Industries": [
-            {
-              "name": "Metal & Glass Containers",
-              "description": "Manufacturers of metal and glass containers used in packaging of beverages, food, and other goods.",
-              "Sub-Industries": [
-                {
-                  "name": "Metal & Glass Containers",
-                  "description": "Producers of cans, jars, and bottles made of metal and glass used in packaging industries."
-                }
-              ]
-            },
-            {
-              "name": "Paper Packaging",
-              "description": "Manufacturers of paper-based packaging products like cartons and corrugated boxes.",
-              "Sub-Industries": [
-                {
-                  "name": "Paper Packaging",
-                  "description": "Companies engaged in producing cardboard boxes, paper bags, and wrapping papers."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Metals & Mining",
-          "description": "Companies involved in the extraction and processing of metals and minerals, including precious, diversified, and steel producers.",
-          "Industries": [
-            {
-              "name": "Aluminum",
-              "description": "Producers and refiners of aluminum and aluminum-based products.",
-              "Sub-Industries": [
-                {
-                  "name": "Aluminum",
-                  "description": "Companies engaged in bauxite mining and aluminum production and refining."
-                }
-              ]
-            },
-            {
-              "name": "Diversified Metals & Mining",
-              "description": "Companies involved in the extraction of various metals and minerals (excluding gold and aluminum).",
-              "Sub-Industries": [
-                {
-                  "name": "Diversified Metals & Mining",
-                  "description": "Producers of base metals including copper, nickel, zinc, and related ores."
-                }
-              ]
-            },
-            {
-              "name": "Gold",
-              "description": "Companies involved in gold mining and related activities.",
-              "Sub-Industries": [
-                {
-                  "name": "Gold",
-                  "description": "Gold exploration, mining, and production companies."
-                }
-              ]
-            },
-            {
-              "name": "Precious Metals & Minerals",
-              "description": "Producers of platinum, palladium, silver, and rare earth elements.",
-              "Sub-Industries": [
-                {
-                  "name": "Precious Metals & Minerals",
-                  "description": "Mining and refining of platinum, palladium, silver, and rare earths (excluding gold)."
-                }
-              ]
-            },
-            {
-              "name": "Steel",
-              "description": "Manufacturers of steel and steel products from iron ore or scrap.",
-              "Sub-Industries": [
-                {
-                  "name": "Steel",
-                  "description": "Producers of raw and fabricated steel, including bars, wires, and sheets."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Paper & Forest Products",
-          "description": "Producers of timber, pulp, paper, and related forest products.",
-          "Industries": [
-            {
-              "name": "Forest Products",
-              "description": "Companies involved in harvesting timber and producing lumber and wood panels.",
-              "Sub-Industries": [
-                {
-                  "name": "Forest Products",
-                  "description": "Producers of plywood, veneer, sawmills, and reconstituted wood products."
-                }
-              ]
-            },
-            {
-              "name": "Paper Products",
-              "description": "Producers of all grades of paper including printing and writing papers, packaging paper, and tissues.",
-              "Sub-Industries": [
-                {
-                  "name": "Paper Products",
-                  "description": "Manufacturers of paper rolls, newsprint, tissues, and industrial paper products."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Industrials",
-      "description": "Manufacturers/distributors of capital goods and providers of commercial/professional and transportation services.",
-      "Industry Groups": [
-        {
-          "name": "Capital Goods",
-          "description": "Companies that manufacture equipment used in construction and engineering, aerospace and defense, electrical components, and other industrial machinery.",
-          "Industries": [
-            {
-              "name": "Aerospace & Defense",
-              "description": "Manufacturers of civil or military aerospace and defense equipment, parts, or products.",
-              "Sub-Industries": [
-                {
-                  "name": "Aerospace & Defense",
-                  "description": "Producers of aircraft, defense systems, satellites, and military hardware."
-                }
-              ]
-            },
-            {
-              "name": "Building Products",
-              "description": "Producers of building components and home improvement products.",
-              "Sub-Industries": [
-                {
-                  "name": "Building Products",
-                  "description": "Manufacturers of insulation, doors, windows, HVAC systems, and related products."
-                }
-              ]
-            },
-            {
-              "name": "Construction & Engineering",
-              "description": "Companies engaged in non-residential construction and civil engineering services.",
-              "Sub-Industries": [
-                {
-                  "name": "Construction & Engineering",
-                  "description": "Providers of construction, design, and engineering services for commercial and infrastructure projects."
-                }
-              ]
-            },
-            {
-              "name": "Electrical Equipment",
-              "description": "Manufacturers of electrical components and power generation equipment.",
-              "Sub-Industries": [
-                {
-                  "name": "Electrical Components & Equipment",
-                  "description": "Producers of transformers, switchgear, motors, and industrial electrical devices."
-                }
-              ]
-            },
-            {
-              "name": "Industrial Conglomerates",
-              "description": "Diversified industrial companies with business in multiple sectors.",
-              "Sub-Industries": [
-                {
-                  "name": "Industrial Conglomerates",
-                  "description": "Multi-industry companies with operations in manufacturing, infrastructure, and services."
-                }
-              ]
-            },
-            {
-              "name": "Machinery",
-              "description": "Manufacturers of construction, agricultural, and industrial machinery and components.",
-              "Sub-Industries": [
-                {
-                  "name": "Construction Machinery & Heavy Trucks",
-                  "description": "Makers of earth-moving equipment, cranes, and heavy-duty trucks."
-                },
-                {
-                  "name": "Industrial Machinery",
-                  "description": "Producers of industrial automation systems, machine tools, compressors, and pumps."
-                }
-              ]
-            },
-            {
-              "name": "Trading Companies & Distributors",
-              "description": "Providers of distribution and supply chain services for industrial and commercial goods.",
-              "Sub-Industries": [
-                {
-                  "name": "Trading Companies & Distributors",
-                  "description": "Wholesalers and logistics providers for heavy equipment, building products, and industrial materials."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Commercial & Professional Services",
-          "description": "Companies providing printing, staffing, security, research, consulting, and office services.",
-          "Industries": [
-            {
-              "name": "Commercial Services & Supplies",
-              "description": "Providers of printing, cleaning, staffing, office services, and other business support.",
-              "Sub-Industries": [
-                {
-                  "name": "Commercial Printing",
-                  "description": "Firms providing offset, digital, and screen printing services."
-                },
-                {
-                  "name": "Environmental & Facilities Services",
-                  "description": "Companies offering waste management, sanitation, and building maintenance services."
-                },
-                {
-                  "name": "Office Services & Supplies",
-                  "description": "Distributors and providers of office products and services like leasing and document handling."
-                },
-                {
-                  "name": "Diversified Support Services",
-                  "description": "Providers of non-core outsourced services such as janitorial, pest control, and logistics."
-                },
-                {
-                  "name": "Security & Alarm Services",
-                  "description": "Providers of security systems, personnel, and surveillance technologies."
-                }
-              ]
-            },
-            {
-              "name": "Professional Services",
-              "description": "Companies providing consulting, staffing, and research services.",
-              "Sub-Industries": [
-                {
-                  "name": "Human Resource & Employment Services",
-                  "description": "Providers of recruitment, staffing, and workforce solutions."
-                },
-                {
-                  "name": "Research & Consulting Services",
-                  "description": "Firms engaged in economic research, strategic consulting, and analytics services."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Transportation",
-          "description": "Providers of air, rail, marine, and road transport and logistics services.",
-          "Industries": [
-            {
-              "name": "Air Freight & Logistics",
-              "description": "Providers of courier, logistics, and air cargo services.",
-              "Sub-Industries": [
-                {
-                  "name": "Air Freight & Logistics",
-                  "description": "Companies offering express delivery, freight forwarding, and supply chain solutions."
-                }
-              ]
-            },
-            {
-              "name": "Airlines",
-              "description": "Companies providing air transportation for passengers and/or cargo.",
-              "Sub-Industries": [
-                {
-                  "name": "Airlines",
-                  "description": "Commercial air carriers operating domestic and international passenger and cargo routes."
-                }
-              ]
-            },
-            {
-              "name": "Marine",
-              "description": "Operators of marine vessels and port services.",
-              "Sub-Industries": [
-                {
-                  "name": "Marine",
-                  "description": "Companies providing marine freight transportation and support services like ports and terminals."
-                }
-              ]
-            },
-            {
-              "name": "Road & Rail",
-              "description": "Operators of trucking and railway services for freight and passengers.",
-              "Sub-Industries": [
-                {
-                  "name": "Railroads",
-                  "description": "Operators of rail freight and passenger services."
-                },
-                {
-                  "name": "Trucking",
-                  "description": "Providers of regional and long-haul trucking and logistics."
-                }
-              ]
-            },
-            {
-              "name": "Transportation Infrastructure",
-              "description": "Owners and operators of roads, tunnels, airports, and marine ports.",
-              "Sub-Industries": [
-                {
-                  "name": "Airport Services",
-                  "description": "Companies that own, operate, or service airport infrastructure."
-                },
-                {
-                  "name": "Highways & Railtracks",
-                  "description": "Operators of toll roads, railways, and other ground infrastructure."
-                },
-                {
-                  "name": "Marine Ports & Services",
-                  "description": "Providers of marine port logistics and support operations."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Consumer Discretionary",
-      "description": "Goods and services sensitive to economic cycles, including autos, apparel, hotels, restaurants, leisure products, and discretionary retail.",
-      "Industry Groups": [
-        {
-          "name": "Automobiles & Components",
-          "description": "Manufacturers and distributors of automobiles, auto parts, and components.",
-          "Industries": [
-            {
-              "name": "Automobile Manufacturers",
-              "description": "Producers of cars, trucks, and other vehicles.",
-              "Sub-Industries": [
-                {
-                  "name": "Automobiles",
-                  "description": "Manufacturers of passenger cars, light trucks, and utility vehicles."
-                }
-              ]
-            },
-            {
-              "name": "Auto Components",
-              "description": "Manufacturers of parts and systems used in vehicles.",
-              "Sub-Industries": [
-                {
-                  "name": "Auto Parts & Equipment",
-                  "description": "Suppliers of vehicle components, including engines, tires, and electrical parts."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Consumer Durables & Apparel",
-          "description": "Manufacturers of household durables, leisure products, and apparel.",
-          "Industries": [
-            {
-              "name": "Consumer Electronics",
-              "description": "Manufacturers of personal electronics, audio and video equipment.",
-              "Sub-Industries": [
-                {
-                  "name": "Consumer Electronics",
-                  "description": "Companies producing TVs, audio devices, cameras, and related electronics."
-                }
-              ]
-            },
-            {
-              "name": "Homebuilding",
-              "description": "Builders and developers of residential properties.",
-              "Sub-Industries": [
-                {
-                  "name": "Homebuilding",
-                  "description": "Companies involved in construction and sale of new homes and residential communities."
-                }
-              ]
-            },
-            {
-              "name": "Household Durables",
-              "description": "Producers of appliances, home furnishings, and tools.",
-              "Sub-Industries": [
-                {
-                  "name": "Household Appliances",
-                  "description": "Manufacturers of large and small electrical appliances."
-                },
-                {
-                  "name": "Housewares & Specialties",
-                  "description": "Companies producing cookware, tableware, and home accessories."
-                },
-                {
-                  "name": "Home Furnishings",
-                  "description": "Manufacturers and retailers of furniture, mattresses, and related products."
-                }
-              ]
-            },
-            {
-              "name": "Leisure Products",
-              "description": "Manufacturers of toys, sporting goods, and leisure equipment.",
-              "Sub-Industries": [
-                {
-                  "name": "Leisure Products",
-                  "description": "Companies producing toys, sporting goods, bicycles, and recreational vehicles."
-                }
-              ]
-            },
-            {
-              "name": "Textiles, Apparel & Luxury Goods",
-              "description": "Producers and retailers of clothing, footwear, and luxury goods.",
-              "Sub-Industries": [
-                {
-                  "name": "Apparel, Accessories & Luxury Goods",
-                  "description": "Manufacturers and sellers of apparel, handbags, shoes, and luxury products."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Consumer Services",
-          "description": "Providers of services such as hotels, restaurants, education, and leisure facilities.",
-          "Industries": [
-            {
-              "name": "Hotels, Restaurants & Leisure",
-              "description": "Operators of hotels, resorts, restaurants, and entertainment venues.",
-              "Sub-Industries": [
-                {
-                  "name": "Hotels, Resorts & Cruise Lines",
-                  "description": "Companies owning and managing lodging and cruise services."
-                },
-                {
-                  "name": "Leisure Facilities",
-                  "description": "Operators of golf courses, casinos, and other recreational facilities."
-                },
-                {
-                  "name": "Restaurants",
-                  "description": "Companies running full-service and limited-service restaurant chains."
-                }
-              ]
-            },
-            {
-              "name": "Education Services",
-              "description": "Providers of educational support services and institutions.",
-              "Sub-Industries": [
-                {
-                  "name": "Education Services",
-                  "description": "Companies offering education and training services."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Retailing",
-          "description": "Retailers selling discretionary goods and services through various channels.",
-          "Industries": [
-            {
-              "name": "Distributors",
-              "description": "Companies that distribute durable and non-durable consumer products.",
-              "Sub-Industries": [
-                {
-                  "name": "Distributors",
-                  "description": "Wholesale distributors of durable and non-durable goods."
-                }
-              ]
-            },
-            {
-              "name": "Internet & Direct Marketing Retail",
-              "description": "Retailers selling goods and services primarily via the internet or direct marketing.",
-              "Sub-Industries": [
-                {
-                  "name": "Internet & Direct Marketing Retail",
-                  "description": "Online retailers and direct-to-consumer sales companies."
-                }
-              ]
-            },
-            {
-              "name": "Multiline Retail",
-              "description": "Operators of department stores and general merchandise stores.",
-              "Sub-Industries": [
-                {
-                  "name": "Department Stores",
-                  "description": "Retailers offering a wide variety of products organized by departments."
-                },
-                {
-                  "name": "General Merchandise Stores",
-                  "description": "Large retailers selling diverse product ranges, including discount stores."
-                }
-              ]
-            },
-            {
-              "name": "Specialty Retail",
-              "description": "Retailers focused on specific product categories or niche markets.",
-              "Sub-Industries": [
-                {
-                  "name": "Apparel Retail",
-                  "description": "Retailers specializing in clothing and footwear."
-                },
-                {
-                  "name": "Consumer Electronics Retail",
-                  "description": "Stores selling audio, video, and computer equipment."
-                },
-                {
-                  "name": "Home Improvement Retail",
-                  "description": "Retailers selling hardware, building materials, and home improvement products."
-                },
-                {
-                  "name": "Specialty Stores",
-                  "description": "Retailers focused on books, sporting goods, toys, office supplies, and other specialty goods."
-                },
-                {
-                  "name": "Automotive Retail",
-                  "description": "Dealerships and retailers of vehicles and automotive parts."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Consumer Staples",
-      "description": "Products and services less sensitive to economic cycles: food, beverages, tobacco, household goods, and staples retail.",
-      "Industry Groups": [
-        {
-          "name": "Food & Staples Retailing",
-          "description": "Retailers and distributors of food, beverages, and household staples.",
-          "Industries": [
-            {
-              "name": "Food Retail",
-              "description": "Operators of supermarkets and grocery stores.",
-              "Sub-Industries": [
-                {
-                  "name": "Supermarkets & Other Grocery (Food) Retailers",
-                  "description": "Stores selling fresh, frozen, and packaged foods and related products."
-                }
-              ]
-            },
-            {
-              "name": "Drug Retail",
-              "description": "Retailers selling prescription and over-the-counter pharmaceuticals and related goods.",
-              "Sub-Industries": [
-                {
-                  "name": "Drug Retail",
-                  "description": "Pharmacy chains and drug stores."
-                }
-              ]
-            },
-            {
-              "name": "Food Distributors",
-              "description": "Distributors of food products to retailers and institutions.",
-              "Sub-Industries": [
-                {
-                  "name": "Food Distributors",
-                  "description": "Wholesale distributors of food and related products."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Food, Beverage & Tobacco",
-          "description": "Manufacturers and marketers of food products, beverages, and tobacco products.",
-          "Industries": [
-            {
-              "name": "Food Products",
-              "description": "Producers of packaged and processed foods.",
-              "Sub-Industries": [
-                {
-                  "name": "Agricultural Products",
-                  "description": "Companies producing crops, livestock, and related raw agricultural commodities."
-                },
-                {
-                  "name": "Packaged Foods & Meats",
-                  "description": "Manufacturers of packaged foods, meat, and seafood products."
-                },
-                {
-                  "name": "Pet Products",
-                  "description": "Manufacturers of pet food and supplies."
-                }
-              ]
-            },
-            {
-              "name": "Beverages",
-              "description": "Producers of alcoholic and non-alcoholic beverages.",
-              "Sub-Industries": [
-                {
-                  "name": "Beverages (Alcoholic)",
-                  "description": "Producers of beer, wine, and distilled spirits."
-                },
-                {
-                  "name": "Beverages (Non-Alcoholic)",
-                  "description": "Manufacturers of soft drinks, bottled water, and other non-alcoholic drinks."
-                }
-              ]
-            },
-            {
-              "name": "Tobacco",
-              "description": "Manufacturers and marketers of tobacco products and related goods.",
-              "Sub-Industries": [
-                {
-                  "name": "Tobacco",
-                  "description": "Producers of cigarettes, cigars, and smokeless tobacco products."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Household & Personal Products",
-          "description": "Manufacturers of household cleaning products, personal care products, and related goods.",
-          "Industries": [
-            {
-              "name": "Household Products",
-              "description": "Producers of cleaning agents, paper products, and other household goods.",
-              "Sub-Industries": [
-                {
-                  "name": "Household Products",
-                  "description": "Manufacturers of cleaning products, paper towels, and related items."
-                }
-              ]
-            },
-            {
-              "name": "Personal Products",
-              "description": "Manufacturers of personal care and hygiene products.",
-              "Sub-Industries": [
-                {
-                  "name": "Personal Products",
-                  "description": "Producers of cosmetics, skin care, and personal hygiene products."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Health Care",
-      "description": "Health care providers, equipment manufacturers, biotech, and pharmaceutical companies.",
-      "Industry Groups": [
-        {
-          "name": "Health Care Equipment & Services",
-          "description": "Companies that manufacture health care equipment and provide health care services.",
-          "Industries": [
-            {
-              "name": "Health Care Equipment",
-              "description": "Producers of medical devices, instruments, and supplies.",
-              "Sub-Industries": [
-                {
-                  "name": "Health Care Equipment",
-                  "description": "Manufacturers of surgical equipment, diagnostic apparatus, and medical instruments."
-                },
-                {
-                  "name": "Health Care Supplies",
-                  "description": "Manufacturers of medical consumables such as gloves, bandages, and disposables."
-                }
-              ]
-            },
-            {
-              "name": "Health Care Providers & Services",
-              "description": "Companies providing health care services and facilities.",
-              "Sub-Industries": [
-                {
-                  "name": "Health Care Facilities",
-                  "description": "Providers of hospital and nursing care services."
-                },
-                {
-                  "name": "Health Care Services",
-                  "description": "Providers of health care services such as home health care, outpatient care, and managed health care."
-                },
-                {
-                  "name": "Health Care Distributors",
-                  "description": "Distributors of pharmaceuticals and medical products."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Pharmaceuticals, Biotechnology & Life Sciences",
-          "description": "Companies engaged in the research, development, production, and marketing of pharmaceuticals, biotechnology products, and life sciences tools and services.",
-          "Industries": [
-            {
-              "name": "Pharmaceuticals",
-              "description": "Producers of medicines and drugs.",
-              "Sub-Industries": [
-                {
-                  "name": "Pharmaceuticals",
-                  "description": "Companies developing and manufacturing prescription drugs."
-                }
-              ]
-            },
-            {
-              "name": "Biotechnology",
-              "description": "Companies involved in biotechnology research and development.",
-              "Sub-Industries": [
-                {
-                  "name": "Biotechnology",
-                  "description": "Companies focused on genetic research, therapies, and biopharmaceuticals."
-                }
-              ]
-            },
-            {
-              "name": "Life Sciences Tools & Services",
-              "description": "Companies providing research tools, reagents, and services to the life sciences industry.",
-              "Sub-Industries": [
-                {
-                  "name": "Life Sciences Tools & Services",
-                  "description": "Providers of instruments, consumables, and services for biotechnology and pharmaceutical research."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Financials",
-      "description": "Companies offering banking, insurance, capital markets, REITs, and financial data services.",
-      "Industry Groups": [
-        {
-          "name": "Banks",
-          "description": "Companies that accept deposits and provide loans and other financial services.",
-          "Industries": [
-            {
-              "name": "Diversified Banks",
-              "description": "Banks providing a wide range of banking services including commercial and retail banking.",
-              "Sub-Industries": [
-                {
-                  "name": "Diversified Banks",
-                  "description": "Large banks offering multiple financial products and services."
-                }
-              ]
-            },
-            {
-              "name": "Regional Banks",
-              "description": "Banks that operate primarily in a specific region or state.",
-              "Sub-Industries": [
-                {
-                  "name": "Regional Banks",
-                  "description": "Banks serving local or regional markets."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Diversified Financials",
-          "description": "Companies engaged in diverse financial services excluding banking and insurance.",
-          "Industries": [
-            {
-              "name": "Consumer Finance",
-              "description": "Companies offering personal loans and consumer credit services.",
-              "Sub-Industries": [
-                {
-                  "name": "Consumer Finance",
-                  "description": "Providers of loans, credit cards, and related financial services."
-                }
-              ]
-            },
-            {
-              "name": "Capital Markets",
-              "description": "Companies involved in investment banking, brokerage, asset management, and related activities.",
-              "Sub-Industries": [
-                {
-                  "name": "Asset Management & Custody Banks",
-                  "description": "Firms managing investments and providing custody services."
-                },
-                {
-                  "name": "Investment Banking & Brokerage",
-                  "description": "Companies providing investment banking and brokerage services."
-                },
-                {
-                  "name": "Diversified Financial Services",
-                  "description": "Companies offering multiple financial services including leasing, financing, and advisory."
-                }
-              ]
-            },
-            {
-              "name": "Mortgage Real Estate Investment Trusts (REITs)",
-              "description": "Companies that invest in mortgages and mortgage-backed securities.",
-              "Sub-Industries": [
-                {
-                  "name": "Mortgage REITs",
-                  "description": "REITs specializing in mortgage-related investments."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Insurance",
-          "description": "Companies underwriting life, health, property, casualty, and reinsurance policies.",
-          "Industries": [
-            {
-              "name": "Insurance Brokers",
-              "description": "Companies acting as intermediaries between insurers and clients.",
-              "Sub-Industries": [
-                {
-                  "name": "Insurance Brokers",
-                  "description": "Firms providing insurance brokerage and consulting."
-                }
-              ]
-            },
-            {
-              "name": "Life & Health Insurance",
-              "description": "Companies underwriting life and health insurance policies.",
-              "Sub-Industries": [
-                {
-                  "name": "Life & Health Insurance",
-                  "description": "Providers of life, annuity, and health insurance."
-                }
-              ]
-            },
-            {
-              "name": "Property & Casualty Insurance",
-              "description": "Companies underwriting property and casualty insurance.",
-              "Sub-Industries": [
-                {
-                  "name": "Property & Casualty Insurance",
-                  "description": "Providers of auto, home, and liability insurance."
-                }
-              ]
-            },
-            {
-              "name": "Reinsurance",
-              "description": "Companies providing insurance to insurance companies.",
-              "Sub-Industries": [
-                {
-                  "name": "Reinsurance",
-                  "description": "Firms offering reinsurance services."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Information Technology",
-      "description": "Companies that develop or distribute software, hardware, semiconductors, IT services, and tech equipment.",
-      "Industry Groups": [
-        {
-          "name": "Software & Services",
-          "description": "Companies providing software, IT consulting, and data processing services.",
-          "Industries": [
-            {
-              "name": "IT Services",
-              "description": "Companies providing IT consulting, systems integration, and outsourcing services.",
-              "Sub-Industries": [
-                {
-                  "name": "IT Consulting & Other Services",
-                  "description": "Firms providing IT consulting and related services."
-                },
-                {
-                  "name": "Data Processing & Outsourced Services",
-                  "description": "Companies offering data processing, outsourcing, and cloud services."
-                }
-              ]
-            },
-            {
-              "name": "Software",
-              "description": "Companies that develop, license, and support software applications and systems software.",
-              "Sub-Industries": [
-                {
-                  "name": "Application Software",
-                  "description": "Firms developing software applications for end users."
-                },
-                {
-                  "name": "Systems Software",
-                  "description": "Companies providing operating systems and systems management software."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Technology Hardware & Equipment",
-          "description": "Companies manufacturing computers, communications equipment, and related devices.",
-          "Industries": [
-            {
-              "name": "Communications Equipment",
-              "description": "Companies producing communication equipment such as routers and switches.",
-              "Sub-Industries": [
-                {
-                  "name": "Communications Equipment",
-                  "description": "Manufacturers of communication hardware."
-                }
-              ]
-            },
-            {
-              "name": "Computer Hardware",
-              "description": "Companies producing computers, peripherals, and related hardware.",
-              "Sub-Industries": [
-                {
-                  "name": "Computer Hardware",
-                  "description": "Manufacturers of computers and related devices."
-                }
-              ]
-            },
-            {
-              "name": "Electronic Equipment, Instruments & Components",
-              "description": "Companies producing electronic equipment and components.",
-              "Sub-Industries": [
-                {
-                  "name": "Electronic Equipment & Instruments",
-                  "description": "Manufacturers of electronic devices and instruments."
-                },
-                {
-                  "name": "Electronic Components",
-                  "description": "Producers of electronic components such as connectors and capacitors."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Semiconductors & Semiconductor Equipment",
-          "description": "Companies manufacturing semiconductors and related equipment.",
-          "Industries": [
-            {
-              "name": "Semiconductors",
-              "description": "Companies designing and manufacturing semiconductor chips.",
-              "Sub-Industries": [
-                {
-                  "name": "Semiconductors",
-                  "description": "Manufacturers of semiconductor devices."
-                }
-              ]
-            },
-            {
-              "name": "Semiconductor Equipment",
-              "description": "Companies providing equipment used in semiconductor manufacturing.",
-              "Sub-Industries": [
-                {
-                  "name": "Semiconductor Equipment",
-                  "description": "Producers of semiconductor fabrication equipment."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Communication Services",
-      "description": "Telecommunication providers, media and entertainment companies, and interactive content producers.",
-      "Industry Groups": [
-        {
-          "name": "Telecommunication Services",
-          "description": "Companies providing communication services primarily through fixed-line, wireless, and satellite networks.",
-          "Industries": [
-            {
-              "name": "Diversified Telecommunication Services",
-              "description": "Companies offering a range of telecommunication services including local and long-distance.",
-              "Sub-Industries": [
-                {
-                  "name": "Alternative Carriers",
-                  "description": "Telecom service providers competing with incumbents."
-                },
-                {
-                  "name": "Integrated Telecommunication Services",
-                  "description": "Companies offering integrated communication solutions."
-                }
-              ]
-            },
-            {
-              "name": "Wireless Telecommunication Services",
-              "description": "Companies providing wireless communication services such as cellular and paging.",
-              "Sub-Industries": [
-                {
-                  "name": "Wireless Telecommunication Services",
-                  "description": "Providers of wireless telecom services."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Media & Entertainment",
-          "description": "Companies involved in media, entertainment, publishing, and interactive content production.",
-          "Industries": [
-            {
-              "name": "Media",
-              "description": "Companies producing and distributing content through television, radio, newspapers, and magazines.",
-              "Sub-Industries": [
-                {
-                  "name": "Advertising",
-                  "description": "Firms providing advertising services."
-                },
-                {
-                  "name": "Broadcasting",
-                  "description": "Television and radio broadcasters."
-                },
-                {
-                  "name": "Cable & Satellite",
-                  "description": "Providers of cable and satellite television services."
-                },
-                {
-                  "name": "Publishing",
-                  "description": "Companies publishing newspapers, books, and magazines."
-                }
-              ]
-            },
-            {
-              "name": "Entertainment",
-              "description": "Companies involved in film production, music, live events, and leisure content.",
-              "Sub-Industries": [
-                {
-                  "name": "Movies & Entertainment",
-                  "description": "Film production and distribution companies."
-                },
-                {
-                  "name": "Interactive Home Entertainment",
-                  "description": "Companies producing interactive gaming and entertainment."
-                },
-                {
-                  "name": "Leisure Facilities",
-                  "description": "Providers of leisure venues and events."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Utilities",
-      "description": "Electric, gas, water utilities, independent power producers, and renewable energy companies.",
-      "industry_groups": [
-        {
-          "name": "Utilities",
-          "description": "Companies providing electric, gas, and water utility services, as well as independent power producers.",
-          "industries": [
-            {
-              "name": "Electric Utilities",
-              "description": "Companies that generate, transmit, and distribute electric power.",
-              "sub_industries": [
-                {
-                  "name": "Electric Utilities",
-                  "description": "Providers of electric power generation and distribution."
-                }
-              ]
-            },
-            {
-              "name": "Gas Utilities",
-              "description": "Companies that distribute natural gas to consumers and businesses.",
-              "sub_industries": [
-                {
-                  "name": "Gas Utilities",
-                  "description": "Providers of natural gas distribution services."
-                }
-              ]
-            },
-            {
-              "name": "Multi-Utilities",
-              "description": "Companies offering a combination of electric, gas, and water services.",
-              "sub_industries": [
-                {
-                  "name": "Multi-Utilities",
-                  "description": "Providers of multiple utility services."
-                }
-              ]
-            },
-            {
-              "name": "Water Utilities",
-              "description": "Companies engaged in water supply and wastewater services.",
-              "sub_industries": [
-                {
-                  "name": "Water Utilities",
-                  "description": "Providers of water supply and wastewater treatment services."
-                }
-              ]
-            },
-            {
-              "name": "Independent Power and Renewable Electricity Producers",
-              "description": "Companies that generate electricity for sale, including renewable energy producers.",
-              "sub_industries": [
-                {
-                  "name": "Independent Power Producers & Energy Traders",
-                  "description": "Companies generating electricity and trading energy."
-                },
-                {
-                  "name": "Renewable Electricity",
-                  "description": "Companies generating electricity from renewable sources like solar, wind, and hydro."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Real Estate",
-      "description": "Companies involved in real estate development, operations, REITs, and real estate services.",
-      "industry_groups": [
-        {
-          "name": "Equity Real Estate Investment Trusts (REITs)",
-          "description": "Companies that own and operate income-producing real estate across various property sectors.",
-          "industries": [
-              {
-              "name": "Diversified REITs",
-              "Sub-Industries": [
-                {
-                  "name": "Diversified REITs*",
-                  "description": "A company or Trust with significantly diversified operations across two or more property types."
-                }
-              ]
-            },
-            {
-              "name": "Industrial REITs",
-              "description": "REITs owning and managing industrial properties such as warehouses and distribution centers.",
-              "sub_industries": [
-                {
-                  "name": "Industrial REITs",
-                  "description": "Industrial real estate investment trusts."
-                }
-              ]
-            },
-            {
-              "name": "Office REITs",
-              "description": "REITs owning office buildings leased to tenants.",
-              "sub_industries": [
-                {
-                  "name": "Office REITs",
-                  "description": "Office real estate investment trusts."
-                }
-              ]
-            },
-            {
-              "name": "Retail REITs",
-              "description": "REITs owning retail properties like shopping malls and strip centers.",
-              "sub_industries": [
-                {
-                  "name": "Retail REITs",
-                  "description": "Retail real estate investment trusts."
-                }
-              ]
-            },
-            {
-              "name": "Residential REITs",
-              "description": "REITs owning residential rental properties including apartments and manufactured homes.",
-              "sub_industries": [
-                {
-                  "name": "Residential REITs",
-                  "description": "Residential real estate investment trusts."
-                }
-              ]
-            },
-            {
-              "name": "Health Care REITs",
-              "description": "REITs owning properties used in the health care industry such as hospitals and nursing facilities.",
-              "sub_industries": [
-                {
-                  "name": "Health Care REITs",
-                  "description": "Health care real estate investment trusts."
-                }
-              ]
-            },
-            {
-              "name": "Hotel & Resort REITs",
-              "description": "REITs owning hotels and resorts.",
-              "sub_industries": [
-                {
-                  "name": "Hotel & Resort REITs",
-                  "description": "Hotel and resort real estate investment trusts."
-                }
-              ]
-            },
-            {
-              "name": "Specialized REITs",
-              "description": "REITs owning specialized properties such as timber, data centers, and infrastructure.",
-              "sub_industries": [
-                {
-                  "name": "Specialized REITs",
-                  "description": "Specialized real estate investment trusts."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Real Estate Management & Development",
-          "description": "Companies that manage, develop, and operate real estate properties and portfolios.",
-          "industries": [
-            {
-              "name": "Real Estate Management & Development",
-              "description": "Companies engaged in real estate property management, development, and brokerage services.",
-              "sub_industries": [
-                {
-                  "name": "Real Estate Management & Development",
-                  "description": "Real estate management and development firms."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    }
-  ]
+GICS_DATA_FILES = {
+    # Coded GICS hierarchy (sector -> industry group -> industry -> sub-industry) with ids.
+    "GICS_SCHEMA": "gics_schema.json",
+    # Sector descriptions with their industry group names.
+    "GICS_SECTOR_SCHEMA": "gics_sector_schema.json",
+    # Described GICS hierarchy without ids.
+    "GICS": "gics.json",
+    # Current GICS hierarchy with MSCI sub-industry definitions, used for classification prompts.
+    "GICS_CLASSIFICATION_SCHEMA": "gics_classification_schema.json",
 }
 
-GICS_CLASSIFICATION_SCHEMA = {
-  "Sectors": [
-    {
-      "name": "Energy",
-      "description": "Companies engaged in exploration & production, refining & marketing, storage & transportation of oil & gas, coal, and consumable fuels. Also includes oil & gas equipment and services.",
-      "Industry Groups": [
-        {
-          "name": "Energy",
-          "Industries": [
-            {
-              "name": "Energy Equipment & Services",
-              "Sub-Industries": [
-                {
-                  "name": "Oil & Gas Drilling",
-                  "description": "Drilling contractors or owners of drilling rigs that contract their services for drilling wells."
-                },
-                {
-                  "name": "Oil & Gas Equipment & Services",
-                  "description": "Manufacturers of equipment, including drilling rigs and equipment, and providers of supplies such as fractured silica and services to companies involved in the drilling, evaluation and completion of oil and gas wells.\n\nThis Sub-Industry includes companies that provide information and data services such as seismic data collection primarily to the oil & gas industry and distributors of oil & gas equipment products.\n\nThis Sub-Industry excludes oil spill services companies classified in the Environmental & Facilities Services Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Oil, Gas & Consumable Fuels",
-              "Sub-Industries": [
-                {
-                  "name": "Integrated Oil & Gas",
-                  "description": "Integrated oil companies engaged in the exploration & production of oil and gas, as well as at least one other significant activity in either refining, marketing and transportation, or chemicals."
-                },
-                {
-                  "name": "Oil & Gas Exploration & Production",
-                  "description": "Companies engaged in the exploration and production of oil and gas, not classified elsewhere."
-                },
-                {
-                  "name": "Oil & Gas Refining & Marketing",
-                  "description": "Companies engaged in the refining and marketing of oil, gas and/or refined products not classified in the Integrated Oil & Gas or Independent Power Producers & Energy Traders Sub-Industries.\n\nThis Sub-Industry includes companies that produce ethanol, biodiesel, and eco-diesel fuels.\n\nThis Sub-Industry excludes retail automotive stores and convenience stores that primarily sell gasoline (retail gas stations), automotive components, lubricants and related products classified in the Automotive Retail Sub-Industry under the Consumer Discretionary Sector and fuel dealers classified in the Oil & Gas Storage & Transportation Sub-Industry under the Energy Sector."
-                },
-                {
-                  "name": "Oil & Gas Storage & Transportation",
-                  "description": "Companies engaged in the storage and/or transportation of oil, gas and/or refined products, including diversified midstream natural gas companies, oil and refined product pipelines, coal slurry pipelines and oil & gas shipping companies.\n\nThis Sub-Industry includes distributors and dealers of petroleum products.\n\nThis Sub-Industry excludes natural gas transmission companies that operate gas pipeline systems and associated facilities designed for gas supply to end users that are classified in the Gas Utilities Sub-Industry under the Utilities Sector."
-                },
-                {
-                  "name": "Coal & Consumable Fuels",
-                  "description": "Companies primarily involved in the production and mining of coal, related products and other consumable fuels related to the generation of energy such as bituminous (thermal) coal, uranium, biomass, hydrogen, and petroleum coke.\n\nThis Sub-Industry excludes companies primarily producing gases classified in the Industrial Gases Sub-Industry and companies primarily mining for metallurgical (coking) coal used for steel production classified in the Steel Sub-Industry under the Materials Sector."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Materials",
-      "Industry Groups": [
-        {
-          "name": "Materials",
-          "description": "Companies manufacturing chemicals, construction materials, forest products, glass, paper, packaging, metals, minerals, and steel production.",
-          "Industries": [
-            {
-              "name": "Chemicals",
-              "Sub-Industries": [
-                {
-                  "name": "Commodity Chemicals",
-                  "description": "Companies that primarily produce industrial chemicals and basic chemicals.\n\nThis Sub-Industry includes plastics, synthetic fibers & filaments, synthetic rubber products, films, commodity-based paints & pigments, carbon black, explosives, petroleum lubricating oils, greases, and petrochemicals.\n\nThis Sub-Industry excludes chemical companies classified in the Diversified Chemicals, Fertilizers & Agricultural Chemicals, Industrial Gases or Specialty Chemicals Sub-Industries."
-                },
-                {
-                  "name": "Diversified Chemicals",
-                  "description": "Manufacturers of a diversified range of chemical products not classified in the Industrial Gases, Commodity Chemicals, Specialty Chemicals or Fertilizers & Agricultural Chemicals Sub-Industries."
-                },
-                {
-                  "name": "Fertilizers & Agricultural Chemicals",
-                  "description": "Producers of fertilizers, pesticides, potash (including potash miners) or other agriculture-related chemicals, not classified elsewhere."
-                },
-                {
-                  "name": "Industrial Gases",
-                  "description": "Manufacturers of industrial gases such as Oxygen, Nitrogen, Hydrogen, Carbon Dioxide, Dry Ice, Helium, and Acetylene. \n\nThis Sub-Industry excludes Hydrogen used for the production of energy classified in the Coal & Consumable Fuels Sub-Industry."
-                },
-                {
-                  "name": "Specialty Chemicals",
-                  "description": "Companies that primarily produce high value-added chemicals used in the manufacture of a wide variety of products, including but not limited to fine chemicals, additives, advanced polymers, adhesives, sealants, and specialty paints, pigments & coatings.\n\nThis Sub-Industry includes manufacturers of fragrance and flavor chemicals used in the consumer goods industry and industrial enzyme manufacturers. \n\nThis Sub-Industry excludes raw materials and chemicals used specifically for battery production classified in the Electrical Components and Equipment Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Construction Materials",
-              "Sub-Industries": [
-                {
-                  "name": "Construction Materials",
-                  "description": "Manufacturers of construction materials, including sand, clay, gypsum, lime, aggregates, cement, concrete, bricks, and refractory materials.\n\nThis Sub-Industry excludes other finished or semi-finished building materials classified in the Building Products Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Containers & Packaging",
-              "Sub-Industries": [
-                {
-                  "name": "Metal, Glass & Plastic Containers",
-                  "description": "Manufacturers of metal, glass or plastic containers, including corks and caps.\n\nThis Sub-Industry excludes manufacturers of glassware classified in the Housewares & Specialties Sub-Industry under the Consumer Discretionary Sector."
-                },
-                {
-                  "name": "Paper & Plastic Packaging Products & Materials",
-                  "description": "Manufacturers of paper and cardboard containers & packaging, plastic packaging materials, wood containers, and related packaging products."
-                }
-              ]
-            },
-            {
-              "name": "Metals & Mining",
-              "Sub-Industries": [
-                {
-                  "name": "Aluminum",
-                  "description": "Producers of aluminum and related products, including companies that mine or process bauxite and companies that recycle aluminum to produce finished or semi-finished products.\n\nThis Sub-Industry excludes companies that primarily produce aluminum building materials classified in the Building Products Sub-Industry."
-                },
-                {
-                  "name": "Diversified Metals & Mining",
-                  "description": "Companies engaged in the diversified production or extraction of metals and minerals, not classified elsewhere.\n\nThis Sub-Industry includes nonferrous metal mining (except bauxite), salt & borate mining, phosphate rock mining, sand & gravel mining, and other diversified mining operations. It also includes providers of on-site mining services to metal miners.\n\nThis Sub-Industry excludes iron ore mining classified in the Steel Sub-Industry, bauxite mining classified in the Aluminum Sub-Industry, and coal mining classified in either the Steel or Coal & Consumable Fuels Sub-Industries."
-                },
-                {
-                  "name": "Copper",
-                  "description": "Companies involved primarily in copper ore mining and companies that manufacture primary and basic copper products such as rods, tubes, and wires.\n\nThis Sub-Industry excludes manufacturers of copper wires used mainly for electrical purposes classified in the Electrical Components & Equipment Sub-Industry under the Industrials Sector."
-                },
-                {
-                  "name": "Gold",
-                  "description": "Producers of gold and related products, including companies that mine or process gold and the South African finance houses which primarily invest in, but do not operate, gold mines."
-                },
-                {
-                  "name": "Precious Metals & Minerals",
-                  "description": "Companies mining precious metals and minerals not classified in the Gold Sub-Industry. \n\nThis Sub-Industry includes companies primarily mining platinum group metals, diamonds, and precious stones."
-                },
-                {
-                  "name": "Silver",
-                  "description": "Companies primarily mining silver.\n\nThis Sub-Industry excludes companies classified in the Gold or Precious Metals & Minerals Sub-Industries."
-                },
-                {
-                  "name": "Steel",
-                  "description": "Producers of iron and steel and related products, including iron ore mining and metallurgical (coking) coal mining used for steel production.\n\nThis Sub-Industry includes ferrous metal, iron and steel foundries."
-                }
-              ]
-            },
-            {
-              "name": "Paper & Forest Products",
-              "Sub-Industries": [
-                {
-                  "name": "Forest Products",
-                  "description": "Manufacturers of timber and related wood products.\n\nThis Sub-Industry includes timber tract operations, forest nurseries, and manufacturers of lumber and plywood for the building industry such as wood panels."
-                },
-                {
-                  "name": "Paper Products",
-                  "description": "Manufacturers of all grades of paper. \n\nThis Sub-Industry includes newsprint mills, converted paper product manufacturing, and pulp, paper & paperboard mills.\n\nThis Sub-Industry excludes companies specializing in paper packaging classified in the Paper & Plastic Packaging Products & Materials Sub-Industry."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Industrials",
-      "description": "Manufacturers/distributors of capital goods and providers of commercial/professional and transportation services.",
-      "Industry Groups": [
-        {
-          "name": "Capital Goods",
-          "Industries": [
-            {
-              "name": "Aerospace & Defense",
-              "Sub-Industries": [
-                {
-                  "name": "Aerospace & Defense",
-                  "description": "Manufacturers of civil or military aerospace and defense equipment, parts or products, such as defense electronics and space equipment.\n\nThis Sub-Industry includes military shipbuilding and companies that offer services to the defense industry, including support services, infrastructure services, operational support services, and supply chain & logistics management.\n\nThis Sub-Industry excludes companies that offer management & technology consulting services to government & defense organizations classified in the Research & Consulting Services Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Building Products",
-              "Sub-Industries": [
-                {
-                  "name": "Building Products",
-                  "description": "Manufacturers of building components and home improvement products and equipment.\n\nThis Sub-Industry excludes lumber and plywood classified in the Forest Products Sub-Industry and cement and other materials classified in the Construction Materials Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Construction & Engineering",
-              "Sub-Industries": [
-                {
-                  "name": "Construction & Engineering",
-                  "description": "Companies engaged in primarily non-residential construction. \n\nThis Sub-Industry includes civil engineering companies and large-scale contractors.\n\nThis Sub-Industry excludes companies classified in the Homebuilding Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Electrical Equipment",
-              "Sub-Industries": [
-                {
-                  "name": "Electrical Components & Equipment",
-                  "description": "Companies that produce electric cables and wires, electrical components or equipment not classified in the Heavy Electrical Equipment Sub-Industry.\n\nThis Sub-Industry includes cables and wires, motors and generators (except automotive), wiring devices, electric lighting equipment, fuel cells, solar power systems, and batteries & light bulbs (except manufacturers of batteries and/or light bulbs who also market and distribute their products to end consumers). This Sub-Industry also includes raw materials and chemicals used specifically for battery production."
-                },
-                {
-                  "name": "Heavy Electrical Equipment",
-                  "description": "Manufacturers of power-generating equipment and other heavy electrical equipment, including power turbines, heavy electrical machinery intended for fixed-use and large electrical systems.\n\nThis Sub-Industry includes manufacturers of engines, power transmission equipment, and turbines & turbine generator set units.\n\nThis Sub-Industry excludes cables and wires classified in the Electrical Components & Equipment Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Industrial Conglomerates",
-              "Sub-Industries": [
-                {
-                  "name": "Industrial Conglomerates",
-                  "description": "Industrial companies with diversified business activities in three or more GICS Sectors, none of which contributes a majority of revenues. Stakes held are predominantly of a controlling nature and stake holders maintain an operational interest in the running of the subsidiaries.\n\nThis Sub-Industry excludes companies with diversified business activities across three or more GICS Sectors, none of which contributes a majority of revenues and where stakes held are predominantly of a non-controlling nature. They are classified in the Multi-Sector Holdings Sub-Industry under the Financials Sector.\n\nThis Sub-Industry also excludes mono holding companies that invest in only one specific industry and are classified in the respective Sub-Industries."
-                }
-              ]
-            },
-            {
-              "name": "Machinery",
-              "Sub-Industries": [
-                {
-                  "name": "Construction Machinery & Heavy Transportation Equipment",
-                  "description": "Manufacturers of heavy duty trucks, rolling machinery, earth-moving & construction equipment, and related parts.\n\nThis Sub-Industry includes non-military shipbuilding."
-                },
-                {
-                  "name": "Agricultural & Farm Machinery",
-                  "description": "Companies manufacturing agricultural machinery, farm machinery, and related parts.\n\nThis Sub-Industry includes machinery used for the production of crops & agricultural livestock, agricultural tractors, planting & fertilizing machinery, fertilizer & chemical application equipment, and grain dryers & blowers."
-                },
-                {
-                  "name": "Industrial Machinery & Supplies & Components",
-                  "description": "Manufacturers of industrial machinery and industrial components.\n\nThis Sub-Industry includes companies that manufacture presses, 3D printers & related supplies, machine tools, compressors, pollution control equipment, elevators, escalators, insulators, pumps, roller bearings and other metal fabrications."
-                }
-              ]
-            },
-            {
-              "name": "Trading Companies & Distributors",
-              "Sub-Industries": [
-                {
-                  "name": "Trading Companies & Distributors",
-                  "description": "Trading companies and distributors of industrial equipment and products.\n\nThis Sub-Industry includes distributors of chemicals, construction materials, containers & packaging products, metals & minerals such as coal & ores, paper & forest products, building products and electrical equipment. It also includes lessors of aircraft, railcars and other transportation equipment as well as companies that engage in industrial machinery rental to other businesses. \n\nThis Sub-Industry also includes companies distributing or wholesaling industrial equipment and products to other businesses using a proprietary online platform/website."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Commercial  & Professional Services",
-          "Industries": [
-            {
-              "name": "Commercial Services & Supplies",
-              "Sub-Industries": [
-                {
-                  "name": "Commercial Printing",
-                  "description": "Companies providing commercial printing services.\n\nThis Sub-Industry includes printers primarily serving the media industry."
-                },
-                {
-                  "name": "Environmental & Facilities Services",
-                  "description": "Companies providing environmental and facilities maintenance services. \n\nThis Sub-Industry includes waste management, facilities management, pollution control services and carbon emission trading.\n\nThis Sub-Industry excludes large-scale water treatment systems classified in the Water Utilities Sub-Industry."
-                },
-                {
-                  "name": "Office Services & Supplies",
-                  "description": "Providers of office services and manufacturers of office supplies and equipment, not classified elsewhere.\n\nThis Sub-Industry includes distributors of office equipment, products and supplies."
-                },
-                {
-                  "name": "Diversified Support Services",
-                  "description": "Companies primarily providing labor oriented support services to businesses and governments.\n\nThis Sub-Industry includes companies offering airline & railway catering services, commercial cleaning services, equipment repair services, industrial maintenance services, industrial auction services, storage & warehousing services, uniform rental services, and companies engaged in storage, indexing & retrieval of physical documents. This Sub-Industry also includes debt recovery & collection companies that are hired by companies for collection from defaulters.\n\nThis Sub-Industry excludes debt collection companies that purchase debt portfolios at a discount from companies and subsequently recollect the same from the debtors and earn interest on debts, classified in the Consumer Finance Sub-Industry under the Financials Sector."
-                },
-                {
-                  "name": "Security & Alarm Services",
-                  "description": "Companies providing security and protection services to business and governments.\n\nThis Sub-Industry includes companies providing services such as correctional facilities, security & alarm services, armored transportation & guarding.\n\nThis Sub-Industry excludes companies providing security software classified in the Systems Software Sub-Industry and home security services classified in the Specialized Consumer Services Sub-Industry. It also excludes companies manufacturing security system equipment classified in the Electronic Equipment & Instruments Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Professional Services",
-              "Sub-Industries": [
-                {
-                  "name": "Human Resource & Employment Services",
-                  "description": "Companies providing business support services relating to human capital management.\n\nThis Sub-Industry includes employment agencies, employee training, payroll processing, benefit & retirement support services, corporate & job seeker recruitment services, and online job portals generating revenue from fees or commissions for offering recruitment services to companies or job seekers.\n\nThis Sub-Industry excludes job portals that mainly publish job related information and generate revenue from advertising, classified in the Interactive Media & Services Sub-Industry under the Communication Services Sector."
-                },
-                {
-                  "name": "Research & Consulting Services",
-                  "description": "Companies primarily providing research and consulting services to businesses and governments, not classified elsewhere.  \n\nThis Sub-Industry includes credit bureaus & credit agencies and companies involved in management consulting services, architectural design, business information or scientific research, marketing, and testing & certification services. It also includes providers of data, content and tools for diverse industries but excludes those that provide such products primarily to the financials industry classified in the Financial Exchanges & Data Sub-Industry under the Financials Sector.\n\nThis Sub-Industry excludes companies providing information technology consulting services classified in the IT Consulting & Other Services Sub-Industry and marketing consulting services & market research companies classified in the Advertising Sub-Industry under the Communication Services Sector."
-                },
-                {
-                  "name": "Data Processing & Outsourced Services",
-                  "description": "Providers of commercial data processing and/or business process outsourcing services.\n\nThis Sub-Industry includes companies providing services for customer experience management, back-office automation, call center management, and investor communications."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Transportation",
-          "Industries": [
-            {
-              "name": "Air Freight & Logistics",
-              "Sub-Industries": [
-                {
-                  "name": "Air Freight & Logistics",
-                  "description": "Companies providing air freight transportation, courier & logistics services, including package & mail delivery and customs agents. \n\nThis Sub-Industry excludes companies classified in the Passenger Airlines, Marine Transportation, Cargo Ground Transportation and Passenger Ground Transportation Sub-Industries."
-                }
-              ]
-            },
-            {
-              "name": "Passenger Airlines",
-              "Sub-Industries": [
-                {
-                  "name": "Passenger Airlines",
-                  "description": "Companies providing primarily passenger air transportation."
-                }
-              ]
-            },
-            {
-              "name": "Marine Transportation",
-              "Sub-Industries": [
-                {
-                  "name": "Marine Transportation",
-                  "description": "Companies providing goods or passenger maritime transportation. \n\nThis Sub-Industry excludes cruise-ships classified in the Hotels, Resorts & Cruise Lines Sub-Industry and oil & gas shipping companies classified in the Oil & Gas Storage & Transportation Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Ground Transportation",
-              "Sub-Industries": [
-                {
-                  "name": "Rail Transportation",
-                  "description": "Companies providing primarily goods and passenger rail transportation."
-                },
-                {
-                  "name": "Cargo Ground Transportation",
-                  "description": "Companies providing ground transportation services for goods and freight."
-                },
-                {
-                  "name": "Passenger Ground Transportation",
-                  "description": "Companies providing passenger ground transportation and related services, including bus, taxi, vehicle rental, ride sharing and on-demand ride sharing platforms, and other passenger logistics."
-                }
-              ]
-            },
-            {
-              "name": "Transportation Infrastructure",
-              "Sub-Industries": [
-                {
-                  "name": "Airport Services",
-                  "description": "Operators of airports and companies providing related services such as air traffic control and other support activities for air transportation."
-                },
-                {
-                  "name": "Highways & Railtracks",
-                  "description": "Owners and operators of roads, tunnels and railtracks, including companies providing support activities for road transportation."
-                },
-                {
-                  "name": "Marine Ports & Services",
-                  "description": "Owners and operators of marine ports, including companies providing support activities for marine transportation."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Consumer Discretionary",
-      "description": "Goods and services sensitive to economic cycles, including autos, apparel, hotels, restaurants, leisure products, and discretionary retail.",
-      "Industry Groups": [
-        {
-          "name": "Automobiles & Components",
-          "Industries": [
-            {
-              "name": "Automobile Components",
-              "Sub-Industries": [
-                {
-                  "name": "Automotive Parts & Equipment",
-                  "description": "Manufacturers of parts and accessories for automobiles and motorcycles.\n\nThis Sub-Industry excludes companies classified in the Tires & Rubber Sub-Industry."
-                },
-                {
-                  "name": "Tires & Rubber",
-                  "description": "Manufacturers of tires and rubber."
-                }
-              ]
-            },
-            {
-              "name": "Automobiles",
-              "Sub-Industries": [
-                {
-                  "name": "Automobile Manufacturers",
-                  "description": "Companies that produce mainly passenger automobiles and light trucks.\n\nThis Sub-Industry excludes companies producing mainly motorcycles and three-wheelers classified in the Motorcycle Manufacturers Sub-Industry and heavy duty trucks classified in the Construction Machinery & Heavy Transportation Equipment Sub-Industry."
-                },
-                {
-                  "name": "Motorcycle Manufacturers",
-                  "description": "Companies that produce motorcycles, scooters or three-wheelers.\n\nThis Sub-Industry excludes bicycles classified in the Leisure Products Sub-Industry."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Consumer Durables & Apparel",
-          "Industries": [
-            {
-              "name": "Household Durables",
-              "Sub-Industries": [
-                {
-                  "name": "Consumer Electronics",
-                  "description": "Manufacturers of consumer electronics products, including TVs, home audio equipment, game consoles, digital cameras, and related products.\n\nThis Sub-Industry excludes manufacturers of smartphones, personal computers, laptops and notebooks classified in the Technology Hardware, Storage & Peripherals Sub-Industry and electric household appliances classified in the Household Appliances Sub-Industry."
-                },
-                {
-                  "name": "Home Furnishings",
-                  "description": "Manufacturers of soft home furnishings or furniture, including upholstery, carpets and wall-coverings."
-                },
-                {
-                  "name": "Homebuilding",
-                  "description": "Residential construction companies that mainly build residential units such as homes, apartments, and condominiums for the purpose of selling to homeowners.\n\nThis Sub-Industry includes manufacturers of prefabricated houses & semi-fixed manufactured homes and contractors for residential plumbing, heating, air conditioning, painting and related services.\n\nThis Sub-Industry excludes companies that develop real estate classified under the Real Estate Sector."
-                },
-                {
-                  "name": "Household Appliances",
-                  "description": "Manufacturers of electric household appliances and related products.\n\nThis Sub-Industry includes manufacturers of power and hand tools, including garden improvement tools.\n\nThis Sub-Industry excludes TVs and other audio & video products classified in the Consumer Electronics Sub-Industry and personal computers classified in the Technology Hardware, Storage & Peripherals Sub-Industry."
-                },
-                {
-                  "name": "Housewares & Specialties",
-                  "description": "Manufacturers of durable household products, including cutlery, cookware, glassware, crystal, silverware, utensils, kitchenware and consumer specialties, not classified elsewhere."
-                }
-              ]
-            },
-            {
-              "name": "Leisure Products",
-              "Sub-Industries": [
-                {
-                  "name": "Leisure Products",
-                  "description": "Manufacturers of leisure products and equipment, including sports equipment, bicycles, toys, and arcade game equipment."
-                }
-              ]
-            },
-            {
-              "name": "Textiles, Apparel & Luxury Goods",
-              "Sub-Industries": [
-                {
-                  "name": "Apparel, Accessories & Luxury Goods",
-                  "description": "Manufacturers of apparel, accessories & luxury goods.\n\nThis Sub-Industry includes companies primarily producing handbags, wallets, luggage, jewelry and watches.\n\nThis Sub-Industry excludes shoes classified in the Footwear Sub-Industry."
-                },
-                {
-                  "name": "Footwear",
-                  "description": "Manufacturers of footwear including sport and leather shoes."
-                },
-                {
-                  "name": "Textiles",
-                  "description": "Manufacturers of textile and related products, not classified in the Apparel, Accessories & Luxury Goods, Footwear or Home Furnishings Sub-Industries."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Consumer Services",
-          "Industries": [
-            {
-              "name": "Hotels, Restaurants & Leisure",
-              "Sub-Industries": [
-                {
-                  "name": "Casinos & Gaming",
-                  "description": "Owners and operators of casinos & gaming facilities and resorts.\n\nThis Sub-Industry includes companies providing lottery & betting services, operators of online casino gaming & betting websites. It also includes companies that offer software for online casino gaming & betting websites and manufacturers of casino gaming equipment.\n\nThis Sub-Industry excludes manufacturers of arcade game equipment classified in the Leisure Products Sub-Industry."
-                },
-                {
-                  "name": "Hotels, Resorts & Cruise Lines",
-                  "description": "Owners and operators of hotels, resorts and cruise-ships.\n\nThis Sub-Industry includes travel agencies, tour operators and companies that offer travel arrangement & reservation services, including online travel agencies that charge commission on each sale for travel tickets or hotel accommodation. It also includes online marketplaces for vacations rentals and travel related data processing & outsourced services.\n\nThis Sub-Industry excludes travel information sites that mainly offer information and generate revenue mainly through advertising or subscriptions, classified in the Interactive Media & Services Sub-Industry. It also excludes casino hotels classified in the Casinos & Gaming Sub-Industry."
-                },
-                {
-                  "name": "Leisure Facilities",
-                  "description": "Owners and operators of leisure facilities, including sport & fitness centers, stadiums, golf courses and amusement parks, not classified in the Movies & Entertainment Sub-Industry."
-                },
-                {
-                  "name": "Restaurants",
-                  "description": "Owners and operators of restaurants, bars, pubs, fast-food or take-out facilities.\n\nThis Sub-Industry includes food delivery companies and providers of food catering services to end consumers."
-                }
-              ]
-            },
-            {
-              "name": "Diversified Consumer Services",
-              "Sub-Industries": [
-                {
-                  "name": "Education Services",
-                  "description": "Companies providing educational services, either on-line or through conventional teaching methods.\n\nThis Sub-Industry includes private universities, correspondence teaching, providers of educational seminars, educational materials and technical education.\n\nThis Sub-Industry excludes companies providing employee education programs classified in the Human Resources & Employment Services Sub-Industry."
-                },
-                {
-                  "name": "Specialized Consumer Services",
-                  "description": "Companies providing consumer services such as home security services, consumer legal services, personal care services, residential renovation & interior design services, consumer auctions, day care centers and wedding & funeral services."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Consumer Discretionary Distribution & Retail",
-          "Industries": [
-            {
-              "name": "Distributors",
-              "Sub-Industries": [
-                {
-                  "name": "Distributors",
-                  "description": "Distributors and wholesalers of consumer merchandise, not classified elsewhere, including automobile distributors.\n\nThis Sub-Industry includes companies distributing or wholesaling consumer merchandise to other businesses using a proprietary online platform/website."
-                }
-              ]
-            },
-            {
-              "name": "Broadline Retail",
-              "Sub-Industries": [
-                {
-                  "name": "Broadline Retail",
-                  "description": "Retailers offering a wide range of consumer discretionary merchandise.\n\nThis Sub-Industry includes general and discount merchandise retailers, department stores and on-line retailers and marketplaces selling mostly consumer discretionary merchandise."
-                }
-              ]
-            },
-            {
-              "name": "Specialty Retail",
-              "Sub-Industries": [
-                {
-                  "name": "Apparel Retail",
-                  "description": "Retailers of apparel, footwear, luggage and other accessories. \n\nThis Sub-Industry includes apparel manufactures that primarily sell through their own retail channels."
-                },
-                {
-                  "name": "Computer & Electronics Retail",
-                  "description": "Retailers of consumer electronics, computers, smartphones, and related products."
-                },
-                {
-                  "name": "Home Improvement Retail",
-                  "description": "Retailers of home & garden improvement products, including building materials and related supplies.\n\nThis Sub-Industry includes companies that offer household goods repair & maintenance services."
-                },
-                {
-                  "name": "Other Specialty Retail",
-                  "description": "Retailers of other consumer products, not classified elsewhere, such as jewelry, perfumes, cosmetics, toys, office supplies, health & vision care products, books and other entertainment products. \n\nThis Sub-Industry includes tobacco retail, art dealers, manufactured (mobile) home dealers, duty free shops and companies that offer rental of miscellaneous consumer goods."
-                },
-                {
-                  "name": "Automotive Retail",
-                  "description": "Retailers of automotives.\n\nThis Sub-Industry includes automotive dealers, gas stations, and retailers of auto accessories, motorcycles & parts, automotive glass, and automotive equipment & parts."
-                },
-                {
-                  "name": "Homefurnishing Retail",
-                  "description": "Retailers of furniture and home furnishing products, including residential furniture, housewares, and interior design. \n\nThis Sub-Industry excludes retailers of home and garden improvement products, classified in the Home Improvement Retail Sub-Industry."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Consumer Staples",
-      "description": "Products and services less sensitive to economic cycles: food, beverages, tobacco, household goods, and staples retail.",
-      "Industry Groups": [
-        {
-          "name": "Consumer Staples Distribution & Retail",
-          "Industries": [
-            {
-              "name": "Consumer Staples Distribution & Retail",
-              "Sub-Industries": [
-                {
-                  "name": "Drug Retail",
-                  "description": "Retailers of drugs including operators of pharmacies."
-                },
-                {
-                  "name": "Food Distributors",
-                  "description": "Distributors of food products to other companies and not directly to the consumer.\n\nThis Sub-Industry includes companies distributing or wholesaling food products to other businesses using a proprietary online platform/website."
-                },
-                {
-                  "name": "Food Retail",
-                  "description": "Retailers of food products."
-                },
-                {
-                  "name": "Consumer Staples Merchandise Retail (New Name & Definition Update)",
-                  "description": "Retailers offering a wide range of consumer staples merchandise such as food, household, and personal care products.\n\nThis Sub-Industry includes hypermarkets, super centers and other consumer staples retailers such as discount retail spaces and on-line marketplaces selling mostly consumer staples goods."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Food, Beverage & Tobacco",
-          "Industries": [
-            {
-              "name": "Beverages",
-              "Sub-Industries": [
-                {
-                  "name": "Brewers",
-                  "description": "Producers of beer and malt liquors, including breweries not classified in the Restaurants Sub-Industry."
-                },
-                {
-                  "name": "Distillers & Vintners",
-                  "description": "Distillers, vintners and producers of alcoholic beverages not classified in the Brewers Sub-Industry."
-                },
-                {
-                  "name": "Soft Drinks & Non-alcoholic Beverages (New Name)",
-                  "description": "Producers of non-alcoholic beverages including mineral waters, sodas and natural bottled water.\n\nThis Sub-Industry excludes producers of milk, coffee, tea and fruit juices, classified in the Packaged Foods & Meats Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Food Products",
-              "Sub-Industries": [
-                {
-                  "name": "Agricultural Products & Services (New Name)",
-                  "description": "Producers of agricultural products.\n\nThis Sub-Industry includes crop growers, owners of plantations, producers of animal feed and companies that produce & process food but do not package & market them.\n\nThis Sub-Industry excludes companies classified in the Forest Products Sub-Industry and those that package & market the food products classified in the Packaged Foods & Meats Sub-Industry."
-                },
-                {
-                  "name": "Packaged Foods & Meats",
-                  "description": "Producers of packaged foods including dairy products, coffee, tea, fruit juices, meats, poultry, fish, and pet & fish food."
-                }
-              ]
-            },
-            {
-              "name": "Tobacco",
-              "Sub-Industries": [
-                {
-                  "name": "Tobacco",
-                  "description": "Manufacturers of cigarettes and other tobacco products such as e-cigarettes.\n\nThis Sub-Industry excludes companies primarily engaged in producing cannabis related products, classified in Sub-Industries based on end use."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Household & Personal Products",
-          "Industries": [
-            {
-              "name": "Household Products",
-              "Sub-Industries": [
-                {
-                  "name": "Household Products",
-                  "description": "Producers of non-durable household products, including detergents, household cleaners & disinfectants and other tissue & household paper products, not classified in the Paper Products Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Personal Care Products (New Name)",
-              "Sub-Industries": [
-                {
-                  "name": "Personal Care Products (New Name)",
-                  "description": "Manufacturers of personal and beauty care products, including cosmetics, perfumes, toiletries, diapers, hygiene products, vitamins, dietary supplements and other herbal & holistic medicines.\n\nThis Sub-Industry excludes products of curative medical nature classified in the Pharmaceuticals Sub-Industry under the Health Care Sector."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Health Care",
-      "description": "Health care providers, equipment manufacturers, biotech, and pharmaceutical companies.",
-      "Industry Groups": [
-        {
-          "name": "Health Care Equipment & Services",
-          "Industries": [
-            {
-              "name": "Health Care Equipment & Supplies",
-              "Sub-Industries": [
-                {
-                  "name": "Health Care Equipment",
-                  "description": "Manufacturers of health care equipment and devices.\n\nThis Sub-Industry includes medical instruments, drug delivery systems, cardiovascular & orthopedic devices, and diagnostic equipment that are generally long lasting and/or reusable."
-                },
-                {
-                  "name": "Health Care Supplies",
-                  "description": "Manufacturers of health care supplies and medical products that tend to be disposable.\n\nThis Sub-Industry includes eye care products, hospital supplies, and safety needle & syringe devices."
-                }
-              ]
-            },
-            {
-              "name": "Health Care Providers & Services",
-              "Sub-Industries": [
-                {
-                  "name": "Health Care Distributors",
-                  "description": "Distributors and wholesalers of health care products, not classified elsewhere. \n\nThis Sub-Industry includes companies distributing or wholesaling health care products to other businesses using a proprietary online platform/website."
-                },
-                {
-                  "name": "Health Care Services",
-                  "description": "Providers of patient health care services, not classified elsewhere.\n\nThis Sub-Industry includes dialysis centers, lab testing services, and pharmacy management services. It also includes companies providing business support services to health care providers, such as clerical support services, collection agency services, staffing services and outsourced sales & marketing services."
-                },
-                {
-                  "name": "Health Care Facilities",
-                  "description": "Owners and operators of health care facilities, including hospitals, nursing homes, rehabilitation centers and animal hospitals.\n\nThis Sub-Industry includes residential care facilities and assisted living facilities."
-                },
-                {
-                  "name": "Managed Health Care",
-                  "description": "Owners and operators of Health Maintenance Organizations (HMOs) and other managed plans. These companies derive premium revenues from risk-based health insurance arrangements and include Preferred Provider Organizations (PPOs), Consumer Driven Health Plans (CDHPs), Health Maintenance Organizations (HMOs) and Point-of-Service (POS) plans. It also includes health and dental benefit plans."
-                }
-              ]
-            },
-            {
-              "name": "Health Care Technology",
-              "Sub-Industries": [
-                {
-                  "name": "Health Care Technology",
-                  "description": "Companies providing information technology services primarily to health care providers.\n\nThis Sub-Industry includes companies providing application, systems and/or data processing software, internet-based tools, and IT consulting services to doctors, hospitals or businesses operating primarily in the Health Care Sector."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Pharmaceuticals, Biotechnology & Life Sciences",
-          "Industries": [
-            {
-              "name": "Biotechnology",
-              "Sub-Industries": [
-                {
-                  "name": "Biotechnology",
-                  "description": "Companies primarily engaged in the research, development, manufacturing and/or marketing of products based on genetic analysis and genetic engineering.\n\nThis Sub-Industry includes companies specializing in protein-based therapeutics to treat human diseases.\n\nThis Sub-Industry excludes companies manufacturing products using biotechnology but without a health care application."
-                }
-              ]
-            },
-            {
-              "name": "Pharmaceuticals",
-              "Sub-Industries": [
-                {
-                  "name": "Pharmaceuticals",
-                  "description": "Companies engaged in the research, development or production of pharmaceuticals, including active pharmaceutical ingredients (APIs) and veterinary drugs."
-                }
-              ]
-            },
-            {
-              "name": "Life Sciences Tools & Services",
-              "Sub-Industries": [
-                {
-                  "name": "Life Sciences Tools & Services",
-                  "description": "Companies enabling the drug discovery, development and production continuum by providing analytical tools, instruments, consumables & supplies, clinical trial services and contract research services.\n\nThis Sub-Industry includes companies primarily servicing the pharmaceutical and biotechnology industries."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Financials",
-      "description": "Companies offering banking, insurance, capital markets, REITs, and financial data services.",
-      "Industry Groups": [
-        {
-          "name": "Banks",
-          "Industries": [
-            {
-              "name": "Banks",
-              "Sub-Industries": [
-                {
-                  "name": "Diversified Banks",
-                  "description": "Large, geographically diverse banks with a national footprint whose revenues are derived primarily from conventional banking operations, have significant business activity in retail banking and small and medium corporate lending, and provide a diverse range of financial services.\n\nThis Sub-Industry excludes companies classified in the Regional Banks, Commercial & Residential Mortgage Finance and Investment Banking & Brokerage Sub-Industries."
-                },
-                {
-                  "name": "Regional Banks",
-                  "description": "Commercial banks, savings banks and thrifts whose business are derived primarily from conventional banking operations such as retail banking, corporate lending and originating various residential and commercial mortgage loans funded mainly through deposits. Regional banks tend to operate in limited geographic regions.\n\nThis Sub-Industry excludes companies classified in the Diversified Banks, Commercial & Residential Mortgage Finance and Investment Banking & Brokerage Sub-Industries."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Financial Services",
-          "Industries": [
-            {
-              "name": "Financial Services",
-              "Sub-Industries": [
-                {
-                  "name": "Diversified Financial Services",
-                  "description": "Providers of a diverse range of financial services and/or with some interest in a wide range of financial services including banking, annuity, insurance, investment management and capital markets, but with no dominant business line.\n\nThis Sub-Industry excludes companies classified in the Regional Banks and Diversified Banks Sub-Industries."
-                },
-                {
-                  "name": "Multi-Sector Holdings",
-                  "description": "Companies with significantly diversified holdings across three or more GICS Sectors, none of which contributes a majority of profit and/or sales. Stakes held are predominantly of a non-controlling nature.\n\nThis Sub-Industry includes diversified financial companies where stakes held are of a controlling nature.\n\nThis Sub-Industry excludes other diversified companies classified in the Industrials Conglomerates Sub-Industry. It also excludes mono holding companies that invest in only one specific industry and are classified in the respective Sub-Industries."
-                },
-                {
-                  "name": "Specialized Finance",
-                  "description": "Providers of specialized financial services, not classified elsewhere. Companies in this Sub-Industry derive a majority of revenue from one specialized line of business.\n\nThis Sub-Industry includes commercial financing companies, central banks, leasing institutions, factoring services, and specialty boutiques.\n\nThis Sub-Industry excludes companies classified in the Financial Exchanges & Data Sub-Industry."
-                },
-                {
-                  "name": "Commercial & Residential Mortgage Finance",
-                  "description": "Financial companies providing commercial and residential mortgage financing and related mortgage services.\n\nThis Sub-Industry includes non-deposit funded mortgage lending institutions, building societies, companies providing real estate financing products, loan servicing, mortgage broker services, and mortgage insurance."
-                },
-                {
-                  "name": "Transaction & Payment Processing Services",
-                  "description": "Providers of transaction & payment processing services and related payment services, including digital/mobile payment processors, payment service providers & gateways, and digital wallet providers."
-                }
-              ]
-            },
-            {
-              "name": "Consumer Finance",
-              "Sub-Industries": [
-                {
-                  "name": "Consumer Finance",
-                  "description": "Providers of consumer finance services, including personal credit, credit cards, lease financing, travel-related money services and pawn shops.\n\nThis Sub-Industry includes companies that purchase debt portfolios at a discount from other companies and engage in collection from debtors and earn interest on the debts. It also includes lending facilitation companies operating peer to peer (P2P) Internet communities where users borrow and lend money online. \n\nThis Sub-Industry excludes mortgage lenders classified in the Commercial & Residential Mortgage Finance Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Capital Markets",
-              "Sub-Industries": [
-                {
-                  "name": "Asset Management & Custody Banks",
-                  "description": "Financial institutions primarily engaged in investment management and/or related custody and securities fee-based services.\n\nThis Sub-Industry includes companies operating mutual funds, closed-end funds and unit investment trusts.\n\nThis Sub-Industry excludes banks and other financial institutions primarily involved in commercial lending, investment banking, brokerage and other specialized financial activities."
-                },
-                {
-                  "name": "Investment Banking & Brokerage",
-                  "description": "Financial institutions primarily engaged in investment banking & brokerage services, including equity & debt underwriting, mergers & acquisitions, securities lending and advisory services.\n\nThis Sub-Industry excludes banks and other financial institutions primarily involved in commercial lending, asset management and specialized financial activities."
-                },
-                {
-                  "name": "Diversified Capital Markets",
-                  "description": "Financial institutions primarily engaged in diversified capital markets activities, including a significant presence in at least two of the following areas: large/major corporate lending, investment banking, brokerage and asset management. \n\nThis Sub-Industry excludes less diversified companies classified in the Asset Management & Custody Banks or Investment Banking & Brokerage Sub-Industries. It also excludes companies classified in the Banks or Insurance Industry Groups and in the Consumer Finance Sub-Industry."
-                },
-                {
-                  "name": "Financial Exchanges & Data",
-                  "description": "Financial exchanges for securities, commodities, derivatives, cryptocurrencies and other financial instruments, and providers of financial decision support tools and products including ratings agencies.\n\nThis Sub-Industry excludes providers of financial magazines, journals, and websites classified in the Publishing Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Mortgage Real Estate Investment Trusts (REITs)",
-              "Sub-Industries": [
-                {
-                  "name": "Mortgage REITs*",
-                  "description": "Companies or Trusts that service, originate, purchase and/or securitize residential and/or commercial mortgage loans.  \n\nThis Sub-Industry includes trusts that invest in mortgage-backed securities and other mortgage related assets."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Insurance",
-          "Industries": [
-            {
-              "name": "Insurance",
-              "Sub-Industries": [
-                {
-                  "name": "Insurance Brokers",
-                  "description": "Insurance and reinsurance brokerage firms."
-                },
-                {
-                  "name": "Life & Health Insurance",
-                  "description": "Companies providing primarily life, disability, indemnity or supplemental health insurance.\n\nThis Sub-Industry excludes managed care companies classified in the Managed Health Care Sub-Industry."
-                },
-                {
-                  "name": "Multi-line Insurance",
-                  "description": "Insurance companies with diversified interests in life, health and property & casualty insurance."
-                },
-                {
-                  "name": "Property & Casualty Insurance",
-                  "description": "Companies providing primarily property and casualty insurance, including financial & title insurance."
-                },
-                {
-                  "name": "Reinsurance",
-                  "description": "Companies providing primarily reinsurance."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Information Technology",
-      "description": "Companies that develop or distribute software, hardware, semiconductors, IT services, and tech equipment.",
-      "Industry Groups": [
-        {
-          "name": "Software & Services",
-          "Industries": [
-            {
-              "name": "IT Services",
-              "Sub-Industries": [
-                {
-                  "name": "IT Consulting & Other Services",
-                  "description": "Providers of information technology and systems integration services.\n\nThis Sub-Industry includes information technology consulting and information management services.\n\nThis Sub-Industry excludes companies that offer management & technology consulting services to government and defense organizations classified in the Research & Consulting Services Sub-Industry."
-                },
-                {
-                  "name": "Internet Services & Infrastructure",
-                  "description": "Companies providing services and infrastructure for the internet industry including data centers and cloud networking & storage infrastructure.\n\nThis Sub-Industry includes companies providing web hosting services, web-based tools for constructing & managing websites, providers of internet security for websites & companies and domain name providers & registry services.\n\nThis Sub-Industry excludes companies classified in the Software Industry."
-                }
-              ]
-            },
-            {
-              "name": "Software",
-              "Sub-Industries": [
-                {
-                  "name": "Application Software",
-                  "description": "Companies engaged in developing and producing software designed for specialized applications for the business or consumer market.\n\nThis Sub-Industry includes enterprise & technical software, cloud-based software and companies engaged in bitcoin mining.\n\nThis Sub-Industry excludes companies classified in the Interactive Home Entertainment Sub-Industry and companies producing systems or database management software classified in the Systems Software Sub-Industry."
-                },
-                {
-                  "name": "Systems Software",
-                  "description": "Companies engaged in developing and producing software for operating systems & platforms, database management software and firewalls."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Technology Hardware & Equipment",
-          "Industries": [
-            {
-              "name": "Communications Equipment",
-              "Sub-Industries": [
-                {
-                  "name": "Communications Equipment",
-                  "description": "Manufacturers of communication equipment and products, including LANs (Local Area Networks), WANs (Wide Area Networks), routers, telephone apparatus & modems, switchboards & exchanges and fiber optic cables & coaxial cables used by the telecommunications industry.\n\nThis Sub-Industry includes radio & television broadcasting equipment.\n\nThis Sub-Industry excludes smartphone manufacturers classified in the Technology Hardware, Storage & Peripherals Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Technology Hardware, Storage & Peripherals",
-              "Sub-Industries": [
-                {
-                  "name": "Technology Hardware, Storage & Peripherals",
-                  "description": "Manufacturers of smartphones, personal computers, laptops, notebooks, servers, electronic computer printers, and related components and peripherals.\n\nThis Sub-Industry includes manufacturers of data storage components, motherboards, audio and video cards, monitors and keyboards. It also includes manufacturers of automatic teller machines (ATMs) and hardware used for cryptocurrency mining and validating.\n\nThis Sub-Industry excludes semiconductors classified in the Semiconductors Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Electronic Equipment, Instruments & Components",
-              "Sub-Industries": [
-                {
-                  "name": "Electronic Equipment & Instruments",
-                  "description": "Manufacturers of electronic equipment and instruments, including analytical, electronic test & measurement instruments, scanner/barcode products, lasers, display screens, point-of-sales machines, and security system equipment."
-                },
-                {
-                  "name": "Electronic Components",
-                  "description": "Manufacturers of electronic components generally used to create end products.\n\nThis Sub-Industry includes electronic components, connection devices, electron tubes, electronic capacitors & resistors, electronic coils, printed circuit boards, transformers & other inductors, and signal processing technology/components."
-                },
-                {
-                  "name": "Electronic Manufacturing Services",
-                  "description": "Producers of electronic equipment mainly for the OEM (Original Equipment Manufacturers) markets. These companies manufacture products that are largely customized as per the specifications outlined by their clients."
-                },
-                {
-                  "name": "Technology Distributors",
-                  "description": "Distributors of software, technology hardware and equipment, communications equipment, computers & peripherals, semiconductors, and electronic equipment & components.\n\nThis Sub-Industry includes companies distributing or wholesaling technology products to other businesses using a proprietary online platform/website."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Semiconductors & Semiconductor Equipment",
-          "description": "Companies that develop or distribute software, hardware, semiconductors, IT services, and tech equipment.",
-          "Industries": [
-            {
-              "name": "Semiconductors & Semiconductor Equipment",
-              "Sub-Industries": [
-                {
-                  "name": "Semiconductor Materials & Equipment",
-                  "description": "Manufacturers of semiconductor equipment, including manufacturers of the raw material and equipment used in the solar power industry such as raw wafers, gases, liquids and related packaging & material delivery systems.\n\nThis Sub-Industry includes companies that provide semiconductor test, assembly, and packaging systems.\n\nThis Sub-Industry excludes printed circuit board manufacturers classified in the Electronic Components Sub-Industry."
-                },
-                {
-                  "name": "Semiconductors",
-                  "description": "Manufacturers of semiconductors and related products, including solar modules, solar cells, integrated circuit devices, diodes and light-emitting diodes (LEDs), microprocessors and chips.\n\nThis Sub-Industry also includes providers of semiconductor packaging and test services."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Communication Services",
-      "Industry Groups": [
-        {
-          "name": "Telecommunication Services",
-          "Industries": [
-            {
-              "name": "Diversified Telecommunication Services",
-              "Sub-Industries": [
-                {
-                  "name": "Alternative Carriers",
-                  "description": "Providers of communications and high-density data transmission services primarily through a high bandwidth/fiber-optic cable network.\n\nThis Sub-Industry includes satellite companies that mainly offer services to the telecommunication industry."
-                },
-                {
-                  "name": "Integrated Telecommunication Services",
-                  "description": "Operators of primarily fixed-line telecommunications networks and companies providing both wireless and fixed-line telecommunications services, not classified elsewhere.\n\nThis Sub-Industry includes internet service providers offering internet access to end users and companies that construct as well as operate telecommunication towers.\n\nThis Sub-Industry excludes companies that mainly construct telecom towers and do not operate them, classified in the Construction & Engineering Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Wireless Telecommunication Services",
-              "Sub-Industries": [
-                {
-                  "name": "Wireless Telecommunication Services",
-                  "description": "Providers of primarily cellular or wireless telecommunication services including in-flight internet providers."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Media & Entertainment",
-          "description": "Telecommunication providers, media and entertainment companies, and interactive content producers.",
-          "Industries": [
-            {
-              "name": "Media",
-              "Sub-Industries": [
-                {
-                  "name": "Advertising",
-                  "description": "Companies providing advertising, marketing or public relations services.\n\nThis Sub-Industry includes companies offering digital advertising services, marketing consulting services, market research and reward program management services."
-                },
-                {
-                  "name": "Broadcasting",
-                  "description": "Owners and operators of television or radio broadcasting systems, including programming.\n\nThis Sub-Industry includes radio and television broadcasting, radio networks, and radio stations."
-                },
-                {
-                  "name": "Cable & Satellite",
-                  "description": "Providers of cable or satellite television services.\n\nThis Sub-Industry includes cable networks and program distribution."
-                },
-                {
-                  "name": "Publishing",
-                  "description": "Publishers of newspapers, magazines and books in print or electronic formats.\n\nThis Sub-Industry includes publishers of financial journals, magazines, and websites, which do not provide financial data, pricing or ratings information to financial service companies."
-                }
-              ]
-            },
-            {
-              "name": "Entertainment",
-              "Sub-Industries": [
-                {
-                  "name": "Movies & Entertainment",
-                  "description": "Companies that engage in producing and selling entertainment products and services, including companies engaged in the production, distribution and screening of movies and television shows, producers and distributors of music, entertainment theaters and sports teams.\n\nThis Sub-Industry also includes companies offering and/or producing entertainment and music content streamed online."
-                },
-                {
-                  "name": "Interactive Home Entertainment",
-                  "description": "Producers of interactive gaming products, including mobile gaming applications.\n\nThis Sub-Industry includes educational software used primarily in the home, video game developers, and streaming platforms focused on gaming.\n\nThis Sub-Industry excludes online gambling companies classified in the Casinos & Gaming Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Interactive Media & Services",
-              "Sub-Industries": [
-                {
-                  "name": "Interactive Media & Services",
-                  "description": "Companies engaging in content and information creation or distribution through proprietary platforms, where revenues are derived primarily through pay-per-click advertisements.\n\nThis Sub-Industry includes search engines, social media & networking platforms, online classifieds, online review companies and Internet TV companies. It also includes online video and content sharing companies.\n\nThis Sub-Industry excludes companies that derive a commission upon a consumer\u2019s purchase or subscription to another company\u2019s product or service, classified in respective Sub-Industries, such as online travel related sites selling a service or product directly to end consumers, which are classified in the Hotels Resorts & Cruise Lines Sub-Industry."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Utilities",
-      "Industry Groups": [
-        {
-          "name": "Utilities",
-          "description": "Electric, gas, water utilities, independent power producers, and renewable energy companies.",
-          "Industries": [
-            {
-              "name": "Electric Utilities",
-              "Sub-Industries": [
-                {
-                  "name": "Electric Utilities",
-                  "description": "Companies that produce or distribute electricity, including both nuclear and non-nuclear facilities.\n\nThis Sub-Industry includes companies that are vertically integrated across electricity generation and distribution chain, but whose primary business focus is on the distribution of electricity to the end users. It also includes electricity transmission & distribution companies."
-                }
-              ]
-            },
-            {
-              "name": "Gas Utilities",
-              "Sub-Industries": [
-                {
-                  "name": "Gas Utilities",
-                  "description": "Companies whose main charter is to distribute and transmit natural & manufactured gas, including propane distributors.\n\nThis Sub-Industry excludes companies primarily involved in gas exploration or production classified in the Oil & Gas Exploration & Production Sub-Industry. It also excludes companies engaged in the storage and/or transportation of oil, gas, and/or refined products classified in the Oil & Gas Storage & Transportation Sub-Industry."
-                }
-              ]
-            },
-            {
-              "name": "Multi-Utilities",
-              "Sub-Industries": [
-                {
-                  "name": "Multi-Utilities",
-                  "description": "Utility companies with significantly diversified activities in addition to core electric utility, gas utility and/or water utility operations."
-                }
-              ]
-            },
-            {
-              "name": "Water Utilities",
-              "Sub-Industries": [
-                {
-                  "name": "Water Utilities",
-                  "description": "Companies that purchase and redistribute water to end consumers. \n\nThis Sub-Industry includes large-scale water treatment systems, water supply & irrigation systems, and steam heating."
-                }
-              ]
-            },
-            {
-              "name": "Independent Power and Renewable Electricity Producers",
-              "Sub-Industries": [
-                {
-                  "name": "Independent Power Producers & Energy Traders",
-                  "description": "Companies that operate as Independent Power Producers (IPPs), Gas & Power Marketing & Trading Specialists and/or Integrated Energy Merchants.\n\nThis Sub-Industry excludes producers of electricity using renewable sources, such as solar power, hydropower, and wind power. It also excludes electricity transmission & distribution companies classified in the Electric Utilities Sub-Industry."
-                },
-                {
-                  "name": "Renewable Electricity",
-                  "description": "Companies that engage in the generation and distribution of electricity using renewable sources, including, but not limited to, companies that produce electricity using biomass, geothermal energy, solar energy, hydropower, and wind power.\n\nThis Sub-Industry excludes companies manufacturing capital equipment used to generate electricity using renewable sources, such as manufacturers of solar power systems, installers of photovoltaic cells, and companies involved in the provision of technology, components, and services mainly to this market."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    },
-    {
-      "name": "Real Estate",
-      "description": "Companies involved in real estate development, operations, REITs, and real estate services.",
-      "Industry Groups": [
-        {
-          "name": "Equity Real Estate Investment Trusts (REITs)",
-          "Industries": [
-            {
-              "name": "Diversified REITs",
-              "Sub-Industries": [
-                {
-                  "name": "Diversified REITs*",
-                  "description": "A company or Trust with significantly diversified operations across two or more property types."
-                }
-              ]
-            },
-            {
-              "name": "Industrial REITs",
-              "Sub-Industries": [
-                {
-                  "name": "Industrial REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of industrial properties, such as industrial warehouses and distribution properties."
-                }
-              ]
-            },
-            {
-              "name": "Hotel & Resort REITs",
-              "Sub-Industries": [
-                {
-                  "name": "Hotel & Resort REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of hotel and resort properties."
-                }
-              ]
-            },
-            {
-              "name": "Office REITs",
-              "Sub-Industries": [
-                {
-                  "name": "Office REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of office properties."
-                }
-              ]
-            },
-            {
-              "name": "Health Care REITs",
-              "Sub-Industries": [
-                {
-                  "name": "Health Care REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of properties serving the health care industry, including hospitals, nursing homes, and assisted living properties."
-                }
-              ]
-            },
-            {
-              "name": "Residential REITs",
-              "Sub-Industries": [
-                {
-                  "name": "Multi-Family Residential REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of apartments and other multi-family housing, including student housing."
-                },
-                {
-                  "name": "Single-Family Residential REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of single-family residential housing, including manufactured homes."
-                }
-              ]
-            },
-            {
-              "name": "Retail REITs",
-              "Sub-Industries": [
-                {
-                  "name": "Retail REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of shopping malls, outlet malls, neighborhood and community shopping centers."
-                }
-              ]
-            },
-            {
-              "name": "Specialized REITs",
-              "Sub-Industries": [
-                {
-                  "name": "Other Specialized REITs* (New Name/ New Code/Definition Update)",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of properties not classified elsewhere.\n\nThis Sub-Industry includes REITs that manage and own properties such as natural gas and crude oil pipelines, gas stations, fiber optic cables, prisons, automobile parking, and automobile dealerships."
-                },
-                {
-                  "name": "Self-Storage REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of self storage properties."
-                },
-                {
-                  "name": "Telecom Tower REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of telecom towers and related structures that support wireless telecommunications."
-                },
-                {
-                  "name": "Timber REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of timberland and timber-related properties."
-                },
-                {
-                  "name": "Data Center REITs*",
-                  "description": "Companies or Trusts engaged in the acquisition, development, ownership, leasing, management and operation of data center properties."
-                }
-              ]
-            }
-          ]
-        },
-        {
-          "name": "Real Estate Management & Development",
-          "Industries": [
-            {
-              "name": "Real Estate Management & Development",
-              "Sub-Industries": [
-                {
-                  "name": "Diversified Real Estate Activities",
-                  "description": "Companies engaged in a diverse spectrum of real estate activities including real estate development & sales, real estate management, or real estate services, but with no dominant business line."
-                },
-                {
-                  "name": "Real Estate Operating Companies",
-                  "description": "Companies engaged in operating real estate properties for the purpose of leasing & management, including real estate property managers."
-                },
-                {
-                  "name": "Real Estate Development",
-                  "description": "Companies that develop real estate and sell the properties after development, including developers of active senior communities.\n\nThis Sub-Industry excludes companies classified in the Homebuilding Sub-Industry."
-                },
-                {
-                  "name": "Real Estate Services",
-                  "description":"Real estate service providers such as real estate agents, brokers, real estate appraisers and other real estate related services. This Sub-Industry includes providers of real estate information, analytics, data and tools. This Sub-Industry excludes online real estate platforms that offer mainly information and earn revenue from pay-per-click advertising classified in the Interactive Media & Services Sub-Industry."
-                }
-              ]
-            }
-          ]
-        }
-      ]
-    }
-  ]
-}
\ No newline at end of file
+GICS_LEVELS = ("sector", "industry_group", "industry", "sub_industry")
+
+class GICSPath(NamedTuple):
+    """Full classification path of a sub-industry."""
+    sector: str
+    industry_group: str
+    industry: str
+    sub_industry: str
+    description: Optional[str]
+
+class GICSNode(NamedTuple):
+    """A coded node of the GICS hierarchy."""
+    id: str
+    level: str
+    name: str
+    description: Optional[str]
+    parent_id: Optional[str]
+
+@lru_cache(maxsize=None)
+def load_gics_data(name: str) -> Dict[str, Any]:
+    """
+    Loads one of the GICS data files by its module-level name.
+
+    Args:
+        name (str): A key of GICS_DATA_FILES, e.g. 'GICS_CLASSIFICATION_SCHEMA'.
+
+    Returns:
+        Dict[str, Any]: The parsed data, shared by every caller. Do not mutate it.
+
+    Raises:
+        KeyError: If the name is unknown.
+    """
+    with open(os.path.join(DATA_DIR, GICS_DATA_FILES[name]), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def get_gics_classification_schema() -> Dict[str, Any]:
+    """
+    Returns the GICS hierarchy used to classify companies.
+    """
+    return load_gics_data("GICS_CLASSIFICATION_SCHEMA")
+
+def normalize_gics_name(name: str) -> str:
+    """
+    Normalizes a GICS name for lookups: lower case, without the '*' markers and
+    parenthesized revision notes used in the classification data.
+    """
+    name = re.sub(r"\(.*?\)", "", name or "").replace("*", "")
+    return " ".join(name.lower().split())
+
+class GICSTaxonomy:
+    """
+    Flat indexes over the GICS data for O(1) lookups:
+
+    - `sub_industries`: normalized sub-industry name -> GICSPath, from the classification schema.
+    - `nodes`: GICS id -> GICSNode, from the coded schema.
+    """
+
+    def __init__(self, classification_schema: Dict[str, Any], coded_schema: Dict[str, Any]):
+        self.sub_industries: Dict[str, GICSPath] = {}
+        self.nodes: Dict[str, GICSNode] = {}
+
+        for sector in classification_schema.get("Sectors", []):
+            for industry_group in sector.get("Industry Groups", []):
+                for industry in industry_group.get("Industries", []):
+                    for sub_industry in industry.get("Sub-Industries", []):
+                        path = GICSPath(
+                            sector=sector["name"],
+                            industry_group=industry_group["name"],
+                            industry=industry["name"],
+                            sub_industry=sub_industry["name"],
+                            description=sub_industry.get("description")
+                        )
+                        self.sub_industries[normalize_gics_name(sub_industry["name"])] = path
+
+        child_keys = ("industry groups", "industries", "sub-industries")
+        def index(nodes: List[Dict[str, Any]], depth: int, parent_id: Optional[str]) -> None:
+            for node in nodes:
+                self.nodes[node["id"]] = GICSNode(
+                    id=node["id"],
+                    level=GICS_LEVELS[depth],
+                    name=node["name"],
+                    description=node.get("description"),
+                    parent_id=parent_id
+                )
+                if depth < len(child_keys):
+                    index(node.get(child_keys[depth], []), depth + 1, node["id"])
+
+        index(coded_schema.get("sectors", []), 0, None)
+
+    def find_sub_industry(self, name: str) -> Optional[GICSPath]:
+        """Returns the classification path of a sub-industry, or None if it is unknown."""
+        return self.sub_industries.get(normalize_gics_name(name))
+
+    def get_node(self, gics_id: str) -> Optional[GICSNode]:
+        """Returns the node with the given GICS id, or None if it is unknown."""
+        return self.nodes.get(str(gics_id))
+
+    def lineage(self, gics_id: str) -> List[GICSNode]:
+        """Returns the nodes from the sector down to the given id (empty if unknown)."""
+        lineage = []
+        node = self.get_node(gics_id)
+        while node:
+            lineage.append(node)
+            node = self.nodes.get(node.parent_id) if node.parent_id else None
+        return lineage[::-1]
+
+@lru_cache(maxsize=1)
+def get_gics_taxonomy() -> GICSTaxonomy:
+    """
+    Returns the process-wide GICS indexes, built on first use.
+    """
+    return GICSTaxonomy(get_gics_classification_schema(), load_gics_data("GICS_SCHEMA"))
+
+def __getattr__(name: str) -> Dict[str, Any]:
+    # Keeps `from ...gics_schema import GICS_CLASSIFICATION_SCHEMA` working without
+    # evaluating the data at import time.
+    if name in GICS_DATA_FILES:
+        return load_gics_data(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
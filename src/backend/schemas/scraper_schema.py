@@ -24,7 +24,9 @@ class CompanyMetadata(BaseModel):
     country: str = Field(..., description="Country of the company`s headquarters.")
     region: str = Field(..., description="Geographic region (e.g., 'North America', 'Europe', 'Asia-Pacific').")
 
+class PeerCompany(CompanyMetadata):
+    company_official_website: str = Field(..., description="Official website URL, or 'unknown'.")
+
 class PeersMetadata(BaseModel):
-    peers_metadata: List[CompanyMetadata] = Field(
-        ..., description="List of peer companies metadata"
-    )
+    country_peers: List[PeerCompany] = Field(..., description="Peers headquartered in the same country.")
+    region_peers: List[PeerCompany] = Field(..., description="Peers headquartered in the same region, outside the country.")
@@ -0,0 +1,298 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Optional
+
+from pymongo.collection import Collection
+from pymongo.errors import PyMongoError
+
+from src.backend.utils.logger import get_logger
+
+logger = get_logger()
+
+class CacheBackend(ABC):
+    """
+    Minimal key/value cache interface shared by the in-memory, disk and MongoDB backends.
+
+    Values must be JSON-serializable so every backend can store them. Backends log and
+    swallow their own storage errors: a failing cache behaves like a cache miss.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, clock: Callable[[], float] = time.time):
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+
+    def _expires_at(self, ttl_seconds: Optional[float]) -> Optional[float]:
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        return self.clock() + ttl_seconds if ttl_seconds else None
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value, or None on a miss or expired entry."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Stores a value, overriding the backend TTL if `ttl_seconds` is given."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Removes a value if present."""
+        raise NotImplementedError
+
+class InMemoryLRUCache(CacheBackend):
+    """
+    Thread-safe, process-local LRU cache with optional TTL.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: Optional[float] = None, clock: Callable[[], float] = time.time):
+        super().__init__(ttl_seconds, clock)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self.clock():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = (self._expires_at(ttl_seconds), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+class DiskCache(CacheBackend):
+    """
+    Stores one JSON file per key under `directory`, evicting the least recently
+    written files once more than `max_entries` are stored.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 1024, ttl_seconds: Optional[float] = None, clock: Callable[[], float] = time.time):
+        super().__init__(ttl_seconds, clock)
+        self.directory = directory
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to read disk cache entry '{path}': {e}")
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= self.clock():
+            self.delete(key)
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "expires_at": self._expires_at(ttl_seconds), "value": value}, f)
+            os.replace(tmp_path, path)
+            self._evict()
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Failed to write disk cache entry '{path}': {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to delete disk cache entry for key '{key}': {e}")
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = [
+                entry for entry in os.scandir(self.directory)
+                if entry.is_file() and entry.name.endswith(".json")
+            ]
+            if len(entries) <= self.max_entries:
+                return
+
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:len(entries) - self.max_entries]:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+class MongoCache(CacheBackend):
+    """
+    Stores cache entries as MongoDB documents. Expired documents are ignored on read
+    and removed by a TTL index on `expires_at`.
+    """
+
+    def __init__(self, collection: Collection, ttl_seconds: Optional[float] = None, clock: Callable[[], float] = time.time):
+        super().__init__(ttl_seconds, clock)
+        self.collection = collection
+        self._index_ready = False
+
+    def _ensure_index(self) -> None:
+        if self._index_ready:
+            return
+        self.collection.create_index("expires_at", expireAfterSeconds=0)
+        self._index_ready = True
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            document = self.collection.find_one({"_id": key})
+        except PyMongoError as e:
+            logger.error(f"Failed to read cache entry '{key}' from MongoDB: {e}")
+            return None
+
+        if not document:
+            return None
+
+        expires_at = document.get("expires_at")
+        if expires_at is not None:
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            if expires_at.timestamp() <= self.clock():
+                return None
+        return document.get("value")
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        expires_at = self._expires_at(ttl_seconds)
+        try:
+            self._ensure_index()
+            self.collection.replace_one(
+                {"_id": key},
+                {
+                    "_id": key,
+                    "value": value,
+                    "expires_at": datetime.fromtimestamp(expires_at, tz=timezone.utc) if expires_at else None,
+                    "updated_at": datetime.now(timezone.utc)
+                },
+                upsert=True
+            )
+        except PyMongoError as e:
+            logger.error(f"Failed to write cache entry '{key}' to MongoDB: {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self.collection.delete_one({"_id": key})
+        except PyMongoError as e:
+            logger.error(f"Failed to delete cache entry '{key}' from MongoDB: {e}")
+
+class TieredCache(CacheBackend):
+    """
+    Chains cache layers from fastest to slowest, e.g. an in-process LRU in front of
+    MongoDB. Reads stop at the first layer that has the key and copy the value into
+    the faster layers in front of it; writes and deletes go to every layer.
+    """
+
+    def __init__(self, layers: List[CacheBackend]):
+        super().__init__()
+        self.layers = layers
+
+    def get(self, key: str) -> Optional[Any]:
+        for position, layer in enumerate(self.layers):
+            value = layer.get(key)
+            if value is not None:
+                for faster_layer in self.layers[:position]:
+                    faster_layer.set(key, value)
+                return value
+        return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        for layer in self.layers:
+            layer.set(key, value, ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        for layer in self.layers:
+            layer.delete(key)
+
+def create_cache(
+    backend: str,
+    max_entries: int = 256,
+    ttl_seconds: Optional[float] = None,
+    directory: Optional[str] = None,
+    collection: Optional[Collection] = None
+) -> Optional[CacheBackend]:
+    """
+    Creates a cache backend by name.
+
+    Args:
+        backend (str): 'memory', 'disk', 'mongo' or 'none'.
+        max_entries (int): Size bound for the memory and disk backends.
+        ttl_seconds (float, optional): Entry lifetime; None keeps entries until evicted.
+        directory (str, optional): Directory used by the disk backend.
+        collection (Collection, optional): Collection used by the MongoDB backend.
+
+    Returns:
+        Optional[CacheBackend]: The cache, or None if caching is disabled.
+
+    Raises:
+        ValueError: If the backend is unsupported or its storage location is missing.
+    """
+    backend = backend.lower()
+
+    if backend == "memory":
+        return InMemoryLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    elif backend == "disk":
+        if not directory:
+            raise ValueError("The disk cache backend requires a directory.")
+        return DiskCache(directory, max_entries=max_entries, ttl_seconds=ttl_seconds)
+    elif backend == "mongo":
+        if collection is None:
+            raise ValueError("The mongo cache backend requires a collection.")
+        return MongoCache(collection, ttl_seconds=ttl_seconds)
+    elif backend == "none":
+        return None
+    else:
+        raise ValueError(f"Unsupported cache backend: {backend}")
+
+def create_tiered_cache(
+    backend: str,
+    max_entries: int = 256,
+    ttl_seconds: Optional[float] = None,
+    collection: Optional[Collection] = None
+) -> Optional[CacheBackend]:
+    """
+    Creates a cache backend by name, fronting the 'mongo' backend with an in-process
+    LRU of `max_entries` so repeated lookups skip the database round trip.
+
+    Returns:
+        Optional[CacheBackend]: The cache, or None if caching is disabled.
+    """
+    if backend.lower() == "mongo":
+        return TieredCache([
+            InMemoryLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds),
+            create_cache("mongo", ttl_seconds=ttl_seconds, collection=collection)
+        ])
+    return create_cache(backend, max_entries=max_entries, ttl_seconds=ttl_seconds)
+
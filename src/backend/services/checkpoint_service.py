@@ -0,0 +1,160 @@
+import os
+import json
+import shutil
+import hashlib
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from pymongo.collection import Collection
+from pymongo.errors import PyMongoError
+
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+
+logger = get_logger()
+
+def checkpoint_key(name: str, schema_sha256: str, prompt: str, model: str) -> str:
+    """
+    Returns the name a section is checkpointed under: `name` followed by a fingerprint of
+    the section's JSON schema, the extractor prompt and the model. A section checkpointed
+    before any of them changed is then requested again instead of being reused.
+
+    Args:
+        name (str): Schema name of the section, or its window key in map-reduce extraction.
+        schema_sha256 (str): SHA-256 of the section's JSON schema.
+        prompt (str): Extractor prompt the section is requested with.
+        model (str): Model the section is extracted by.
+    """
+    fingerprint_json = json.dumps({
+        "schema_sha256": schema_sha256,
+        "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        "model": model,
+    }, sort_keys=True)
+    return f"{name}.{hashlib.sha256(fingerprint_json.encode('utf-8')).hexdigest()[:16]}"
+
+class CheckpointStore(ABC):
+    """
+    Stores successfully extracted schema sections keyed by file hash and checkpoint key
+    (see `checkpoint_key`), so an interrupted extraction only re-requests the sections
+    that are still missing.
+    """
+
+    @abstractmethod
+    def load(self, file_hash: str) -> Dict[str, Dict[str, Any]]:
+        """Returns all stored sections for a file as {checkpoint_key: section}."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, file_hash: str, key: str, section: Dict[str, Any]) -> None:
+        """Stores a single extracted section."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, file_hash: str) -> None:
+        """Removes every stored section for a file."""
+        raise NotImplementedError
+
+class LocalCheckpointStore(CheckpointStore):
+    """
+    Keeps checkpoints as JSON files under `<directory>/<file_hash>/<checkpoint_key>.json`.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _file_dir(self, file_hash: str) -> str:
+        return os.path.join(self.directory, file_hash)
+
+    def load(self, file_hash: str) -> Dict[str, Dict[str, Any]]:
+        file_dir = self._file_dir(file_hash)
+        if not os.path.isdir(file_dir):
+            return {}
+
+        sections = {}
+        for entry in sorted(os.listdir(file_dir)):
+            if not entry.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(file_dir, entry), "r", encoding="utf-8") as f:
+                    sections[entry[:-len(".json")]] = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error(f"Ignoring unreadable checkpoint '{entry}' for file {file_hash}: {e}")
+        return sections
+
+    def save(self, file_hash: str, key: str, section: Dict[str, Any]) -> None:
+        file_dir = self._file_dir(file_hash)
+        os.makedirs(file_dir, exist_ok=True)
+
+        path = os.path.join(file_dir, f"{key}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(section, f)
+        os.replace(tmp_path, path)
+
+    def clear(self, file_hash: str) -> None:
+        shutil.rmtree(self._file_dir(file_hash), ignore_errors=True)
+
+class MongoCheckpointStore(CheckpointStore):
+    """
+    Keeps checkpoints as one MongoDB document per (file_hash, checkpoint_key).
+    """
+
+    def __init__(self, collection: Collection):
+        self.collection = collection
+
+    def load(self, file_hash: str) -> Dict[str, Dict[str, Any]]:
+        documents = self.collection.find({"file_hash": file_hash})
+        return {
+            document["checkpoint_key"]: document["section"]
+            for document in documents if "checkpoint_key" in document
+        }
+
+    def save(self, file_hash: str, key: str, section: Dict[str, Any]) -> None:
+        self.collection.update_one(
+            {"_id": f"{file_hash}:{key}"},
+            {"$set": {
+                "file_hash": file_hash,
+                "checkpoint_key": key,
+                "section": section,
+                "updated_at": datetime.now(timezone.utc)
+            }},
+            upsert=True
+        )
+
+    def clear(self, file_hash: str) -> None:
+        self.collection.delete_many({"file_hash": file_hash})
+
+def get_checkpoint_store(backend: Optional[str] = None) -> Optional[CheckpointStore]:
+    """
+    Returns the checkpoint store configured by EXTRACTION_CHECKPOINT_BACKEND.
+
+    Args:
+        backend (str, optional): 'local', 'mongo' or 'none'. Defaults to the configured backend.
+
+    Returns:
+        Optional[CheckpointStore]: The store, or None if checkpointing is disabled.
+
+    Raises:
+        ValueError: If the backend is not supported.
+    """
+    backend = (backend or config.EXTRACTION_CHECKPOINT_BACKEND).lower()
+
+    if backend == "local":
+        return LocalCheckpointStore(config.EXTRACTION_CHECKPOINT_DIR)
+    elif backend == "mongo":
+        return MongoCheckpointStore(config.EXTRACTION_CHECKPOINT_COLLECTION)
+    elif backend == "none":
+        return None
+    else:
+        raise ValueError(f"Unsupported checkpoint backend: {backend}")
+
+def safe_save_checkpoint(store: CheckpointStore, file_hash: str, key: str, section: Dict[str, Any]) -> None:
+    """
+    Saves a checkpoint, logging instead of raising so a storage failure never aborts an extraction.
+    """
+    try:
+        store.save(file_hash, key, section)
+        logger.info(f"Checkpointed '{key}' for file {file_hash}")
+    except (OSError, PyMongoError) as e:
+        logger.error(f"Failed to checkpoint '{key}' for file {file_hash}: {e}")
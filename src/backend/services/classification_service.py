@@ -0,0 +1,121 @@
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from src.backend.utils.logger import get_logger
+from src.backend.utils.bm25 import BM25Index
+from src.backend.config.config import config
+from src.backend.schemas.gics_schema import (
+    GICSPath, get_gics_classification_schema, get_gics_taxonomy, normalize_gics_name
+)
+
+logger = get_logger()
+
+class GICSCandidate(NamedTuple):
+    """A sub-industry ranked against a company's web content."""
+    path: GICSPath
+    score: float
+
+@lru_cache(maxsize=1)
+def get_sub_industry_index() -> Tuple[List[GICSPath], BM25Index]:
+    """
+    Returns the sub-industry paths and a BM25 index over their names and definitions,
+    built on first use.
+    """
+    paths = list(get_gics_taxonomy().sub_industries.values())
+    documents = [
+        " ".join(filter(None, (path.sector, path.industry_group, path.industry, path.sub_industry, path.description)))
+        for path in paths
+    ]
+    return paths, BM25Index(documents)
+
+def rank_sub_industries(content: List[str], k: int) -> List[GICSCandidate]:
+    """
+    Scores every GICS sub-industry against the company content and returns the best `k`.
+
+    Args:
+        content (List[str]): Text snippets describing the company (e.g. Tavily results).
+        k (int): Number of candidates to return.
+
+    Returns:
+        List[GICSCandidate]: Candidates with a positive score, best first.
+    """
+    paths, index = get_sub_industry_index()
+    return [GICSCandidate(paths[position], score) for position, score in index.top_k(" ".join(content), k)]
+
+def select_sub_industry_candidates(
+    content: List[str],
+    top_k: Optional[int] = None,
+    confident_margin: Optional[float] = None
+) -> List[GICSCandidate]:
+    """
+    Picks the sub-industries worth showing to the classification LLM.
+
+    Returns the top `top_k` candidates, or only the best one when it leads the
+    runner-up by at least `confident_margin` (relative to its own score).
+
+    Args:
+        content (List[str]): Text snippets describing the company.
+        top_k (int, optional): Defaults to `config.GICS_PREFILTER_TOP_K`.
+        confident_margin (float, optional): Defaults to `config.GICS_CONFIDENT_MARGIN`.
+
+    Returns:
+        List[GICSCandidate]: Selected candidates, best first (empty if nothing matched).
+    """
+    top_k = config.GICS_PREFILTER_TOP_K if top_k is None else top_k
+    confident_margin = config.GICS_CONFIDENT_MARGIN if confident_margin is None else confident_margin
+
+    candidates = rank_sub_industries(content, top_k)
+    if len(candidates) > 1 and confident_margin:
+        best, runner_up = candidates[0].score, candidates[1].score
+        if (best - runner_up) / best >= confident_margin:
+            return candidates[:1]
+    return candidates
+
+def build_gics_subset(sub_industries: List[str]) -> Dict[str, Any]:
+    """
+    Returns the classification schema pruned to the given sub-industries, keeping the
+    original nesting and order so it renders like the full schema in prompts.
+    """
+    wanted = {normalize_gics_name(name) for name in sub_industries}
+    sectors = []
+    for sector in get_gics_classification_schema().get("Sectors", []):
+        industry_groups = []
+        for industry_group in sector.get("Industry Groups", []):
+            industries = []
+            for industry in industry_group.get("Industries", []):
+                kept = [
+                    sub_industry for sub_industry in industry.get("Sub-Industries", [])
+                    if normalize_gics_name(sub_industry["name"]) in wanted
+                ]
+                if kept:
+                    industries.append({**industry, "Sub-Industries": kept})
+            if industries:
+                industry_groups.append({**industry_group, "Industries": industries})
+        if industry_groups:
+            sectors.append({**sector, "Industry Groups": industry_groups})
+    return {"Sectors": sectors}
+
+def classification_schema_for(content: List[str]) -> Dict[str, Any]:
+    """
+    Returns the GICS schema to send with a classification prompt: the subset of
+    sub-industries that match the content, or the full schema if pre-filtering is
+    disabled (`GICS_PREFILTER_TOP_K=0`) or nothing matched.
+
+    Args:
+        content (List[str]): Text snippets describing the company.
+
+    Returns:
+        Dict[str, Any]: A schema in the shape of GICS_CLASSIFICATION_SCHEMA.
+    """
+    if config.GICS_PREFILTER_TOP_K <= 0:
+        return get_gics_classification_schema()
+
+    candidates = select_sub_industry_candidates(content)
+    if not candidates:
+        logger.info("No GICS sub-industry matched the company content; using the full schema.")
+        return get_gics_classification_schema()
+
+    logger.info(
+        "GICS candidates: " + ", ".join(f"{c.path.sub_industry} ({c.score:.2f})" for c in candidates)
+    )
+    return build_gics_subset([candidate.path.sub_industry for candidate in candidates])
@@ -0,0 +1,204 @@
+import re
+import asyncio
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from src.backend.utils.logger import get_logger
+from src.backend.utils.rate_limiter import get_rate_limiter
+from src.backend.utils.system_prompts import build_company_classification_prompt
+from src.backend.config.config import config
+from src.backend.schemas.scraper_schema import CompanyMetadata
+from src.backend.services.mongo_db_service import slugify_company
+from src.backend.services.cache_service import CacheBackend, create_tiered_cache
+from src.backend.services.tavily_service import fetch_info_from_tavily, fetch_info_from_tavily_async
+from src.backend.services.classification_service import classification_schema_for
+from src.backend.services.openai_service import get_openai_client, get_async_openai_client
+
+logger = get_logger()
+
+# Trailing legal-form tokens ignored when matching company names ("Zalando SE" -> "zalando").
+LEGAL_SUFFIXES = frozenset({
+    "ab", "ag", "asa", "bv", "co", "company", "corp", "corporation", "gmbh", "inc",
+    "incorporated", "kgaa", "limited", "llc", "lp", "ltd", "nv", "oyj", "plc", "sa",
+    "sas", "se", "spa",
+})
+
+def normalize_company_name(name: str) -> str:
+    """
+    Normalizes a company name for cache lookups: drops punctuation and trailing legal
+    forms, then slugifies it with `slugify_company`.
+
+    Examples:
+        "Zalando SE" -> "zalando", "Tesla, Inc." -> "tesla"
+    """
+    tokens = re.sub(r"[^\w&\- ]+", " ", name or "").split()
+    while len(tokens) > 1 and tokens[-1].lower() in LEGAL_SUFFIXES:
+        tokens.pop()
+    return slugify_company(" ".join(tokens))
+
+def company_metadata_key(name: str) -> str:
+    """
+    Returns the cache key for a company name.
+    """
+    return f"company_metadata:{normalize_company_name(name)}"
+
+class CompanyMetadataCache:
+    """
+    Caches CompanyMetadata by normalized company name.
+
+    An entry is stored under the key of the legal name returned by the classifier, and
+    the name that was asked for is recorded as an alias pointing to it, so "Zalando"
+    and "Zalando SE" resolve to the same metadata.
+    """
+
+    def __init__(self, cache: CacheBackend):
+        self.cache = cache
+
+    def get(self, company_name: str) -> Optional[CompanyMetadata]:
+        """
+        Returns the cached metadata for a company, or None on a miss.
+        """
+        entry = self.cache.get(company_metadata_key(company_name))
+        if entry and entry.get("alias_of"):
+            entry = self.cache.get(entry["alias_of"])
+        if not entry or "metadata" not in entry:
+            return None
+
+        try:
+            return CompanyMetadata(**entry["metadata"])
+        except ValidationError as e:
+            logger.warning(f"Ignoring stale cached metadata for '{company_name}': {e}")
+            return None
+
+    def set(self, company_name: str, metadata: CompanyMetadata) -> None:
+        """
+        Caches metadata under its legal name and `company_name` as an alias.
+        """
+        canonical_key = company_metadata_key(metadata.company_name)
+        alias_key = company_metadata_key(company_name)
+
+        entry: Dict[str, Any] = {"metadata": metadata.model_dump()}
+        self.cache.set(canonical_key, entry)
+        if alias_key != canonical_key:
+            self.cache.set(alias_key, {"alias_of": canonical_key})
+
+    def delete(self, company_name: str) -> None:
+        """
+        Removes a company's alias entry and the metadata it points to.
+        """
+        key = company_metadata_key(company_name)
+        entry = self.cache.get(key)
+        if entry and entry.get("alias_of"):
+            self.cache.delete(entry["alias_of"])
+        self.cache.delete(key)
+
+@lru_cache(maxsize=1)
+def get_company_metadata_cache() -> Optional[CompanyMetadataCache]:
+    """
+    Returns the process-wide company metadata cache configured by
+    COMPANY_METADATA_CACHE_BACKEND. The 'mongo' backend is fronted by an in-process LRU.
+
+    Returns:
+        Optional[CompanyMetadataCache]: The cache, or None if caching is disabled.
+    """
+    backend = config.COMPANY_METADATA_CACHE_BACKEND
+    cache = create_tiered_cache(
+        backend,
+        max_entries=config.COMPANY_METADATA_CACHE_MAX_ENTRIES,
+        ttl_seconds=config.COMPANY_METADATA_CACHE_TTL_SECONDS,
+        collection=config.COMPANY_METADATA_COLLECTION if backend.lower() == "mongo" else None
+    )
+    return CompanyMetadataCache(cache) if cache else None
+
+def company_description_query(company_name: str) -> str:
+    """Returns the Tavily query used to describe a company before classifying it."""
+    return f"What does {company_name} do and where is it located?"
+
+def classification_content(company_name: str, response: Dict[str, Any]) -> Optional[List[str]]:
+    """
+    Returns the result snippets of a company description search, or None if there are none.
+    """
+    if not response or 'results' not in response:
+        logger.error(f"No results found for company: '{company_name}'")
+        return None
+
+    content = [res.get("content") for res in response['results'] if res.get("content")]
+    if not content:
+        logger.error(f"No usable content found to classify company: '{company_name}'")
+        return None
+    return content
+
+def classification_request(company_name: str, content: List[str]) -> Dict[str, Any]:
+    """
+    Returns the `responses.parse` arguments classifying a company from web snippets.
+    """
+    logger.info(f"Building classification prompt for company: '{company_name}'")
+    return {
+        "model": config.OPENAI_PEERS_TOOL_MODEL,
+        "input": build_company_classification_prompt(content, classification_schema_for(content)),
+        "text_format": CompanyMetadata,
+        "temperature": 0,
+    }
+
+def classify_company(company_name: str) -> Optional[CompanyMetadata]:
+    """
+    Classifies a company into the GICS taxonomy from web search results, using the
+    company metadata cache when the company (or an alias of it) was classified before.
+
+    Args:
+        company_name (str): Name of the company to classify.
+
+    Returns:
+        Optional[CompanyMetadata]: The classification, or None if no usable content was found.
+
+    Raises:
+        Exception: If the OpenAI request fails.
+    """
+    metadata_cache = get_company_metadata_cache()
+    if metadata_cache:
+        cached_metadata = metadata_cache.get(company_name)
+        if cached_metadata:
+            logger.info(f"Using cached metadata for company: '{company_name}'")
+            return cached_metadata
+
+    content = classification_content(company_name, fetch_info_from_tavily(query=company_description_query(company_name)))
+    if not content:
+        return None
+
+    with get_rate_limiter("openai").limit(tokens=config.OPENAI_ESTIMATED_TOKENS_PER_REQUEST) as reservation:
+        completion = get_openai_client().responses.parse(**classification_request(company_name, content))
+        if completion.usage:
+            reservation.record_usage(completion.usage.total_tokens)
+
+    metadata = completion.output_parsed
+    if metadata and metadata_cache:
+        metadata_cache.set(company_name, metadata)
+    return metadata
+
+async def classify_company_async(company_name: str) -> Optional[CompanyMetadata]:
+    """
+    Async counterpart of `classify_company`. Cache reads and writes run in a worker thread.
+    """
+    metadata_cache = get_company_metadata_cache()
+    if metadata_cache:
+        cached_metadata = await asyncio.to_thread(metadata_cache.get, company_name)
+        if cached_metadata:
+            logger.info(f"Using cached metadata for company: '{company_name}'")
+            return cached_metadata
+
+    response = await fetch_info_from_tavily_async(query=company_description_query(company_name))
+    content = classification_content(company_name, response)
+    if not content:
+        return None
+
+    async with get_rate_limiter("openai").limit_async(tokens=config.OPENAI_ESTIMATED_TOKENS_PER_REQUEST) as reservation:
+        completion = await get_async_openai_client().responses.parse(**classification_request(company_name, content))
+        if completion.usage:
+            reservation.record_usage(completion.usage.total_tokens)
+
+    metadata = completion.output_parsed
+    if metadata and metadata_cache:
+        await asyncio.to_thread(metadata_cache.set, company_name, metadata)
+    return metadata
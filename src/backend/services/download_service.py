@@ -0,0 +1,263 @@
+import asyncio
+import hashlib
+import tempfile
+import threading
+from typing import BinaryIO, Dict, Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.backend.utils.logger import get_logger
+from src.backend.utils.async_utils import loop_local
+from src.backend.config.config import config
+from src.backend.services.cache_service import InMemoryLRUCache
+
+logger = get_logger()
+
+DOWNLOAD_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+PDF_MAGIC = b"%PDF-"
+# The PDF spec tolerates leading bytes before the header; readers accept it within the first 1 KB.
+PDF_MAGIC_WINDOW = 1024
+CHUNK_SIZE = 1024 * 1024
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# url -> {"etag", "last_modified", "sha256"} of the last successful download.
+_validators = InMemoryLRUCache(max_entries=1024)
+
+class DownloadError(Exception):
+    """Raised when a report cannot be downloaded or is not an acceptable PDF."""
+    pass
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the process-wide HTTP session used for report downloads.
+
+    The session keeps connections alive per host (HTTP_POOL_CONNECTIONS hosts,
+    HTTP_POOL_MAXSIZE connections each) and retries 429/5xx responses and connection
+    errors with exponential backoff, honouring Retry-After.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=config.HTTP_MAX_RETRIES,
+                    backoff_factor=config.HTTP_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    allowed_methods=("GET", "HEAD"),
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=config.HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=config.HTTP_POOL_MAXSIZE,
+                    max_retries=retry
+                )
+                session = requests.Session()
+                session.headers.update(DOWNLOAD_HEADERS)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+                logger.info("HTTP session for report downloads initialized.")
+    return _session
+
+class PDFSpool:
+    """
+    Accumulates a PDF body chunk by chunk into a spooled temporary file, hashing it
+    and enforcing the size limit and the PDF signature as the bytes arrive. Shared by
+    the sync and async downloads.
+    """
+
+    def __init__(self, url: str, max_bytes: int = None):
+        self.url = url
+        self.max_bytes = max_bytes or config.DOWNLOAD_MAX_BYTES
+        self.file = tempfile.SpooledTemporaryFile(max_size=config.DOWNLOAD_SPOOL_MAX_MEMORY_BYTES)
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._head = b""
+
+    def check_content_length(self, content_length: Optional[str]) -> None:
+        """Rejects a response whose declared size already exceeds the limit."""
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            raise DownloadError(f"Report at '{self.url}' is {int(content_length)} bytes; the limit is {self.max_bytes} bytes.")
+
+    def write(self, chunk: bytes) -> None:
+        """
+        Appends a chunk of the body.
+
+        Raises:
+            DownloadError: As soon as the body exceeds the limit or is evidently not a PDF.
+        """
+        if not chunk:
+            return
+
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise DownloadError(f"Report at '{self.url}' exceeds the {self.max_bytes} byte limit.")
+
+        if len(self._head) < PDF_MAGIC_WINDOW:
+            self._head += chunk[:PDF_MAGIC_WINDOW - len(self._head)]
+            if len(self._head) >= PDF_MAGIC_WINDOW and PDF_MAGIC not in self._head:
+                raise DownloadError(f"Content at '{self.url}' is not a PDF.")
+
+        self._digest.update(chunk)
+        self.file.write(chunk)
+
+    def finish(self, etag: Optional[str], last_modified: Optional[str]) -> Tuple[BinaryIO, str]:
+        """
+        Validates the complete body, records the URL's cache validators and rewinds the file.
+
+        Returns:
+            Tuple[BinaryIO, str]: The spooled file and the hex SHA-256 of its content.
+        """
+        if PDF_MAGIC not in self._head:
+            raise DownloadError(f"Content at '{self.url}' is not a PDF.")
+
+        self.file.seek(0)
+        file_hash = self._digest.hexdigest()
+        if etag or last_modified:
+            _validators.set(self.url, {"etag": etag, "last_modified": last_modified, "sha256": file_hash})
+
+        logger.info(f"Downloaded {self.size} bytes from '{self.url}'")
+        return self.file, file_hash
+
+def conditional_headers(url: str, conditional: bool) -> Tuple[Dict[str, str], Optional[Dict[str, str]]]:
+    """
+    Returns the revalidation headers for a URL downloaded before, and its stored validators.
+    """
+    headers = {}
+    validators = _validators.get(url) if conditional else None
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers, validators
+
+def download_pdf(url: str, conditional: bool = False) -> Tuple[Optional[BinaryIO], str]:
+    """
+    Streams a PDF from a URL into a spooled temporary file, hashing it on the way.
+
+    The body is kept in memory up to DOWNLOAD_SPOOL_MAX_MEMORY_BYTES and spilled to
+    disk beyond that, so concurrent downloads of large reports do not grow the process
+    RSS. The download is aborted as soon as the size exceeds DOWNLOAD_MAX_BYTES or the
+    first bytes show that the body is not a PDF (e.g. an HTML error page).
+
+    With `conditional=True`, a URL that was downloaded before is requested with its
+    ETag / Last-Modified validators; if the server answers 304 Not Modified, no body is
+    transferred and the file is returned as None together with the known hash.
+
+    Args:
+        url (str): The report URL.
+        conditional (bool): Whether to revalidate a previous download instead of refetching it.
+
+    Returns:
+        Tuple[Optional[BinaryIO], str]: The spooled file, rewound to the start (None if
+        not modified), and the hex SHA-256 of its content. The caller is responsible
+        for closing the file.
+
+    Raises:
+        DownloadError: If the body is too large or not a PDF.
+        requests.RequestException: On connection errors, timeouts or HTTP error statuses.
+    """
+    timeout = (config.DOWNLOAD_CONNECT_TIMEOUT_SECONDS, config.DOWNLOAD_READ_TIMEOUT_SECONDS)
+    headers, validators = conditional_headers(url, conditional)
+
+    with get_http_session().get(url, headers=headers, stream=True, timeout=timeout) as response:
+        if response.status_code == 304 and validators:
+            logger.info(f"Report at '{url}' not modified since the last download")
+            return None, validators["sha256"]
+
+        response.raise_for_status()
+
+        spool = PDFSpool(url)
+        try:
+            spool.check_content_length(response.headers.get("Content-Length"))
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                spool.write(chunk)
+            return spool.finish(response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        except BaseException:
+            spool.file.close()
+            raise
+
+@loop_local
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Returns the HTTP client used for async report downloads on the running event loop.
+
+    Connection errors are retried by the transport; 429/5xx responses are retried by
+    `download_pdf_async` itself, mirroring the sync session.
+    """
+    client = httpx.AsyncClient(
+        headers=DOWNLOAD_HEADERS,
+        follow_redirects=True,
+        timeout=httpx.Timeout(config.DOWNLOAD_READ_TIMEOUT_SECONDS, connect=config.DOWNLOAD_CONNECT_TIMEOUT_SECONDS),
+        limits=httpx.Limits(
+            max_connections=config.HTTP_POOL_CONNECTIONS * config.HTTP_POOL_MAXSIZE,
+            max_keepalive_connections=config.HTTP_POOL_MAXSIZE
+        ),
+        transport=httpx.AsyncHTTPTransport(retries=config.HTTP_MAX_RETRIES)
+    )
+    logger.info("Async HTTP client for report downloads initialized.")
+    return client
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Returns the server's Retry-After in seconds, or an exponential backoff."""
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return config.HTTP_BACKOFF_FACTOR * (2 ** attempt)
+
+async def download_pdf_async(url: str, conditional: bool = False) -> Tuple[Optional[BinaryIO], str]:
+    """
+    Async counterpart of `download_pdf`, streaming the body with httpx.
+
+    Writes to the spooled file are synchronous; they only touch disk once a report
+    exceeds DOWNLOAD_SPOOL_MAX_MEMORY_BYTES.
+
+    Returns:
+        Tuple[Optional[BinaryIO], str]: The spooled file (None if not modified) and the
+        hex SHA-256 of its content. The caller is responsible for closing the file.
+
+    Raises:
+        DownloadError: If the body is too large or not a PDF.
+        httpx.HTTPError: On connection errors, timeouts or HTTP error statuses.
+    """
+    headers, validators = conditional_headers(url, conditional)
+    client = get_async_http_client()
+
+    for attempt in range(config.HTTP_MAX_RETRIES + 1):
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code in RETRY_STATUS_CODES and attempt < config.HTTP_MAX_RETRIES:
+                delay = _retry_delay(response, attempt)
+                logger.info(f"Download of '{url}' returned {response.status_code}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code == 304 and validators:
+                logger.info(f"Report at '{url}' not modified since the last download")
+                return None, validators["sha256"]
+
+            response.raise_for_status()
+
+            spool = PDFSpool(url)
+            try:
+                spool.check_content_length(response.headers.get("Content-Length"))
+                async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                    spool.write(chunk)
+                return spool.finish(response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            except BaseException:
+                spool.file.close()
+                raise
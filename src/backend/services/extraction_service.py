@@ -0,0 +1,1292 @@
+import json
+import asyncio
+import hashlib
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional, Tuple, Type, Union
+
+from google import genai
+from google.genai import types
+from pydantic import BaseModel, ValidationError
+from pymongo.errors import PyMongoError
+
+from src.backend.utils.logger import get_logger
+from src.backend.utils.rate_limiter import Reservation, get_rate_limiter
+from src.backend.utils.retry_policy import RetryPolicy, RetryBudget, MalformedResponseError, status_code_of
+from src.backend.config.config import config
+from src.backend.utils.system_prompts import EXTRACTOR_TOOL_PROMPT, EXTRACTOR_CACHED_REQUEST_PROMPT
+from src.backend.services.checkpoint_service import (
+    CheckpointStore, checkpoint_key, safe_save_checkpoint, get_checkpoint_store
+)
+from src.backend.services.gemini_service import (
+    get_gemini_client, open_file_input, upload_file,
+    open_file_input_async, upload_file_async,
+    context_cache, context_cache_async
+)
+from src.backend.services.cache_service import CacheBackend, create_cache
+from src.backend.services.schema_packing_service import (
+    output_size_stats, pack_schemas, packed_model, unpack_sections, split_group
+)
+from src.backend.services.page_routing_service import (
+    ReportPages, load_report_pages, page_routing_signature, upload_report_pages, upload_report_pages_async
+)
+from src.backend.services.map_reduce_service import (
+    PageWindow, ReportWindows, load_report_windows, map_reduce_signature, reduce_sections,
+    upload_window, upload_window_async, window_section_key
+)
+from src.backend.services.preflight_service import PAGE_ROUTE, REJECT, SPLIT, PreflightError, preflight_pdf
+from src.backend.schemas.esg_schema import (
+    ReportMetadata, EnvironmentalEmissionsEnergy, EnvironmentalWaterWaste, SocialTrainingAndCSR,
+    SocialWorkforceAndWellBeing, GovernanceEthicsAndComplaints, GovernanceStructureAndOpenness,
+    MaterialityAssessment
+)
+
+logger = get_logger()
+
+RESPONSE_SCHEMA = [
+    ReportMetadata,
+    EnvironmentalEmissionsEnergy,
+    EnvironmentalWaterWaste,
+    SocialTrainingAndCSR,
+    SocialWorkforceAndWellBeing,
+    GovernanceEthicsAndComplaints,
+    GovernanceStructureAndOpenness,
+    MaterialityAssessment
+]
+
+def new_token_usage() -> Dict[str, int]:
+    """
+    Returns an empty Gemini token usage counter.
+
+    `total_prompt_tokens` is the sum of `total_cached_prompt_tokens` (served from a
+    context cache, billed at the cached rate) and `total_uncached_prompt_tokens`.
+    """
+    return {
+        "total_prompt_tokens": 0,
+        "total_cached_prompt_tokens": 0,
+        "total_uncached_prompt_tokens": 0,
+        "total_output_tokens": 0,
+        "total_tokens": 0
+    }
+
+def add_token_usage(token_usage: Dict[str, int], other: Dict[str, int]) -> None:
+    """
+    Adds the counters of `other` into `token_usage` in place.
+    """
+    for key, value in other.items():
+        token_usage[key] = token_usage.get(key, 0) + (value or 0)
+
+def schema_name_of(schema: Type[BaseModel]) -> str:
+    """
+    Returns the name used to identify a schema section in logs and checkpoints.
+    """
+    return getattr(schema, "__name__", str(schema))
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(schema: Type[BaseModel]) -> str:
+    """
+    Returns a SHA-256 of the schema's JSON schema, so any field change invalidates cached results.
+    """
+    schema_json = json.dumps(schema.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema_json.encode("utf-8")).hexdigest()
+
+def extraction_cache_key(file_hash: str, schemas: Optional[List[Type[BaseModel]]] = None) -> str:
+    """
+    Builds the content-addressed cache key for an extraction result.
+
+    The key covers everything that determines the output: the report bytes, the Gemini
+    model, the extractor prompt and the JSON schema of every requested section, plus the
+    settings of the optional extraction paths that are enabled: the per-request prompt of
+    the context cache, schema packing, page routing and map-reduce.
+
+    Args:
+        file_hash (str): SHA-256 of the report bytes.
+        schemas (List[Type[BaseModel]], optional): Extracted sections. Defaults to RESPONSE_SCHEMA.
+
+    Returns:
+        str: The cache key.
+    """
+    schemas = schemas or RESPONSE_SCHEMA
+    key_parts = {
+        "file_sha256": file_hash,
+        "model": config.GEMINI_EXTRACTION_MODEL,
+        "prompt_sha256": hashlib.sha256(EXTRACTOR_TOOL_PROMPT.encode("utf-8")).hexdigest(),
+        "schemas": [[schema_name_of(schema), schema_fingerprint(schema)] for schema in schemas],
+    }
+    if config.GEMINI_CONTEXT_CACHE_ENABLED:
+        key_parts["cached_request_prompt_sha256"] = hashlib.sha256(
+            EXTRACTOR_CACHED_REQUEST_PROMPT.encode("utf-8")
+        ).hexdigest()
+    if config.SCHEMA_PACK_MAX_OUTPUT_TOKENS:
+        key_parts["schema_pack_max_output_tokens"] = config.SCHEMA_PACK_MAX_OUTPUT_TOKENS
+    routing = page_routing_signature()
+    if routing:
+        key_parts["page_routing"] = routing
+    map_reduce = map_reduce_signature()
+    if map_reduce:
+        key_parts["map_reduce"] = map_reduce
+    key_json = json.dumps(key_parts, sort_keys=True)
+    return f"extraction:{hashlib.sha256(key_json.encode('utf-8')).hexdigest()}"
+
+@lru_cache(maxsize=1)
+def get_extraction_cache() -> Optional[CacheBackend]:
+    """
+    Returns the process-wide extraction result cache configured by EXTRACTION_CACHE_BACKEND.
+    """
+    backend = config.EXTRACTION_CACHE_BACKEND.lower()
+    return create_cache(
+        backend,
+        max_entries=config.EXTRACTION_CACHE_MAX_ENTRIES,
+        ttl_seconds=config.EXTRACTION_CACHE_TTL_SECONDS,
+        directory=config.EXTRACTION_CACHE_DIR,
+        collection=config.EXTRACTION_CACHE_COLLECTION if backend == "mongo" else None
+    )
+
+def generation_config(schema: Type[BaseModel], cached_content: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Returns the Gemini generation config requesting `schema` as a JSON response,
+    optionally reading the report and prompt from a context cache.
+    """
+    generation = {
+        'response_mime_type': 'application/json',
+        'response_schema': schema,
+        'temperature': 0.0,
+    }
+    if cached_content:
+        generation['cached_content'] = cached_content
+    return generation
+
+def request_contents(uploaded_file: types.File, cached_content: Optional[str] = None) -> List[Any]:
+    """
+    Returns the contents of a schema request: the report and the extractor prompt, or
+    only a short instruction when both are served from the context cache.
+    """
+    if cached_content:
+        return [EXTRACTOR_CACHED_REQUEST_PROMPT]
+    return [uploaded_file, EXTRACTOR_TOOL_PROMPT]
+
+def parse_schema_response(
+    response: types.GenerateContentResponse,
+    schema_name: str,
+    token_usage: Dict[str, int],
+    reservation: Reservation
+) -> Dict[str, Any]:
+    """
+    Records the token usage of a schema extraction response and parses its JSON body.
+
+    Raises:
+        MalformedResponseError: If the response is empty or not a JSON object.
+        json.JSONDecodeError: If the body is not valid JSON.
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if usage:
+        reservation.record_usage(usage.total_token_count or 0)
+        cached_tokens = usage.cached_content_token_count or 0
+        token_usage["total_prompt_tokens"] += usage.prompt_token_count or 0
+        token_usage["total_cached_prompt_tokens"] += cached_tokens
+        token_usage["total_uncached_prompt_tokens"] += max(0, (usage.prompt_token_count or 0) - cached_tokens)
+        token_usage["total_output_tokens"] += usage.candidates_token_count or 0
+        token_usage["total_tokens"] += usage.total_token_count or 0
+
+    raw_text = getattr(response, "text", "")
+    if not raw_text and getattr(response, "candidates", []):
+        raw_text = response.candidates[0].content.parts[0].text
+
+    if not raw_text:
+        logger.error(f"Empty response for schema '{schema_name}'.")
+        logger.info(f"Raw response (if any): {response}")
+        raise MalformedResponseError("Empty Gemini response")
+
+    result_json = json.loads(raw_text)
+    if not isinstance(result_json, dict):
+        logger.error(f"Schema '{schema_name}' did not return a JSON object.")
+        raise MalformedResponseError("Gemini response is not a JSON object")
+
+    logger.info(f"Successfully extracted schema: {schema_name}")
+    return result_json
+
+def extract_schema(
+    client: genai.Client,
+    uploaded_file: types.File,
+    schema: Type[BaseModel],
+    retry_budget: Optional[RetryBudget] = None,
+    cached_content: Optional[str] = None
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, int]]:
+    """
+    Extracts a single ESG schema section from an uploaded report, retrying on failure.
+
+    Retries follow `RetryPolicy`: empty or unparseable output is retried immediately,
+    quota and transient errors wait for the server's retry hint or a jittered backoff,
+    and fatal errors (auth, bad request) are not retried.
+
+    Args:
+        client (genai.Client): Gemini client used for the request.
+        uploaded_file (types.File): Report previously uploaded to Gemini.
+        schema (Type[BaseModel]): Pydantic model used as the response schema.
+        retry_budget (RetryBudget, optional): Cap on the time spent waiting between
+            retries, shared by every section of the same report.
+        cached_content (str, optional): Name of a context cache holding the report and
+            the extractor prompt (see `context_cache`); the file is sent inline otherwise.
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Dict[str, int]]: The parsed section (None if every
+        attempt failed) and the tokens consumed by all attempts.
+    """
+    schema_name = schema_name_of(schema)
+    token_usage = new_token_usage()
+    rate_limiter = get_rate_limiter("gemini")
+    estimated_tokens = config.GEMINI_ESTIMATED_TOKENS_PER_REQUEST
+
+    def attempt() -> Dict[str, Any]:
+        with rate_limiter.limit(tokens=estimated_tokens) as reservation:
+            response = client.models.generate_content(
+                model=config.GEMINI_EXTRACTION_MODEL,
+                contents=request_contents(uploaded_file, cached_content),
+                config=generation_config(schema, cached_content),
+            )
+            return parse_schema_response(response, schema_name, token_usage, reservation)
+
+    try:
+        result_json = RetryPolicy().call(attempt, budget=retry_budget, label=f"schema '{schema_name}'")
+        return result_json, token_usage
+    except Exception:
+        return None, token_usage
+
+async def extract_schema_async(
+    client: genai.Client,
+    uploaded_file: types.File,
+    schema: Type[BaseModel],
+    retry_budget: Optional[RetryBudget] = None,
+    cached_content: Optional[str] = None
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, int]]:
+    """
+    Async counterpart of `extract_schema`, using the genai async client (`client.aio`).
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Dict[str, int]]: The parsed section (None if every
+        attempt failed) and the tokens consumed by all attempts.
+    """
+    schema_name = schema_name_of(schema)
+    token_usage = new_token_usage()
+    rate_limiter = get_rate_limiter("gemini")
+    estimated_tokens = config.GEMINI_ESTIMATED_TOKENS_PER_REQUEST
+
+    async def attempt() -> Dict[str, Any]:
+        async with rate_limiter.limit_async(tokens=estimated_tokens) as reservation:
+            response = await client.aio.models.generate_content(
+                model=config.GEMINI_EXTRACTION_MODEL,
+                contents=request_contents(uploaded_file, cached_content),
+                config=generation_config(schema, cached_content),
+            )
+            return parse_schema_response(response, schema_name, token_usage, reservation)
+
+    try:
+        result_json = await RetryPolicy().call_async(attempt, budget=retry_budget, label=f"schema '{schema_name}'")
+        return result_json, token_usage
+    except Exception:
+        return None, token_usage
+
+def schema_group_label(schemas: List[Type[BaseModel]]) -> str:
+    return f"schemas '{'+'.join(schema_name_of(schema) for schema in schemas)}'"
+
+def parse_packed_response(
+    response: types.GenerateContentResponse,
+    schemas: List[Type[BaseModel]],
+    token_usage: Dict[str, int],
+    reservation: Reservation
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Parses and validates the response to a packed request.
+
+    Returns:
+        Optional[Dict[str, Dict[str, Any]]]: The sections by schema name, or None if the
+        response is empty, truncated or fails validation, in which case the group is split
+        rather than requested again as a whole.
+    """
+    label = schema_group_label(schemas)
+    try:
+        result_json = parse_schema_response(response, label, token_usage, reservation)
+        return unpack_sections(result_json, schemas)
+    except (MalformedResponseError, json.JSONDecodeError, ValidationError) as e:
+        logger.error(f"Unusable packed response for {label}: {e}")
+        return None
+
+def packed_request_rejected(error: Exception) -> bool:
+    """
+    Returns True when Gemini refused a packed request itself (e.g. the combined response
+    schema is too complex), so smaller groups may still succeed. Other errors (auth,
+    quota, exhausted retry budget) would fail the same way for every group.
+    """
+    return status_code_of(error) == 400
+
+def record_sections(schemas: List[Type[BaseModel]], sections: Dict[str, Dict[str, Any]]) -> None:
+    """Feeds the output sizes of extracted sections back into the packing estimates."""
+    for schema in schemas:
+        if schema_name_of(schema) in sections:
+            output_size_stats.record(schema, sections[schema_name_of(schema)])
+
+def extract_schema_group(
+    client: genai.Client,
+    uploaded_file: types.File,
+    schemas: List[Type[BaseModel]],
+    retry_budget: Optional[RetryBudget] = None,
+    cached_content: Optional[str] = None
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """
+    Extracts a group of schema sections (see `pack_schemas`) with a single request whose
+    response schema packs them together, and falls back to splitting the group in two
+    whenever the packed response is truncated, malformed or fails validation. A group of
+    one schema is a plain `extract_schema` call.
+
+    Args:
+        client (genai.Client): Gemini client used for the requests.
+        uploaded_file (types.File): Report previously uploaded to Gemini.
+        schemas (List[Type[BaseModel]]): Sections requested together.
+        retry_budget (RetryBudget, optional): Cap on the time spent waiting between retries.
+        cached_content (str, optional): Name of a context cache holding the report and prompt.
+
+    Returns:
+        Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]: The extracted sections by schema
+        name (failed sections are missing) and the tokens consumed by all requests.
+    """
+    if len(schemas) == 1:
+        section, token_usage = extract_schema(client, uploaded_file, schemas[0], retry_budget, cached_content)
+        sections = {schema_name_of(schemas[0]): section} if section is not None else {}
+        record_sections(schemas, sections)
+        return sections, token_usage
+
+    label = schema_group_label(schemas)
+    token_usage = new_token_usage()
+    rate_limiter = get_rate_limiter("gemini")
+    estimated_tokens = config.GEMINI_ESTIMATED_TOKENS_PER_REQUEST
+
+    def attempt() -> Optional[Dict[str, Dict[str, Any]]]:
+        with rate_limiter.limit(tokens=estimated_tokens) as reservation:
+            response = client.models.generate_content(
+                model=config.GEMINI_EXTRACTION_MODEL,
+                contents=request_contents(uploaded_file, cached_content),
+                config=generation_config(packed_model(tuple(schemas)), cached_content),
+            )
+            return parse_packed_response(response, schemas, token_usage, reservation)
+
+    try:
+        sections = RetryPolicy().call(attempt, budget=retry_budget, label=label)
+    except Exception as e:
+        if not packed_request_rejected(e):
+            return {}, token_usage
+        sections = None
+
+    if sections is not None:
+        record_sections(schemas, sections)
+        return sections, token_usage
+
+    sections = {}
+    for half in split_group(schemas):
+        logger.info(f"Splitting {label}: retrying {schema_group_label(half)}")
+        half_sections, usage = extract_schema_group(client, uploaded_file, half, retry_budget, cached_content)
+        sections.update(half_sections)
+        add_token_usage(token_usage, usage)
+    return sections, token_usage
+
+async def extract_schema_group_async(
+    client: genai.Client,
+    uploaded_file: types.File,
+    schemas: List[Type[BaseModel]],
+    retry_budget: Optional[RetryBudget] = None,
+    cached_content: Optional[str] = None
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """
+    Async counterpart of `extract_schema_group`, using the genai async client (`client.aio`).
+
+    Returns:
+        Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]: The extracted sections by schema
+        name (failed sections are missing) and the tokens consumed by all requests.
+    """
+    if len(schemas) == 1:
+        section, token_usage = await extract_schema_async(client, uploaded_file, schemas[0], retry_budget, cached_content)
+        sections = {schema_name_of(schemas[0]): section} if section is not None else {}
+        record_sections(schemas, sections)
+        return sections, token_usage
+
+    label = schema_group_label(schemas)
+    token_usage = new_token_usage()
+    rate_limiter = get_rate_limiter("gemini")
+    estimated_tokens = config.GEMINI_ESTIMATED_TOKENS_PER_REQUEST
+
+    async def attempt() -> Optional[Dict[str, Dict[str, Any]]]:
+        async with rate_limiter.limit_async(tokens=estimated_tokens) as reservation:
+            response = await client.aio.models.generate_content(
+                model=config.GEMINI_EXTRACTION_MODEL,
+                contents=request_contents(uploaded_file, cached_content),
+                config=generation_config(packed_model(tuple(schemas)), cached_content),
+            )
+            return parse_packed_response(response, schemas, token_usage, reservation)
+
+    try:
+        sections = await RetryPolicy().call_async(attempt, budget=retry_budget, label=label)
+    except Exception as e:
+        if not packed_request_rejected(e):
+            return {}, token_usage
+        sections = None
+
+    if sections is not None:
+        record_sections(schemas, sections)
+        return sections, token_usage
+
+    sections = {}
+    for half in split_group(schemas):
+        logger.info(f"Splitting {label}: retrying {schema_group_label(half)}")
+        half_sections, usage = await extract_schema_group_async(client, uploaded_file, half, retry_budget, cached_content)
+        sections.update(half_sections)
+        add_token_usage(token_usage, usage)
+    return sections, token_usage
+
+def extract_routed_group(
+    client: genai.Client,
+    uploaded_file: Optional[types.File],
+    report_pages: Optional[ReportPages],
+    schemas: List[Type[BaseModel]],
+    retry_budget: Optional[RetryBudget] = None,
+    cached_content: Optional[str] = None
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """
+    Extracts a group of schema sections from the pages routed to them (see
+    `upload_report_pages`), or from the whole uploaded report when `report_pages` is None.
+
+    Returns:
+        Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]: The extracted sections by schema
+        name (failed sections are missing) and the tokens consumed by all requests.
+    """
+    if report_pages is not None:
+        try:
+            uploaded_file = upload_report_pages(report_pages, schemas)
+        except Exception as e:
+            logger.error(f"Failed to upload the pages of {schema_group_label(schemas)}: {e}")
+            return {}, new_token_usage()
+    return extract_schema_group(client, uploaded_file, schemas, retry_budget, cached_content)
+
+async def extract_routed_group_async(
+    client: genai.Client,
+    uploaded_file: Optional[types.File],
+    report_pages: Optional[ReportPages],
+    schemas: List[Type[BaseModel]],
+    retry_budget: Optional[RetryBudget] = None,
+    cached_content: Optional[str] = None
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """
+    Async counterpart of `extract_routed_group`.
+    """
+    if report_pages is not None:
+        try:
+            uploaded_file = await upload_report_pages_async(report_pages, schemas)
+        except Exception as e:
+            logger.error(f"Failed to upload the pages of {schema_group_label(schemas)}: {e}")
+            return {}, new_token_usage()
+    return await extract_schema_group_async(client, uploaded_file, schemas, retry_budget, cached_content)
+
+def section_checkpoint_key(key: str, schema: Type[BaseModel]) -> str:
+    """
+    Returns the checkpoint key of a section stored under `key` (its schema name, or its
+    window key), fingerprinted with the schema, the extractor prompt and the Gemini model.
+    """
+    return checkpoint_key(key, schema_fingerprint(schema), EXTRACTOR_TOOL_PROMPT, config.GEMINI_EXTRACTION_MODEL)
+
+def schema_checkpoint_keys(schemas: List[Type[BaseModel]]) -> Dict[str, str]:
+    """
+    Returns the schema names of the sections by checkpoint key.
+    """
+    return {section_checkpoint_key(schema_name_of(schema), schema): schema_name_of(schema) for schema in schemas}
+
+def window_checkpoint_keys(windows: List[PageWindow], schemas: List[Type[BaseModel]]) -> Dict[str, str]:
+    """
+    Returns the window keys of the sections of every window by checkpoint key.
+    """
+    keys = {}
+    for window in windows:
+        for schema in schemas:
+            key = window_section_key(schema_name_of(schema), window)
+            keys[section_checkpoint_key(key, schema)] = key
+    return keys
+
+def load_checkpoints(
+    checkpoint_store: CheckpointStore,
+    file_hash: str,
+    keys: Dict[str, str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Loads the sections checkpointed for a report, treating storage errors as no checkpoints.
+
+    Args:
+        checkpoint_store (CheckpointStore): Where sections are checkpointed.
+        file_hash (str): SHA-256 of the report bytes.
+        keys (Dict[str, str]): Section keys by checkpoint key (see `section_checkpoint_key`).
+            Checkpoints under any other key, e.g. of an older schema, prompt or model, are ignored.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The checkpointed sections by section key.
+    """
+    sections = {}
+    try:
+        stored = checkpoint_store.load(file_hash)
+        sections = {keys[key]: section for key, section in stored.items() if key in keys}
+    except (OSError, PyMongoError) as e:
+        logger.error(f"Failed to load checkpoints for file {file_hash}: {e}")
+    if sections:
+        logger.info(f"Resuming extraction for file {file_hash} with checkpointed schema(s): {', '.join(sections)}")
+    return sections
+
+def clear_checkpoints(checkpoint_store: CheckpointStore, file_hash: str) -> None:
+    """
+    Clears the checkpoints of a fully extracted report, logging storage errors.
+    """
+    try:
+        checkpoint_store.clear(file_hash)
+    except (OSError, PyMongoError) as e:
+        logger.error(f"Failed to clear checkpoints for file {file_hash}: {e}")
+
+def log_failed_schemas(failed_schemas: List[str], checkpointed: int, file_hash: Optional[str]) -> None:
+    """
+    Logs the sections that could not be extracted and, when checkpointing, how many were kept.
+    """
+    logger.error(f"Extraction failed for schema(s): {', '.join(failed_schemas)}")
+    if file_hash:
+        logger.info(f"{checkpointed} schema(s) checkpointed for file {file_hash}; a rerun will resume from them.")
+
+def merge_sections(schemas: List[Type[BaseModel]], sections: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merges extracted sections in schema order, so the result does not depend on completion order.
+    """
+    merged_result: Dict[str, Any] = {}
+    for schema in schemas:
+        merged_result.update(sections[schema_name_of(schema)])
+    return merged_result
+
+def use_context_cache_for(schema_groups: List[List[Type[BaseModel]]], use_context_cache: Optional[bool]) -> bool:
+    """
+    Decides whether a report's section requests share a context cache. A cache only pays
+    off when the report is read by more than one request.
+    """
+    if use_context_cache is None:
+        use_context_cache = config.GEMINI_CONTEXT_CACHE_ENABLED
+    return use_context_cache and len(schema_groups) > 1
+
+def extract_report(
+    client: genai.Client,
+    uploaded_file: Optional[types.File],
+    schemas: Optional[List[Type[BaseModel]]] = None,
+    max_concurrency: Optional[int] = None,
+    file_hash: Optional[str] = None,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    use_context_cache: Optional[bool] = None,
+    report_pages: Optional[ReportPages] = None
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, int]]:
+    """
+    Extracts every ESG schema section from an uploaded report and merges the results.
+
+    Sections are requested concurrently, with at most `max_concurrency` Gemini calls
+    in flight, and merged in schema order so the output does not depend on which
+    call finishes first. All sections share one retry budget (RETRY_BUDGET_SECONDS), so a
+    report cannot spend more than that waiting between retries.
+
+    When `file_hash` and `checkpoint_store` are given, every section is checkpointed as
+    soon as it is parsed and sections checkpointed by an earlier run are reused, so a
+    rerun after a partial failure only requests the missing sections. Checkpoints are
+    cleared once the whole report has been extracted.
+
+    With `use_context_cache`, the report and the extractor prompt are put in a Gemini
+    context cache once and every section request reads them from it, instead of
+    re-sending (and paying full price for) the whole report per section. The cache is
+    deleted when the report is done.
+
+    Sections are packed into as few requests as the output token budget allows (see
+    `pack_schemas`); a packed request whose response is unusable is split in two.
+
+    With `report_pages`, each request is sent only the pages relevant to its sections,
+    uploaded as a separate PDF, instead of the whole report (see `ReportPages`). The
+    context cache is not used then, since each page subset is read by a single request.
+
+    Args:
+        client (genai.Client): Gemini client used for the requests.
+        uploaded_file (types.File, optional): Report previously uploaded to Gemini. Only
+            optional with `report_pages`.
+        schemas (List[Type[BaseModel]], optional): Sections to extract. Defaults to RESPONSE_SCHEMA.
+        max_concurrency (int, optional): Maximum in-flight requests. Defaults to
+            `config.EXTRACTION_MAX_CONCURRENCY`; 1 extracts sequentially.
+        file_hash (str, optional): SHA-256 of the report bytes, used as the checkpoint key.
+        checkpoint_store (CheckpointStore, optional): Where sections are checkpointed.
+        use_context_cache (bool, optional): Share one context cache between the section
+            requests. Defaults to `config.GEMINI_CONTEXT_CACHE_ENABLED`.
+        report_pages (ReportPages, optional): Indexed report pages used to route pages to sections.
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Dict[str, int]]: The merged result (None if any
+        section failed) and the token usage of the requests made by this run.
+    """
+    schemas = schemas or RESPONSE_SCHEMA
+    checkpointing = bool(file_hash and checkpoint_store)
+    token_usage = new_token_usage()
+    sections: Dict[str, Dict[str, Any]] = {}
+    failed_schemas: List[str] = []
+    retry_budget = RetryBudget(config.RETRY_BUDGET_SECONDS)
+
+    if checkpointing:
+        sections = load_checkpoints(checkpoint_store, file_hash, schema_checkpoint_keys(schemas))
+
+    pending_schemas = [schema for schema in schemas if schema_name_of(schema) not in sections]
+    schema_groups = pack_schemas(pending_schemas)
+    max_concurrency = max(1, min(max_concurrency or config.EXTRACTION_MAX_CONCURRENCY, len(schema_groups)))
+    use_cache = report_pages is None and use_context_cache_for(schema_groups, use_context_cache)
+
+    logger.info(
+        f"Extracting {len(pending_schemas)} schema(s) in {len(schema_groups)} request(s) "
+        f"with max concurrency {max_concurrency}"
+    )
+
+    with context_cache(client, uploaded_file, EXTRACTOR_TOOL_PROMPT, enabled=use_cache) as cached_content, \
+            ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="schema-extract") as executor:
+        futures = [
+            executor.submit(
+                extract_routed_group, client, uploaded_file, report_pages, group, retry_budget, cached_content
+            )
+            for group in schema_groups
+        ]
+
+        for group, future in zip(schema_groups, futures):
+            if future.cancelled():
+                continue
+
+            group_sections, usage = future.result()
+            add_token_usage(token_usage, usage)
+
+            for schema in group:
+                schema_name = schema_name_of(schema)
+                if schema_name not in group_sections:
+                    failed_schemas.append(schema_name)
+                    continue
+
+                sections[schema_name] = group_sections[schema_name]
+                if checkpointing:
+                    safe_save_checkpoint(
+                        checkpoint_store, file_hash, section_checkpoint_key(schema_name, schema), group_sections[schema_name]
+                    )
+
+            # Without checkpoints the remaining sections would be thrown away anyway.
+            if failed_schemas and not checkpointing:
+                for pending in futures:
+                    pending.cancel()
+
+    if failed_schemas:
+        log_failed_schemas(failed_schemas, len(sections), file_hash if checkpointing else None)
+        return None, token_usage
+
+    if checkpointing:
+        clear_checkpoints(checkpoint_store, file_hash)
+    return merge_sections(schemas, sections), token_usage
+
+async def extract_report_async(
+    client: genai.Client,
+    uploaded_file: Optional[types.File],
+    schemas: Optional[List[Type[BaseModel]]] = None,
+    max_concurrency: Optional[int] = None,
+    file_hash: Optional[str] = None,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    use_context_cache: Optional[bool] = None,
+    report_pages: Optional[ReportPages] = None
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, int]]:
+    """
+    Async counterpart of `extract_report`: sections are requested as tasks on the
+    running event loop, with at most `max_concurrency` in flight. Checkpoint reads
+    and writes run in worker threads.
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Dict[str, int]]: The merged result (None if any
+        section failed) and the token usage of the requests made by this run.
+    """
+    schemas = schemas or RESPONSE_SCHEMA
+    checkpointing = bool(file_hash and checkpoint_store)
+    token_usage = new_token_usage()
+    sections: Dict[str, Dict[str, Any]] = {}
+    failed_schemas: List[str] = []
+    retry_budget = RetryBudget(config.RETRY_BUDGET_SECONDS)
+
+    if checkpointing:
+        sections = await asyncio.to_thread(load_checkpoints, checkpoint_store, file_hash, schema_checkpoint_keys(schemas))
+
+    pending_schemas = [schema for schema in schemas if schema_name_of(schema) not in sections]
+    schema_groups = pack_schemas(pending_schemas)
+    max_concurrency = max(1, min(max_concurrency or config.EXTRACTION_MAX_CONCURRENCY, len(schema_groups)))
+    use_cache = report_pages is None and use_context_cache_for(schema_groups, use_context_cache)
+    slots = asyncio.Semaphore(max_concurrency)
+
+    logger.info(
+        f"Extracting {len(pending_schemas)} schema(s) in {len(schema_groups)} request(s) "
+        f"with max concurrency {max_concurrency}"
+    )
+
+    async def extract(
+        group: List[Type[BaseModel]],
+        cached_content: Optional[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+        async with slots:
+            return await extract_routed_group_async(
+                client, uploaded_file, report_pages, group, retry_budget, cached_content
+            )
+
+    async with context_cache_async(client, uploaded_file, EXTRACTOR_TOOL_PROMPT, enabled=use_cache) as cached_content:
+        tasks = [asyncio.create_task(extract(group, cached_content)) for group in schema_groups]
+        try:
+            for group, task in zip(schema_groups, tasks):
+                group_sections, usage = await task
+                add_token_usage(token_usage, usage)
+
+                for schema in group:
+                    schema_name = schema_name_of(schema)
+                    if schema_name not in group_sections:
+                        failed_schemas.append(schema_name)
+                        continue
+
+                    sections[schema_name] = group_sections[schema_name]
+                    if checkpointing:
+                        await asyncio.to_thread(
+                            safe_save_checkpoint, checkpoint_store, file_hash,
+                            section_checkpoint_key(schema_name, schema), group_sections[schema_name]
+                        )
+
+                # Without checkpoints the remaining sections would be thrown away anyway.
+                if failed_schemas and not checkpointing:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled requests finish before the cache they read from is deleted.
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    if failed_schemas:
+        log_failed_schemas(failed_schemas, len(sections), file_hash if checkpointing else None)
+        return None, token_usage
+
+    if checkpointing:
+        await asyncio.to_thread(clear_checkpoints, checkpoint_store, file_hash)
+    return merge_sections(schemas, sections), token_usage
+
+def extract_window_group(
+    client: genai.Client,
+    report_windows: ReportWindows,
+    window: PageWindow,
+    schemas: List[Type[BaseModel]],
+    retry_budget: Optional[RetryBudget] = None
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """
+    Extracts a group of schema sections from the pages of one window (see `upload_window`).
+
+    Returns:
+        Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]: The extracted sections by schema
+        name (failed sections are missing) and the tokens consumed by all requests.
+    """
+    try:
+        uploaded_file = upload_window(report_windows, window)
+    except Exception as e:
+        logger.error(f"Failed to upload {window.label} for {schema_group_label(schemas)}: {e}")
+        return {}, new_token_usage()
+    return extract_schema_group(client, uploaded_file, schemas, retry_budget)
+
+async def extract_window_group_async(
+    client: genai.Client,
+    report_windows: ReportWindows,
+    window: PageWindow,
+    schemas: List[Type[BaseModel]],
+    retry_budget: Optional[RetryBudget] = None
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """
+    Async counterpart of `extract_window_group`.
+    """
+    try:
+        uploaded_file = await upload_window_async(report_windows, window)
+    except Exception as e:
+        logger.error(f"Failed to upload {window.label} for {schema_group_label(schemas)}: {e}")
+        return {}, new_token_usage()
+    return await extract_schema_group_async(client, uploaded_file, schemas, retry_budget)
+
+def window_requests(
+    windows: List[PageWindow],
+    schemas: List[Type[BaseModel]],
+    window_sections: Dict[str, Dict[str, Any]]
+) -> List[Tuple[PageWindow, List[Type[BaseModel]]]]:
+    """
+    Returns the (window, schema group) requests still needed, skipping the sections
+    checkpointed for a window. Sections are packed per window as in `extract_report`.
+    """
+    packed: Dict[Tuple[Type[BaseModel], ...], List[List[Type[BaseModel]]]] = {}
+    requests = []
+    for window in windows:
+        pending = tuple(
+            schema for schema in schemas
+            if window_section_key(schema_name_of(schema), window) not in window_sections
+        )
+        if pending and pending not in packed:
+            packed[pending] = pack_schemas(list(pending))
+        requests.extend((window, group) for group in packed.get(pending, []))
+    return requests
+
+def reduce_windows(
+    schemas: List[Type[BaseModel]],
+    windows: List[PageWindow],
+    window_sections: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Merges the window results of a report (see `reduce_sections`) into one result, with
+    the conflicting fields listed under `merge_conflicts` for review.
+    """
+    sections, conflicts = reduce_sections(schemas, windows, window_sections)
+    return {**merge_sections(schemas, sections), "merge_conflicts": conflicts}
+
+def extract_report_windows(
+    client: genai.Client,
+    report_windows: ReportWindows,
+    schemas: Optional[List[Type[BaseModel]]] = None,
+    max_concurrency: Optional[int] = None,
+    file_hash: Optional[str] = None,
+    checkpoint_store: Optional[CheckpointStore] = None
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, int]]:
+    """
+    Map-reduce extraction of a report too long to be sent whole (see `ReportWindows`).
+
+    Every schema section is extracted from every page window, with at most
+    `max_concurrency` requests in flight across all windows, so the time taken depends
+    on the concurrency rather than on the length of the report. The window results are
+    then merged field by field (see `reduce_sections`).
+
+    Checkpointing works as in `extract_report`, per section and window, so a rerun only
+    requests the windows that failed. Sections are packed per window; the context cache
+    is not used, since each window is read by few requests.
+
+    Args:
+        client (genai.Client): Gemini client used for the requests.
+        report_windows (ReportWindows): The report split into page windows.
+        schemas (List[Type[BaseModel]], optional): Sections to extract. Defaults to RESPONSE_SCHEMA.
+        max_concurrency (int, optional): Maximum in-flight requests. Defaults to
+            `config.EXTRACTION_MAX_CONCURRENCY`.
+        file_hash (str, optional): SHA-256 of the report bytes, used as the checkpoint key.
+        checkpoint_store (CheckpointStore, optional): Where window sections are checkpointed.
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Dict[str, int]]: The merged result (None if any
+        section failed in any window) and the token usage of the requests made by this run.
+    """
+    schemas = schemas or RESPONSE_SCHEMA
+    windows = report_windows.windows
+    checkpointing = bool(file_hash and checkpoint_store)
+    token_usage = new_token_usage()
+    window_sections: Dict[str, Dict[str, Any]] = {}
+    failed_sections: List[str] = []
+    retry_budget = RetryBudget(config.RETRY_BUDGET_SECONDS)
+
+    if checkpointing:
+        window_sections = load_checkpoints(checkpoint_store, file_hash, window_checkpoint_keys(windows, schemas))
+
+    requests = window_requests(windows, schemas, window_sections)
+    max_concurrency = max(1, min(max_concurrency or config.EXTRACTION_MAX_CONCURRENCY, len(requests) or 1))
+
+    logger.info(
+        f"Extracting {len(schemas)} schema(s) from {len(windows)} window(s) of {report_windows.page_count} "
+        f"pages in {len(requests)} request(s) with max concurrency {max_concurrency}"
+    )
+
+    with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="window-extract") as executor:
+        futures = [
+            executor.submit(extract_window_group, client, report_windows, window, group, retry_budget)
+            for window, group in requests
+        ]
+
+        for (window, group), future in zip(requests, futures):
+            if future.cancelled():
+                continue
+
+            group_sections, usage = future.result()
+            add_token_usage(token_usage, usage)
+
+            for schema in group:
+                key = window_section_key(schema_name_of(schema), window)
+                if schema_name_of(schema) not in group_sections:
+                    failed_sections.append(key)
+                    continue
+
+                window_sections[key] = group_sections[schema_name_of(schema)]
+                if checkpointing:
+                    safe_save_checkpoint(
+                        checkpoint_store, file_hash, section_checkpoint_key(key, schema), window_sections[key]
+                    )
+
+            # Without checkpoints the remaining windows would be thrown away anyway.
+            if failed_sections and not checkpointing:
+                for pending in futures:
+                    pending.cancel()
+
+    if failed_sections:
+        log_failed_schemas(failed_sections, len(window_sections), file_hash if checkpointing else None)
+        return None, token_usage
+
+    if checkpointing:
+        clear_checkpoints(checkpoint_store, file_hash)
+    return reduce_windows(schemas, windows, window_sections), token_usage
+
+async def extract_report_windows_async(
+    client: genai.Client,
+    report_windows: ReportWindows,
+    schemas: Optional[List[Type[BaseModel]]] = None,
+    max_concurrency: Optional[int] = None,
+    file_hash: Optional[str] = None,
+    checkpoint_store: Optional[CheckpointStore] = None
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, int]]:
+    """
+    Async counterpart of `extract_report_windows`: window requests are tasks on the
+    running event loop, with at most `max_concurrency` in flight.
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Dict[str, int]]: The merged result (None if any
+        section failed in any window) and the token usage of the requests made by this run.
+    """
+    schemas = schemas or RESPONSE_SCHEMA
+    windows = report_windows.windows
+    checkpointing = bool(file_hash and checkpoint_store)
+    token_usage = new_token_usage()
+    window_sections: Dict[str, Dict[str, Any]] = {}
+    failed_sections: List[str] = []
+    retry_budget = RetryBudget(config.RETRY_BUDGET_SECONDS)
+
+    if checkpointing:
+        window_sections = await asyncio.to_thread(
+            load_checkpoints, checkpoint_store, file_hash, window_checkpoint_keys(windows, schemas)
+        )
+
+    requests = window_requests(windows, schemas, window_sections)
+    max_concurrency = max(1, min(max_concurrency or config.EXTRACTION_MAX_CONCURRENCY, len(requests) or 1))
+    slots = asyncio.Semaphore(max_concurrency)
+
+    logger.info(
+        f"Extracting {len(schemas)} schema(s) from {len(windows)} window(s) of {report_windows.page_count} "
+        f"pages in {len(requests)} request(s) with max concurrency {max_concurrency}"
+    )
+
+    async def extract(
+        window: PageWindow,
+        group: List[Type[BaseModel]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+        async with slots:
+            return await extract_window_group_async(client, report_windows, window, group, retry_budget)
+
+    tasks = [asyncio.create_task(extract(window, group)) for window, group in requests]
+    try:
+        for (window, group), task in zip(requests, tasks):
+            group_sections, usage = await task
+            add_token_usage(token_usage, usage)
+
+            for schema in group:
+                key = window_section_key(schema_name_of(schema), window)
+                if schema_name_of(schema) not in group_sections:
+                    failed_sections.append(key)
+                    continue
+
+                window_sections[key] = group_sections[schema_name_of(schema)]
+                if checkpointing:
+                    await asyncio.to_thread(
+                        safe_save_checkpoint, checkpoint_store, file_hash, section_checkpoint_key(key, schema), window_sections[key]
+                    )
+
+            # Without checkpoints the remaining windows would be thrown away anyway.
+            if failed_sections and not checkpointing:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if failed_sections:
+        log_failed_schemas(failed_sections, len(window_sections), file_hash if checkpointing else None)
+        return None, token_usage
+
+    if checkpointing:
+        await asyncio.to_thread(clear_checkpoints, checkpoint_store, file_hash)
+    return reduce_windows(schemas, windows, window_sections), token_usage
+
+class PreparedReport(NamedTuple):
+    """
+    A report that has been hashed and, unless its result was cached, either uploaded to
+    Gemini, indexed by page for page routing (its pages are uploaded per section) or split
+    into page windows for map-reduce extraction (each window is uploaded on its own).
+    """
+    file_hash: str
+    uploaded_file: Optional[types.File]
+    cached_result: Optional[Dict[str, Any]]
+    report_pages: Optional[ReportPages] = None
+    report_windows: Optional[ReportWindows] = None
+
+    def close(self) -> None:
+        """Releases the local copy of a page-routed or map-reduced report."""
+        if self.report_pages:
+            self.report_pages.close()
+        if self.report_windows:
+            self.report_windows.close()
+
+def route_report(stream: BinaryIO, file_hash: str, file_name: Optional[str]) -> Optional[PreparedReport]:
+    """
+    Runs the preflight inspection of a report about to be uploaded (see `inspect_pdf`)
+    and returns the prepared report when its pages are routed (PAGE_ROUTE) or when it is
+    split into page windows (SPLIT), or None when it is to be uploaded whole.
+
+    Raises:
+        PreflightError: If the report is rejected.
+    """
+    preflight = preflight_pdf(stream, file_hash)
+    if preflight.decision == SPLIT:
+        report_windows = load_report_windows(stream, file_hash, file_name)
+        if report_windows is None:
+            raise PreflightError(preflight._replace(
+                decision=REJECT,
+                reason=f"{preflight.reason}, and it cannot be split into page windows"
+            ))
+        return PreparedReport(file_hash, None, None, report_windows=report_windows)
+
+    if preflight.decision == PAGE_ROUTE:
+        report_pages = load_report_pages(stream, file_hash, file_name)
+        if report_pages:
+            return PreparedReport(file_hash, None, None, report_pages)
+    return None
+
+def prepare_stream(stream: BinaryIO, file_name: Optional[str], file_hash: str) -> PreparedReport:
+    """
+    Runs the preflight and routing of an opened report (see `route_report`) and uploads
+    it whole unless its pages are routed or it is split into page windows.
+
+    Raises:
+        PreflightError: If the report is rejected by the preflight inspection.
+        Exception: If the report cannot be uploaded.
+    """
+    routed = route_report(stream, file_hash, file_name)
+    if routed:
+        return routed
+
+    uploaded_file = upload_file(file=stream, file_name=file_name, sha256=file_hash)
+    if not uploaded_file:
+        raise ValueError("File upload to Gemini failed.")
+    return PreparedReport(file_hash, uploaded_file, None)
+
+async def prepare_stream_async(stream: BinaryIO, file_name: Optional[str], file_hash: str) -> PreparedReport:
+    """
+    Async counterpart of `prepare_stream`; the preflight and routing run in a worker thread.
+    """
+    routed = await asyncio.to_thread(route_report, stream, file_hash, file_name)
+    if routed:
+        return routed
+
+    uploaded_file = await upload_file_async(file=stream, file_name=file_name, sha256=file_hash)
+    if not uploaded_file:
+        raise ValueError("File upload to Gemini failed.")
+    return PreparedReport(file_hash, uploaded_file, None)
+
+def prepare_report(file_input: Union[BinaryIO, bytes, str]) -> PreparedReport:
+    """
+    Opens and hashes a report, then returns the cached extraction result if there is
+    one. Otherwise the report goes through a local preflight inspection, which rejects
+    unusable inputs before anything is uploaded, and is uploaded to Gemini. When page
+    routing applies (see `route_report`), the report's pages are indexed instead and
+    uploaded per section at extraction time; reports too long to be sent whole are split
+    into page windows, uploaded per window.
+
+    URLs are revalidated first, so an unchanged report with a cached result is not
+    downloaded again. An unchanged report without a cached result (e.g. rejected by the
+    preflight, or whose extraction failed) is downloaded again, so it goes through the
+    preflight and routing like any other report.
+
+    Args:
+        file_input (Union[BinaryIO, bytes, str]): Local file path, URL, bytes, or binary stream.
+
+    Returns:
+        PreparedReport: The content hash plus the cached result, the uploaded file, the
+        indexed pages or the page windows.
+
+    Raises:
+        PreflightError: If the report is rejected by the preflight inspection.
+        Exception: If the report cannot be read, downloaded or uploaded.
+    """
+    cache = get_extraction_cache()
+
+    with open_file_input(file_input, conditional=True) as (stream, file_name, file_hash):
+        cached_result = cache.get(extraction_cache_key(file_hash)) if cache else None
+        if cached_result:
+            logger.info(f"Extraction cache hit for file {file_hash}")
+            return PreparedReport(file_hash, None, cached_result)
+
+        if stream is not None:
+            return prepare_stream(stream, file_name, file_hash)
+
+    logger.info(f"File {file_hash} is unchanged but has no cached result; downloading it again")
+    with open_file_input(file_input) as (stream, file_name, file_hash):
+        return prepare_stream(stream, file_name, file_hash)
+
+async def prepare_report_async(file_input: Union[BinaryIO, bytes, str]) -> PreparedReport:
+    """
+    Async counterpart of `prepare_report`. Cache lookups run in a worker thread.
+
+    Raises:
+        PreflightError: If the report is rejected by the preflight inspection.
+        Exception: If the report cannot be read, downloaded or uploaded.
+    """
+    cache = get_extraction_cache()
+
+    async with open_file_input_async(file_input, conditional=True) as (stream, file_name, file_hash):
+        cached_result = await asyncio.to_thread(cache.get, extraction_cache_key(file_hash)) if cache else None
+        if cached_result:
+            logger.info(f"Extraction cache hit for file {file_hash}")
+            return PreparedReport(file_hash, None, cached_result)
+
+        if stream is not None:
+            return await prepare_stream_async(stream, file_name, file_hash)
+
+    logger.info(f"File {file_hash} is unchanged but has no cached result; downloading it again")
+    async with open_file_input_async(file_input) as (stream, file_name, file_hash):
+        return await prepare_stream_async(stream, file_name, file_hash)
+
+def build_esg_document(merged_result: Dict[str, Any], token_usage: Dict[str, int]) -> Optional[Dict[str, Any]]:
+    """
+    Wraps a merged extraction result into the document stored by `upsert_esg_report`.
+
+    Returns:
+        Optional[Dict[str, Any]]: The document, or None if the company name or reporting year is missing.
+    """
+    report_metadata = merged_result.get("report_metadata") or {}
+    company_legal_name = report_metadata.get("company_legal_name")
+    reporting_year = report_metadata.get("reporting_year")
+
+    if not company_legal_name or not reporting_year:
+        logger.error("Missing 'company_legal_name' or 'reporting_year' in report metadata.")
+        return None
+
+    return {
+        "_id": company_legal_name,
+        "year": str(reporting_year),
+        "esg_report": merged_result,
+        "token_usage": token_usage
+    }
+
+def extract_prepared_report(prepared: PreparedReport) -> Optional[Dict[str, Any]]:
+    """
+    Extracts a prepared report (or returns its cached result) and caches new results.
+    The report's local copy, if any, is closed afterwards.
+
+    Args:
+        prepared (PreparedReport): Output of `prepare_report`.
+
+    Returns:
+        Optional[Dict[str, Any]]: The ESG document with a `cache_hit` flag, or None on failure.
+    """
+    if prepared.cached_result:
+        return {**prepared.cached_result, "token_usage": new_token_usage(), "cache_hit": True}
+
+    try:
+        if prepared.report_windows:
+            merged_result, token_usage = extract_report_windows(
+                get_gemini_client(),
+                prepared.report_windows,
+                file_hash=prepared.file_hash,
+                checkpoint_store=get_checkpoint_store()
+            )
+            return cache_extracted_document(prepared, merged_result, token_usage)
+
+        merged_result, token_usage = extract_report(
+            get_gemini_client(),
+            prepared.uploaded_file,
+            file_hash=prepared.file_hash,
+            checkpoint_store=get_checkpoint_store(),
+            report_pages=prepared.report_pages
+        )
+        return cache_extracted_document(prepared, merged_result, token_usage)
+    finally:
+        prepared.close()
+
+def cache_extracted_document(
+    prepared: PreparedReport,
+    merged_result: Optional[Dict[str, Any]],
+    token_usage: Dict[str, int]
+) -> Optional[Dict[str, Any]]:
+    """
+    Builds the ESG document of a fresh extraction and stores it in the extraction cache.
+
+    Returns:
+        Optional[Dict[str, Any]]: The document with `cache_hit` False, or None if the
+        extraction failed or the report metadata is incomplete.
+    """
+    if merged_result is None:
+        return None
+
+    document = build_esg_document(merged_result, token_usage)
+    if document is None:
+        return None
+
+    cache = get_extraction_cache()
+    if cache:
+        cache.set(extraction_cache_key(prepared.file_hash), document)
+
+    return {**document, "cache_hit": False}
+
+async def extract_prepared_report_async(prepared: PreparedReport) -> Optional[Dict[str, Any]]:
+    """
+    Async counterpart of `extract_prepared_report`.
+    """
+    if prepared.cached_result:
+        return {**prepared.cached_result, "token_usage": new_token_usage(), "cache_hit": True}
+
+    try:
+        if prepared.report_windows:
+            merged_result, token_usage = await extract_report_windows_async(
+                get_gemini_client(),
+                prepared.report_windows,
+                file_hash=prepared.file_hash,
+                checkpoint_store=get_checkpoint_store()
+            )
+            return await asyncio.to_thread(cache_extracted_document, prepared, merged_result, token_usage)
+
+        merged_result, token_usage = await extract_report_async(
+            get_gemini_client(),
+            prepared.uploaded_file,
+            file_hash=prepared.file_hash,
+            checkpoint_store=get_checkpoint_store(),
+            report_pages=prepared.report_pages
+        )
+        return await asyncio.to_thread(cache_extracted_document, prepared, merged_result, token_usage)
+    finally:
+        prepared.close()
+
+def extract_esg_document(file_input: Union[BinaryIO, bytes, str]) -> Optional[Dict[str, Any]]:
+    """
+    Runs the full extraction pipeline for one report: hash, cache lookup, upload,
+    schema extraction and caching of the result.
+
+    Args:
+        file_input (Union[BinaryIO, bytes, str]): Local file path, URL, bytes, or binary stream.
+
+    Returns:
+        Optional[Dict[str, Any]]: The ESG document with a `cache_hit` flag, or None on failure.
+    """
+    try:
+        prepared = prepare_report(file_input)
+    except Exception as upload_err:
+        logger.error(f"Exception during file upload: {upload_err}")
+        return None
+
+    return extract_prepared_report(prepared)
+
+async def extract_esg_document_async(file_input: Union[BinaryIO, bytes, str]) -> Optional[Dict[str, Any]]:
+    """
+    Async counterpart of `extract_esg_document`.
+
+    Returns:
+        Optional[Dict[str, Any]]: The ESG document with a `cache_hit` flag, or None on failure.
+    """
+    try:
+        prepared = await prepare_report_async(file_input)
+    except Exception as upload_err:
+        logger.error(f"Exception during file upload: {upload_err}")
+        return None
+
+    return await extract_prepared_report_async(prepared)
@@ -1,23 +1,35 @@
 import os
 import re
-from typing import Optional, Dict, Union, IO, List, BinaryIO
-import requests
+import asyncio
+import time
+import threading
+from functools import lru_cache
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Optional, Dict, Union, IO, List, BinaryIO, Iterator, AsyncIterator, Tuple, NamedTuple
 import io
 from dotenv import load_dotenv
 
 from google import genai
-from google.genai import types
+from google.genai import types, errors
 
 from src.backend.utils.logger import get_logger
+from src.backend.utils.single_flight import AsyncSingleFlight
 from src.backend.config.config import config
+from src.backend.utils.common_functions import compute_sha256
+from src.backend.services.download_service import download_pdf, download_pdf_async
 
 logger=get_logger()
 load_dotenv()
 
+@lru_cache(maxsize=None)
 def get_gemini_client(api_key: str = None) -> genai.Client:
     """
     Initializes and returns a Gemini (genai) client instance.
 
+    The client is created on first use and shared by later calls with the same key,
+    so importing this module does not require credentials.
+
     Args:
         api_key (str, optional): Your Gemini API key. If not provided, it uses the GEMINI_API_KEY environment variable.
 
@@ -29,16 +41,18 @@ def get_gemini_client(api_key: str = None) -> genai.Client:
         GenAIError: If the Gemini client fails to initialize.
     """
 
+    api_key = api_key or config.GEMINI_API_KEY
+    if not api_key:
+        raise ValueError("Gemini API key must be provided or set in the GEMINI_API_KEY environment variable.")
+
     try:
-        client = genai.Client(api_key = config.GEMINI_API_KEY)
+        client = genai.Client(api_key = api_key)
         logger.info("Gemini (genai) client initialized successfully.")
         return client
     except Exception as e:
         logger.error("Failed to initialize Gemini client: %s", e)
         raise
 
-client = get_gemini_client()
-
 def sanitize_file_name(name: str, max_length: int = 40) -> str:
     """
     Sanitizes a file name to comply with Gemini API naming rules:
@@ -69,15 +83,166 @@ def sanitize_file_name(name: str, max_length: int = 40) -> str:
 
     return name
 
+class RegisteredFile(NamedTuple):
+    """A Gemini file handle with the metadata the registry needs for lookups."""
+    file: types.File
+    size_bytes: Optional[int]
+    sha256_hash: Optional[str]
+    expiration_time: Optional[datetime]
+
+class GeminiFileRegistry:
+    """
+    Local, thread-safe index of the files uploaded to Gemini (name -> handle).
+
+    The index is populated lazily from a paginated `files.list()` the first time it is
+    consulted, kept current as files are uploaded or deleted through this module, and
+    relisted once it is older than `ttl_seconds` to pick up files uploaded or expired
+    elsewhere. A name that is not in the index falls back to one direct `files.get()`,
+    so lookups of known files are O(1) and never touch the network, and files uploaded
+    by other processes are still found between relistings.
+
+    Listing runs without holding the index lock: lookups and uploads carry on against
+    the current index, and only the first load waits for it. Files added or removed
+    while a listing is running are kept as this process left them.
+    """
+
+    def __init__(self, ttl_seconds: float = config.GEMINI_FILE_REGISTRY_TTL_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: Dict[str, RegisteredFile] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._name_locks: Dict[str, threading.Lock] = {}
+        self._loaded_at: Optional[float] = None
+        # Changes made during a listing (name -> entry, None if removed), replayed onto its result.
+        self._changes: Optional[Dict[str, Optional[RegisteredFile]]] = None
+
+    @staticmethod
+    def _is_expired(entry: RegisteredFile) -> bool:
+        return entry.expiration_time is not None and entry.expiration_time <= datetime.now(timezone.utc)
+
+    @staticmethod
+    def _entry(file: types.File) -> RegisteredFile:
+        return RegisteredFile(
+            file=file,
+            size_bytes=file.size_bytes,
+            sha256_hash=file.sha256_hash,
+            expiration_time=file.expiration_time
+        )
+
+    def _set(self, name: str, entry: Optional[RegisteredFile]) -> None:
+        with self._lock:
+            if entry is None:
+                self._entries.pop(name, None)
+            else:
+                self._entries[name] = entry
+            if self._changes is not None:
+                self._changes[name] = entry
+
+    def add(self, file: types.File) -> types.File:
+        """Registers (or replaces) a file handle and returns it."""
+        self._set(file.name, self._entry(file))
+        return file
+
+    def lock_for(self, name: str) -> threading.Lock:
+        """Returns a per-name lock so concurrent uploads of the same content happen once."""
+        with self._lock:
+            return self._name_locks.setdefault(name, threading.Lock())
+
+    def remove(self, name: str) -> None:
+        """Drops a file from the index."""
+        self._set(name, None)
+
+    def refresh(self) -> None:
+        """Rebuilds the index from a full, paginated `files.list()`."""
+        with self._refresh_lock:
+            self._refresh_locked()
+
+    def _refresh_locked(self) -> None:
+        with self._lock:
+            self._changes = {}
+        try:
+            entries = {file.name: self._entry(file) for file in get_gemini_client().files.list()}
+        except BaseException:
+            with self._lock:
+                self._changes = None
+            raise
+
+        with self._lock:
+            for name, entry in self._changes.items():
+                if entry is None:
+                    entries.pop(name, None)
+                else:
+                    entries[name] = entry
+            self._entries = entries
+            self._changes = None
+            self._loaded_at = self.clock()
+        logger.info(f"Gemini file registry loaded with {len(entries)} file(s).")
+
+    def _is_stale(self, loaded_at: Optional[float]) -> bool:
+        if loaded_at is None:
+            return True
+        return bool(self.ttl_seconds) and self.clock() - loaded_at >= self.ttl_seconds
+
+    def _ensure_loaded(self) -> None:
+        loaded_at = self._loaded_at
+        if not self._is_stale(loaded_at):
+            return
+
+        # Only the first load blocks; a stale index keeps serving while one thread relists.
+        if loaded_at is None:
+            self._refresh_lock.acquire()
+        elif not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            if self._is_stale(self._loaded_at):
+                self._refresh_locked()
+        except Exception as e:
+            if self._loaded_at is None:
+                raise
+            logger.error(f"Gemini file registry refresh failed, keeping the current index: {e}")
+        finally:
+            self._refresh_lock.release()
+
+    def names(self) -> List[str]:
+        """Returns the names of all indexed, unexpired files."""
+        self._ensure_loaded()
+        with self._lock:
+            return [name for name, entry in self._entries.items() if not self._is_expired(entry)]
+
+    def get(self, name: str) -> Optional[types.File]:
+        """
+        Returns the file handle for `name`, or None if the file does not exist on Gemini.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                if not self._is_expired(entry):
+                    return entry.file
+                del self._entries[name]
+
+        try:
+            return self.add(get_gemini_client().files.get(name=name))
+        except errors.ClientError as e:
+            # Gemini answers 403 rather than 404 for names that were never uploaded.
+            if e.code in (403, 404):
+                return None
+            raise
+
+file_registry = GeminiFileRegistry()
+
+_upload_flights = AsyncSingleFlight()
+
 def get_files() -> List[str]:
     """
-    Retrieves all uploaded file names from Gemini.
+    Retrieves all uploaded file names from Gemini, refreshing the local file registry.
 
     Returns:
         List[str]: List of existing file names.
     """
-    files = client.files.list()
-    return [file.name for file in files]
+    file_registry.refresh()
+    return file_registry.names()
 
 def delete_files(file_names: Union[str, List[str]], client) -> None:
     """
@@ -93,28 +258,165 @@ def delete_files(file_names: Union[str, List[str]], client) -> None:
     if isinstance(file_names, str):
         file_names = [file_names]
 
-    existing_files = get_files()
-
     for name in file_names:
         logger.info(f"Attempting to delete file: {name}")
-        if name in existing_files:
+        if file_registry.get(name):
             client.files.delete(name=name)
+            file_registry.remove(name)
             logger.info(f"Deleted file: {name}")
         else:
             logger.error(f"File not found: {name}")
 
+def is_url(file: Union[BinaryIO, bytes, str, IO[bytes]]) -> bool:
+    """
+    Returns True if the file input is an http(s) URL.
+    """
+    return isinstance(file, str) and file.startswith(('http://', 'https://'))
+
+def infer_file_name(file: Union[BinaryIO, bytes, str, IO[bytes]]) -> Optional[str]:
+    """
+    Infers a file name from a URL, local path, or named binary stream.
+
+    Args:
+        file (Union[BinaryIO, bytes, str, IO[bytes]]): Local file path, URL, or binary file object.
+
+    Returns:
+        Optional[str]: The base name of the source, or None if it cannot be inferred.
+    """
+    if is_url(file):
+        return os.path.basename(file.split("?")[0])
+    if isinstance(file, str):
+        return os.path.basename(file)
+    if hasattr(file, "name") and isinstance(file.name, str):
+        return os.path.basename(file.name)
+    return None
+
+def _open_local_input(file: Union[BinaryIO, bytes, str, IO[bytes]]) -> Tuple[BinaryIO, str, bool]:
+    """
+    Opens a local path or wraps raw bytes, and hashes the content.
+
+    Returns:
+        Tuple[BinaryIO, str, bool]: The stream, its hex SHA-256 and whether the stream
+        was opened here (and must be closed by the caller).
+    """
+    if isinstance(file, str):
+        if not os.path.isfile(file):
+            raise FileNotFoundError(f"Local file '{file}' does not exist.")
+        stream = open(file, "rb")
+    elif isinstance(file, (bytes, bytearray)):
+        stream = io.BytesIO(file)
+    else:
+        return file, compute_sha256(file), False
+    return stream, compute_sha256(stream), True
+
+@contextmanager
+def open_file_input(
+    file: Union[BinaryIO, bytes, str, IO[bytes]],
+    file_name: Optional[str] = None,
+    conditional: bool = False
+) -> Iterator[Tuple[Optional[BinaryIO], Optional[str], str]]:
+    """
+    Opens a report input as a seekable binary stream and hashes its content.
+
+    URLs are streamed into a spooled temporary file (hashing each chunk as it arrives),
+    local paths are opened and raw bytes are wrapped in memory. Streams opened here are closed on exit;
+    caller-provided streams are left open.
+
+    Args:
+        file (Union[BinaryIO, bytes, str, IO[bytes]]): Local file path, URL, bytes, or binary file object.
+        file_name (Optional[str]): Name for the file. If None, tries to infer it from the source.
+        conditional (bool): Revalidate a previously downloaded URL instead of refetching it.
+
+    Yields:
+        Tuple[Optional[BinaryIO], Optional[str], str]: The binary stream, the file name and
+        the hex SHA-256 of the content. The stream is None only when `conditional` is set
+        and the server reports the URL as not modified.
+
+    Raises:
+        FileNotFoundError: If a local path does not exist.
+        DownloadError: If a URL is too large or does not point to a PDF.
+        requests.RequestException: If a URL cannot be downloaded.
+    """
+    file_name = file_name or infer_file_name(file)
+
+    if is_url(file):
+        stream, file_hash = download_pdf(file, conditional=conditional)
+        owned = stream is not None
+    else:
+        stream, file_hash, owned = _open_local_input(file)
+
+    try:
+        yield stream, file_name, file_hash
+    finally:
+        if owned:
+            stream.close()
+
+@asynccontextmanager
+async def open_file_input_async(
+    file: Union[BinaryIO, bytes, str, IO[bytes]],
+    file_name: Optional[str] = None,
+    conditional: bool = False
+) -> AsyncIterator[Tuple[Optional[BinaryIO], Optional[str], str]]:
+    """
+    Async counterpart of `open_file_input`: URLs are downloaded with the async HTTP
+    client, and local files and streams are hashed in a worker thread.
+
+    Yields:
+        Tuple[Optional[BinaryIO], Optional[str], str]: The binary stream (None if a
+        conditional download was not modified), the file name and the hex SHA-256.
+    """
+    file_name = file_name or infer_file_name(file)
+
+    if is_url(file):
+        stream, file_hash = await download_pdf_async(file, conditional=conditional)
+        owned = stream is not None
+    else:
+        stream, file_hash, owned = await asyncio.to_thread(_open_local_input, file)
+
+    try:
+        yield stream, file_name, file_hash
+    finally:
+        if owned:
+            stream.close()
+
+def content_file_name(file_hash: str) -> str:
+    """
+    Derives the Gemini file name from the content hash, so identical bytes always map
+    to the same Gemini file and different bytes never share one.
+    """
+    return sanitize_file_name(f"esg-{file_hash}")
+
+def get_uploaded_file(file_hash: str) -> Optional[types.File]:
+    """
+    Returns the Gemini file holding the given content, or None if it was never uploaded or has expired.
+    """
+    return file_registry.get(f"files/{content_file_name(file_hash)}")
+
+async def get_uploaded_file_async(file_hash: str) -> Optional[types.File]:
+    """
+    Async counterpart of `get_uploaded_file`; registry lookups run in a worker thread.
+    """
+    return await asyncio.to_thread(get_uploaded_file, file_hash)
+
 def upload_file(
     file: Union[BinaryIO, bytes, str, IO[bytes]],
     file_name: Optional[str] = None,
-    config: Optional[Dict[str, str]] = None
+    config: Optional[Dict[str, str]] = None,
+    sha256: Optional[str] = None
 ) -> Optional[types.File]:
     """
     Uploads a file to the Gemini API, handling local file paths, binary streams, and URLs.
 
+    Uploads are deduplicated by content: the Gemini file name is derived from the
+    SHA-256 of the bytes, so a report that was already uploaded (from any path or URL)
+    is returned without being uploaded again. The original file name is kept as the
+    display name.
+
     Args:
         file (Union[BinaryIO, bytes, str, IO[bytes]]): Local file path, URL, or binary file object.
-        file_name (Optional[str]): Name for the file. If None, tries to infer it from the source.
+        file_name (Optional[str]): Display name for the file. If None, tries to infer it from the source.
         config (Optional[Dict[str, str]]): Extra config like 'mime_type'.
+        sha256 (Optional[str]): Hex SHA-256 of a binary stream the caller already hashed.
 
     Returns:
         Optional[types.File]: The uploaded Gemini file object, or existing one if already uploaded.
@@ -123,63 +425,216 @@ def upload_file(
         Exception: If upload fails.
     """
     try:
-        is_url = isinstance(file, str) and file.startswith(('http://', 'https://'))
-
-        if not file_name:
-            if is_url:
-                file_name = os.path.basename(file.split("?")[0]) 
-            elif isinstance(file, str):
-                file_name = os.path.basename(file)
-            elif hasattr(file, "name"):
-                file_name = os.path.basename(file.name)
-                
-        if not file_name or not file_name.strip():
-            raise ValueError("file_name must be a non-empty string. Could not infer from input.")
-
-        sanitized_name = sanitize_file_name(os.path.splitext(file_name)[0])
-        mime_type = "application/pdf"
-        config = config or {}
-        config.update({"name": sanitized_name, "mime_type": mime_type})
-        gemini_file_key = f"files/{sanitized_name}"
-
-        if gemini_file_key in get_files():
-            logger.info(f"File already exists on Gemini: {gemini_file_key}")
-            return client.files.get(name=gemini_file_key)
-
-        logger.info(f"Uploading file to Gemini: {gemini_file_key}")
-
-        if is_url:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-            response = requests.get(file, headers=headers)
-            response.raise_for_status()
-            file_content = io.BytesIO(response.content)
-            uploaded_file = client.files.upload(file=file_content, config=config)
-            logger.info(f"File uploaded successfully to Gemini: {gemini_file_key}")
-            return uploaded_file
-
-        if isinstance(file, str):
-            if not os.path.isfile(file):
-                raise FileNotFoundError(f"Local file '{file}' does not exist.")
-            with open(file, "rb") as f:
-                uploaded_file = client.files.upload(file=f, config=config)
-                logger.info(f"File uploaded successfully to Gemini: {gemini_file_key}")
-                return uploaded_file
-        
-        if hasattr(file, "read"):
-            file.seek(0)
-            uploaded_file = client.files.upload(file=file, config=config)
-            logger.info(f"File uploaded successfully to Gemini: {gemini_file_key}")
-            return uploaded_file
-        
-        uploaded_file = client.files.upload(file=file, config=config)
+        if sha256 and hasattr(file, "read"):
+            return _upload_stream(file, file_name or infer_file_name(file), sha256, config)
+
+        with open_file_input(file, file_name) as (stream, file_name, file_hash):
+            return _upload_stream(stream, file_name, file_hash, config)
+
+    except Exception as e:
+        logger.error(f"Failed to upload file '{file_name}': {e}")
+        raise
+
+def _upload_config(
+    file_hash: str,
+    file_name: Optional[str],
+    config: Optional[Dict[str, str]] = None
+) -> Tuple[str, Dict[str, str]]:
+    """
+    Returns the Gemini file key and the upload config for content with the given hash.
+    """
+    gemini_name = content_file_name(file_hash)
+    config = dict(config or {})
+    config.update({"name": gemini_name, "mime_type": "application/pdf"})
+    if file_name:
+        config.setdefault("display_name", file_name)
+    return f"files/{gemini_name}", config
+
+def _upload_stream(
+    stream: BinaryIO,
+    file_name: Optional[str],
+    file_hash: str,
+    config: Optional[Dict[str, str]] = None
+) -> types.File:
+    """
+    Uploads an already opened and hashed stream unless its content is already on Gemini.
+    """
+    gemini_file_key, config = _upload_config(file_hash, file_name, config)
+
+    with file_registry.lock_for(gemini_file_key):
+        existing_file = file_registry.get(gemini_file_key)
+        if existing_file:
+            logger.info(f"File already exists on Gemini: {gemini_file_key} ({file_name})")
+            return existing_file
+
+        logger.info(f"Uploading file to Gemini: {gemini_file_key} ({file_name})")
+        stream.seek(0)
+        try:
+            uploaded_file = file_registry.add(get_gemini_client().files.upload(file=stream, config=config))
+        except errors.ClientError as e:
+            # Another process uploaded the same content in the meantime.
+            if e.code == 409:
+                existing_file = file_registry.get(gemini_file_key)
+                if existing_file:
+                    return existing_file
+            raise
+
         logger.info(f"File uploaded successfully to Gemini: {gemini_file_key}")
         return uploaded_file
 
+async def upload_file_async(
+    file: Union[BinaryIO, bytes, str, IO[bytes]],
+    file_name: Optional[str] = None,
+    config: Optional[Dict[str, str]] = None,
+    sha256: Optional[str] = None
+) -> Optional[types.File]:
+    """
+    Async counterpart of `upload_file`, using the genai async client.
+
+    Concurrent uploads of the same content on one event loop share a single request.
+
+    Returns:
+        Optional[types.File]: The uploaded Gemini file object, or existing one if already uploaded.
+
+    Raises:
+        Exception: If upload fails.
+    """
+    try:
+        if sha256 and hasattr(file, "read"):
+            return await _upload_stream_async(file, file_name or infer_file_name(file), sha256, config)
+
+        async with open_file_input_async(file, file_name) as (stream, file_name, file_hash):
+            return await _upload_stream_async(stream, file_name, file_hash, config)
+
     except Exception as e:
         logger.error(f"Failed to upload file '{file_name}': {e}")
         raise
 
+async def _upload_stream_async(
+    stream: BinaryIO,
+    file_name: Optional[str],
+    file_hash: str,
+    config: Optional[Dict[str, str]] = None
+) -> types.File:
+    """
+    Async counterpart of `_upload_stream`.
+    """
+    gemini_file_key, config = _upload_config(file_hash, file_name, config)
+
+    async def upload() -> types.File:
+        existing_file = await asyncio.to_thread(file_registry.get, gemini_file_key)
+        if existing_file:
+            logger.info(f"File already exists on Gemini: {gemini_file_key} ({file_name})")
+            return existing_file
+
+        logger.info(f"Uploading file to Gemini: {gemini_file_key} ({file_name})")
+        stream.seek(0)
+        try:
+            uploaded_file = file_registry.add(await get_gemini_client().aio.files.upload(file=stream, config=config))
+        except errors.ClientError as e:
+            # Another process uploaded the same content in the meantime.
+            if e.code == 409:
+                existing_file = await asyncio.to_thread(file_registry.get, gemini_file_key)
+                if existing_file:
+                    return existing_file
+            raise
+
+        logger.info(f"File uploaded successfully to Gemini: {gemini_file_key}")
+        return uploaded_file
+
+    return await _upload_flights.do(gemini_file_key, upload)
+
+def _context_cache_config(uploaded_file: types.File, system_instruction: str) -> types.CreateCachedContentConfig:
+    """
+    Returns the config of a context cache holding a report and the prompt applied to it.
+    """
+    return types.CreateCachedContentConfig(
+        display_name=uploaded_file.name,
+        contents=[uploaded_file],
+        system_instruction=system_instruction,
+        ttl=f"{config.GEMINI_CONTEXT_CACHE_TTL_SECONDS}s"
+    )
+
+def _log_context_cache(cached_content: types.CachedContent, uploaded_file: types.File) -> None:
+    usage = cached_content.usage_metadata
+    cached_tokens = usage.total_token_count if usage else None
+    logger.info(f"Created context cache {cached_content.name} for {uploaded_file.name} ({cached_tokens} tokens)")
+
+@contextmanager
+def context_cache(
+    client: genai.Client,
+    uploaded_file: types.File,
+    system_instruction: str,
+    enabled: bool = True
+) -> Iterator[Optional[str]]:
+    """
+    Caches an uploaded report together with its system instruction on Gemini for the
+    duration of the block, so the report is tokenized once instead of once per request.
+
+    Yields the cache name to pass as `cached_content` in the generation config, or None
+    when caching is disabled or the cache cannot be created (e.g. the report is below
+    the model's minimum cacheable size); callers then send the file with every request.
+    The cache is deleted on exit and otherwise expires after GEMINI_CONTEXT_CACHE_TTL_SECONDS.
+
+    Usage:
+        with context_cache(client, uploaded_file, PROMPT) as cached_content:
+            ...
+    """
+    if not enabled:
+        yield None
+        return
+
+    try:
+        cached_content = client.caches.create(
+            model=config.GEMINI_EXTRACTION_MODEL,
+            config=_context_cache_config(uploaded_file, system_instruction)
+        )
+    except Exception as e:
+        logger.error(f"Context cache creation failed for {uploaded_file.name}, sending the file with each request: {e}")
+        yield None
+        return
+
+    _log_context_cache(cached_content, uploaded_file)
+    try:
+        yield cached_content.name
+    finally:
+        try:
+            client.caches.delete(name=cached_content.name)
+        except Exception as e:
+            logger.error(f"Failed to delete context cache {cached_content.name}: {e}")
+
+@asynccontextmanager
+async def context_cache_async(
+    client: genai.Client,
+    uploaded_file: types.File,
+    system_instruction: str,
+    enabled: bool = True
+) -> AsyncIterator[Optional[str]]:
+    """
+    Async counterpart of `context_cache`, using the genai async client.
+    """
+    if not enabled:
+        yield None
+        return
+
+    try:
+        cached_content = await client.aio.caches.create(
+            model=config.GEMINI_EXTRACTION_MODEL,
+            config=_context_cache_config(uploaded_file, system_instruction)
+        )
+    except Exception as e:
+        logger.error(f"Context cache creation failed for {uploaded_file.name}, sending the file with each request: {e}")
+        yield None
+        return
+
+    _log_context_cache(cached_content, uploaded_file)
+    try:
+        yield cached_content.name
+    finally:
+        try:
+            await client.aio.caches.delete(name=cached_content.name)
+        except Exception as e:
+            logger.error(f"Failed to delete context cache {cached_content.name}: {e}")
+
 # files = get_files()
 # deleted_file = delete_files(files)
\ No newline at end of file
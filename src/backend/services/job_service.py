@@ -0,0 +1,261 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.collection import Collection
+
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+
+logger = get_logger()
+
+# === Job states ===
+QUEUED = "queued"          # waiting for a worker (new, or retrying after a failure)
+RUNNING = "running"        # claimed by a worker holding an unexpired lease
+SUCCEEDED = "succeeded"
+FAILED = "failed"          # failed on its last allowed attempt
+
+ACTIVE_STATES = (QUEUED, RUNNING)
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+class ExtractionJobQueue:
+    """
+    MongoDB-backed queue of report extraction jobs, shared by any number of worker processes.
+
+    A worker claims a job with an atomic `find_one_and_update`, which gives it a lease
+    of `lease_seconds`. The worker renews the lease with `heartbeat` while the job
+    runs. If the worker dies, the lease expires and the next `claim` hands the job to
+    another worker. Each claim counts as an attempt. A failed attempt puts the job
+    back in the queue after `retry_delay_seconds`, until `max_attempts` is reached. A
+    job whose lease expires on its last attempt (e.g. its report crashes every worker
+    that runs it) is marked as failed instead of being claimed again.
+
+    Job documents:
+        {
+            "_id": str, "source": str, "status": "queued" | "running" | "succeeded" | "failed",
+            "attempts": int, "max_attempts": int, "worker_id": str | None,
+            "available_at": datetime, "lease_expires_at": datetime | None,
+            "created_at": datetime, "updated_at": datetime,
+            "result": dict | None, "error": str | None
+        }
+    """
+
+    def __init__(
+        self,
+        collection: Optional[Collection] = None,
+        lease_seconds: float = config.JOB_LEASE_SECONDS,
+        max_attempts: int = config.JOB_MAX_ATTEMPTS,
+        retry_delay_seconds: float = config.JOB_RETRY_DELAY_SECONDS,
+        clock: Callable[[], datetime] = utc_now
+    ):
+        self._collection = collection
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay_seconds = retry_delay_seconds
+        self.clock = clock
+
+    @property
+    def collection(self) -> Collection:
+        return self._collection if self._collection is not None else config.EXTRACTION_JOB_COLLECTION
+
+    def ensure_indexes(self) -> None:
+        """Creates the indexes used by `claim` and by the duplicate check of `enqueue`."""
+        self.collection.create_index([("status", ASCENDING), ("available_at", ASCENDING)])
+        self.collection.create_index([("status", ASCENDING), ("lease_expires_at", ASCENDING)])
+        self.collection.create_index([("source", ASCENDING), ("status", ASCENDING)])
+
+    def enqueue(self, source: str) -> Dict[str, Any]:
+        """
+        Queues the extraction of a report, unless the same source is already queued or
+        running. The duplicate check is best-effort: two concurrent calls may both queue.
+
+        Args:
+            source (str): Report URL, or a local path readable by the workers.
+
+        Returns:
+            Dict[str, Any]: The new job, or the active job for the same source.
+        """
+        existing = self.collection.find_one({"source": source, "status": {"$in": list(ACTIVE_STATES)}})
+        if existing:
+            logger.info(f"Extraction of '{source}' is already {existing['status']} as job {existing['_id']}")
+            return existing
+
+        now = self.clock()
+        job = {
+            "_id": uuid.uuid4().hex,
+            "source": source,
+            "status": QUEUED,
+            "attempts": 0,
+            "max_attempts": self.max_attempts,
+            "worker_id": None,
+            "available_at": now,
+            "lease_expires_at": None,
+            "created_at": now,
+            "updated_at": now,
+            "result": None,
+            "error": None
+        }
+        self.collection.insert_one(job)
+        logger.info(f"Queued extraction job {job['_id']} for '{source}'")
+        return job
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically claims the oldest runnable job: a queued job that is due, or a
+        running job whose lease has expired and that has attempts left.
+
+        Returns:
+            Optional[Dict[str, Any]]: The claimed job, or None if there is nothing to do.
+        """
+        now = self.clock()
+        self.fail_expired()
+        return self.collection.find_one_and_update(
+            {"$or": [
+                {"status": QUEUED, "available_at": {"$lte": now}},
+                {
+                    "status": RUNNING,
+                    "lease_expires_at": {"$lt": now},
+                    "$expr": {"$lt": ["$attempts", "$max_attempts"]}
+                }
+            ]},
+            {
+                "$set": {
+                    "status": RUNNING,
+                    "worker_id": worker_id,
+                    "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+                    "updated_at": now
+                },
+                "$inc": {"attempts": 1}
+            },
+            sort=[("available_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    def fail_expired(self) -> int:
+        """
+        Marks as failed the running jobs whose lease expired on their last attempt: their
+        worker died without reporting back, as many times as the job may be attempted.
+
+        Returns:
+            int: The number of jobs marked as failed.
+        """
+        now = self.clock()
+        result = self.collection.update_many(
+            {
+                "status": RUNNING,
+                "lease_expires_at": {"$lt": now},
+                "$expr": {"$gte": ["$attempts", "$max_attempts"]}
+            },
+            {"$set": {
+                "status": FAILED,
+                "error": "Lease expired on the last attempt; the worker stopped without reporting a result.",
+                "worker_id": None,
+                "lease_expires_at": None,
+                "updated_at": now
+            }}
+        )
+        if result.modified_count:
+            logger.error(f"Marked {result.modified_count} job(s) as failed after their last lease expired")
+        return result.modified_count
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """
+        Extends the lease of a running job.
+
+        Returns:
+            bool: False if the worker no longer owns the job (its lease expired and the
+            job was claimed by another worker).
+        """
+        now = self.clock()
+        result = self.collection.update_one(
+            {"_id": job_id, "status": RUNNING, "worker_id": worker_id},
+            {"$set": {"lease_expires_at": now + timedelta(seconds=self.lease_seconds), "updated_at": now}}
+        )
+        return result.matched_count == 1
+
+    def complete(self, job_id: str, worker_id: str, result: Dict[str, Any]) -> bool:
+        """
+        Marks a job as succeeded with its result.
+
+        Returns:
+            bool: False if the worker no longer owns the job.
+        """
+        update = self.collection.update_one(
+            {"_id": job_id, "status": RUNNING, "worker_id": worker_id},
+            {"$set": {
+                "status": SUCCEEDED,
+                "result": result,
+                "error": None,
+                "lease_expires_at": None,
+                "updated_at": self.clock()
+            }}
+        )
+        return update.matched_count == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry: bool = True) -> Optional[str]:
+        """
+        Records a failed attempt: the job is queued again after `retry_delay_seconds`,
+        or marked as failed once it has used all its attempts.
+
+        Args:
+            job_id (str): The failed job.
+            worker_id (str): The worker that ran it.
+            error (str): Why the attempt failed.
+            retry (bool): False to mark the job as failed right away, when another attempt
+                would fail the same way (e.g. the report is rejected by the preflight).
+
+        Returns:
+            Optional[str]: The job's new status, or None if the worker no longer owns the job.
+        """
+        job = self.collection.find_one({"_id": job_id, "status": RUNNING, "worker_id": worker_id})
+        if job is None:
+            return None
+
+        now = self.clock()
+        status = FAILED if not retry or job["attempts"] >= job.get("max_attempts", self.max_attempts) else QUEUED
+        update = self.collection.update_one(
+            {"_id": job_id, "status": RUNNING, "worker_id": worker_id},
+            {"$set": {
+                "status": status,
+                "error": error,
+                "worker_id": None,
+                "lease_expires_at": None,
+                "available_at": now + timedelta(seconds=self.retry_delay_seconds),
+                "updated_at": now
+            }}
+        )
+        return status if update.matched_count == 1 else None
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Returns a job document, or None if the id is unknown."""
+        return self.collection.find_one({"_id": job_id})
+
+def job_status(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the public view of a job, as reported to the agent.
+    """
+    def timestamp(value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+
+    return {
+        "job_id": job["_id"],
+        "source": job["source"],
+        "status": job["status"],
+        "attempts": job.get("attempts", 0),
+        "max_attempts": job.get("max_attempts"),
+        "created_at": timestamp(job.get("created_at")),
+        "updated_at": timestamp(job.get("updated_at")),
+        "result": job.get("result"),
+        "error": job.get("error")
+    }
+
+@lru_cache(maxsize=1)
+def get_job_queue() -> ExtractionJobQueue:
+    """
+    Returns the process-wide extraction job queue.
+    """
+    return ExtractionJobQueue()
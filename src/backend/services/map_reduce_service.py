@@ -0,0 +1,348 @@
+import re
+import json
+import asyncio
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from google.genai import types
+from pydantic import BaseModel
+from pypdf.errors import PyPdfError
+
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+from src.backend.services.gemini_service import upload_file, upload_file_async
+from src.backend.services.page_routing_service import SpooledPdf, page_subset_key
+
+logger = get_logger()
+
+# Values the extractor uses for data a report does not disclose (see EXTRACTOR_TOOL_PROMPT).
+MISSING_PLACEHOLDERS = frozenset({
+    "", "data_not_found", "not_found", "not found", "not_available", "not available",
+    "not_reported", "not reported", "n/a", "na", "none", "null", "unknown",
+})
+
+# Field giving the reporting year of what a window describes (ReportMetadata).
+REPORTING_YEAR_FIELD = "reporting_year"
+YEAR_PATTERN = re.compile(r"(?<!\d)(?:19|20)\d{2}(?!\d)")
+
+class PageWindow(NamedTuple):
+    """A contiguous range of report pages: zero-based, `start` inclusive and `end` exclusive."""
+    index: int
+    start: int
+    end: int
+
+    @property
+    def pages(self) -> List[int]:
+        return list(range(self.start, self.end))
+
+    @property
+    def label(self) -> str:
+        return f"pages {self.start + 1}-{self.end}"
+
+def page_windows(page_count: int, window_pages: Optional[int] = None, overlap: Optional[int] = None) -> List[PageWindow]:
+    """
+    Splits a report into windows of `window_pages` pages, each sharing `overlap` pages
+    with the previous one so that tables running across a window boundary are seen whole
+    by at least one window.
+
+    Args:
+        page_count (int): Pages in the report.
+        window_pages (int, optional): Pages per window. Defaults to `config.MAP_REDUCE_WINDOW_PAGES`.
+        overlap (int, optional): Pages shared by consecutive windows. Defaults to
+            `config.MAP_REDUCE_WINDOW_OVERLAP`.
+
+    Returns:
+        List[PageWindow]: The windows in page order, covering every page.
+    """
+    window_pages = max(1, window_pages or config.MAP_REDUCE_WINDOW_PAGES)
+    overlap = config.MAP_REDUCE_WINDOW_OVERLAP if overlap is None else overlap
+    step = window_pages - max(0, min(overlap, window_pages - 1))
+
+    windows: List[PageWindow] = []
+    start = 0
+    while start < page_count:
+        end = min(start + window_pages, page_count)
+        windows.append(PageWindow(len(windows), start, end))
+        if end == page_count:
+            break
+        start += step
+    return windows
+
+def window_section_key(schema_name: str, window: PageWindow) -> str:
+    """
+    Returns the name a section extracted from one window is checkpointed under.
+    """
+    return f"{schema_name}.pages-{window.start + 1}-{window.end}"
+
+class ReportWindows:
+    """
+    A report split into page windows, each uploaded to Gemini as a separate PDF and
+    extracted on its own (the map step); the window results are merged per field by
+    `reduce_sections` (the reduce step).
+
+    The report is parsed once (see `SpooledPdf`); call `close` when done with it.
+
+    Usage:
+        report_windows = ReportWindows(stream, file_hash, "report.pdf")
+        report_windows.windows  # [PageWindow(0, 0, 50), PageWindow(1, 48, 98), ...]
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        file_hash: str,
+        file_name: Optional[str] = None,
+        window_pages: Optional[int] = None,
+        overlap: Optional[int] = None
+    ):
+        self.pdf = SpooledPdf(stream)
+        self.file_hash = file_hash
+        self.file_name = file_name
+        self.page_count = self.pdf.page_count
+        self.windows = page_windows(self.page_count, window_pages, overlap)
+
+    def upload_args(self, window: PageWindow) -> Dict[str, Any]:
+        """
+        Returns the `upload_file` arguments of a window: its pages as a separate PDF, or
+        the whole report when the window covers all of it. The caller is responsible for
+        closing the file.
+        """
+        if window.start == 0 and window.end == self.page_count:
+            return {"file": self.pdf.copy(), "file_name": self.file_name, "sha256": self.file_hash}
+
+        base_name = (self.file_name or "report").rsplit(".", 1)[0]
+        return {
+            "file": self.pdf.subset(window.pages),
+            "file_name": f"{base_name}-pages-{window.start + 1}-{window.end}.pdf",
+            "sha256": page_subset_key(self.file_hash, window.pages)
+        }
+
+    def close(self) -> None:
+        self.pdf.close()
+
+def load_report_windows(stream: BinaryIO, file_hash: str, file_name: Optional[str] = None) -> Optional[ReportWindows]:
+    """
+    Reads a report and splits it into page windows for map-reduce extraction.
+
+    Returns:
+        Optional[ReportWindows]: The windows, or None if the PDF cannot be parsed.
+    """
+    try:
+        report_windows = ReportWindows(stream, file_hash, file_name)
+    except (PyPdfError, ValueError, KeyError) as e:
+        logger.error(f"Cannot split file {file_hash} into page windows, the PDF could not be parsed: {e}")
+        return None
+
+    logger.info(
+        f"Split {report_windows.page_count} pages of file {file_hash} into {len(report_windows.windows)} "
+        f"window(s) of up to {config.MAP_REDUCE_WINDOW_PAGES} pages"
+    )
+    return report_windows
+
+def map_reduce_signature() -> Optional[Dict[str, Any]]:
+    """
+    Returns the window settings that affect extraction results, for the extraction
+    cache key, or None when only reports too long to send whole are split.
+    """
+    if not config.MAP_REDUCE_MIN_PAGES:
+        return None
+    return {
+        "min_pages": config.MAP_REDUCE_MIN_PAGES,
+        "window_pages": config.MAP_REDUCE_WINDOW_PAGES,
+        "overlap": config.MAP_REDUCE_WINDOW_OVERLAP,
+    }
+
+def upload_window(report_windows: ReportWindows, window: PageWindow) -> types.File:
+    """
+    Uploads the pages of a window to Gemini. Windows are deduplicated by content, so the
+    requests of every section group of a window share one upload.
+
+    Raises:
+        Exception: If the upload fails.
+    """
+    upload_args = report_windows.upload_args(window)
+    with upload_args["file"]:
+        return upload_file(**upload_args)
+
+async def upload_window_async(report_windows: ReportWindows, window: PageWindow) -> types.File:
+    """
+    Async counterpart of `upload_window`; the window PDF is written in a worker thread.
+    """
+    upload_args = await asyncio.to_thread(report_windows.upload_args, window)
+    with upload_args["file"]:
+        return await upload_file_async(**upload_args)
+
+# === Reduce ===
+
+class Candidate(NamedTuple):
+    """A value of one field as extracted from one window."""
+    value: Any
+    window: PageWindow
+    year: Optional[int]
+
+def is_missing(value: Any) -> bool:
+    """
+    Returns True for values that carry no data: null, placeholders such as
+    "data_not_found", empty lists, and objects whose fields are all missing.
+    """
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value.strip().lower() in MISSING_PLACEHOLDERS
+    if isinstance(value, list):
+        return not value
+    if isinstance(value, dict):
+        return all(is_missing(item) for item in value.values())
+    return False
+
+def is_record(value: Any) -> bool:
+    """
+    Returns True for objects without nested objects or lists (e.g. a Measurement), which
+    are merged as a whole so a value is never combined with the unit of another window.
+    """
+    return isinstance(value, dict) and not any(isinstance(item, (dict, list)) for item in value.values())
+
+def canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+def reporting_year_of(value: Any) -> Optional[int]:
+    """
+    Returns the most recent year found in the `reporting_year` fields of extracted sections.
+    """
+    years: List[int] = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == REPORTING_YEAR_FIELD and not is_missing(item):
+                years.extend(int(year) for year in YEAR_PATTERN.findall(str(item)))
+            else:
+                year = reporting_year_of(item)
+                if year is not None:
+                    years.append(year)
+    elif isinstance(value, list):
+        years.extend(year for year in map(reporting_year_of, value) if year is not None)
+    return max(years) if years else None
+
+def choose_value(present: List[Candidate], path: str, conflicts: List[Dict[str, Any]]) -> Any:
+    """
+    Picks one of several non-missing values of a field. Identical values are grouped;
+    when they differ, the value from the most recent reporting year wins, then the value
+    reported by the most windows, then the one from the earliest window. Differences are
+    recorded in `conflicts`.
+    """
+    groups: Dict[str, List[Candidate]] = {}
+    for candidate in present:
+        groups.setdefault(canonical(candidate.value), []).append(candidate)
+    if len(groups) == 1:
+        return present[0].value
+
+    def rank(group: List[Candidate]) -> Tuple[int, int, int]:
+        years = [candidate.year for candidate in group if candidate.year is not None]
+        return -(max(years) if years else 0), -len(group), group[0].window.index
+
+    ranked = sorted(groups.values(), key=rank)
+    chosen = ranked[0][0].value
+    conflicts.append({
+        "field": path,
+        "chosen": chosen,
+        "candidates": [
+            {
+                "value": group[0].value,
+                "pages": [candidate.window.label for candidate in group],
+                "reporting_year": max((c.year for c in group if c.year is not None), default=None)
+            }
+            for group in ranked
+        ]
+    })
+    return chosen
+
+def merge_candidates(candidates: List[Candidate], path: str, conflicts: List[Dict[str, Any]]) -> Any:
+    """
+    Merges the values of one field extracted from every window, in window order:
+
+    - missing values are ignored as long as any window reports the field;
+    - objects are merged field by field, records (see `is_record`) as a whole, keeping
+      the most complete ones: a record whose filled fields are a subset of another's is dropped;
+    - lists are concatenated without duplicates;
+    - differing values are resolved by `choose_value` and recorded as conflicts.
+    """
+    present = [candidate for candidate in candidates if not is_missing(candidate.value)]
+    if not present:
+        return next((candidate.value for candidate in candidates if candidate.value is not None), None)
+
+    if all(isinstance(candidate.value, dict) for candidate in present):
+        if not all(is_record(candidate.value) for candidate in present):
+            objects = [candidate for candidate in candidates if isinstance(candidate.value, dict)]
+            keys = list(dict.fromkeys(key for candidate in objects for key in candidate.value))
+            return {
+                key: merge_candidates(
+                    [candidate._replace(value=candidate.value.get(key)) for candidate in objects],
+                    f"{path}.{key}",
+                    conflicts
+                )
+                for key in keys
+            }
+
+        filled = [
+            {key for key, item in candidate.value.items() if not is_missing(item)}
+            for candidate in present
+        ]
+        present = [
+            candidate for candidate, fields in zip(present, filled)
+            if not any(fields < other for other in filled)
+        ]
+        return choose_value(present, path, conflicts)
+
+    if all(isinstance(candidate.value, list) for candidate in present):
+        items: Dict[str, Any] = {}
+        for candidate in present:
+            for item in candidate.value:
+                items.setdefault(canonical(item), item)
+        return list(items.values())
+
+    return choose_value(present, path, conflicts)
+
+def reduce_sections(
+    schemas: List[Type[BaseModel]],
+    windows: List[PageWindow],
+    window_sections: Dict[str, Dict[str, Any]]
+) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Merges the sections extracted from every window into one section per schema.
+
+    The merge is deterministic: it only depends on the window results, never on the
+    order in which the requests finished. Each window's reporting year is taken from
+    the `reporting_year` it extracted (ReportMetadata), so values from comparative
+    tables of earlier years lose against those of the year being reported.
+
+    Args:
+        schemas (List[Type[BaseModel]]): Extracted sections.
+        windows (List[PageWindow]): The report's windows.
+        window_sections (Dict[str, Dict[str, Any]]): Sections by `window_section_key`;
+            every schema must have been extracted from every window.
+
+    Returns:
+        Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]: The merged sections by
+        schema name and the conflicts found: the field path, the chosen value and every
+        distinct value with the windows that reported it.
+    """
+    years = {
+        window.index: reporting_year_of([
+            window_sections[window_section_key(schema.__name__, window)] for schema in schemas
+        ])
+        for window in windows
+    }
+
+    sections: Dict[str, Dict[str, Any]] = {}
+    conflicts: List[Dict[str, Any]] = []
+    for schema in schemas:
+        candidates = [
+            Candidate(window_sections[window_section_key(schema.__name__, window)], window, years[window.index])
+            for window in windows
+        ]
+        sections[schema.__name__] = merge_candidates(candidates, schema.__name__, conflicts) or {}
+
+    if conflicts:
+        logger.info(
+            f"Merged {len(windows)} window(s) with {len(conflicts)} conflicting field(s): "
+            + ", ".join(conflict["field"] for conflict in conflicts)
+        )
+    return sections, conflicts
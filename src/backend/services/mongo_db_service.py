@@ -1,14 +1,22 @@
 import re
-from typing import List, Dict
+import time
+import threading
+from typing import Callable, List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from dotenv import load_dotenv
-from pymongo.errors import PyMongoError
+from pymongo.errors import PyMongoError, BulkWriteError
+from pymongo.collection import Collection
+from pymongo.results import UpdateResult
 from unidecode import unidecode
-from pymongo import errors
+from pymongo import errors, UpdateOne
 from bson import ObjectId
 
 from src.backend.utils.logger import get_logger
+from src.backend.utils.async_utils import loop_local
 from src.backend.config.config import config
 
+if TYPE_CHECKING:
+    from pymongo.asynchronous.collection import AsyncCollection
+
 logger = get_logger()
 load_dotenv()
 
@@ -49,7 +57,47 @@ def list_collections() -> List[str]:
         logger.exception(f"Unexpected error while listing collections: {str(e)}")
     return []
 
-def upsert_esg_report(document: Dict) -> bool:
+REQUIRED_ESG_DOCUMENT_KEYS = {"_id", "year", "esg_report"}
+
+def validate_esg_document(document: Dict) -> Optional[Dict[str, Any]]:
+    """
+    Checks that a document can be upserted as a year-specific ESG report.
+
+    Args:
+        document (Dict): Must contain '_id', 'year', and 'esg_report'.
+
+    Returns:
+        Optional[Dict[str, Any]]: None if the document is valid, otherwise an error result.
+    """
+    if not isinstance(document, dict):
+        msg = "Document must be a dict."
+        logger.error(msg)
+        return {"status": "error", "message": msg}
+
+    if not REQUIRED_ESG_DOCUMENT_KEYS.issubset(document):
+        missing = REQUIRED_ESG_DOCUMENT_KEYS - document.keys()
+        msg = f"Missing keys in document: {missing}"
+        logger.error(msg)
+        return {
+            "status": "error",
+            "company_id": document.get("_id"),
+            "year": str(document.get("year", "")),
+            "message": msg,
+            "missing_keys": sorted(missing)
+        }
+    return None
+
+def build_esg_report_update(document: Dict) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Builds the filter and `$set` update for a validated ESG report document.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, Any]]: The filter and update documents.
+    """
+    update_path = f"esg_reports.{document['year']}"
+    return {"_id": document["_id"]}, {"$set": {update_path: document["esg_report"]}}
+
+def upsert_esg_report(document: Dict) -> Dict[str, Any]:
     """
     Upserts a year-specific ESG report into the 'esg_reports.{year}' field of a company document.
 
@@ -60,69 +108,246 @@ def upsert_esg_report(document: Dict) -> bool:
         document (Dict): Must contain '_id', 'year', and 'esg_report'.
 
     Returns:
-        Dict[str, Any]: Result including status ('inserted' or 'updated'), message, and identifiers.
+        Dict[str, Any]: Result including status ('inserted', 'updated', 'unchanged' or 'error'),
+        message, and identifiers.
+    """
+    try:
+        error = validate_esg_document(document)
+        if error:
+            return error
+
+        logger.debug(f"Document : {document}")
+        collection = config.ESG_REPORT_COLLECTION
+        result = collection.update_one(*build_esg_report_update(document), upsert=True)
+        return upsert_result(document, result)
+    except Exception as e:
+        return upsert_error(document, e)
+
+async def upsert_esg_report_async(document: Dict) -> Dict[str, Any]:
+    """
+    Async counterpart of `upsert_esg_report`, using pymongo's AsyncMongoClient.
+
+    Returns:
+        Dict[str, Any]: Result including status ('inserted', 'updated', 'unchanged' or 'error'),
+        message, and identifiers.
     """
     try:
-        logger.info(f"Document : {document}")
-        required_keys = {"_id", "year", "esg_report"}
-        if not required_keys.issubset(document):
-            missing = required_keys - document.keys()
-            msg = f"Missing keys in document: {missing}"
+        error = validate_esg_document(document)
+        if error:
+            return error
+
+        logger.debug(f"Document : {document}")
+        collection = get_async_esg_report_collection()
+        result = await collection.update_one(*build_esg_report_update(document), upsert=True)
+        return upsert_result(document, result)
+    except Exception as e:
+        return upsert_error(document, e)
+
+@loop_local
+def get_async_esg_report_collection() -> "AsyncCollection":
+    """
+    Returns the ESG report collection through the async MongoDB client of the running event loop.
+    """
+    return config.get_async_mongo_client()[config.MONGODB_DB_NAME][config.ESG_REPORT_COLLECTION_NAME]
+
+def upsert_result(document: Dict, result: UpdateResult) -> Dict[str, Any]:
+    """
+    Builds the status of a single ESG report upsert from its `UpdateResult`.
+    """
+    company_id = document["_id"]
+    year = str(document["year"])
+    if result.upserted_id:
+        status, msg = "inserted", f"ESG report inserted for company_id={company_id}, year={year}"
+    elif result.modified_count > 0:
+        status, msg = "updated", f"ESG report updated for company_id={company_id}, year={year}"
+    else:
+        status, msg = "unchanged", f"No changes made to ESG report for company_id={company_id}, year={year}"
+
+    logger.info(msg)
+    return {
+        "status": status,
+        "company_id": company_id,
+        "year": year,
+        "message": msg
+    }
+
+def upsert_error(document: Dict, error: Exception) -> Dict[str, Any]:
+    """
+    Builds the error status of a failed ESG report upsert.
+    """
+    msg = f"Exception during ESG report upsert: {error}"
+    logger.error(msg)
+    return {
+        "status": "error",
+        "company_id": document.get("_id") if isinstance(document, dict) else None,
+        "year": str(document.get("year", "")) if isinstance(document, dict) else "",
+        "message": msg
+    }
+
+class ESGReportBulkWriter:
+    """
+    Buffers ESG report upserts and writes them with a single unordered `bulk_write`.
+
+    The buffer is flushed when it holds `max_operations` reports or when the oldest
+    buffered report is older than `max_delay_seconds`, and on `flush()` / exiting the
+    context manager. The delay is checked on every `add`; callers that may stop adding
+    for a while (e.g. while workers are busy extracting) call `flush_if_due()`
+    periodically so a partial batch is not held back. Each report is returned with its
+    own status. MongoDB only reports the number of modified documents per batch, so a
+    matched report is 'updated' or 'unchanged' when the whole batch agrees and
+    'matched' when the batch mixes both.
+
+    The buffer is swapped out under a lock and written outside it, so other threads
+    keep adding reports during a `bulk_write`; batches are still written one at a time,
+    in the order they were taken.
+
+    Usage:
+        with ESGReportBulkWriter() as writer:
+            for document in documents:
+                writer.add(document)
+        results = writer.results
+    """
+
+    def __init__(
+        self,
+        collection: Optional[Collection] = None,
+        max_operations: int = config.MONGO_BULK_MAX_OPERATIONS,
+        max_delay_seconds: float = config.MONGO_BULK_MAX_DELAY_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.collection = collection
+        self.max_operations = max_operations
+        self.max_delay_seconds = max_delay_seconds
+        self.clock = clock
+        self.results: List[Dict[str, Any]] = []
+        self._pending: List[Tuple[UpdateOne, Dict[str, Any], Any]] = []
+        self._oldest_pending_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def __enter__(self) -> "ESGReportBulkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+
+    def add(self, document: Dict, context: Any = None) -> List[Dict[str, Any]]:
+        """
+        Buffers one report, flushing if a count or time threshold is reached.
+
+        Args:
+            document (Dict): Must contain '_id', 'year', and 'esg_report'.
+            context (Any, optional): Caller data returned with the report's result.
+
+        Returns:
+            List[Dict[str, Any]]: Results of the reports written by this call (empty if nothing was flushed).
+        """
+        error = validate_esg_document(document)
+        if error:
+            result = {**error, "context": context}
+            with self._lock:
+                self.results.append(result)
+            return [result]
+
+        operation = UpdateOne(*build_esg_report_update(document), upsert=True)
+        identity = {"company_id": document["_id"], "year": str(document["year"])}
+        with self._lock:
+            if not self._pending:
+                self._oldest_pending_at = self.clock()
+            self._pending.append((operation, identity, context))
+            due = len(self._pending) >= self.max_operations or self._delay_elapsed_locked()
+        return self.flush() if due else []
+
+    def flush_if_due(self) -> List[Dict[str, Any]]:
+        """
+        Writes the buffered reports if the oldest of them has waited `max_delay_seconds`.
+
+        Returns:
+            List[Dict[str, Any]]: One result per written report (empty if nothing was due).
+        """
+        with self._lock:
+            due = self._delay_elapsed_locked()
+        return self.flush() if due else []
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        Writes all buffered reports.
+
+        Returns:
+            List[Dict[str, Any]]: One result per written report, in the order they were added.
+        """
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                self._oldest_pending_at = None
+            if not pending:
+                return []
+            results = self._write(pending)
+            with self._lock:
+                self.results.extend(results)
+        return results
+
+    def _delay_elapsed_locked(self) -> bool:
+        return bool(self._pending) and self.clock() - self._oldest_pending_at >= self.max_delay_seconds
+
+    def _write(self, pending: List[Tuple[UpdateOne, Dict[str, Any], Any]]) -> List[Dict[str, Any]]:
+        operations = [operation for operation, _, _ in pending]
+        collection = self.collection if self.collection is not None else config.ESG_REPORT_COLLECTION
+
+        failed: Dict[int, str] = {}
+        try:
+            result = collection.bulk_write(operations, ordered=False)
+            upserted = set(result.upserted_ids or {})
+            matched_count, modified_count = result.matched_count, result.modified_count
+        except BulkWriteError as e:
+            details = e.details
+            failed = {error["index"]: error.get("errmsg", "write error") for error in details.get("writeErrors", [])}
+            upserted = {entry["index"] for entry in details.get("upserted", [])}
+            matched_count, modified_count = details.get("nMatched", 0), details.get("nModified", 0)
+        except PyMongoError as e:
+            msg = f"Exception during bulk ESG report upsert: {e}"
             logger.error(msg)
-            return {"status": "error", "message": msg}
+            failed = {index: msg for index in range(len(pending))}
+            upserted, matched_count, modified_count = set(), 0, 0
 
-        company_id = document["_id"]
-        year = str(document["year"])
-        esg_report_data = document["esg_report"]
+        if modified_count == matched_count:
+            matched_status = "updated"
+        elif modified_count == 0:
+            matched_status = "unchanged"
+        else:
+            matched_status = "matched"
 
-        update_path = f"esg_reports.{year}"
-        update_doc = { "$set": { update_path: esg_report_data }}
-        collection = config.ESG_REPORT_COLLECTION
+        results = []
+        for index, (_, identity, context) in enumerate(pending):
+            if index in failed:
+                results.append({"status": "error", **identity, "message": failed[index], "context": context})
+            elif index in upserted:
+                results.append({"status": "inserted", **identity, "context": context})
+            else:
+                results.append({"status": matched_status, **identity, "context": context})
 
-        result = collection.update_one(
-            { "_id": company_id },
-            update_doc,
-            upsert=True
+        logger.info(
+            f"Bulk upserted {len(pending)} ESG report(s): {len(upserted)} inserted, "
+            f"{modified_count} modified, {len(failed)} failed"
         )
+        return results
 
-        if result.upserted_id:
-            msg = f"ESG report inserted for company_id={company_id}, year={year}"
-            logger.info(msg)
-            return {
-                "status": "inserted",
-                "company_id": company_id,
-                "year": year,
-                "message": msg
-            }
-        
-        elif result.modified_count > 0:
-            msg = f"ESG report updated for company_id={company_id}, year={year}"
-            logger.info(msg)
-            return {
-                "status": "updated",
-                "company_id": company_id,
-                "year": year,
-                "message": msg
-            }
-        
-        else:
-            msg = f"No changes made to ESG report for company_id={company_id}, year={year}"
-            logger.info(msg)
-            return {
-                "status": "unchanged",
-                "company_id": company_id,
-                "year": year,
-                "message": msg
-            }
-    except Exception as e:
-        msg = f"Exception during ESG report upsert: {e}"
-        logger.error(msg)
-        return {
-            "status": "error",
-            "company_id": document.get("_id"),
-            "year": str(document.get("year", "")),
-            "message": msg
-        }
+def upsert_esg_reports(documents: List[Dict]) -> List[Dict[str, Any]]:
+    """
+    Upserts many year-specific ESG reports with batched `bulk_write` calls.
+
+    Args:
+        documents (List[Dict]): Each must contain '_id', 'year', and 'esg_report'.
+
+    Returns:
+        List[Dict[str, Any]]: One result per document, in input order.
+    """
+    with ESGReportBulkWriter() as writer:
+        for index, document in enumerate(documents):
+            writer.add(document, context=index)
+
+    results = sorted(writer.results, key=lambda result: result["context"])
+    return [{key: value for key, value in result.items() if key != "context"} for result in results]
 
 def retrieve_document_by_id(collection_name: str, document_id, convert_to_object_id: bool = False):
     """
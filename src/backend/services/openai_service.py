@@ -1,14 +1,21 @@
 import os
-
-from openai import OpenAI, OpenAIError
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from src.backend.utils.logger import get_logger
+from src.backend.utils.async_utils import loop_local
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
 
 logger = get_logger()
 
-def get_openai_client(api_key: str = None) -> OpenAI:
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str = None) -> "OpenAI":
     """
     Initializes and returns an OpenAI client instance.
+
+    The client is created on first use and shared by later calls with the same key.
     
     Args:
         api_key (str, optional): Your OpenAI API key. If not provided, it uses the OPENAI_API_KEY environment variable.
@@ -25,10 +32,29 @@ def get_openai_client(api_key: str = None) -> OpenAI:
     if not api_key:
         raise ValueError("OpenAI API key must be provided or set in the OPENAI_API_KEY environment variable.")
     
+    from openai import OpenAI, OpenAIError
     try:
         client = OpenAI(api_key=api_key)
         logger.info("OpenAI client initialized successfully.")
         return client
     except OpenAIError as e:
         logger.error("Failed to initialize OpenAI client: %s", e)
-        raise
\ No newline at end of file
+        raise
+
+@loop_local
+def get_async_openai_client() -> "AsyncOpenAI":
+    """
+    Returns the AsyncOpenAI client of the running event loop, created on first use.
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set.
+        RuntimeError: If called outside a running event loop.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OpenAI API key must be set in the OPENAI_API_KEY environment variable.")
+
+    from openai import AsyncOpenAI
+    client = AsyncOpenAI(api_key=api_key)
+    logger.info("Async OpenAI client initialized successfully.")
+    return client
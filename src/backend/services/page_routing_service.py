@@ -0,0 +1,295 @@
+import shutil
+import asyncio
+import hashlib
+import tempfile
+import threading
+from typing import Any, BinaryIO, Dict, List, Optional, Type
+
+from google.genai import types
+from pydantic import BaseModel
+from pypdf import PdfReader, PdfWriter
+from pypdf.errors import PyPdfError
+
+from src.backend.utils.bm25 import BM25Index
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+from src.backend.services.download_service import CHUNK_SIZE
+from src.backend.services.gemini_service import upload_file, upload_file_async
+
+logger = get_logger()
+
+# Keywords describing where each RESPONSE_SCHEMA section is reported. Pages are ranked
+# against them with BM25; sections without an entry are sent the whole report.
+SECTION_QUERIES: Dict[str, str] = {
+    "ReportMetadata": (
+        "sustainability esg annual integrated report reporting year period fiscal company name "
+        "headquarters scope boundary gri sasb tcfd about this report"
+    ),
+    "EnvironmentalEmissionsEnergy": (
+        "greenhouse gas ghg emissions scope co2 co2e tco2e carbon intensity energy consumption "
+        "electricity fuel renewable non-renewable mwh gj"
+    ),
+    "EnvironmentalWaterWaste": (
+        "water withdrawal discharge consumption effluent groundwater surface megalitres m3 waste "
+        "generated hazardous non-hazardous landfill recycled recovered disposal incineration"
+    ),
+    "SocialTrainingAndCSR": (
+        "training hours human rights health safety ltifr lost time injury frequency rate incidents "
+        "fatalities grievances third-party assessment csr community beneficiaries"
+    ),
+    "SocialWorkforceAndWellBeing": (
+        "employees workers workforce gender female male diversity turnover attrition new hires "
+        "well-being insurance benefits parental leave wages minimum wage remuneration"
+    ),
+    "GovernanceEthicsAndComplaints": (
+        "non-compliance fines penalties disciplinary action corruption bribery ethics conduct "
+        "consumer complaints customer data breaches privacy"
+    ),
+    "GovernanceStructureAndOpenness": (
+        "board directors governance women diversity committee purchases sales concentration trading "
+        "houses dealers distributors related party transactions"
+    ),
+    "MaterialityAssessment": (
+        "materiality assessment matrix material topics issues stakeholders importance impact priority"
+    ),
+}
+
+# Sections also sent the first pages of the report (cover, about this report).
+LEADING_PAGE_SECTIONS = frozenset({"ReportMetadata"})
+
+# Reports with a text layer on fewer pages than this (e.g. scanned reports) are not routed.
+MIN_TEXT_COVERAGE = 0.5
+
+def extract_page_text(page: Any) -> str:
+    """
+    Returns the text layer of a PDF page, or an empty string if it cannot be extracted.
+    """
+    try:
+        return page.extract_text() or ""
+    except Exception as e:
+        logger.info(f"Skipping text of an unreadable PDF page: {e}")
+        return ""
+
+def page_subset_key(file_hash: str, pages: List[int]) -> str:
+    """
+    Returns a stable content key for a page subset of a report. Used instead of the
+    hash of the subset bytes, which vary between writes, so the same subset is uploaded once.
+    """
+    page_list = ",".join(str(page) for page in pages)
+    return hashlib.sha256(f"{file_hash}:pages:{page_list}".encode("utf-8")).hexdigest()
+
+class SpooledPdf:
+    """
+    A private copy of a report, parsed once and shared by every page subset written from it.
+
+    The copy is kept in memory up to DOWNLOAD_SPOOL_MAX_MEMORY_BYTES and spilled to disk
+    beyond that, like downloads (see `PDFSpool`), so long reports are never held in RAM
+    whole, and it stays readable after the caller's stream is closed. pypdf readers are
+    not thread-safe, so the reader is only used under a lock.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self.file = tempfile.SpooledTemporaryFile(max_size=config.DOWNLOAD_SPOOL_MAX_MEMORY_BYTES)
+        self._lock = threading.Lock()
+        try:
+            stream.seek(0)
+            shutil.copyfileobj(stream, self.file, CHUNK_SIZE)
+            self.file.seek(0)
+            self.reader = PdfReader(self.file)
+            self.page_count = len(self.reader.pages)
+        except BaseException:
+            self.file.close()
+            raise
+        finally:
+            stream.seek(0)
+
+    def page_texts(self) -> List[str]:
+        """Returns the text layer of every page."""
+        with self._lock:
+            return [extract_page_text(page) for page in self.reader.pages]
+
+    def subset(self, pages: List[int]) -> BinaryIO:
+        """
+        Writes a PDF with only the given pages, in the given order, to a new spooled file.
+
+        Returns:
+            BinaryIO: The subset, rewound. The caller is responsible for closing it.
+        """
+        output = tempfile.SpooledTemporaryFile(max_size=config.DOWNLOAD_SPOOL_MAX_MEMORY_BYTES)
+        with self._lock:
+            writer = PdfWriter()
+            for page in pages:
+                writer.add_page(self.reader.pages[page])
+            writer.write(output)
+        output.seek(0)
+        return output
+
+    def copy(self) -> BinaryIO:
+        """
+        Returns a new spooled copy of the whole report, rewound. The caller is responsible for closing it.
+        """
+        output = tempfile.SpooledTemporaryFile(max_size=config.DOWNLOAD_SPOOL_MAX_MEMORY_BYTES)
+        with self._lock:
+            self.file.seek(0)
+            shutil.copyfileobj(self.file, output, CHUNK_SIZE)
+        output.seek(0)
+        return output
+
+    def close(self) -> None:
+        self.file.close()
+
+class ReportPages:
+    """
+    The text of every page of a report, indexed with BM25 so that each schema section
+    can be sent only the pages that mention it.
+
+    The report is parsed once (see `SpooledPdf`); call `close` when done with it.
+
+    Usage:
+        report_pages = ReportPages(stream, file_hash, "report.pdf")
+        report_pages.select_pages([EnvironmentalEmissionsEnergy])  # [41, 42, 57, ...]
+    """
+
+    def __init__(self, stream: BinaryIO, file_hash: str, file_name: Optional[str] = None):
+        self.pdf = SpooledPdf(stream)
+        self.file_hash = file_hash
+        self.file_name = file_name
+        self.page_texts = self.pdf.page_texts()
+        self.index = BM25Index(self.page_texts)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_texts)
+
+    @property
+    def text_coverage(self) -> float:
+        """Share of pages with a text layer; low for scanned reports."""
+        if not self.page_texts:
+            return 0.0
+        return sum(1 for text in self.page_texts if text.strip()) / self.page_count
+
+    def select_pages(self, schemas: List[Type[BaseModel]], top_k: Optional[int] = None) -> Optional[List[int]]:
+        """
+        Selects the pages relevant to a group of schema sections: the `top_k` best BM25
+        matches of each section's query, plus the leading pages for report metadata.
+
+        Returns:
+            Optional[List[int]]: Zero-based page numbers in document order, or None if the
+            whole report should be sent (a section without a query, no match, or a
+            selection covering more than PAGE_ROUTING_MAX_FRACTION of the report).
+        """
+        top_k = top_k or config.PAGE_ROUTING_TOP_K
+        pages = set()
+        for schema in schemas:
+            query = SECTION_QUERIES.get(schema.__name__)
+            if query is None:
+                return None
+            if schema.__name__ in LEADING_PAGE_SECTIONS:
+                pages.update(range(min(config.PAGE_ROUTING_LEADING_PAGES, self.page_count)))
+            pages.update(index for index, _ in self.index.top_k(query, top_k))
+
+        if not pages or len(pages) > config.PAGE_ROUTING_MAX_FRACTION * self.page_count:
+            return None
+        return sorted(pages)
+
+    def subset_pdf(self, pages: List[int]) -> BinaryIO:
+        """
+        Writes a PDF with only the given pages, in the given order, to a spooled file
+        the caller is responsible for closing.
+        """
+        return self.pdf.subset(pages)
+
+    def subset_key(self, pages: List[int]) -> str:
+        """
+        Returns a stable content key for a page subset of this report (see `page_subset_key`).
+        """
+        return page_subset_key(self.file_hash, pages)
+
+    def close(self) -> None:
+        self.pdf.close()
+
+def load_report_pages(stream: BinaryIO, file_hash: str, file_name: Optional[str] = None) -> Optional[ReportPages]:
+    """
+    Reads and indexes the pages of a report when page routing applies to it.
+
+    Returns:
+        Optional[ReportPages]: The indexed pages, or None if routing is disabled, the PDF
+        cannot be parsed, is shorter than PAGE_ROUTING_MIN_PAGES or has no usable text
+        layer (e.g. a scanned report); the whole report is sent in that case.
+    """
+    if not config.PAGE_ROUTING_ENABLED:
+        return None
+
+    try:
+        report_pages = ReportPages(stream, file_hash, file_name)
+    except (PyPdfError, ValueError, KeyError) as e:
+        logger.error(f"Page routing disabled for file {file_hash}, the PDF could not be parsed: {e}")
+        return None
+
+    if report_pages.page_count < config.PAGE_ROUTING_MIN_PAGES:
+        report_pages.close()
+        return None
+    if report_pages.text_coverage < MIN_TEXT_COVERAGE:
+        logger.info(f"Page routing disabled for file {file_hash}: only {report_pages.text_coverage:.0%} of pages have text")
+        report_pages.close()
+        return None
+
+    logger.info(f"Indexed {report_pages.page_count} pages of file {file_hash} for page routing")
+    return report_pages
+
+def page_routing_signature() -> Optional[Dict[str, Any]]:
+    """
+    Returns the routing settings that affect extraction results, for the extraction
+    cache key, or None when page routing is disabled.
+    """
+    if not config.PAGE_ROUTING_ENABLED:
+        return None
+    return {
+        "top_k": config.PAGE_ROUTING_TOP_K,
+        "leading_pages": config.PAGE_ROUTING_LEADING_PAGES,
+        "max_fraction": config.PAGE_ROUTING_MAX_FRACTION,
+        "min_pages": config.PAGE_ROUTING_MIN_PAGES,
+        "queries_sha256": hashlib.sha256(repr(sorted(SECTION_QUERIES.items())).encode("utf-8")).hexdigest(),
+    }
+
+def _page_subset(report_pages: ReportPages, schemas: List[Type[BaseModel]]) -> Dict[str, Any]:
+    """
+    Returns the upload arguments of the pages a group of sections needs (the whole report
+    when routing does not narrow it down).
+    """
+    pages = report_pages.select_pages(schemas)
+    if pages is None:
+        return {"file": report_pages.pdf.copy(), "file_name": report_pages.file_name, "sha256": report_pages.file_hash}
+
+    logger.info(
+        f"Routing {len(pages)} of {report_pages.page_count} pages to "
+        f"{'+'.join(schema.__name__ for schema in schemas)}"
+    )
+    base_name = (report_pages.file_name or "report").rsplit(".", 1)[0]
+    return {
+        "file": report_pages.subset_pdf(pages),
+        "file_name": f"{base_name}-pages-{len(pages)}.pdf",
+        "sha256": report_pages.subset_key(pages)
+    }
+
+def upload_report_pages(report_pages: ReportPages, schemas: List[Type[BaseModel]]) -> types.File:
+    """
+    Uploads the pages needed by a group of schema sections to Gemini.
+
+    Returns:
+        types.File: The uploaded page subset, or the whole report.
+
+    Raises:
+        Exception: If the upload fails.
+    """
+    subset = _page_subset(report_pages, schemas)
+    with subset["file"]:
+        return upload_file(**subset)
+
+async def upload_report_pages_async(report_pages: ReportPages, schemas: List[Type[BaseModel]]) -> types.File:
+    """
+    Async counterpart of `upload_report_pages`; the subset PDF is written in a worker thread.
+    """
+    subset = await asyncio.to_thread(_page_subset, report_pages, schemas)
+    with subset["file"]:
+        return await upload_file_async(**subset)
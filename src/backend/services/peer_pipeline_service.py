@@ -0,0 +1,243 @@
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+from src.backend.services.tavily_service import search_sustainability_reports, search_sustainability_reports_async
+from src.backend.services.extraction_service import (
+    PreparedReport, prepare_report, extract_prepared_report, prepare_report_async, extract_prepared_report_async
+)
+from src.backend.services.mongo_db_service import upsert_esg_report, upsert_esg_report_async
+
+logger = get_logger()
+
+SUCCESS_STATUSES = {"inserted", "updated", "unchanged"}
+
+def peer_company_names(peers: Union[List[Any], Dict[str, Any]]) -> List[str]:
+    """
+    Collects unique company names from a peer list.
+
+    Accepts a list of names or of peer dicts, or the output of `get_peer_companies`
+    ({"country_peers": [...], "region_peers": [...]}), where each peer has a
+    `company_name` (or `name`) field.
+
+    Returns:
+        List[str]: Company names in their original order, without duplicates.
+    """
+    if isinstance(peers, dict):
+        peers = [peer for group in peers.values() if isinstance(group, list) for peer in group]
+
+    names: List[str] = []
+    for peer in peers or []:
+        if isinstance(peer, dict):
+            peer = peer.get("company_name") or peer.get("name")
+        if isinstance(peer, str) and peer.strip() and peer.strip() not in names:
+            names.append(peer.strip())
+    return names
+
+def prepare_first_available_report(urls: List[str]) -> Tuple[Optional[PreparedReport], Optional[str], List[str]]:
+    """
+    Prepares the first candidate URL that downloads as a valid PDF.
+
+    Returns:
+        Tuple[Optional[PreparedReport], Optional[str], List[str]]: The prepared report,
+        its URL, and the errors of the candidates that were skipped.
+    """
+    errors = []
+    for url in urls:
+        try:
+            return prepare_report(url), url, errors
+        except Exception as e:
+            logger.info(f"Skipping report candidate '{url}': {e}")
+            errors.append(f"{url}: {e}")
+    return None, None, errors
+
+async def prepare_first_available_report_async(urls: List[str]) -> Tuple[Optional[PreparedReport], Optional[str], List[str]]:
+    """
+    Async counterpart of `prepare_first_available_report`.
+    """
+    errors = []
+    for url in urls:
+        try:
+            return await prepare_report_async(url), url, errors
+        except Exception as e:
+            logger.info(f"Skipping report candidate '{url}': {e}")
+            errors.append(f"{url}: {e}")
+    return None, None, errors
+
+def report_candidates(urls: List[str]) -> List[str]:
+    """
+    Returns the report URLs worth trying, PDF links first; the download rejects
+    anything that is not a PDF anyway.
+    """
+    urls = sorted(urls, key=lambda url: not url.lower().split("?")[0].endswith(".pdf"))
+    return urls[:config.PEER_MAX_REPORT_CANDIDATES]
+
+def stored_report_result(document: Dict[str, Any], upsert_result: Dict[str, Any], report_url: str) -> Dict[str, Any]:
+    """
+    Returns the per-company result fields of an extracted and upserted report.
+
+    Raises:
+        ValueError: If the upsert failed.
+    """
+    if upsert_result.get("status") not in SUCCESS_STATUSES:
+        raise ValueError(upsert_result.get("message", "Upsert failed."))
+
+    return {
+        "status": upsert_result["status"],
+        "report_url": report_url,
+        "company_id": document["_id"],
+        "year": document["year"],
+        "cache_hit": document.get("cache_hit", False),
+        "total_tokens": (document.get("token_usage") or {}).get("total_tokens", 0)
+    }
+
+def process_peer(company: str, year: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Finds, extracts and stores the sustainability report of one company.
+
+    Args:
+        company (str): Company name.
+        year (int, optional): Reporting year to search for.
+
+    Returns:
+        Dict[str, Any]: Per-company result with `status` ('inserted', 'updated',
+        'unchanged', 'no_report' or 'error'), the report URL and token usage.
+    """
+    started = time.monotonic()
+    result: Dict[str, Any] = {"company": company}
+
+    try:
+        urls = search_sustainability_reports(company, year)
+        prepared, report_url, errors = prepare_first_available_report(report_candidates(urls))
+
+        if prepared is None:
+            result.update({"status": "no_report", "error": "; ".join(errors) or "No report found."})
+        else:
+            document = extract_prepared_report(prepared)
+            if document is None:
+                raise ValueError("Extraction failed or report metadata is incomplete.")
+            result.update(stored_report_result(document, upsert_esg_report(document), report_url))
+    except Exception as e:
+        logger.error(f"Peer extraction failed for '{company}': {e}")
+        result.update({"status": "error", "error": str(e)})
+
+    result["elapsed_seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+async def process_peer_async(company: str, year: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Async counterpart of `process_peer`.
+    """
+    started = time.monotonic()
+    result: Dict[str, Any] = {"company": company}
+
+    try:
+        urls = await search_sustainability_reports_async(company, year)
+        prepared, report_url, errors = await prepare_first_available_report_async(report_candidates(urls))
+
+        if prepared is None:
+            result.update({"status": "no_report", "error": "; ".join(errors) or "No report found."})
+        else:
+            document = await extract_prepared_report_async(prepared)
+            if document is None:
+                raise ValueError("Extraction failed or report metadata is incomplete.")
+            result.update(stored_report_result(document, await upsert_esg_report_async(document), report_url))
+    except Exception as e:
+        logger.error(f"Peer extraction failed for '{company}': {e}")
+        result.update({"status": "error", "error": str(e)})
+
+    result["elapsed_seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+def extract_peer_reports(
+    peers: Union[List[Any], Dict[str, Any]],
+    year: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Runs report discovery, extraction and storage for many companies concurrently.
+
+    Args:
+        peers (Union[List[Any], Dict[str, Any]]): Company names or a `get_peer_companies` result.
+        year (int, optional): Reporting year to search for.
+        max_concurrency (int, optional): Companies processed at once. Defaults to
+            `config.PEER_FANOUT_CONCURRENCY`.
+        on_result (Callable, optional): Called with each company's result as soon as it finishes.
+
+    Returns:
+        Dict[str, Any]: Summary with counts, total tokens, elapsed time and the
+        per-company results in input order.
+    """
+    companies = peer_company_names(peers)
+    started = time.monotonic()
+    results: Dict[str, Dict[str, Any]] = {}
+
+    if companies:
+        max_workers = max(1, min(max_concurrency or config.PEER_FANOUT_CONCURRENCY, len(companies)))
+        logger.info(f"Extracting reports for {len(companies)} peer(s) with max concurrency {max_workers}")
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="peer") as executor:
+            futures = {executor.submit(process_peer, company, year): company for company in companies}
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                logger.info(f"[{len(results)}/{len(companies)}] {result['status']}: {result['company']}")
+                if on_result:
+                    on_result(result)
+
+    return summarize_peer_results(companies, results, started)
+
+async def extract_peer_reports_async(
+    peers: Union[List[Any], Dict[str, Any]],
+    year: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Async counterpart of `extract_peer_reports`: companies are processed as tasks on
+    the running event loop, at most `max_concurrency` at a time.
+
+    Returns:
+        Dict[str, Any]: Summary with counts, total tokens, elapsed time and the
+        per-company results in input order.
+    """
+    companies = peer_company_names(peers)
+    started = time.monotonic()
+    results: Dict[str, Dict[str, Any]] = {}
+
+    if companies:
+        concurrency = max(1, min(max_concurrency or config.PEER_FANOUT_CONCURRENCY, len(companies)))
+        slots = asyncio.Semaphore(concurrency)
+        logger.info(f"Extracting reports for {len(companies)} peer(s) with max concurrency {concurrency}")
+
+        async def process(company: str) -> Dict[str, Any]:
+            async with slots:
+                return await process_peer_async(company, year)
+
+        for next_result in asyncio.as_completed([process(company) for company in companies]):
+            result = await next_result
+            results[result["company"]] = result
+            logger.info(f"[{len(results)}/{len(companies)}] {result['status']}: {result['company']}")
+            if on_result:
+                on_result(result)
+
+    return summarize_peer_results(companies, results, started)
+
+def summarize_peer_results(companies: List[str], results: Dict[str, Dict[str, Any]], started: float) -> Dict[str, Any]:
+    """
+    Summarizes per-company results, listed in input order.
+    """
+    ordered = [results[company] for company in companies]
+    return {
+        "total": len(ordered),
+        "succeeded": sum(1 for result in ordered if result["status"] in SUCCESS_STATUSES),
+        "no_report": sum(1 for result in ordered if result["status"] == "no_report"),
+        "failed": sum(1 for result in ordered if result["status"] == "error"),
+        "total_tokens": sum(result.get("total_tokens", 0) for result in ordered),
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+        "results": ordered
+    }
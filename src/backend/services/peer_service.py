@@ -0,0 +1,163 @@
+import asyncio
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from pydantic import ValidationError
+
+from src.backend.utils.logger import get_logger
+from src.backend.utils.rate_limiter import get_rate_limiter
+from src.backend.utils.system_prompts import build_peer_prompt
+from src.backend.config.config import config
+from src.backend.schemas.scraper_schema import CompanyMetadata, PeersMetadata
+from src.backend.schemas.gics_schema import normalize_gics_name
+from src.backend.services.openai_service import get_openai_client, get_async_openai_client
+from src.backend.services.company_metadata_service import normalize_company_name
+from src.backend.services.cache_service import CacheBackend, create_tiered_cache
+
+logger = get_logger()
+
+def peer_set_key(metadata: CompanyMetadata) -> str:
+    """
+    Returns the cache key of a peer set: GICS sub-industry plus country and region.
+    """
+    parts = (metadata.sub_industries, metadata.country, metadata.region)
+    return "peers:" + "|".join(normalize_gics_name(part) for part in parts)
+
+@lru_cache(maxsize=1)
+def get_peer_cache() -> Optional[CacheBackend]:
+    """
+    Returns the process-wide peer set cache configured by PEER_CACHE_BACKEND.
+    """
+    backend = config.PEER_CACHE_BACKEND
+    return create_tiered_cache(
+        backend,
+        max_entries=config.PEER_CACHE_MAX_ENTRIES,
+        ttl_seconds=config.PEER_CACHE_TTL_SECONDS,
+        collection=config.PEER_CACHE_COLLECTION if backend.lower() == "mongo" else None
+    )
+
+def _without_company(peers: PeersMetadata, company_name: str) -> PeersMetadata:
+    """Drops the target company from a peer set shared by companies of the same segment."""
+    target = normalize_company_name(company_name)
+    return PeersMetadata(
+        country_peers=[peer for peer in peers.country_peers if normalize_company_name(peer.company_name) != target],
+        region_peers=[peer for peer in peers.region_peers if normalize_company_name(peer.company_name) != target]
+    )
+
+def get_cached_peers(metadata: CompanyMetadata, num_country_peers: int, num_region_peers: int) -> Optional[PeersMetadata]:
+    """
+    Returns cached peers for the company's segment if the cached set has enough of
+    them once the company itself is excluded.
+    """
+    cache = get_peer_cache()
+    entry = cache.get(peer_set_key(metadata)) if cache else None
+    if not entry:
+        return None
+
+    try:
+        peers = _without_company(PeersMetadata(**entry), metadata.company_name)
+    except ValidationError as e:
+        logger.info(f"Ignoring cached peer set {peer_set_key(metadata)} that no longer validates: {e}")
+        return None
+    if len(peers.country_peers) < num_country_peers or len(peers.region_peers) < num_region_peers:
+        return None
+    return PeersMetadata(
+        country_peers=peers.country_peers[:num_country_peers],
+        region_peers=peers.region_peers[:num_region_peers]
+    )
+
+def peer_request(metadata: CompanyMetadata, num_country_peers: int, num_region_peers: int) -> Dict[str, Any]:
+    """
+    Returns the `responses.parse` arguments of a peer search with web search enabled.
+    """
+    prompt = build_peer_prompt(
+        company_name=metadata.company_name,
+        sector=metadata.sector,
+        industry_group=metadata.industry_group,
+        industry=metadata.industry,
+        sub_industries=metadata.sub_industries,
+        headquarters=metadata.headquarters,
+        country=metadata.country,
+        region=metadata.region,
+        num_country_peers=num_country_peers,
+        num_region_peers=num_region_peers
+    )
+    return {
+        "model": config.OPENAI_PEERS_TOOL_MODEL,
+        "tools": [{
+            "type": "web_search_preview",
+            "search_context_size": "low",
+        }],
+        "input": prompt,
+        "text_format": PeersMetadata,
+        "temperature": 0,
+    }
+
+def parse_peers(response: Any) -> PeersMetadata:
+    """
+    Returns the peers of a parsed peer search response.
+
+    Raises:
+        ValueError: If the response has no structured output.
+    """
+    peers = response.output_parsed
+    if peers is None:
+        raise ValueError("The peer search returned no structured output.")
+    return peers
+
+def cache_peers(metadata: CompanyMetadata, peers: PeersMetadata) -> None:
+    """
+    Stores the peer set found for a company's segment as returned by the search, with
+    the company itself included, since the set is shared by every company of the segment.
+    """
+    cache = get_peer_cache()
+    if cache:
+        cache.set(peer_set_key(metadata), peers.model_dump())
+
+def find_peer_companies(metadata: CompanyMetadata, num_country_peers: int, num_region_peers: int) -> PeersMetadata:
+    """
+    Finds ESG peer companies as validated structured data, using the peer set cache
+    when it already holds enough peers for the company's segment.
+
+    Args:
+        metadata (CompanyMetadata): Classification and location of the target company.
+        num_country_peers (int): Number of peers from the same country.
+        num_region_peers (int): Number of peers from the same region.
+
+    Returns:
+        PeersMetadata: Country and region peers.
+
+    Raises:
+        Exception: If the OpenAI request fails or returns no parsable output.
+    """
+    cached = get_cached_peers(metadata, num_country_peers, num_region_peers)
+    if cached:
+        logger.info(f"Using cached peer set for '{metadata.company_name}' ({peer_set_key(metadata)})")
+        return cached
+
+    with get_rate_limiter("openai").limit(tokens=config.OPENAI_ESTIMATED_TOKENS_PER_REQUEST) as reservation:
+        response = get_openai_client().responses.parse(**peer_request(metadata, num_country_peers, num_region_peers))
+        if response.usage:
+            reservation.record_usage(response.usage.total_tokens)
+
+    peers = parse_peers(response)
+    cache_peers(metadata, peers)
+    return _without_company(peers, metadata.company_name)
+
+async def find_peer_companies_async(metadata: CompanyMetadata, num_country_peers: int, num_region_peers: int) -> PeersMetadata:
+    """
+    Async counterpart of `find_peer_companies`. Cache reads and writes run in a worker thread.
+    """
+    cached = await asyncio.to_thread(get_cached_peers, metadata, num_country_peers, num_region_peers)
+    if cached:
+        logger.info(f"Using cached peer set for '{metadata.company_name}' ({peer_set_key(metadata)})")
+        return cached
+
+    async with get_rate_limiter("openai").limit_async(tokens=config.OPENAI_ESTIMATED_TOKENS_PER_REQUEST) as reservation:
+        response = await get_async_openai_client().responses.parse(**peer_request(metadata, num_country_peers, num_region_peers))
+        if response.usage:
+            reservation.record_usage(response.usage.total_tokens)
+
+    peers = parse_peers(response)
+    await asyncio.to_thread(cache_peers, metadata, peers)
+    return _without_company(peers, metadata.company_name)
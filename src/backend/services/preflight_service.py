@@ -0,0 +1,159 @@
+import os
+import time
+from typing import BinaryIO, NamedTuple, Optional
+
+from pypdf import PdfReader
+from pypdf.errors import DependencyError, PyPdfError
+
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+from src.backend.services.download_service import PDF_MAGIC, PDF_MAGIC_WINDOW
+from src.backend.services.page_routing_service import MIN_TEXT_COVERAGE, extract_page_text
+
+logger = get_logger()
+
+# === Routing decisions ===
+REJECT = "reject"           # not a usable PDF: fail now instead of after the model calls
+EXTRACT = "extract"         # send the whole report with every request
+PAGE_ROUTE = "page_route"   # send each request only its relevant pages (see page_routing_service)
+SPLIT = "split"             # too long for whole-report requests; extract it in page windows (see map_reduce_service)
+
+# A sampled page counts as having a text layer above this many characters of text.
+MIN_PAGE_TEXT_CHARS = 20
+
+class PreflightReport(NamedTuple):
+    """Result of the local inspection of a report, with the routing decision taken from it."""
+    decision: str
+    reason: str
+    size_bytes: int
+    page_count: Optional[int] = None
+    encrypted: bool = False
+    text_ratio: Optional[float] = None
+
+class PreflightError(ValueError):
+    """Raised when a report is rejected by the preflight inspection."""
+
+    def __init__(self, report: PreflightReport):
+        super().__init__(f"Report rejected by preflight: {report.reason}")
+        self.report = report
+
+def text_layer_ratio(reader: PdfReader, sample_pages: Optional[int] = None) -> float:
+    """
+    Returns the share of pages with a text layer, from up to `sample_pages` pages spread
+    evenly over the document. Image-only (scanned) reports score close to 0.
+    """
+    page_count = len(reader.pages)
+    if not page_count:
+        return 0.0
+    sample_size = min(page_count, sample_pages or config.PREFLIGHT_SAMPLE_PAGES)
+    sample = sorted({int(index * page_count / sample_size) for index in range(sample_size)})
+    with_text = sum(1 for index in sample if len(extract_page_text(reader.pages[index]).strip()) >= MIN_PAGE_TEXT_CHARS)
+    return with_text / len(sample)
+
+def decide(size_bytes: int, page_count: int, encrypted: bool, text_ratio: Optional[float]) -> PreflightReport:
+    """
+    Chooses how a readable report is processed.
+
+    - SPLIT: more pages than a single Gemini request accepts (PREFLIGHT_MAX_PAGES), or a
+      scanned report longer than PREFLIGHT_MAX_SCANNED_PAGES, whose page images alone
+      would fill most of the context of every request, or at least MAP_REDUCE_MIN_PAGES
+      pages when map-reduce extraction is enabled.
+    - PAGE_ROUTE: page routing is enabled and the report is long enough and has a text layer.
+    - EXTRACT: everything else.
+    """
+    def report(decision: str, reason: str) -> PreflightReport:
+        return PreflightReport(decision, reason, size_bytes, page_count, encrypted, text_ratio)
+
+    scanned = text_ratio is not None and text_ratio < MIN_TEXT_COVERAGE
+    if page_count > config.PREFLIGHT_MAX_PAGES:
+        return report(SPLIT, f"{page_count} pages exceed the {config.PREFLIGHT_MAX_PAGES} page limit of one request")
+    if scanned and page_count > config.PREFLIGHT_MAX_SCANNED_PAGES:
+        return report(SPLIT, f"scanned report of {page_count} pages (over {config.PREFLIGHT_MAX_SCANNED_PAGES})")
+    if config.MAP_REDUCE_MIN_PAGES and page_count >= config.MAP_REDUCE_MIN_PAGES:
+        return report(SPLIT, f"{page_count} pages (map-reduce from {config.MAP_REDUCE_MIN_PAGES})")
+    if config.PAGE_ROUTING_ENABLED and not scanned and text_ratio is not None \
+            and page_count >= config.PAGE_ROUTING_MIN_PAGES:
+        return report(PAGE_ROUTE, f"{page_count} pages with a text layer on {text_ratio:.0%} of them")
+    return report(EXTRACT, f"{page_count} pages")
+
+def inspect_pdf(stream: BinaryIO) -> PreflightReport:
+    """
+    Inspects a report locally, without any model call: PDF signature, byte size,
+    encryption, page count and text-layer ratio. Only the first bytes, the cross-reference
+    data and a sample of pages are read, so this takes milliseconds to a fraction of a
+    second even for very long reports.
+
+    Reports are rejected when they are not PDFs (e.g. HTML error pages), exceed
+    DOWNLOAD_MAX_BYTES, cannot be parsed, need a password to open, or have no pages.
+    Encrypted reports that open with an empty password (permission-only protection) are
+    accepted.
+
+    Args:
+        stream (BinaryIO): Seekable report content; rewound before returning.
+
+    Returns:
+        PreflightReport: The findings and the routing decision.
+    """
+    stream.seek(0, os.SEEK_END)
+    size_bytes = stream.tell()
+    stream.seek(0)
+
+    def reject(reason: str, **findings) -> PreflightReport:
+        return PreflightReport(REJECT, reason, size_bytes, **findings)
+
+    try:
+        head = stream.read(PDF_MAGIC_WINDOW)
+        if PDF_MAGIC not in head:
+            if b"<html" in head.lower() or b"<!doctype html" in head.lower():
+                return reject("content is an HTML page, not a PDF")
+            return reject("content is not a PDF")
+        if size_bytes > config.DOWNLOAD_MAX_BYTES:
+            return reject(f"{size_bytes} bytes exceed the {config.DOWNLOAD_MAX_BYTES} byte limit")
+
+        stream.seek(0)
+        try:
+            # The reader tries the empty password itself when the PDF is encrypted.
+            reader = PdfReader(stream)
+            encrypted = reader.is_encrypted
+            if encrypted and not reader.decrypt(""):
+                return reject("the PDF is password protected", encrypted=True)
+        except DependencyError as e:
+            # AES decryption needs an optional dependency, and the page tree of an
+            # encrypted document cannot be read without it: upload the file whole
+            # with an undetermined page count and let Gemini try it.
+            logger.info(f"Cannot decrypt the report locally: {e}")
+            return PreflightReport(
+                EXTRACT, "encrypted report that cannot be decrypted locally; page count undetermined",
+                size_bytes, encrypted=True
+            )
+
+        page_count = len(reader.pages)
+        if not page_count:
+            return reject("the PDF has no pages", encrypted=encrypted, page_count=0)
+        return decide(size_bytes, page_count, encrypted, text_layer_ratio(reader))
+
+    except (PyPdfError, ValueError, KeyError, TypeError, AttributeError) as e:
+        return reject(f"the PDF cannot be parsed: {e}")
+    finally:
+        stream.seek(0)
+
+def preflight_pdf(stream: BinaryIO, file_hash: str) -> PreflightReport:
+    """
+    Runs `inspect_pdf` on a report about to be uploaded and logs the decision.
+
+    Returns:
+        PreflightReport: The findings; the decision is never REJECT.
+
+    Raises:
+        PreflightError: If the report is rejected.
+    """
+    started = time.perf_counter()
+    report = inspect_pdf(stream)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info(
+        f"Preflight of file {file_hash} in {elapsed_ms:.0f} ms: {report.decision} ({report.reason}; "
+        f"{report.size_bytes} bytes, encrypted={report.encrypted}, text_ratio={report.text_ratio})"
+    )
+    if report.decision == REJECT:
+        raise PreflightError(report)
+    return report
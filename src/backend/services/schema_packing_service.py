@@ -0,0 +1,136 @@
+import json
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, create_model
+
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+
+logger = get_logger()
+
+# Rough size of a token in JSON output, used to turn character counts into tokens.
+CHARS_PER_TOKEN = 4
+
+class OutputSizeStats:
+    """
+    Tracks how many output tokens each schema section has taken so far, as an
+    exponentially weighted moving average per schema (in-process only).
+
+    Before a schema has been observed, its output is estimated from the size of its
+    JSON schema, which is an upper bound for most reports: the schema carries every
+    field description while a report fills in only part of the fields.
+    """
+
+    def __init__(self, smoothing: float = 0.3, headroom: float = 1.25):
+        self.smoothing = smoothing
+        self.headroom = headroom
+        self._averages: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, schema: Type[BaseModel], section: Dict[str, Any]) -> None:
+        """Records the output size of an extracted section."""
+        tokens = len(json.dumps(section)) / CHARS_PER_TOKEN
+        with self._lock:
+            average = self._averages.get(schema.__name__)
+            self._averages[schema.__name__] = (
+                tokens if average is None else average + self.smoothing * (tokens - average)
+            )
+
+    def estimate(self, schema: Type[BaseModel]) -> int:
+        """Returns the expected output tokens of a section, with headroom for larger reports."""
+        with self._lock:
+            average = self._averages.get(schema.__name__)
+        if average is None:
+            return schema_size_tokens(schema)
+        return int(average * self.headroom) + 1
+
+@lru_cache(maxsize=None)
+def schema_size_tokens(schema: Type[BaseModel]) -> int:
+    """
+    Returns the size of a schema's JSON schema in tokens, the prior estimate of its output size.
+    """
+    return len(json.dumps(schema.model_json_schema())) // CHARS_PER_TOKEN + 1
+
+output_size_stats = OutputSizeStats()
+
+def pack_schemas(
+    schemas: List[Type[BaseModel]],
+    max_output_tokens: Optional[int] = None,
+    stats: Optional[OutputSizeStats] = None
+) -> List[List[Type[BaseModel]]]:
+    """
+    Groups schema sections so each group can be requested in a single call whose
+    expected output fits in `max_output_tokens`.
+
+    Groups are formed first-fit decreasing (largest sections first), which keeps the
+    number of calls close to the minimum. A section larger than the budget gets a
+    group of its own. Groups and the sections inside them keep the order of `schemas`,
+    so packing is deterministic for the same estimates.
+
+    Args:
+        schemas (List[Type[BaseModel]]): Sections to extract.
+        max_output_tokens (int, optional): Output token budget of one call. Defaults to
+            `config.SCHEMA_PACK_MAX_OUTPUT_TOKENS`; 0 disables packing.
+        stats (OutputSizeStats, optional): Output size estimates. Defaults to the process-wide stats.
+
+    Returns:
+        List[List[Type[BaseModel]]]: The groups, one per call.
+    """
+    max_output_tokens = config.SCHEMA_PACK_MAX_OUTPUT_TOKENS if max_output_tokens is None else max_output_tokens
+    if max_output_tokens <= 0 or len(schemas) < 2:
+        return [[schema] for schema in schemas]
+
+    stats = stats or output_size_stats
+    estimates = {schema: stats.estimate(schema) for schema in schemas}
+    groups: List[Tuple[int, List[Type[BaseModel]]]] = []
+    for schema in sorted(schemas, key=lambda schema: -estimates[schema]):
+        for index, (used, group) in enumerate(groups):
+            if used + estimates[schema] <= max_output_tokens:
+                groups[index] = (used + estimates[schema], group + [schema])
+                break
+        else:
+            groups.append((estimates[schema], [schema]))
+
+    position = {schema: index for index, schema in enumerate(schemas)}
+    packed = [sorted(group, key=position.get) for _, group in groups]
+    packed.sort(key=lambda group: position[group[0]])
+    logger.info(
+        f"Packed {len(schemas)} schema(s) into {len(packed)} call(s): "
+        + "; ".join("+".join(schema.__name__ for schema in group) for group in packed)
+    )
+    return packed
+
+@lru_cache(maxsize=None)
+def packed_model(schemas: Tuple[Type[BaseModel], ...]) -> Type[BaseModel]:
+    """
+    Returns a response model with one required field per schema, named after it, so
+    several sections can be requested with one response schema.
+    """
+    fields = {schema.__name__: (schema, ...) for schema in schemas}
+    return create_model("_".join(schema.__name__ for schema in schemas), **fields)
+
+def unpack_sections(result_json: Dict[str, Any], schemas: List[Type[BaseModel]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Validates a packed response and splits it into one section per schema.
+
+    The sections are returned as produced by the model, like single-schema responses.
+
+    Raises:
+        pydantic.ValidationError: If a section is missing or does not match its schema.
+    """
+    packed_model(tuple(schemas)).model_validate(result_json)
+    return {schema.__name__: result_json[schema.__name__] for schema in schemas}
+
+def split_group(schemas: List[Type[BaseModel]]) -> List[List[Type[BaseModel]]]:
+    """
+    Splits a group whose packed request failed into two halves of similar expected size.
+    """
+    total = sum(output_size_stats.estimate(schema) for schema in schemas)
+    used = 0
+    for index, schema in enumerate(schemas[:-1], start=1):
+        used += output_size_stats.estimate(schema)
+        if used * 2 >= total:
+            return [schemas[:index], schemas[index:]]
+    return [schemas[:-1], schemas[-1:]]
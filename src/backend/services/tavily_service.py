@@ -1,11 +1,90 @@
 import os
-from typing import Literal, Dict, Any
+import copy
+from functools import lru_cache
+from typing import Literal, Dict, Any, List, Optional
 
 from src.backend.utils.logger import get_logger
+from src.backend.utils.rate_limiter import get_rate_limiter
+from src.backend.utils.async_utils import loop_local
+from src.backend.utils.single_flight import AsyncSingleFlight, SingleFlight
 from src.backend.config.config import config
+from src.backend.services.cache_service import CacheBackend, create_cache
 
 logger = get_logger()
 
+_search_flights = SingleFlight()
+_async_search_flights = AsyncSingleFlight()
+
+@lru_cache(maxsize=1)
+def get_tavily_client():
+    """
+    Returns the process-wide Tavily client, created on first use.
+    """
+    return config.get_tavily_client()
+
+@loop_local
+def get_async_tavily_client():
+    """
+    Returns the async Tavily client of the running event loop, created on first use.
+    """
+    return config.get_async_tavily_client()
+
+@lru_cache(maxsize=1)
+def get_search_cache() -> Optional[CacheBackend]:
+    """
+    Returns the process-wide Tavily result cache configured by TAVILY_CACHE_BACKEND.
+    """
+    return create_cache(
+        config.TAVILY_CACHE_BACKEND,
+        max_entries=config.TAVILY_CACHE_MAX_ENTRIES,
+        ttl_seconds=config.TAVILY_CACHE_TTL_SECONDS
+    )
+
+def normalize_query(query: str) -> str:
+    """
+    Normalizes a search query for caching: lower case, single spaces, no trailing '?'.
+    """
+    return " ".join(query.lower().split()).rstrip("?").strip()
+
+def search_cache_key(query: str, search_depth: str) -> str:
+    """
+    Returns the cache and coalescing key of a Tavily search.
+    """
+    return f"tavily:{search_depth}:{normalize_query(query)}"
+
+def build_search_result(query: str, response: Any) -> Dict[str, Any]:
+    """
+    Shapes a raw Tavily response into the result returned by `fetch_info_from_tavily`.
+
+    Returns:
+        Dict[str, Any]: The result, or a dict with an "error" or "info" key if the
+        response is malformed or has no results. Only the former should be cached.
+    """
+    if not isinstance(response, dict):
+        logger.warning("Unexpected response format from Tavily for query '%s': %s", query, response)
+        return {"error": f"Unexpected response format for query: '{query}'."}
+
+    results = response.get("results")
+    if not results:
+        logger.info("No results found for query: '%s'", query)
+        return {"info": f"No information found for query: '{query}'."}
+
+    logger.info("Retrieved %d result(s) for query '%s'.", len(results), query)
+    return {
+        "query": query,
+        "answer": response.get("answer"),
+        "images": response.get("images", []),
+        "results": results,
+        "response_time": response.get("response_time")
+    }
+
+def cached_search_result(query: str, cached: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a private copy of a cached search result, answering the caller's own query
+    (cached entries are shared by every query that normalizes to the same key).
+    """
+    return {**copy.deepcopy(cached), "query": query}
+
 def fetch_info_from_tavily(query: str, search_depth: Literal['basic', 'advanced'] = "basic") -> Dict[str, Any]:
     """
     Fetches web-based information related to a natural language query using Tavily's Search API.
@@ -14,6 +93,10 @@ def fetch_info_from_tavily(query: str, search_depth: Literal['basic', 'advanced'
     across the web. It supports answering factual questions, summarizing topics, or retrieving 
     concise information with supporting links.
 
+    Successful results are cached by normalized query and search depth, and concurrent
+    calls for the same query share a single in-flight request. Every caller gets its
+    own copy of the result, so it may be modified freely.
+
     Args:
         query (str): A natural language question or phrase, such as 
                      "What does OpenAI do?" or "Where is Microsoft headquartered?".
@@ -39,31 +122,62 @@ def fetch_info_from_tavily(query: str, search_depth: Literal['basic', 'advanced'
         Logs and catches network errors, timeout issues, and any other unexpected exceptions.
     """
     try:
-        logger.info("Querying Tavily: '%s'", query)
-        tavily_client = config.get_tavily_client()
-        response = tavily_client.search(query=query, search_depth=search_depth)
-
-        if not isinstance(response, dict):
-            logger.warning("Unexpected response format from Tavily for query '%s': %s", query, response)
-            return {"error": f"Unexpected response format for query: '{query}'."}
-
-        results = response.get("results")
-        if not results:
-            logger.info("No results found for query: '%s'", query)
-            return {"info": f"No information found for query: '{query}'."}
-
-        answer = response.get("answer")
-        images = response.get("images", [])
-        response_time = response.get("response_time")
-
-        logger.info("Retrieved %d result(s) for query '%s'.", len(results), query)
-        return {
-            "query": query,
-            "answer": answer,
-            "images": images,
-            "results": results,
-            "response_time": response_time
-        }
+        cache_key = search_cache_key(query, search_depth)
+        cache = get_search_cache()
+        cached = cache.get(cache_key) if cache else None
+        if cached:
+            logger.info("Using cached Tavily results for query '%s'.", query)
+            return cached_search_result(query, cached)
+
+        def search() -> Any:
+            logger.info("Querying Tavily: '%s'", query)
+            get_rate_limiter("tavily").acquire()
+            return get_tavily_client().search(query=query, search_depth=search_depth)
+
+        result = build_search_result(query, copy.deepcopy(_search_flights.do(cache_key, search)))
+        if cache and "results" in result:
+            cache.set(cache_key, copy.deepcopy(result))
+        return result
+
+    except ConnectionError as ce:
+        logger.exception("Network error while querying '%s': %s", query, str(ce))
+        return {"error": f"Network issue while retrieving information for query: '{query}'."}
+
+    except TimeoutError as te:
+        logger.exception("Timeout error while querying '%s': %s", query, str(te))
+        return {"error": f"Request timed out for query: '{query}'."}
+
+    except Exception as e:
+        logger.exception("Unexpected error while querying '%s': %s", query, str(e))
+        return {"error": f"Unexpected error while retrieving information for query: '{query}'."}
+
+async def fetch_info_from_tavily_async(query: str, search_depth: Literal['basic', 'advanced'] = "basic") -> Dict[str, Any]:
+    """
+    Async counterpart of `fetch_info_from_tavily`, using the async Tavily client.
+
+    Shares the result cache with the sync function; concurrent awaits for the same
+    query share a single in-flight request.
+
+    Returns:
+        Dict[str, Any]: The search result, or a dict with an "error" or "info" key.
+    """
+    try:
+        cache_key = search_cache_key(query, search_depth)
+        cache = get_search_cache()
+        cached = cache.get(cache_key) if cache else None
+        if cached:
+            logger.info("Using cached Tavily results for query '%s'.", query)
+            return cached_search_result(query, cached)
+
+        async def search() -> Any:
+            logger.info("Querying Tavily: '%s'", query)
+            await get_rate_limiter("tavily").acquire_async()
+            return await get_async_tavily_client().search(query=query, search_depth=search_depth)
+
+        result = build_search_result(query, copy.deepcopy(await _async_search_flights.do(cache_key, search)))
+        if cache and "results" in result:
+            cache.set(cache_key, copy.deepcopy(result))
+        return result
 
     except ConnectionError as ce:
         logger.exception("Network error while querying '%s': %s", query, str(ce))
@@ -76,7 +190,47 @@ def fetch_info_from_tavily(query: str, search_depth: Literal['basic', 'advanced'
     except Exception as e:
         logger.exception("Unexpected error while querying '%s': %s", query, str(e))
         return {"error": f"Unexpected error while retrieving information for query: '{query}'."}
-    
+
+def sustainability_report_query(company: str, year: Optional[int] = None) -> str:
+    """
+    Returns the Tavily query used to find a company's sustainability report PDFs.
+    """
+    base_query = f"{company} sustainability report"
+    return f"{base_query} {year} filetype:pdf" if year else f"{base_query} filetype:pdf"
+
+def report_urls(company: str, response: Dict[str, Any]) -> List[str]:
+    """
+    Returns the result URLs of a report search in Tavily's ranking order.
+    """
+    if not response or 'results' not in response:
+        logger.warning("No results found or invalid response structure.")
+        return []
+
+    urls = [res.get("url") for res in response['results'] if res.get("url")]
+    logger.info(f"Found {len(urls)} report(s) for '{company}'")
+    return urls
+
+def search_sustainability_reports(company: str, year: Optional[int] = None) -> List[str]:
+    """
+    Searches for publicly available sustainability (ESG) report PDFs for a company.
+
+    Args:
+        company (str): Company name.
+        year (int, optional): Reporting year to search for.
+
+    Returns:
+        List[str]: Result URLs in Tavily's ranking order (empty if nothing was found).
+    """
+    logger.info(f"Searching for sustainability report for '{company}'" + (f" in {year}" if year else ""))
+    return report_urls(company, fetch_info_from_tavily(sustainability_report_query(company, year)))
+
+async def search_sustainability_reports_async(company: str, year: Optional[int] = None) -> List[str]:
+    """
+    Async counterpart of `search_sustainability_reports`.
+    """
+    logger.info(f"Searching for sustainability report for '{company}'" + (f" in {year}" if year else ""))
+    return report_urls(company, await fetch_info_from_tavily_async(sustainability_report_query(company, year)))
+
 # query = f"What does {company_name} do and where it is located"
 # response = fetch_info_from_tavily(query=query)
 # content = [res.get("content") for res in response['results'] if res.get("content")]
\ No newline at end of file
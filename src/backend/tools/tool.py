@@ -1,66 +1,60 @@
-import json
-from typing import Optional, Dict, Union, BinaryIO, Any
-import threading
-import time
+import asyncio
+from typing import Optional, Dict, Union, BinaryIO, Any, Awaitable, Callable
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 
-from langchain_core.tools import tool
+from langchain_core.tools import BaseTool, tool
+from langgraph.config import get_stream_writer
 
 from src.backend.utils.logger import get_logger
-from src.backend.services.gemini_service import upload_file
-from src.backend.schemas.esg_schema import (
-    ReportMetadata, EnvironmentalEmissionsEnergy, EnvironmentalWaterWaste, SocialTrainingAndCSR, 
-    SocialWorkforceAndWellBeing, GovernanceEthicsAndComplaints, GovernanceStructureAndOpenness,
-    MaterialityAssessment
-)
-from src.backend.utils.system_prompts import EXTRACTOR_TOOL_PROMPT
-from src.backend.utils.system_prompts import build_peer_prompt, build_company_classification_prompt
-from src.backend.services.tavily_service import fetch_info_from_tavily
+from src.backend.services.extraction_service import extract_esg_document, extract_esg_document_async
+from src.backend.services import mongo_db_service, peer_pipeline_service
+from src.backend.services.tavily_service import search_sustainability_reports, search_sustainability_reports_async
 from src.backend.schemas.scraper_schema import CompanyMetadata
-from src.backend.schemas.gics_schema import GICS_CLASSIFICATION_SCHEMA
-from src.backend.config.config import config
-from src.backend.services.openai_service import get_openai_client
-from src.backend.services.gemini_service import get_gemini_client
-
-
-gemini_client = get_gemini_client()
-openai_client=get_openai_client()
-
-RESPONSE_SCHEMA = [
-    ReportMetadata,
-    EnvironmentalEmissionsEnergy,
-    EnvironmentalWaterWaste,
-    SocialTrainingAndCSR,
-    SocialWorkforceAndWellBeing,
-    GovernanceEthicsAndComplaints,
-    GovernanceStructureAndOpenness,
-    MaterialityAssessment
-]
+from src.backend.services.company_metadata_service import classify_company, classify_company_async
+from src.backend.services.peer_service import find_peer_companies, find_peer_companies_async
+from src.backend.services.job_service import get_job_queue, job_status
 
 load_dotenv()
 logger = get_logger()
 
-thread_local = threading.local()
+def async_implementation(sync_tool: BaseTool) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Registers a coroutine as the async implementation of a tool.
+
+    `ainvoke` (used when the graph runs on an event loop, e.g. under `langgraph dev`)
+    then awaits the coroutine instead of running the sync function in a thread pool;
+    `invoke` keeps using the sync function.
+    """
+    def register(coroutine: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        sync_tool.coroutine = coroutine
+        return coroutine
+    return register
 
 @tool
-def extract_emission_data_as_json(file_input: Union[BinaryIO, bytes, str]) -> Optional[Dict[str, Any]]:
+def extract_emission_data_as_json(file_input: Union[BinaryIO, bytes, str], background: bool = False) -> Optional[Dict[str, Any]]:
     """
     Tool: ESG Report Extractor
 
     Uploads and processes a sustainability report (PDF) using the Gemini model to extract structured ESG data.
 
     This tool:
+    - Returns a cached result if the same PDF was already extracted with the same model, prompt and schemas.
     - Uploads a report to Gemini.
-    - Iteratively extracts predefined ESG schemas.
+    - Extracts predefined ESG schemas concurrently (bounded by EXTRACTION_MAX_CONCURRENCY).
+    - Checkpoints each extracted schema by file hash, so a rerun only requests missing schemas.
     - Merges results into a unified JSON object.
     - Tracks Gemini token usage.
+    - With `background=True`, queues the extraction for the worker processes instead and
+      returns immediately; the worker also stores the result (no upsert step needed).
 
     Input:
         file_input (str | bytes | BinaryIO): ESG PDF report.
             - Accepts: local file path, remote URL (ending in .pdf), byte stream.
+            - Background jobs accept only URLs and paths readable by the workers.
+        background (bool, optional): Queue the extraction as a job (default False).
 
     Output:
         dict | None:
@@ -70,10 +64,14 @@ def extract_emission_data_as_json(file_input: Union[BinaryIO, bytes, str]) -> Op
                 "esg_report": {merged ESG data},
                 "token_usage": {
                     "total_prompt_tokens": int,
+                    "total_cached_prompt_tokens": int,
+                    "total_uncached_prompt_tokens": int,
                     "total_output_tokens": int,
                     "total_tokens": int
-                }
+                },
+                "cache_hit": bool
             }
+        or, with `background=True`, the job status (see `get_extraction_status`).
 
     Returns None on failure or if required metadata is missing.
     """
@@ -81,91 +79,31 @@ def extract_emission_data_as_json(file_input: Union[BinaryIO, bytes, str]) -> Op
         logger.error("No file input provided for ESG extraction.")
         return None
 
-    try:
-        uploaded_file = upload_file(file=file_input)
-        if not uploaded_file:
-            logger.error("File upload to Gemini failed.")
-            return None
-    except Exception as upload_err:
-        logger.error(f"Exception during file upload: {upload_err}")
+    if background:
+        return enqueue_extraction(file_input)
+    return extract_esg_document(file_input)
+
+@async_implementation(extract_emission_data_as_json)
+async def extract_emission_data_as_json_async(file_input: Union[BinaryIO, bytes, str], background: bool = False) -> Optional[Dict[str, Any]]:
+    if not file_input:
+        logger.error("No file input provided for ESG extraction.")
         return None
-    
-    if not hasattr(thread_local, "gemini_client"):
-        thread_local.gemini_client = gemini_client
-    
-    client = thread_local.gemini_client
-
-    merged_result: Dict[str, Any] = {}
-    token_usage = {
-        "total_prompt_tokens": 0,
-        "total_output_tokens": 0,
-        "total_tokens": 0
-    }
-    MAX_RETRIES = config.MAX_RETRIES
-    RETRY_DELAY_SECONDS = config.RETRY_DELAY_SECONDS
-
-    for schema in RESPONSE_SCHEMA:
-        schema_name = getattr(schema, "__name__", str(schema))
-        attempt = 0
-
-        while attempt < MAX_RETRIES:
-            try:
-                response = client.models.generate_content(
-                    model=config.GEMINI_EXTRACTION_MODEL,
-                    contents=[uploaded_file, EXTRACTOR_TOOL_PROMPT],
-                    config={
-                        'response_mime_type': 'application/json',
-                        'response_schema': schema,
-                        'temperature': 0.0,
-                    },
-                )
-
-                usage = getattr(response, "usage_metadata", None)
-                if usage:
-                    token_usage["total_prompt_tokens"] += usage.prompt_token_count or 0
-                    token_usage["total_output_tokens"] += usage.candidates_token_count or 0
-                    token_usage["total_tokens"] += usage.total_token_count or 0
-
-                raw_text = getattr(response, "text", "")
-                if not raw_text and getattr(response, "candidates", []):
-                    raw_text = response.candidates[0].content.parts[0].text
-
-                if not raw_text:
-                    logger.error(f"Empty response for schema '{schema_name}'.")
-                    logger.info(f"Raw response (if any): {response}")
-                    raise ValueError("Empty Gemini response")
-
-                result_json = json.loads(raw_text)
-                if not isinstance(result_json, dict):
-                    logger.error(f"Schema '{schema_name}' did not return a JSON object.")
-
-                merged_result.update(result_json)
-                logger.info(f"Successfully extracted schema: {schema_name}")
-                break
-
-            except Exception as err:
-                attempt += 1
-                logger.info(f"Attempt {attempt} failed for schema '{schema_name}': {err}")
-                
-                if attempt == MAX_RETRIES:
-                    logger.error(f"Schema '{schema_name}' failed after {MAX_RETRIES} attempts.")
-                    return None
-                time.sleep(RETRY_DELAY_SECONDS * attempt)
-        
-    report_metadata = merged_result.get("report_metadata", {})
-    company_legal_name = report_metadata.get("company_legal_name")
-    reporting_year = report_metadata.get("reporting_year")
-
-    if not company_legal_name or not reporting_year:
-        logger.error("Missing 'company_legal_name' or 'reporting_year' in report metadata.")
+
+    if background:
+        return await asyncio.to_thread(enqueue_extraction, file_input)
+    return await extract_esg_document_async(file_input)
+
+def enqueue_extraction(file_input: Union[BinaryIO, bytes, str]) -> Optional[Dict[str, Any]]:
+    """Queues an extraction job and returns its status, or None if the input cannot be queued."""
+    if not isinstance(file_input, str):
+        logger.error("Only report URLs and file paths can be extracted in the background.")
+        return None
+
+    try:
+        return job_status(get_job_queue().enqueue(file_input))
+    except Exception as e:
+        logger.error(f"Failed to queue extraction of '{file_input}': {e}", exc_info=True)
         return None
-    
-    return {
-        "_id": company_legal_name,
-        "year": str(reporting_year),
-        "esg_report": merged_result,
-        "token_usage": token_usage
-    }
 
 @tool    
 def upsert_esg_report(document: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -198,60 +136,17 @@ def upsert_esg_report(document: Optional[Dict[str, Any]]) -> Optional[Dict[str,
                 "missing_keys": list[str] (on error)
             }
     """
-    try:
-        logger.info(f"Input document: {document}")
-
-        required_keys = {"_id", "year", "esg_report"}
-        if not required_keys.issubset(document):
-            missing = required_keys - document.keys()
-            msg = f"Missing keys in document: {missing}"
-            logger.error(msg)
-            return {
-                "status": "error",
-                "message": msg,
-                "missing_keys": list(missing)
-            }
-
-        company_id = document["_id"]
-        year = str(document["year"])
-        esg_report_data = document["esg_report"]
-
-        update_path = f"esg_reports.{year}"
-        update_doc = { "$set": { update_path: esg_report_data }}
-
-        collection = config.ESG_REPORT_COLLECTION
-
-        result = collection.update_one(
-            { "_id": company_id },
-            update_doc,
-            upsert=True
-        )
-
-        if result.upserted_id:
-            status = "inserted"
-        elif result.modified_count > 0:
-            status = "updated"
-        else:
-            status = "unchanged"
+    return with_esg_report_keys(document, mongo_db_service.upsert_esg_report(document))
 
-        logger.info(f"ESG report {status} for company_id={company_id}, year={year}")
+@async_implementation(upsert_esg_report)
+async def upsert_esg_report_async(document: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    return with_esg_report_keys(document, await mongo_db_service.upsert_esg_report_async(document))
 
-        return {
-            "status": status,
-            "company_id": company_id,
-            "year": year,
-            "esg_report_keys": list(esg_report_data.keys())
-        }
-
-    except Exception as e:
-        msg = f"Exception during ESG report upsert: {e}"
-        logger.error(msg, exc_info=True)
-        return {
-            "status": "error",
-            "message": msg,
-            "company_id": document.get("company_id"),
-            "year": str(document.get("year", "")),
-        }
+def with_esg_report_keys(document: Optional[Dict[str, Any]], result: Dict[str, Any]) -> Dict[str, Any]:
+    """Adds the top-level keys of the stored report to a successful upsert result."""
+    if result.get("status") != "error":
+        result["esg_report_keys"] = list(document["esg_report"].keys()) if isinstance(document["esg_report"], dict) else []
+    return result
 
 @tool
 def fetch_company_metadata(company_name: str) -> Optional[CompanyMetadata]:
@@ -261,7 +156,9 @@ def fetch_company_metadata(company_name: str) -> Optional[CompanyMetadata]:
     Uses unstructured web content to classify a company into the GICS taxonomy.
 
     This tool:
-    - Retrieves content via Tavily.
+    - Returns cached metadata for companies classified before (aliases such as
+      "Zalando" and "Zalando SE" share an entry).
+    - Otherwise retrieves content via Tavily.
     - Uses OpenAI to classify based on GICS schema.
     - Returns structured metadata (sector, industry, region, etc.).
 
@@ -278,32 +175,16 @@ def fetch_company_metadata(company_name: str) -> Optional[CompanyMetadata]:
     Returns None on classification failure or missing data.
     """
     try:
-        query = f"What does {company_name} do and where is it located?"
-        response = fetch_info_from_tavily(query=query)
-        if not response or 'results' not in response:
-            logger.error(f"No results found for company: '{company_name}'")
-            return None
-
-        content = [
-            res.get("content")
-            for res in response['results']
-            if res.get("content")
-        ]
-
-        if not content:
-            logger.error(f"No usable content found to classify company: '{company_name}'")
-            return None
-
-        logger.info(f"Building classification prompt for company: '{company_name}'")
-        messages = build_company_classification_prompt(content, GICS_CLASSIFICATION_SCHEMA)
-
-        completion = openai_client.responses.parse(
-            model=config.OPENAI_PEERS_TOOL_MODEL,
-            input=messages,
-            text_format=CompanyMetadata,
-            temperature=0,
-        )
-        return completion.output_parsed
+        return classify_company(company_name)
+
+    except Exception as e:
+        logger.error(f"Error classifying company '{company_name}': {e}", exc_info=True)
+        return None
+
+@async_implementation(fetch_company_metadata)
+async def fetch_company_metadata_async(company_name: str) -> Optional[CompanyMetadata]:
+    try:
+        return await classify_company_async(company_name)
 
     except Exception as e:
         logger.error(f"Error classifying company '{company_name}': {e}", exc_info=True)
@@ -321,8 +202,8 @@ def get_peer_companies(
     Finds ESG peer companies using GICS classification and geographic metadata.
 
     This tool:
-    - Builds a contextual prompt for OpenAI.
-    - Uses structured metadata (sector, country, etc.) to retrieve peer companies.
+    - Reuses a cached peer set for the same GICS sub-industry, country and region when available.
+    - Otherwise builds a contextual prompt for OpenAI and parses the answer into validated records.
     - Returns peers grouped by geography (country and region).
 
     Input:
@@ -333,8 +214,8 @@ def get_peer_companies(
     Output:
         dict:
             {
-                "country_peers": [ {name, sector, ...}, ... ],
-                "region_peers": [ {name, sector, ...}, ... ]
+                "country_peers": [ {company_name, core, sector, ..., company_official_website}, ... ],
+                "region_peers": [ {company_name, core, sector, ..., company_official_website}, ... ]
             }
 
     Returns empty dict on failure or invalid input.
@@ -342,7 +223,47 @@ def get_peer_companies(
     if not metadata:
         logger.error("Aborting peer analysis: metadata is None.")
         return {}
-    
+
+    num_country_peers, num_region_peers = peer_counts(metadata, num_country_peers, num_region_peers)
+    try:
+        peers = find_peer_companies(metadata, num_country_peers, num_region_peers)
+        logger.info(f"Found {len(peers.country_peers)} country and {len(peers.region_peers)} region peers "
+                    f"for '{metadata.company_name}'")
+        return peers.model_dump()
+
+    except Exception as e:
+        logger.error(f"[Exception] Failed to retrieve peer companies: {e}", exc_info=True)
+
+    return {}
+
+@async_implementation(get_peer_companies)
+async def get_peer_companies_async(
+    metadata: CompanyMetadata,
+    num_country_peers: Optional[int] = None,
+    num_region_peers: Optional[int] = None
+) -> Dict[str, List[Dict[str, str]]]:
+    if not metadata:
+        logger.error("Aborting peer analysis: metadata is None.")
+        return {}
+
+    num_country_peers, num_region_peers = peer_counts(metadata, num_country_peers, num_region_peers)
+    try:
+        peers = await find_peer_companies_async(metadata, num_country_peers, num_region_peers)
+        logger.info(f"Found {len(peers.country_peers)} country and {len(peers.region_peers)} region peers "
+                    f"for '{metadata.company_name}'")
+        return peers.model_dump()
+
+    except Exception as e:
+        logger.error(f"[Exception] Failed to retrieve peer companies: {e}", exc_info=True)
+
+    return {}
+
+def peer_counts(
+    metadata: CompanyMetadata,
+    num_country_peers: Optional[int],
+    num_region_peers: Optional[int]
+) -> Tuple[int, int]:
+    """Applies the default peer counts (5 each, or 0 for the side that was not requested)."""
     if num_country_peers is None and num_region_peers is None:
         num_country_peers = 5
         num_region_peers = 5
@@ -356,40 +277,7 @@ def get_peer_companies(
 
     logger.info(f"Initiating peer analysis for '{metadata.company_name}'. "
                 f"Country peers: {num_country_peers}, Region peers: {num_region_peers}")
-    
-    try:
-
-        prompt = build_peer_prompt(
-            company_name=metadata.company_name,
-            sector=metadata.sector,
-            industry_group=metadata.industry_group,
-            industry=metadata.industry,
-            sub_industries=metadata.sub_industries,
-            headquarters=metadata.headquarters,
-            country=metadata.country,
-            region=metadata.region,
-            num_country_peers=num_country_peers,
-            num_region_peers=num_region_peers
-        )
-
-
-        response = openai_client.responses.create(
-            model=config.OPENAI_PEERS_TOOL_MODEL,
-            tools=[{
-                "type": "web_search_preview",
-                "search_context_size": "low",
-            }],
-            input=prompt,
-            temperature=0
-        )
-        result = response.output_text
-        logger.info(f"Result : {result}")
-        return result
-
-    except Exception as e:
-        logger.error(f"[Exception] Failed to retrieve peer companies: {e}", exc_info=True)
-
-    return {}
+    return num_country_peers, num_region_peers
 
 @tool
 def get_company_sustainability_report(company: str, year: Optional[int] = None) -> List[str]:
@@ -411,22 +299,106 @@ def get_company_sustainability_report(company: str, year: Optional[int] = None)
 
     Returns an empty list if no valid URLs are found.
     """
-    logger.info(f"Searching for sustainability report for '{company}'" + (f" in {year}" if year else ""))
+    try:
+        return search_sustainability_reports(company, year)
+
+    except Exception as e:
+        logger.error(f"Error while fetching report for '{company}': {e}", exc_info=True)
+        return []
 
+@async_implementation(get_company_sustainability_report)
+async def get_company_sustainability_report_async(company: str, year: Optional[int] = None) -> List[str]:
     try:
-        base_query = f"{company} sustainability report"
-        query = f"{base_query} {year} filetype:pdf" if year else f"{base_query} filetype:pdf"
-        response = fetch_info_from_tavily(query)
-        logger.info(f"Response : {response}")
-        
-        if not response or 'results' not in response:
-            logger.warning("No results found or invalid response structure.")
-            return []
-
-        urls = [res.get("url") for res in response['results'] if res.get("url")]
-        logger.info(f"Found {len(urls)} report(s) for '{company}'")
-        return urls
+        return await search_sustainability_reports_async(company, year)
 
     except Exception as e:
         logger.error(f"Error while fetching report for '{company}': {e}", exc_info=True)
-        return []
\ No newline at end of file
+        return []
+
+@tool
+def extract_peer_reports(peers: Union[List[str], Dict[str, Any]], year: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Tool: Peer Report Batch Extractor
+
+    Finds, extracts and stores the sustainability reports of several companies at once.
+
+    This tool:
+    - Searches each company's report via Tavily and downloads the first valid PDF.
+    - Extracts and upserts every report, processing companies concurrently.
+    - Streams each company's result (custom stream mode, key "peer_result") as it finishes.
+
+    Input:
+        peers (list[str] | dict): Company names, or the output of `get_peer_companies`
+            ({"country_peers": [...], "region_peers": [...]}).
+        year (int, optional): Reporting year to search for.
+
+    Output:
+        dict:
+            {
+                "total": int, "succeeded": int, "no_report": int, "failed": int,
+                "total_tokens": int, "elapsed_seconds": float,
+                "results": [ {company, status, report_url, company_id, year, error}, ... ]
+            }
+    """
+    return peer_pipeline_service.extract_peer_reports(peers, year, on_result=peer_result_streamer())
+
+@async_implementation(extract_peer_reports)
+async def extract_peer_reports_async(peers: Union[List[str], Dict[str, Any]], year: Optional[int] = None) -> Dict[str, Any]:
+    return await peer_pipeline_service.extract_peer_reports_async(peers, year, on_result=peer_result_streamer())
+
+def peer_result_streamer() -> Callable[[Dict[str, Any]], None]:
+    """Returns a callback streaming each peer result to the current LangGraph run, if any."""
+    try:
+        stream_writer = get_stream_writer()
+    except RuntimeError:
+        # Called outside a LangGraph run: nothing to stream to.
+        stream_writer = None
+
+    def on_result(result: Dict[str, Any]) -> None:
+        if stream_writer:
+            stream_writer({"peer_result": result})
+
+    return on_result
+
+@tool
+def get_extraction_status(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Tool: Extraction Job Status
+
+    Reports the progress of a background extraction queued with
+    `extract_emission_data_as_json(file_input, background=True)`.
+
+    Input:
+        job_id (str): The `job_id` returned when the extraction was queued.
+
+    Output:
+        dict | None:
+            {
+                "job_id": str, "source": str,
+                "status": "queued" | "running" | "succeeded" | "failed",
+                "attempts": int, "max_attempts": int,
+                "created_at": str, "updated_at": str,
+                "result": {company_id, year, upsert_status, cache_hit, token_usage} | None,
+                "error": str | None
+            }
+
+    Returns None if the job does not exist or the queue cannot be reached.
+    """
+    return read_extraction_status(job_id)
+
+@async_implementation(get_extraction_status)
+async def get_extraction_status_async(job_id: str) -> Optional[Dict[str, Any]]:
+    return await asyncio.to_thread(read_extraction_status, job_id)
+
+def read_extraction_status(job_id: str) -> Optional[Dict[str, Any]]:
+    """Returns the status of an extraction job, or None if it is unknown or unreadable."""
+    try:
+        job = get_job_queue().get(job_id)
+    except Exception as e:
+        logger.error(f"Failed to read extraction job '{job_id}': {e}", exc_info=True)
+        return None
+
+    if job is None:
+        logger.error(f"Unknown extraction job: '{job_id}'")
+        return None
+    return job_status(job)
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+import functools
+import weakref
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+def loop_local(factory: Callable[[], T]) -> Callable[[], T]:
+    """
+    Caches the result of a zero-argument factory per running event loop.
+
+    Async clients (httpx, AsyncOpenAI, AsyncMongoClient) bind their connection pools
+    to the loop they are first used on, so a single process-wide instance breaks as
+    soon as a second loop (e.g. one `asyncio.run` per thread) touches it. Instances
+    are dropped together with their loop.
+
+    Usage:
+        @loop_local
+        def get_async_client() -> AsyncClient:
+            return AsyncClient()
+
+    Raises:
+        RuntimeError: If the decorated function is called outside a running event loop.
+    """
+    instances: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T]" = weakref.WeakKeyDictionary()
+    lock = threading.Lock()
+
+    @functools.wraps(factory)
+    def get() -> T:
+        loop = asyncio.get_running_loop()
+        with lock:
+            if loop not in instances:
+                instances[loop] = factory()
+            return instances[loop]
+
+    get.cache_clear = instances.clear
+    return get
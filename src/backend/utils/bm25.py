@@ -0,0 +1,128 @@
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in include includes including into is it its
+of on or other such that the their these this to which with
+""".split())
+
+# Longest suffixes first; only applied to tokens long enough to keep a useful stem.
+SUFFIXES = ("ations", "ation", "ities", "ings", "ers", "ies", "ing", "ity", "ed", "er", "es", "s")
+
+def stem(token: str) -> str:
+    """
+    Strips common English inflection suffixes so that e.g. 'manufacturers',
+    'manufactures' and 'manufacturing' share a stem.
+    """
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 4:
+            return token[:-len(suffix)]
+    return token
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lower-cases text and splits it into stemmed alphanumeric tokens, dropping
+    stopwords and one-character tokens.
+    """
+    return [
+        stem(token) for token in TOKEN_PATTERN.findall((text or "").lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+class BM25Index:
+    """
+    Okapi BM25 over a fixed corpus, backed by per-term postings in NumPy arrays.
+
+    The postings hold the precomputed BM25 weight of every (term, document) pair that
+    occurs, sorted by term, so memory grows with the number of distinct terms per
+    document rather than with documents x vocabulary. That keeps long reports with
+    large vocabularies (numbers, names) cheap to index, and a query only reads the
+    postings of its own terms.
+
+    Usage:
+        index = BM25Index(["first document", "second document"])
+        index.top_k("document", k=1)  # [(0, 0.13)]
+    """
+
+    def __init__(self, documents: Iterable[str], k1: float = 1.5, b: float = 0.75):
+        counts = [Counter(tokenize(document)) for document in documents]
+        self.k1 = k1
+        self.b = b
+        self.vocabulary: Dict[str, int] = {}
+        for document_counts in counts:
+            for token in document_counts:
+                self.vocabulary.setdefault(token, len(self.vocabulary))
+
+        self.document_count = len(counts)
+        posting_count = sum(len(document_counts) for document_counts in counts)
+        terms = np.fromiter(
+            (self.vocabulary[token] for document_counts in counts for token in document_counts),
+            dtype=np.int32, count=posting_count
+        )
+        term_frequencies = np.fromiter(
+            (frequency for document_counts in counts for frequency in document_counts.values()),
+            dtype=np.float32, count=posting_count
+        )
+        documents_of = np.repeat(
+            np.arange(self.document_count, dtype=np.int32), [len(document_counts) for document_counts in counts]
+        )
+
+        lengths = np.array([sum(document_counts.values()) for document_counts in counts], dtype=np.float32)
+        average_length = lengths.mean() if self.document_count else 0.0
+        document_frequencies = np.bincount(terms, minlength=len(self.vocabulary))
+
+        self.idf = np.log1p(
+            (self.document_count - document_frequencies + 0.5) / (document_frequencies + 0.5)
+        ).astype(np.float32)
+        # Precompute the BM25 weight of every posting; scoring a query is then a sum
+        # over the postings of its terms.
+        length_norm = k1 * (1 - b + b * lengths / average_length) if average_length \
+            else np.full(self.document_count, k1, dtype=np.float32)
+        weights = (
+            term_frequencies * (k1 + 1) / (term_frequencies + length_norm[documents_of])
+        ) * self.idf[terms]
+
+        order = np.argsort(terms, kind="stable")
+        self._documents = documents_of[order]
+        self._weights = weights[order].astype(np.float32)
+        self._offsets = np.zeros(len(self.vocabulary) + 1, dtype=np.int64)
+        np.cumsum(document_frequencies, out=self._offsets[1:])
+
+    def __len__(self) -> int:
+        return self.document_count
+
+    def score(self, query: str) -> np.ndarray:
+        """
+        Scores every document against a query.
+
+        Returns:
+            np.ndarray: One BM25 score per document, in corpus order.
+        """
+        scores = np.zeros(len(self), dtype=np.float32)
+        for token in tokenize(query):
+            column = self.vocabulary.get(token)
+            if column is not None:
+                start, end = self._offsets[column], self._offsets[column + 1]
+                scores[self._documents[start:end]] += self._weights[start:end]
+        return scores
+
+    def top_k(self, query: str, k: int) -> List[Tuple[int, float]]:
+        """
+        Returns the `k` best-scoring documents with a positive score.
+
+        Returns:
+            List[Tuple[int, float]]: (document index, score) pairs, best first.
+        """
+        scores = self.score(query)
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(int(index), float(scores[index])) for index in ranked if scores[index] > 0]
@@ -1,4 +1,6 @@
 import re
+import hashlib
+from typing import BinaryIO
 
 def is_valid_metadata(data: dict) -> bool:
     """
@@ -14,3 +16,14 @@ def clean_json_output(raw_output: str) -> str:
     """
     cleaned = re.sub(r"```(?:json)?", "", raw_output).strip("` \n")
     return cleaned
+
+def compute_sha256(stream: BinaryIO, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Return the hex SHA-256 digest of a seekable binary stream, rewinding it afterwards.
+    """
+    digest = hashlib.sha256()
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
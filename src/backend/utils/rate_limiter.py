@@ -0,0 +1,233 @@
+import time
+import asyncio
+import threading
+from functools import lru_cache
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+
+logger = get_logger()
+
+class TokenBucket:
+    """
+    Thread-safe token bucket holding up to `capacity` tokens, refilled continuously at
+    `refill_per_second`.
+
+    Tokens are reserved rather than taken: a reservation always succeeds, may drive the
+    balance negative, and returns how long the caller must wait until the deficit has
+    been refilled. Callers are therefore served in the order they reserved, and the lock
+    is never held while sleeping.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+        self._updated_at = now
+
+    @property
+    def tokens(self) -> float:
+        """Currently available tokens (negative while reservations are outstanding)."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self, amount: float) -> float:
+        """
+        Reserves `amount` tokens.
+
+        Returns:
+            float: Seconds to wait before the reserved tokens are available (0 if they already are).
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_second
+
+    def adjust(self, amount: float) -> None:
+        """
+        Charges (positive) or refunds (negative) tokens after the fact, e.g. once the real
+        cost of a request is known.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - amount)
+
+class Reservation:
+    """
+    The tokens reserved for one request. Settled once with the actual usage reported by
+    the provider, or refunded if the request fails before any usage is reported.
+    """
+
+    def __init__(self, limiter: "RateLimiter", tokens: float):
+        self.limiter = limiter
+        self.tokens = tokens
+        self.settled = False
+
+    def record_usage(self, actual_tokens: float) -> None:
+        """Corrects the reservation by the tokens the request actually consumed."""
+        if not self.settled:
+            self.settled = True
+            self.limiter.record_usage(actual_tokens, self.tokens)
+
+    def release(self) -> None:
+        """Refunds the reserved tokens unless the usage was already recorded."""
+        if not self.settled:
+            self.settled = True
+            self.limiter.refund(tokens=self.tokens)
+
+class RateLimiter:
+    """
+    Per-provider limiter combining a requests-per-minute and a tokens-per-minute bucket.
+
+    A limit of 0 (or None) disables that bucket. Token costs are reserved up front from
+    an estimate and corrected with `record_usage` once the provider reports the actual
+    usage, so an underestimate delays later callers instead of tripping the quota. A
+    reservation whose request fails before reporting usage is refunded, so failed and
+    rejected calls do not hold back later callers; the request itself stays counted.
+
+    Usage:
+        limiter = get_rate_limiter("gemini")
+        with limiter.limit(tokens=estimate) as reservation:
+            response = call_provider()
+            reservation.record_usage(actual_tokens)
+
+    Async callers use `async with limiter.limit_async(tokens=estimate)` instead.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.name = name
+        self.sleep = sleep
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute / 60, clock) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60, clock) if tokens_per_minute else None
+
+    def reserve(self, tokens: float = 0) -> float:
+        """
+        Reserves one request and `tokens` tokens without waiting.
+
+        Returns:
+            float: Seconds the caller must wait before sending the request.
+        """
+        wait = 0.0
+        if self._requests:
+            wait = max(wait, self._requests.reserve(1))
+        if self._tokens and tokens:
+            wait = max(wait, self._tokens.reserve(tokens))
+        return wait
+
+    def refund(self, tokens: float = 0, request: bool = False) -> None:
+        """
+        Returns reserved but unused tokens, and the request itself if it was never sent.
+        """
+        if self._requests and request:
+            self._requests.adjust(-1)
+        if self._tokens and tokens:
+            self._tokens.adjust(-tokens)
+
+    def acquire(self, tokens: float = 0) -> float:
+        """
+        Blocks until one request and `tokens` tokens are available. If the wait is
+        interrupted, the whole reservation is refunded.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            logger.info(f"Rate limiter '{self.name}': waiting {wait:.2f}s to stay under quota")
+            try:
+                self.sleep(wait)
+            except BaseException:
+                self.refund(tokens, request=True)
+                raise
+        return wait
+
+    async def acquire_async(self, tokens: float = 0) -> float:
+        """
+        Awaits until one request and `tokens` tokens are available, without blocking
+        the event loop. Shares its buckets with `acquire`.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            logger.info(f"Rate limiter '{self.name}': waiting {wait:.2f}s to stay under quota")
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                self.refund(tokens, request=True)
+                raise
+        return wait
+
+    def record_usage(self, actual_tokens: float, estimated_tokens: float = 0) -> None:
+        """
+        Corrects the token bucket by the difference between actual and reserved tokens.
+        """
+        if self._tokens and actual_tokens != estimated_tokens:
+            self._tokens.adjust(actual_tokens - estimated_tokens)
+
+    @contextmanager
+    def limit(self, tokens: float = 0) -> Iterator[Reservation]:
+        """
+        Acquires one request and `tokens` tokens for the enclosed call, and refunds the
+        tokens if the call raises before its usage is recorded on the reservation.
+        """
+        self.acquire(tokens)
+        reservation = Reservation(self, tokens)
+        try:
+            yield reservation
+        except BaseException:
+            reservation.release()
+            raise
+
+    @asynccontextmanager
+    async def limit_async(self, tokens: float = 0) -> AsyncIterator[Reservation]:
+        """
+        Async counterpart of `limit`.
+        """
+        await self.acquire_async(tokens)
+        reservation = Reservation(self, tokens)
+        try:
+            yield reservation
+        except BaseException:
+            reservation.release()
+            raise
+
+@lru_cache(maxsize=None)
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """
+    Returns the process-wide limiter for a provider, configured by
+    `<PROVIDER>_REQUESTS_PER_MINUTE` and `<PROVIDER>_TOKENS_PER_MINUTE`.
+
+    Args:
+        provider (str): Provider name, e.g. 'gemini', 'openai' or 'tavily'.
+
+    Returns:
+        RateLimiter: The shared limiter.
+    """
+    prefix = provider.upper()
+    return RateLimiter(
+        provider,
+        requests_per_minute=getattr(config, f"{prefix}_REQUESTS_PER_MINUTE", 0),
+        tokens_per_minute=getattr(config, f"{prefix}_TOKENS_PER_MINUTE", 0)
+    )
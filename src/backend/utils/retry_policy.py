@@ -0,0 +1,269 @@
+import json
+import time
+import asyncio
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from pydantic import ValidationError
+
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+# === Error categories ===
+RATE_LIMITED = "rate_limited"   # 429 / quota exhausted: wait, honouring the server's hint
+TRANSIENT = "transient"         # timeouts, connection resets, 5xx: back off and retry
+MALFORMED = "malformed"         # empty or unparseable model output: retry immediately
+INVALID = "invalid"             # output that fails schema validation: retry immediately
+FATAL = "fatal"                 # auth, permission, bad request: never retry
+
+IMMEDIATE_RETRY_CATEGORIES = {MALFORMED, INVALID}
+TRANSIENT_STATUS_CODES = {408, 409, 500, 502, 503, 504}
+FATAL_STATUS_CODES = {400, 401, 403, 404, 422}
+
+class MalformedResponseError(ValueError):
+    """Raised when a model response is empty or not the expected JSON object."""
+    pass
+
+def status_code_of(error: BaseException) -> Optional[int]:
+    """
+    Returns the HTTP status carried by a provider SDK error, if any.
+
+    google-genai errors expose it as `code`, openai errors as `status_code`.
+    """
+    for attribute in ("status_code", "code"):
+        value = getattr(error, attribute, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+def classify_error(error: BaseException) -> str:
+    """
+    Maps an exception raised while calling a model provider to a retry category.
+
+    Args:
+        error (BaseException): The exception to classify.
+
+    Returns:
+        str: One of RATE_LIMITED, TRANSIENT, MALFORMED, INVALID or FATAL.
+    """
+    status_code = status_code_of(error)
+    if status_code == 429:
+        return RATE_LIMITED
+    if status_code in TRANSIENT_STATUS_CODES or (status_code and status_code >= 500):
+        return TRANSIENT
+    if status_code in FATAL_STATUS_CODES:
+        return FATAL
+
+    if isinstance(error, ValidationError):
+        return INVALID
+    if isinstance(error, (MalformedResponseError, json.JSONDecodeError)):
+        return MALFORMED
+    if isinstance(error, (ConnectionError, TimeoutError, OSError)):
+        return TRANSIENT
+
+    name = type(error).__name__
+    if "RateLimit" in name:
+        return RATE_LIMITED
+    if "Authentication" in name or "PermissionDenied" in name:
+        return FATAL
+    if "Timeout" in name or "Connection" in name:
+        return TRANSIENT
+
+    # Unknown errors are treated as transient so they still get a bounded, backed-off retry.
+    return TRANSIENT
+
+def _parse_duration(value: Any) -> Optional[float]:
+    """Parses '37s', '1.5s', '37' or a number of seconds."""
+    try:
+        return max(0.0, float(str(value).strip().rstrip("s")))
+    except ValueError:
+        return None
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Extracts the server-provided retry hint from a provider error.
+
+    Looks at the `Retry-After` response header (seconds or HTTP date) and at the
+    `google.rpc.RetryInfo.retryDelay` entry of Gemini error details.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the error carries no hint.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        retry_after = headers.get("Retry-After") or headers.get("retry-after")
+        if retry_after:
+            seconds = _parse_duration(retry_after)
+            if seconds is not None:
+                return seconds
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+
+    details = getattr(error, "details", None)
+    if isinstance(details, dict):
+        error_body = details.get("error", details)
+        details = error_body.get("details") if isinstance(error_body, dict) else None
+    if isinstance(details, list):
+        for detail in details:
+            if isinstance(detail, dict) and detail.get("retryDelay"):
+                return _parse_duration(detail["retryDelay"])
+    return None
+
+class RetryBudget:
+    """
+    Caps the total time a unit of work (e.g. one report) may spend sleeping between
+    retries. Shared by all threads working on it.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.spent = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> float:
+        with self._lock:
+            return max(0.0, self.seconds - self.spent)
+
+    def consume(self, delay: float) -> bool:
+        """
+        Charges `delay` seconds to the budget.
+
+        Returns:
+            bool: False (and charges nothing) if the delay does not fit in what is left.
+        """
+        with self._lock:
+            if self.spent + delay > self.seconds:
+                return False
+            self.spent += delay
+            return True
+
+class RetryPolicy:
+    """
+    Retries a call according to the category of the error it raised.
+
+    - FATAL errors are raised immediately.
+    - MALFORMED and INVALID outputs are retried without waiting.
+    - RATE_LIMITED and TRANSIENT errors wait for the server's retry hint when there is
+      one, and otherwise for a decorrelated-jitter backoff:
+      `min(max_delay, uniform(base_delay, previous_delay * 3))`.
+
+    Every call makes at most `max_attempts` attempts, and waits are charged to an
+    optional RetryBudget; once a wait does not fit in the budget the last error is raised.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = config.MAX_RETRIES,
+        base_delay_seconds: float = config.RETRY_BASE_DELAY_SECONDS,
+        max_delay_seconds: float = config.RETRY_MAX_DELAY_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+
+    def backoff(self, previous_delay: float) -> float:
+        """Returns the next decorrelated-jitter delay."""
+        upper = max(self.base_delay_seconds, previous_delay * 3)
+        return min(self.max_delay_seconds, self.rng.uniform(self.base_delay_seconds, upper))
+
+    def delay_for(self, error: BaseException, category: str, previous_delay: float) -> float:
+        """Returns how long to wait before retrying after `error`."""
+        if category in IMMEDIATE_RETRY_CATEGORIES:
+            return 0.0
+        hint = retry_after_seconds(error)
+        if hint is not None:
+            return hint
+        return self.backoff(previous_delay)
+
+    def call(self, func: Callable[[], T], budget: Optional[RetryBudget] = None, label: str = "call") -> T:
+        """
+        Calls `func` until it succeeds or the policy gives up.
+
+        Args:
+            func (Callable[[], T]): The operation to attempt.
+            budget (RetryBudget, optional): Shared cap on the time spent waiting.
+            label (str): Name used in log messages.
+
+        Returns:
+            T: The result of the first successful attempt.
+
+        Raises:
+            Exception: The last error, once it is fatal or attempts or budget are exhausted.
+        """
+        previous_delay = self.base_delay_seconds
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return func()
+            except Exception as err:
+                delay = self._next_delay(err, attempt, previous_delay, budget, label)
+                if delay > 0:
+                    logger.info(f"Retrying {label} in {delay:.2f}s")
+                    self.sleep(delay)
+                    previous_delay = delay
+
+    async def call_async(
+        self,
+        func: Callable[[], Awaitable[T]],
+        budget: Optional[RetryBudget] = None,
+        label: str = "call"
+    ) -> T:
+        """
+        Async counterpart of `call`: awaits `func()` and waits with `asyncio.sleep`.
+
+        Raises:
+            Exception: The last error, once it is fatal or attempts or budget are exhausted.
+        """
+        previous_delay = self.base_delay_seconds
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await func()
+            except Exception as err:
+                delay = self._next_delay(err, attempt, previous_delay, budget, label)
+                if delay > 0:
+                    logger.info(f"Retrying {label} in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+                    previous_delay = delay
+
+    def _next_delay(
+        self,
+        err: Exception,
+        attempt: int,
+        previous_delay: float,
+        budget: Optional[RetryBudget],
+        label: str
+    ) -> float:
+        """
+        Returns the wait before the next attempt, or re-raises `err` when the policy gives up.
+        Must be called from the `except` block handling `err`.
+        """
+        category = classify_error(err)
+        logger.info(f"Attempt {attempt} failed for {label} ({category}): {err}")
+
+        if category == FATAL:
+            logger.error(f"Not retrying {label}: {category} error.")
+            raise err
+        if attempt == self.max_attempts:
+            logger.error(f"{label} failed after {self.max_attempts} attempts.")
+            raise err
+
+        delay = self.delay_for(err, category, previous_delay)
+        if budget is not None and not budget.consume(delay):
+            logger.error(f"Retry budget exhausted for {label}: {budget.remaining:.1f}s left, {delay:.1f}s needed.")
+            raise err
+        return delay
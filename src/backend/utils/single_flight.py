@@ -0,0 +1,103 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key: the first caller runs the function
+    and every caller that arrives while it is in flight receives the same result (or
+    exception) instead of issuing a duplicate request.
+
+    Usage:
+        flights = SingleFlight()
+        result = flights.do(key, lambda: expensive_call(key))
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Runs `func` for `key` unless a call for the same key is already running.
+
+        Returns:
+            T: The result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+        return future.result()
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of `SingleFlight`: concurrent awaits for the same key share
+    one in-flight coroutine. Keys are scoped to the running event loop.
+
+    The shared coroutine runs in its own task, so cancelling the caller that started
+    it does not cancel the other callers; it is only cancelled once every caller
+    waiting for it has been cancelled.
+
+    Usage:
+        flights = AsyncSingleFlight()
+        result = await flights.do(key, lambda: expensive_call_async(key))
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Tuple[int, Hashable], "asyncio.Task"] = {}
+        self._waiters: Dict["asyncio.Task", int] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Awaits `func()` for `key` unless a call for the same key is already running.
+
+        Returns:
+            T: The result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+            asyncio.CancelledError: If this caller, or the shared call, was cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        task = self._in_flight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._in_flight[flight_key] = task
+            task.add_done_callback(lambda done: self._finish(flight_key, done))
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[task] == 1:
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+
+    def _finish(self, flight_key: Tuple[int, Hashable], task: "asyncio.Task") -> None:
+        if self._in_flight.get(flight_key) is task:
+            del self._in_flight[flight_key]
@@ -82,6 +82,12 @@ EXTRACTOR_TOOL_PROMPT = (
     """
 )
 
+# Sent with each schema request when the report and EXTRACTOR_TOOL_PROMPT (as system
+# instruction) are served from a Gemini context cache.
+EXTRACTOR_CACHED_REQUEST_PROMPT = (
+    "Extract the data described by the response schema from the report, following your instructions."
+)
+
 def flatten_gics_schema(schema: Dict[str, Any]) -> str:
     """
     Converts a nested GICS schema dictionary into a flattened, indented string
@@ -173,6 +179,7 @@ def build_peer_prompt(
 
     metadata_block = (
         "- company_name\n"
+        "- core\n"
         "- sector\n"
         "- industry_group\n"
         "- industry\n"
@@ -300,11 +307,13 @@ SUPERVISOR_SYSTEM_PROMPT = (
         - Don't ask the user to confirm the link. once valid link received pass it to extractor as the original intenet is to extract
 
     If the user requests ESG extraction for **multiple companies** (e.g., peer companies):
-      -> Iterate through each company:
-          1. Use `scraper_agent` to find a valid `.pdf` report.
-          2. If a `.pdf` is found, pass it to `extractor_agent`.
-      -> Aggregate all extractor results and return the combined output.
-      -> Skip companies where no valid report is found. Do not fail the entire process.
+      -> If only a reference company is given, use `scraper_agent` once to fetch its peer companies.
+      -> Pass the full list of company names (and the year, if any) to `extractor_agent` in a single step.
+         It finds, extracts and stores all reports concurrently and returns one aggregated summary.
+      -> Do **not** route each company separately. Companies without a valid report are skipped, not fatal.
+
+    If the user asks to extract a report in the background, or asks about an extraction job (job id / status):
+      -> use `extractor_agent`; it queues background jobs and reports their status.
 
     --- RULES ---
 
@@ -378,7 +387,19 @@ EXTRACTOR_AGENT_PROMPT = (
 
     First, determine the user's intent.
 
-    You must use the following tools in this exact order:
+    For a **list of companies** (e.g., peer companies) instead of a single PDF:
+    - Call `extract_peer_reports(peers, year=None)` once with all company names (or the peer
+      result as received) and return its summary exactly as received. Do not call the other tools.
+
+    If the user asks to run an extraction **in the background** (or to queue it):
+    - Call `extract_emission_data_as_json(file_input, background=True)` once. It returns a job with a `job_id`;
+      the worker stores the result itself, so do not call `upsert_esg_report`.
+    - Return the `job_id` and tell the user they can ask for its status.
+
+    If the user asks for the **status of an extraction job**:
+    - Call `get_extraction_status(job_id)` and return its response exactly as received.
+
+    For a single PDF, you must use the following tools in this exact order:
 
     1. `extract_emission_data_as_json(file_input)`  
     - Extracts ESG emissions data from the PDF.  
@@ -390,7 +411,7 @@ EXTRACTOR_AGENT_PROMPT = (
     - Returns an object with `status` and an optional `message`.
     ---
     Rules:  
-    - Only invoke tools if a valid input file is provided.  
+    - Only invoke `extract_emission_data_as_json` if a valid input file is provided.  
     - Never interpret, transform, or modify tool outputs.  
     - Never skip, retry, or reorder any steps.  
     - Pass the output of `extract_emission_data_as_json` **exactly as received** to `upsert_esg_report`.  
@@ -0,0 +1,204 @@
+"""
+Extraction job worker.
+
+Pulls report extraction jobs queued by the `extract_emission_data_as_json` tool (with
+`background=True`) from MongoDB, and runs extraction -> upsert for each of them,
+`--concurrency` jobs at a time. Any number of workers can run against the same
+queue, on one or many machines.
+
+Usage:
+    python -m src.backend.worker [--concurrency 2] [--poll-interval 5] [--once]
+
+While a job runs its lease is renewed every JOB_HEARTBEAT_SECONDS. If the worker
+dies, the lease expires after JOB_LEASE_SECONDS and another worker picks the job up.
+With EXTRACTION_CHECKPOINT_BACKEND=mongo that worker resumes from the sections the
+first one already extracted.
+"""
+import os
+import sys
+import uuid
+import json
+import signal
+import socket
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from src.backend.utils.logger import get_logger
+from src.backend.config.config import config
+from src.backend.services.extraction_service import extract_prepared_report, prepare_report
+from src.backend.services.preflight_service import PreflightError
+from src.backend.services.mongo_db_service import upsert_esg_report
+from src.backend.services.job_service import ExtractionJobQueue, get_job_queue
+
+logger = get_logger()
+
+class LeaseHeartbeat:
+    """
+    Renews a job's lease from a background thread while the job runs.
+
+    Usage:
+        with LeaseHeartbeat(queue, job_id, worker_id, interval):
+            run_job()
+    """
+
+    def __init__(self, queue: ExtractionJobQueue, job_id: str, worker_id: str, interval_seconds: float):
+        self.queue = queue
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.interval_seconds = interval_seconds
+        self.lost = False
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{job_id[:8]}", daemon=True)
+
+    def __enter__(self) -> "LeaseHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval_seconds):
+            try:
+                if not self.queue.heartbeat(self.job_id, self.worker_id):
+                    logger.error(f"Lost the lease of job {self.job_id}; another worker may run it.")
+                    self.lost = True
+                    return
+            except Exception as e:
+                # A missed heartbeat only matters if every renewal fails until the lease expires.
+                logger.error(f"Heartbeat failed for job {self.job_id}: {e}")
+
+class ExtractionWorker:
+    """
+    Claims and processes extraction jobs with `concurrency` threads until stopped.
+    """
+
+    def __init__(
+        self,
+        queue: Optional[ExtractionJobQueue] = None,
+        concurrency: int = config.WORKER_CONCURRENCY,
+        poll_interval_seconds: float = config.WORKER_POLL_INTERVAL_SECONDS,
+        heartbeat_seconds: float = config.JOB_HEARTBEAT_SECONDS,
+        worker_id: Optional[str] = None
+    ):
+        self.queue = queue or get_job_queue()
+        self.concurrency = max(1, concurrency)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.processed: List[Dict[str, Any]] = []
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    def stop(self) -> None:
+        """Stops claiming new jobs; jobs already running are finished."""
+        if not self._stopped.is_set():
+            logger.info(f"Worker {self.worker_id} stopping after its running jobs")
+        self._stopped.set()
+
+    def process(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extracts and upserts the report of a claimed job and records the outcome in the queue.
+        A report rejected by the preflight (see `inspect_pdf`) fails the job on its first
+        attempt, since every retry would download it again to reach the same verdict.
+
+        Returns:
+            Dict[str, Any]: {"job_id", "status", "result" or "error"}.
+        """
+        job_id = job["_id"]
+        logger.info(f"Worker {self.worker_id} running job {job_id} (attempt {job['attempts']}): {job['source']}")
+
+        try:
+            with LeaseHeartbeat(self.queue, job_id, self.worker_id, self.heartbeat_seconds):
+                document = extract_prepared_report(prepare_report(job["source"]))
+                if document is None:
+                    raise ValueError("Extraction failed or report metadata is incomplete.")
+
+                upsert_result = upsert_esg_report(document)
+                if upsert_result.get("status") == "error":
+                    raise ValueError(upsert_result.get("message", "Upsert failed."))
+
+            result = {
+                "company_id": document["_id"],
+                "year": document["year"],
+                "upsert_status": upsert_result["status"],
+                "cache_hit": document.get("cache_hit", False),
+                "token_usage": document.get("token_usage")
+            }
+            if not self.queue.complete(job_id, self.worker_id, result):
+                logger.error(f"Job {job_id} finished after its lease was lost; result kept by the current owner.")
+            return {"job_id": job_id, "status": "succeeded", "result": result}
+
+        except PreflightError as e:
+            logger.error(f"Job {job_id} failed without retry: {e}")
+            status = self.queue.fail(job_id, self.worker_id, str(e), retry=False)
+            return {"job_id": job_id, "status": status or "lost", "error": str(e)}
+
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            status = self.queue.fail(job_id, self.worker_id, str(e))
+            return {"job_id": job_id, "status": status or "lost", "error": str(e)}
+
+    def _loop(self, drain: bool) -> None:
+        while not self._stopped.is_set():
+            try:
+                job = self.queue.claim(self.worker_id)
+            except Exception as e:
+                logger.error(f"Failed to claim a job: {e}")
+                job = None
+
+            if job is None:
+                if drain:
+                    return
+                self._stopped.wait(self.poll_interval_seconds)
+                continue
+
+            outcome = self.process(job)
+            with self._lock:
+                self.processed.append(outcome)
+
+    def run(self, drain: bool = False) -> List[Dict[str, Any]]:
+        """
+        Processes jobs until `stop()` is called, or until the queue is empty when `drain` is set.
+
+        Returns:
+            List[Dict[str, Any]]: The outcome of every job processed by this worker.
+        """
+        self.queue.ensure_indexes()
+        logger.info(f"Worker {self.worker_id} started with concurrency {self.concurrency}")
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="job") as executor:
+            for future in [executor.submit(self._loop, drain) for _ in range(self.concurrency)]:
+                future.result()
+
+        logger.info(f"Worker {self.worker_id} stopped after {len(self.processed)} job(s)")
+        return self.processed
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Process queued ESG report extraction jobs.")
+    parser.add_argument("--concurrency", type=int, default=config.WORKER_CONCURRENCY, help="Jobs processed in parallel.")
+    parser.add_argument("--poll-interval", type=float, default=config.WORKER_POLL_INTERVAL_SECONDS,
+                        help="Seconds to wait when the queue is empty.")
+    parser.add_argument("--once", action="store_true", help="Exit once the queue is empty.")
+    args = parser.parse_args(argv)
+
+    worker = ExtractionWorker(concurrency=args.concurrency, poll_interval_seconds=args.poll_interval)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: worker.stop())
+
+    processed = worker.run(drain=args.once)
+    summary = {
+        "processed": len(processed),
+        "succeeded": sum(1 for outcome in processed if outcome["status"] == "succeeded"),
+        "requeued": sum(1 for outcome in processed if outcome["status"] == "queued"),
+        "failed": sum(1 for outcome in processed if outcome["status"] == "failed"),
+        "lost": sum(1 for outcome in processed if outcome["status"] == "lost")
+    }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import math
+import random
+import tracemalloc
+
+import pytest
+
+from src.backend.utils.bm25 import BM25Index, tokenize
+
+DOCUMENTS = [
+    "Scope 1 and scope 2 emissions fell while energy consumption rose.",
+    "The board oversees governance, ethics and risk.",
+    "Water withdrawal and water discharge by site.",
+    "Emissions intensity per tonne of steel produced.",
+]
+
+def reference_scores(documents, query, k1=1.5, b=0.75):
+    """Textbook BM25, one document at a time."""
+    tokenized = [tokenize(document) for document in documents]
+    average_length = sum(map(len, tokenized)) / len(tokenized)
+    scores = []
+    for tokens in tokenized:
+        score = 0.0
+        for term in tokenize(query):
+            frequency = tokens.count(term)
+            document_frequency = sum(term in other for other in tokenized)
+            idf = math.log1p((len(tokenized) - document_frequency + 0.5) / (document_frequency + 0.5))
+            score += idf * frequency * (k1 + 1) / (frequency + k1 * (1 - b + b * len(tokens) / average_length))
+        scores.append(score)
+    return scores
+
+@pytest.mark.parametrize("query", ["scope emissions", "water water", "governance board steel", "unrelated"])
+def test_scores_match_textbook_bm25(query):
+    index = BM25Index(DOCUMENTS)
+    assert index.score(query).tolist() == pytest.approx(reference_scores(DOCUMENTS, query), rel=1e-5)
+
+def test_top_k_keeps_positive_scores_best_first():
+    index = BM25Index(DOCUMENTS)
+    assert [document for document, _ in index.top_k("emissions", k=3)] == [3, 0]
+    assert index.top_k("unrelated", k=3) == []
+
+def test_long_report_with_large_vocabulary_stays_bounded():
+    random.seed(0)
+    words = "scope emissions energy water waste employees board governance revenue suppliers".split()
+    pages = [
+        " ".join(random.choice(words) if random.random() < 0.5 else str(random.randrange(40_000)) for _ in range(200))
+        for _ in range(1000)
+    ]
+
+    tracemalloc.start()
+    try:
+        index = BM25Index(pages)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # A dense pages x vocabulary float32 matrix alone would take 1000 x 30k x 4 bytes = 120 MB.
+    assert len(index) == 1000 and len(index.vocabulary) > 30_000
+    assert peak < 40 * 1024 * 1024
+    assert index.top_k("scope emissions", k=5)
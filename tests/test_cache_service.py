@@ -0,0 +1,11 @@
+import pytest
+
+from src.backend.services.cache_service import CacheBackend
+
+def test_incomplete_cache_backend_fails_when_created():
+    class ReadOnlyCache(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        ReadOnlyCache()
@@ -0,0 +1,73 @@
+import pytest
+
+from src.backend.config.config import config
+from src.backend.services import extraction_service
+from src.backend.services.checkpoint_service import CheckpointStore, LocalCheckpointStore
+from src.backend.services.extraction_service import (
+    EnvironmentalEmissionsEnergy, MaterialityAssessment, extract_report, new_token_usage, schema_name_of
+)
+
+SCHEMAS = [EnvironmentalEmissionsEnergy, MaterialityAssessment]
+FILE_HASH = "f" * 64
+
+class FakeExtraction:
+    """Stands in for the Gemini requests, failing the schemas listed in `failing`."""
+
+    def __init__(self):
+        self.requested = []
+        self.failing = set()
+
+    def __call__(self, client, uploaded_file, report_pages, schemas, retry_budget=None, cached_content=None):
+        names = [schema_name_of(schema) for schema in schemas]
+        self.requested.extend(names)
+        return {name: {name: "extracted"} for name in names if name not in self.failing}, new_token_usage()
+
+@pytest.fixture
+def extraction(monkeypatch):
+    monkeypatch.setattr(config, "SCHEMA_PACK_MAX_OUTPUT_TOKENS", 0)
+    extraction = FakeExtraction()
+    monkeypatch.setattr(extraction_service, "extract_routed_group", extraction)
+    return extraction
+
+def run(store):
+    result, _ = extract_report(
+        None, None, SCHEMAS, max_concurrency=1, file_hash=FILE_HASH, checkpoint_store=store, use_context_cache=False
+    )
+    return result
+
+def interrupted_run(store, extraction):
+    extraction.failing = {"MaterialityAssessment"}
+    assert run(store) is None
+    extraction.failing = set()
+    extraction.requested.clear()
+
+def test_rerun_resumes_from_checkpointed_sections(tmp_path, extraction):
+    store = LocalCheckpointStore(str(tmp_path))
+    interrupted_run(store, extraction)
+
+    assert run(store) == {"EnvironmentalEmissionsEnergy": "extracted", "MaterialityAssessment": "extracted"}
+    assert extraction.requested == ["MaterialityAssessment"]
+    assert store.load(FILE_HASH) == {}
+
+@pytest.mark.parametrize("change", ["model", "prompt", "schema"])
+def test_checkpoints_of_another_model_prompt_or_schema_are_not_reused(tmp_path, extraction, monkeypatch, change):
+    store = LocalCheckpointStore(str(tmp_path))
+    interrupted_run(store, extraction)
+
+    if change == "model":
+        monkeypatch.setattr(config, "GEMINI_EXTRACTION_MODEL", "another-model")
+    elif change == "prompt":
+        monkeypatch.setattr(extraction_service, "EXTRACTOR_TOOL_PROMPT", "Another prompt.")
+    else:
+        monkeypatch.setattr(extraction_service, "schema_fingerprint", lambda schema: "another-schema")
+
+    assert run(store) is not None
+    assert extraction.requested == ["EnvironmentalEmissionsEnergy", "MaterialityAssessment"]
+
+def test_incomplete_checkpoint_store_fails_when_created():
+    class LoadOnlyStore(CheckpointStore):
+        def load(self, file_hash):
+            return {}
+
+    with pytest.raises(TypeError):
+        LoadOnlyStore()
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+from google.genai import errors, types
+
+from src.backend.config.config import config
+from src.backend.utils.system_prompts import EXTRACTOR_CACHED_REQUEST_PROMPT, EXTRACTOR_TOOL_PROMPT
+from src.backend.services.extraction_service import (
+    RESPONSE_SCHEMA, extract_report, extract_report_async, schema_name_of
+)
+
+UPLOADED_FILE = types.File(name="files/report-1", uri="https://example.com/files/report-1", mime_type="application/pdf")
+
+class FakeGenaiClient:
+    """
+    Stands in for `genai.Client`: records context cache and generation calls, in order,
+    and answers every section request with a small JSON object.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.requests = []
+        self._lock = threading.Lock()
+        self.caches = SimpleNamespace(create=self.create_cache, delete=self.delete_cache)
+        self.models = SimpleNamespace(generate_content=self.generate_content)
+        self.aio = SimpleNamespace(
+            caches=SimpleNamespace(create=self.create_cache_async, delete=self.delete_cache_async),
+            models=SimpleNamespace(generate_content=self.generate_content_async)
+        )
+
+    def create_cache(self, model, config):
+        with self._lock:
+            self.events.append(("create", config.display_name, list(config.contents), config.system_instruction))
+            return types.CachedContent(name=f"cachedContents/{len(self.events)}")
+
+    def delete_cache(self, name):
+        with self._lock:
+            self.events.append(("delete", name))
+
+    def generate_content(self, model, contents, config):
+        name = schema_name_of(config["response_schema"])
+        with self._lock:
+            self.events.append(("generate", name))
+            self.requests.append((contents, config.get("cached_content")))
+        return SimpleNamespace(text=json.dumps({name: "extracted"}), usage_metadata=None, candidates=[])
+
+    async def create_cache_async(self, model, config):
+        return self.create_cache(model, config)
+
+    async def delete_cache_async(self, name):
+        self.delete_cache(name)
+
+    async def generate_content_async(self, model, contents, config):
+        await asyncio.sleep(0)
+        return self.generate_content(model, contents, config)
+
+@pytest.fixture(autouse=True)
+def one_request_per_section(monkeypatch):
+    monkeypatch.setattr(config, "SCHEMA_PACK_MAX_OUTPUT_TOKENS", 0)
+
+def assert_one_cache_shared_then_deleted(client, result):
+    assert result == {schema_name_of(schema): "extracted" for schema in RESPONSE_SCHEMA}
+
+    creates = [event for event in client.events if event[0] == "create"]
+    assert creates == [("create", UPLOADED_FILE.name, [UPLOADED_FILE], EXTRACTOR_TOOL_PROMPT)]
+    assert client.events[0] == creates[0]
+    assert client.events[-1] == ("delete", "cachedContents/1")
+    assert [event for event in client.events if event[0] == "delete"] == [client.events[-1]]
+
+    assert len(client.requests) == len(RESPONSE_SCHEMA)
+    assert all(request == ([EXTRACTOR_CACHED_REQUEST_PROMPT], "cachedContents/1") for request in client.requests)
+
+def test_report_sections_share_one_context_cache():
+    client = FakeGenaiClient()
+    result, _ = extract_report(client, UPLOADED_FILE, use_context_cache=True)
+    assert_one_cache_shared_then_deleted(client, result)
+
+def test_report_sections_share_one_context_cache_async():
+    client = FakeGenaiClient()
+    result, _ = asyncio.run(extract_report_async(client, UPLOADED_FILE, use_context_cache=True))
+    assert_one_cache_shared_then_deleted(client, result)
+
+def test_context_cache_is_deleted_when_extraction_fails():
+    client = FakeGenaiClient()
+
+    def reject(model, contents, config):
+        raise errors.ClientError(400, {"error": {"code": 400, "message": "Bad request", "status": "INVALID_ARGUMENT"}})
+
+    client.models.generate_content = reject
+    result, _ = extract_report(client, UPLOADED_FILE, use_context_cache=True, max_concurrency=1)
+    assert result is None
+    assert [event[0] for event in client.events] == ["create", "delete"]
+
+def test_single_request_does_not_create_a_cache():
+    client = FakeGenaiClient()
+    result, _ = extract_report(client, UPLOADED_FILE, schemas=RESPONSE_SCHEMA[:1], use_context_cache=True)
+
+    assert result == {schema_name_of(RESPONSE_SCHEMA[0]): "extracted"}
+    assert client.requests == [([UPLOADED_FILE, EXTRACTOR_TOOL_PROMPT], None)]
+    assert not [event for event in client.events if event[0] != "generate"]
@@ -0,0 +1,34 @@
+import asyncio
+import hashlib
+
+from src.backend.services.download_service import download_pdf, download_pdf_async
+
+REPORT = b"%PDF-1.4\n" + b"0" * 100_000
+
+def test_downloads_reuse_one_connection(report_server):
+    report_server.body = REPORT
+    for index in range(5):
+        file, sha256 = download_pdf(report_server.url(f"/report-{index}.pdf"))
+        with file:
+            assert file.read() == REPORT and sha256 == hashlib.sha256(REPORT).hexdigest()
+
+    # Revalidations travel over the same kept-alive connection.
+    file, _ = download_pdf(report_server.url("/report-0.pdf"), conditional=True)
+    assert file is None
+
+    assert report_server.statuses == [200] * 5 + [304]
+    assert report_server.connections == 1
+
+def test_async_downloads_reuse_one_connection(report_server):
+    report_server.body = REPORT
+
+    async def download_all():
+        for index in range(5):
+            file, _ = await download_pdf_async(report_server.url(f"/async-report-{index}.pdf"))
+            file.close()
+        file, _ = await download_pdf_async(report_server.url("/async-report-0.pdf"), conditional=True)
+        assert file is None
+
+    asyncio.run(download_all())
+    assert report_server.statuses == [200] * 5 + [304]
+    assert report_server.connections == 1
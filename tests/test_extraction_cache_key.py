@@ -0,0 +1,25 @@
+import pytest
+
+from src.backend.config.config import config
+from src.backend.services import extraction_service
+from src.backend.services.extraction_service import extraction_cache_key
+
+FILE_HASH = "f" * 64
+
+@pytest.fixture
+def optional_paths(monkeypatch):
+    monkeypatch.setattr(config, "GEMINI_CONTEXT_CACHE_ENABLED", True)
+    monkeypatch.setattr(config, "SCHEMA_PACK_MAX_OUTPUT_TOKENS", 8192)
+
+def test_key_changes_with_the_context_cache_request_prompt(optional_paths, monkeypatch):
+    key = extraction_cache_key(FILE_HASH)
+    monkeypatch.setattr(extraction_service, "EXTRACTOR_CACHED_REQUEST_PROMPT", "Another request prompt.")
+    assert extraction_cache_key(FILE_HASH) != key
+
+def test_key_changes_with_the_schema_packing_budget(optional_paths, monkeypatch):
+    key = extraction_cache_key(FILE_HASH)
+    monkeypatch.setattr(config, "SCHEMA_PACK_MAX_OUTPUT_TOKENS", 4096)
+    packed_smaller = extraction_cache_key(FILE_HASH)
+    monkeypatch.setattr(config, "SCHEMA_PACK_MAX_OUTPUT_TOKENS", 0)
+
+    assert len({key, packed_smaller, extraction_cache_key(FILE_HASH)}) == 3
@@ -0,0 +1,89 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from google.genai import errors, types
+
+from src.backend.services import gemini_service
+from src.backend.services.gemini_service import GeminiFileRegistry
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class FakeFiles:
+    """Stands in for `client.files`: a paginated listing that can be held mid-way."""
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.lists = 0
+        self.gets = []
+        self.hold = None
+        self.listing = threading.Event()
+
+    def list(self):
+        self.lists += 1
+        names = list(self.names)
+        for index, name in enumerate(names):
+            if index == 1 and self.hold:
+                self.listing.set()
+                assert self.hold.wait(5)
+            yield types.File(name=name)
+
+    def get(self, name):
+        self.gets.append(name)
+        if name not in self.names:
+            raise errors.ClientError(403, {"error": {"code": 403, "message": "Forbidden", "status": "PERMISSION_DENIED"}})
+        return types.File(name=name)
+
+@pytest.fixture
+def files(monkeypatch):
+    files = FakeFiles(["files/a", "files/b", "files/c"])
+    monkeypatch.setattr(gemini_service, "get_gemini_client", lambda: SimpleNamespace(files=files))
+    return files
+
+def test_lists_once_and_falls_back_to_get_on_a_miss(files):
+    registry = GeminiFileRegistry(ttl_seconds=0)
+    assert registry.get("files/a").name == "files/a"
+    assert sorted(registry.names()) == ["files/a", "files/b", "files/c"]
+
+    files.names.append("files/d")  # uploaded by another process
+    assert registry.get("files/d").name == "files/d"
+    assert registry.get("files/missing") is None
+    assert files.lists == 1 and files.gets == ["files/d", "files/missing"]
+
+def test_stale_index_is_relisted_after_its_ttl(files):
+    clock = FakeClock()
+    registry = GeminiFileRegistry(ttl_seconds=600, clock=clock)
+    registry.names()
+
+    files.names = ["files/b", "files/e"]  # files/a expired, files/e uploaded elsewhere
+    clock.now = 599
+    assert "files/a" in registry.names()
+    clock.now = 600
+    assert sorted(registry.names()) == ["files/b", "files/e"]
+    assert files.lists == 2
+
+def test_lookups_and_uploads_are_not_blocked_by_a_relisting(files):
+    clock = FakeClock()
+    registry = GeminiFileRegistry(ttl_seconds=600, clock=clock)
+    registry.names()
+    clock.now = 600
+
+    files.hold = threading.Event()
+    relisting = threading.Thread(target=registry.names)
+    relisting.start()
+    assert files.listing.wait(5)
+
+    # The listing is paused half-way; the current index still answers, and changes go through.
+    assert registry.get("files/a").name == "files/a"
+    registry.add(types.File(name="files/uploaded"))
+    registry.remove("files/c")
+    files.hold.set()
+    relisting.join(5)
+
+    assert sorted(registry.names()) == ["files/a", "files/b", "files/uploaded"]
+    assert files.lists == 2
@@ -0,0 +1,25 @@
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# SDKs only needed once a client or agent is first used.
+LAZY_SDKS = ["openai", "tavily", "langchain_openai", "langchain_google_genai"]
+
+def test_importing_the_tools_does_not_import_client_sdks(tmp_path):
+    script = (
+        "import json, sys\n"
+        "import src.backend.tools.tool\n"
+        f"print(json.dumps([name for name in {LAZY_SDKS!r} if name in sys.modules]))\n"
+    )
+    # No API keys: importing must not construct (or validate the settings of) any client.
+    env = {key: value for key, value in os.environ.items() if not key.endswith("_API_KEY")}
+    env["PYTHONPATH"] = REPO_ROOT
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert json.loads(completed.stdout.strip().splitlines()[-1]) == []
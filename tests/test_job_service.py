@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+
+from src.backend.services.job_service import FAILED, QUEUED, RUNNING, SUCCEEDED, ExtractionJobQueue
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def queue(clock):
+    collection = mongomock.MongoClient().db.extraction_jobs
+    return ExtractionJobQueue(collection, lease_seconds=60, max_attempts=3, retry_delay_seconds=10, clock=clock)
+
+def test_claim_complete(queue):
+    job = queue.enqueue("https://example.com/report.pdf")
+    assert queue.enqueue("https://example.com/report.pdf")["_id"] == job["_id"]
+
+    claimed = queue.claim("worker-1")
+    assert claimed["_id"] == job["_id"] and claimed["status"] == RUNNING and claimed["attempts"] == 1
+    assert queue.claim("worker-2") is None
+
+    assert queue.complete(job["_id"], "worker-1", {"status": "inserted"})
+    assert queue.get(job["_id"])["status"] == SUCCEEDED
+
+def test_reported_failures_retry_until_max_attempts(queue, clock):
+    job = queue.enqueue("report.pdf")
+    for attempt in range(1, 4):
+        assert queue.claim("worker-1")["attempts"] == attempt
+        assert queue.fail(job["_id"], "worker-1", "boom") == (FAILED if attempt == 3 else QUEUED)
+        assert queue.claim("worker-1") is None  # not due before the retry delay
+        clock.advance(10)
+    assert queue.get(job["_id"])["status"] == FAILED
+
+def test_expired_lease_is_reclaimed_by_another_worker(queue, clock):
+    job = queue.enqueue("report.pdf")
+    queue.claim("worker-1")
+    clock.advance(61)
+
+    reclaimed = queue.claim("worker-2")
+    assert reclaimed["_id"] == job["_id"] and reclaimed["attempts"] == 2
+    assert not queue.heartbeat(job["_id"], "worker-1")
+    assert queue.heartbeat(job["_id"], "worker-2")
+
+def test_job_crashing_every_worker_fails_after_max_attempts(queue, clock):
+    job = queue.enqueue("crashes-the-worker.pdf")
+    for attempt in range(1, 4):
+        assert queue.claim(f"worker-{attempt}")["attempts"] == attempt
+        clock.advance(61)  # the worker dies without reporting back
+
+    assert queue.claim("worker-4") is None
+    failed = queue.get(job["_id"])
+    assert failed["status"] == FAILED and failed["attempts"] == 3
+    assert "Lease expired" in failed["error"]
+
+def test_failure_without_retry_fails_on_first_attempt(queue):
+    job = queue.enqueue("not-a-pdf.html")
+    queue.claim("worker-1")
+
+    assert queue.fail(job["_id"], "worker-1", "Report rejected by preflight", retry=False) == FAILED
+    assert queue.get(job["_id"])["attempts"] == 1
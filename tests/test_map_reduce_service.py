@@ -0,0 +1,41 @@
+import io
+
+from pypdf import PdfReader
+
+from src.backend.benchmarks.page_routing_benchmark import build_pdf
+from src.backend.services import map_reduce_service, page_routing_service
+from src.backend.services.map_reduce_service import ReportWindows, page_subset_key, upload_window
+
+def test_windows_are_written_from_one_spooled_parse(monkeypatch):
+    parses = []
+    monkeypatch.setattr(
+        page_routing_service, "PdfReader", lambda *args, **kwargs: parses.append(1) or PdfReader(*args, **kwargs)
+    )
+    uploads = []
+
+    def fake_upload(file, file_name, sha256):
+        uploads.append((file, file_name, sha256, len(PdfReader(file).pages)))
+        return file_name
+
+    monkeypatch.setattr(map_reduce_service, "upload_file", fake_upload)
+
+    source = io.BytesIO(build_pdf([[f"Page {page}"] for page in range(12)]))
+    report_windows = ReportWindows(source, "f" * 64, "report.pdf", window_pages=5, overlap=1)
+    source.close()  # the windows outlive the caller's stream
+
+    assert [upload_window(report_windows, window) for window in report_windows.windows] == [
+        "report-pages-1-5.pdf", "report-pages-5-9.pdf", "report-pages-9-12.pdf"
+    ]
+    assert [page_count for *_, page_count in uploads] == [5, 5, 4]
+    assert all(file.closed for file, *_ in uploads)
+    assert uploads[1][2] == page_subset_key("f" * 64, [4, 5, 6, 7, 8])
+    assert len(parses) == 1
+    report_windows.close()
+
+def test_single_window_uploads_the_whole_report(monkeypatch):
+    pdf_bytes = build_pdf([["Scope 1 emissions"]] * 3)
+    monkeypatch.setattr(map_reduce_service, "upload_file", lambda file, file_name, sha256: (file.read(), file_name, sha256))
+
+    report_windows = ReportWindows(io.BytesIO(pdf_bytes), "f" * 64, "report.pdf", window_pages=5)
+    assert upload_window(report_windows, report_windows.windows[0]) == (pdf_bytes, "report.pdf", "f" * 64)
+    report_windows.close()
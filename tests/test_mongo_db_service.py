@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+
+from mongomock.collection import BulkOperationBuilder
+
+from src.backend.services.mongo_db_service import ESGReportBulkWriter
+
+@pytest.fixture
+def collection(monkeypatch):
+    # mongomock 4.3 predates the `sort` argument that pymongo 4.11+ passes to bulk update builders.
+    add_update = BulkOperationBuilder.add_update
+    monkeypatch.setattr(
+        BulkOperationBuilder, "add_update", lambda self, *args, sort=None, **kwargs: add_update(self, *args, **kwargs)
+    )
+    return mongomock.MongoClient().db.esg_reports
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def report(company_id: str, year: int = 2024, **esg_report):
+    return {"_id": company_id, "year": year, "esg_report": esg_report or {"scope_1": 100}}
+
+def test_flushes_every_max_operations(collection):
+    writer = ESGReportBulkWriter(collection, max_operations=2, max_delay_seconds=60)
+
+    assert writer.add(report("acme"), context=0) == []
+    results = writer.add(report("globex"), context=1)
+    assert [(result["status"], result["context"]) for result in results] == [("inserted", 0), ("inserted", 1)]
+    assert collection.count_documents({}) == 2
+
+    writer.add(report("acme", scope_1=200))
+    writer.add(report("globex"))
+    assert [result["status"] for result in writer.results[2:]] == ["matched", "matched"]
+    assert collection.find_one({"_id": "acme"})["esg_reports"]["2024"] == {"scope_1": 200}
+
+def test_invalid_report_is_not_buffered(collection):
+    writer = ESGReportBulkWriter(collection, max_operations=10)
+    [result] = writer.add({"_id": "acme"}, context="row-1")
+    assert result["status"] == "error" and result["context"] == "row-1"
+    assert writer.flush() == []
+
+def test_partial_batch_is_flushed_once_due_without_further_adds(collection):
+    clock = FakeClock()
+    writer = ESGReportBulkWriter(collection, max_operations=100, max_delay_seconds=5, clock=clock)
+
+    writer.add(report("acme"))
+    clock.now = 4.9
+    assert writer.flush_if_due() == []
+    clock.now = 5
+    assert [result["status"] for result in writer.flush_if_due()] == ["inserted"]
+    assert collection.count_documents({}) == 1
+    assert writer.flush_if_due() == []
+
+def test_reports_are_buffered_while_a_batch_is_written(collection):
+    writing, release = threading.Event(), threading.Event()
+
+    class SlowCollection:
+        def bulk_write(self, operations, ordered):
+            writing.set()
+            assert release.wait(5)
+            return collection.bulk_write(operations, ordered=ordered)
+
+    writer = ESGReportBulkWriter(SlowCollection(), max_operations=1)
+    flushing = threading.Thread(target=writer.add, args=(report("acme"),))
+    flushing.start()
+    assert writing.wait(5)
+
+    # The first batch is still being written, yet the buffer accepts the next report.
+    writer.max_operations = 100
+    assert writer.add(report("globex")) == []
+    release.set()
+    flushing.join(5)
+
+    assert [result["company_id"] for result in writer.flush()] == ["globex"]
+    assert [result["company_id"] for result in writer.results] == ["acme", "globex"]
@@ -0,0 +1,54 @@
+import io
+
+from pypdf import PdfReader
+
+from src.backend.config.config import config
+from src.backend.benchmarks.page_routing_benchmark import build_pdf
+from src.backend.services import page_routing_service
+from src.backend.services.page_routing_service import ReportPages, upload_report_pages
+from src.backend.services.extraction_service import EnvironmentalEmissionsEnergy, MaterialityAssessment
+
+def synthetic_pages(page_count: int):
+    pages = [[f"Page {page} about our strategy, customers and growth."] for page in range(page_count)]
+    pages[7] = ["Scope 1 GHG emissions were 412,880 tCO2e; energy consumption was 2,140,000 GJ."]
+    pages[21] = ["Our materiality assessment identified 18 material topics with stakeholders."]
+    return build_pdf(pages)
+
+def test_report_is_parsed_once_and_spooled(monkeypatch):
+    monkeypatch.setattr(config, "DOWNLOAD_SPOOL_MAX_MEMORY_BYTES", 1024)
+    parses = []
+    monkeypatch.setattr(
+        page_routing_service, "PdfReader", lambda *args, **kwargs: parses.append(1) or PdfReader(*args, **kwargs)
+    )
+
+    source = io.BytesIO(synthetic_pages(40))
+    report_pages = ReportPages(source, "f" * 64, "report.pdf")
+    source.close()  # the routed report outlives the caller's stream
+
+    assert report_pages.pdf.file._rolled  # over the memory limit, the copy lives on disk
+    for schema in (EnvironmentalEmissionsEnergy, MaterialityAssessment):
+        pages = report_pages.select_pages([schema], top_k=2)
+        with report_pages.subset_pdf(pages) as subset:
+            assert len(PdfReader(subset).pages) == len(pages)
+
+    assert len(parses) == 1
+    report_pages.close()
+
+def test_uploads_routed_pages_and_closes_them(monkeypatch):
+    uploads = []
+
+    def fake_upload(file, file_name, sha256):
+        uploads.append((file, file_name, sha256, len(PdfReader(file).pages)))
+        return file_name
+
+    monkeypatch.setattr(page_routing_service, "upload_file", fake_upload)
+    report_pages = ReportPages(io.BytesIO(synthetic_pages(40)), "f" * 64, "report.pdf")
+
+    pages = report_pages.select_pages([EnvironmentalEmissionsEnergy])
+    assert 7 in pages and len(pages) < report_pages.page_count
+
+    assert upload_report_pages(report_pages, [EnvironmentalEmissionsEnergy]) == f"report-pages-{len(pages)}.pdf"
+    file, _, sha256, page_count = uploads[0]
+    assert page_count == len(pages) and file.closed
+    assert sha256 == report_pages.subset_key(pages)
+    report_pages.close()
@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.backend.services import peer_service
+from src.backend.services.peer_service import find_peer_companies, get_cached_peers
+from src.backend.schemas.scraper_schema import CompanyMetadata, PeerCompany, PeersMetadata
+
+SEGMENT = dict(
+    sector="Materials", industry_group="Materials", industry="Metals & Mining", sub_industries="Steel",
+    headquarters="Luxembourg, Luxembourg", country="Luxembourg", region="Europe"
+)
+
+class DictCache:
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def set(self, key, value):
+        self.entries[key] = value
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = DictCache()
+    monkeypatch.setattr(peer_service, "get_peer_cache", lambda: cache)
+    return cache
+
+def company(name: str) -> CompanyMetadata:
+    return CompanyMetadata(company_name=name, core="Steel products", **SEGMENT)
+
+def peer(name: str) -> PeerCompany:
+    return PeerCompany(company_official_website=f"https://{name.lower()}.example", **company(name).model_dump())
+
+def test_peer_companies_carry_the_company_metadata_fields():
+    assert set(CompanyMetadata.model_fields) < set(PeerCompany.model_fields)
+    assert isinstance(peer("Acme"), CompanyMetadata)
+
+def test_cached_peer_set_is_shared_by_the_segment_without_the_company(cache, monkeypatch):
+    searched = PeersMetadata(
+        country_peers=[peer("Acme"), peer("Steelco"), peer("Ironworks")], region_peers=[peer("Eurosteel")]
+    )
+    response = SimpleNamespace(output_parsed=searched, usage=None)
+    client = SimpleNamespace(responses=SimpleNamespace(parse=lambda **kwargs: response))
+    monkeypatch.setattr(peer_service, "get_openai_client", lambda: client)
+
+    found = find_peer_companies(company("Acme"), num_country_peers=2, num_region_peers=1)
+    assert [p.company_name for p in found.country_peers] == ["Steelco", "Ironworks"]
+
+    # The segment's set is cached whole, so Acme is a peer of the next company of its segment.
+    cached = get_cached_peers(company("Steelco"), num_country_peers=2, num_region_peers=1)
+    assert [p.company_name for p in cached.country_peers] == ["Acme", "Ironworks"]
+    assert [p.company_name for p in cached.region_peers] == ["Eurosteel"]
+
+def test_cached_peer_set_that_no_longer_validates_is_ignored(cache):
+    stale = {"company_name": "Acme", "company_official_website": "unknown", **SEGMENT}  # written before `core`
+    cache.set(peer_service.peer_set_key(company("Steelco")), {"country_peers": [stale], "region_peers": []})
+
+    assert get_cached_peers(company("Steelco"), num_country_peers=1, num_region_peers=0) is None
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+import pypdf._encryption
+from pypdf._crypt_providers import _fallback
+
+from src.backend.benchmarks.page_routing_benchmark import build_pdf
+from src.backend.services.preflight_service import EXTRACT, inspect_pdf
+
+def aes_encrypted_pdf(page_count: int) -> io.BytesIO:
+    """Returns a report encrypted with AES-256 that opens with an empty user password."""
+    pytest.importorskip("cryptography")
+    writer = PdfWriter(clone_from=PdfReader(io.BytesIO(build_pdf([["Scope 1 emissions."]] * page_count))))
+    writer.encrypt(user_password="", owner_password="owner", algorithm="AES-256")
+    stream = io.BytesIO()
+    writer.write(stream)
+    return stream
+
+def without_aes_provider(monkeypatch):
+    """Decrypts as pypdf does when neither cryptography nor pycryptodome is installed."""
+    for name in ("CryptAES", "aes_cbc_decrypt", "aes_cbc_encrypt", "aes_ecb_decrypt", "aes_ecb_encrypt"):
+        monkeypatch.setattr(pypdf._encryption, name, getattr(_fallback, name))
+
+def test_aes_encrypted_report_with_empty_password_is_inspected():
+    report = inspect_pdf(aes_encrypted_pdf(3))
+    assert report.decision == EXTRACT and report.encrypted and report.page_count == 3
+
+def test_aes_encrypted_report_without_aes_provider_has_undetermined_page_count(monkeypatch):
+    stream = aes_encrypted_pdf(3)
+    without_aes_provider(monkeypatch)
+    report = inspect_pdf(stream)
+
+    assert report.decision == EXTRACT and report.encrypted
+    assert report.page_count is None and report.text_ratio is None
+    assert stream.tell() == 0
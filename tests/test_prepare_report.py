@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from src.backend.config.config import config
+from src.backend.benchmarks.page_routing_benchmark import build_pdf
+from src.backend.services import extraction_service
+from src.backend.services.extraction_service import prepare_report, prepare_report_async
+from src.backend.services.preflight_service import PreflightError
+
+# A PDF signature followed by no parseable document: downloads fine, fails the preflight.
+UNPARSEABLE_PDF = b"%PDF-1.4\n" + b"x" * 2048
+
+def fail_upload(*args, **kwargs):
+    raise AssertionError("the report must not be uploaded")
+
+@pytest.fixture
+def no_extraction_cache(monkeypatch):
+    monkeypatch.setattr(extraction_service, "get_extraction_cache", lambda: None)
+    monkeypatch.setattr(extraction_service, "upload_file", fail_upload)
+    monkeypatch.setattr(extraction_service, "upload_file_async", fail_upload)
+
+def test_unchanged_url_without_cached_result_is_preflighted_again(report_server, no_extraction_cache):
+    report_server.body = UNPARSEABLE_PDF
+    url = report_server.url("/rejected.pdf")
+
+    for _ in range(2):
+        with pytest.raises(PreflightError):
+            prepare_report(url)
+
+    # The second call revalidates (304), then downloads the body again for the preflight.
+    assert report_server.statuses == [200, 304, 200]
+
+def test_unchanged_url_without_cached_result_is_preflighted_again_async(report_server, no_extraction_cache):
+    report_server.body = UNPARSEABLE_PDF
+    url = report_server.url("/rejected-async.pdf")
+
+    for _ in range(2):
+        with pytest.raises(PreflightError):
+            asyncio.run(prepare_report_async(url))
+
+    assert report_server.statuses == [200, 304, 200]
+
+def test_unchanged_long_report_without_cached_result_is_split_again(report_server, no_extraction_cache, monkeypatch):
+    monkeypatch.setattr(config, "MAP_REDUCE_MIN_PAGES", 10)
+    monkeypatch.setattr(config, "MAP_REDUCE_WINDOW_PAGES", 5)
+    monkeypatch.setattr(config, "MAP_REDUCE_WINDOW_OVERLAP", 1)
+    report_server.body = build_pdf([["Scope 1 emissions were 412,880 tCO2e."]] * 12)
+    url = report_server.url("/long.pdf")
+
+    for _ in range(2):
+        prepared = prepare_report(url)
+        assert prepared.uploaded_file is None
+        assert prepared.report_windows.page_count == 12
+        assert len(prepared.report_windows.windows) == 3
+
+    assert report_server.statuses == [200, 304, 200]
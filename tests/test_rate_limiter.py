@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from src.backend.utils.rate_limiter import RateLimiter, TokenBucket
+
+class FakeClock:
+    """A monotonic clock that only moves when slept on."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def limiter(clock, requests_per_minute=None, tokens_per_minute=None):
+    return RateLimiter("test", requests_per_minute, tokens_per_minute, clock=clock, sleep=clock.sleep)
+
+def test_bucket_refills_continuously_up_to_capacity(clock):
+    bucket = TokenBucket(capacity=60, refill_per_second=1, clock=clock)
+    assert bucket.reserve(60) == 0
+    assert bucket.reserve(30) == 30  # a deficit of 30 tokens takes 30s to refill
+
+    clock.now += 30
+    assert bucket.tokens == 0
+    clock.now += 1000
+    assert bucket.tokens == 60
+
+def test_requests_wait_in_reservation_order(clock):
+    rate_limiter = limiter(clock, requests_per_minute=2)
+    assert [rate_limiter.reserve() for _ in range(4)] == [0, 0, 30, 60]
+    assert rate_limiter.acquire() == 90
+    assert clock.sleeps == [90]
+
+def test_record_usage_corrects_the_estimate(clock):
+    rate_limiter = limiter(clock, tokens_per_minute=600)
+    with rate_limiter.limit(tokens=100) as reservation:
+        reservation.record_usage(400)
+    assert rate_limiter._tokens.tokens == 200
+
+    with rate_limiter.limit(tokens=100) as reservation:
+        reservation.record_usage(40)
+    assert rate_limiter._tokens.tokens == 160
+
+def test_failed_call_refunds_its_tokens_but_not_its_request(clock):
+    rate_limiter = limiter(clock, requests_per_minute=60, tokens_per_minute=600)
+    with pytest.raises(RuntimeError):
+        with rate_limiter.limit(tokens=500):
+            raise RuntimeError("429 Too Many Requests")
+
+    assert rate_limiter._tokens.tokens == 600
+    assert rate_limiter._requests.tokens == 59
+    assert rate_limiter.acquire(tokens=500) == 0
+
+def test_failure_after_recorded_usage_is_not_refunded(clock):
+    rate_limiter = limiter(clock, tokens_per_minute=600)
+    with pytest.raises(ValueError):
+        with rate_limiter.limit(tokens=100) as reservation:
+            reservation.record_usage(300)
+            raise ValueError("unparseable response")
+    assert rate_limiter._tokens.tokens == 300
+
+def test_interrupted_wait_refunds_the_whole_reservation(clock):
+    def interrupted(seconds):
+        raise KeyboardInterrupt
+
+    rate_limiter = RateLimiter("test", 60, 600, clock=clock, sleep=interrupted)
+    rate_limiter.acquire(tokens=600)
+    with pytest.raises(KeyboardInterrupt):
+        rate_limiter.acquire(tokens=300)
+
+    assert rate_limiter._tokens.tokens == 0
+    assert rate_limiter._requests.tokens == 59
+
+def test_async_failed_call_refunds_its_tokens(clock):
+    rate_limiter = limiter(clock, tokens_per_minute=600)
+
+    async def failing_call():
+        async with rate_limiter.limit_async(tokens=500):
+            raise RuntimeError("400 Bad Request")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(failing_call())
+    assert rate_limiter._tokens.tokens == 600
+
+def test_cancelled_async_wait_refunds_the_whole_reservation(clock):
+    rate_limiter = limiter(clock, requests_per_minute=60, tokens_per_minute=600)
+    rate_limiter.acquire(tokens=600)
+
+    async def cancelled_wait():
+        task = asyncio.create_task(rate_limiter.acquire_async(tokens=300))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancelled_wait())
+    assert rate_limiter._tokens.tokens == 0
+    assert rate_limiter._requests.tokens == 59
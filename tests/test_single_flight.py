@@ -0,0 +1,97 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.backend.utils.single_flight import AsyncSingleFlight, SingleFlight
+
+def test_concurrent_calls_share_one_result():
+    flights = SingleFlight()
+    calls, started, release = [], threading.Event(), threading.Event()
+
+    def slow_call():
+        calls.append(1)
+        started.set()
+        assert release.wait(5)
+        return {"answer": 42}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flights.do("key", slow_call)))
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(flights.do("key", slow_call)))
+    follower.start()
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert calls == [1] and results == [{"answer": 42}] * 2
+    assert flights.do("key", lambda: "fresh") == "fresh"
+
+class SlowCall:
+    def __init__(self):
+        self.started = 0
+        self.cancelled = False
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.started += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return "result"
+
+def test_cancelling_the_leader_does_not_cancel_followers():
+    async def scenario():
+        flights, call = AsyncSingleFlight(), SlowCall()
+        leader = asyncio.create_task(flights.do("key", call))
+        follower = asyncio.create_task(flights.do("key", call))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        call.release.set()
+
+        assert await follower == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert call.started == 1 and not call.cancelled
+
+    asyncio.run(scenario())
+
+def test_call_is_cancelled_once_every_caller_is():
+    async def scenario():
+        flights, call = AsyncSingleFlight(), SlowCall()
+        callers = [asyncio.create_task(flights.do("key", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert call.cancelled
+        # A later call starts a new flight instead of joining the cancelled one.
+        call.release.set()
+        assert await flights.do("key", call) == "result"
+        assert call.started == 2
+
+    asyncio.run(scenario())
+
+def test_exceptions_are_shared():
+    async def scenario():
+        flights = AsyncSingleFlight()
+
+        async def failing_call():
+            await asyncio.sleep(0)
+            raise ConnectionError("unreachable")
+
+        results = await asyncio.gather(
+            flights.do("key", failing_call), flights.do("key", failing_call), return_exceptions=True
+        )
+        assert [type(result) for result in results] == [ConnectionError, ConnectionError]
+        assert results[0] is results[1]
+
+    asyncio.run(scenario())
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from src.backend.services import tavily_service
+from src.backend.services.cache_service import InMemoryLRUCache
+from src.backend.services.tavily_service import fetch_info_from_tavily, fetch_info_from_tavily_async
+
+class FakeTavilyClient:
+    """Stands in for TavilyClient / AsyncTavilyClient, counting searches."""
+
+    def __init__(self):
+        self.queries = []
+
+    def response(self, query):
+        self.queries.append(query)
+        return {"answer": "Acme makes anvils.", "results": [{"url": "https://acme.example/esg.pdf", "content": "Anvils"}]}
+
+    def search(self, query, search_depth):
+        return self.response(query)
+
+class FakeAsyncTavilyClient(FakeTavilyClient):
+    async def search(self, query, search_depth):
+        await asyncio.sleep(0)
+        return self.response(query)
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = InMemoryLRUCache()
+    monkeypatch.setattr(tavily_service, "get_search_cache", lambda: cache)
+    return cache
+
+def test_cached_results_are_private_copies_answering_each_query(monkeypatch, cache):
+    client = FakeTavilyClient()
+    monkeypatch.setattr(tavily_service, "get_tavily_client", lambda: client)
+
+    first = fetch_info_from_tavily("What does Acme do?")
+    first["results"].clear()
+    first["answer"] = "mutated"
+
+    second = fetch_info_from_tavily("what does  ACME do")
+    assert client.queries == ["What does Acme do?"]
+    assert second["query"] == "what does  ACME do"
+    assert second["answer"] == "Acme makes anvils." and len(second["results"]) == 1
+
+    second["results"][0]["url"] = "mutated"
+    assert fetch_info_from_tavily("What does Acme do?")["results"][0]["url"] == "https://acme.example/esg.pdf"
+
+def test_coalesced_async_callers_get_their_own_results(monkeypatch, cache):
+    client = FakeAsyncTavilyClient()
+    monkeypatch.setattr(tavily_service, "get_async_tavily_client", lambda: client)
+
+    async def search_concurrently():
+        return await asyncio.gather(
+            fetch_info_from_tavily_async("Acme sustainability report"),
+            fetch_info_from_tavily_async("acme sustainability report?")
+        )
+
+    first, second = asyncio.run(search_concurrently())
+    assert client.queries == ["Acme sustainability report"]
+    assert (first["query"], second["query"]) == ("Acme sustainability report", "acme sustainability report?")
+    assert first["results"] == second["results"] and first["results"] is not second["results"]
+    assert first["results"][0] is not second["results"][0]
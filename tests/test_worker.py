@@ -0,0 +1,29 @@
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+
+from src.backend import worker as worker_module
+from src.backend.services.job_service import FAILED, QUEUED, ExtractionJobQueue
+from src.backend.services.preflight_service import REJECT, PreflightError, PreflightReport
+from src.backend.worker import ExtractionWorker
+
+def reject_report(source):
+    raise PreflightError(PreflightReport(REJECT, "content is an HTML page, not a PDF", 512))
+
+def fail_download(source):
+    raise ConnectionError("connection reset")
+
+@pytest.fixture
+def queue():
+    collection = mongomock.MongoClient().db.extraction_jobs
+    return ExtractionJobQueue(collection, lease_seconds=60, max_attempts=3, retry_delay_seconds=0)
+
+@pytest.mark.parametrize("prepare, status", [(reject_report, FAILED), (fail_download, QUEUED)])
+def test_only_preflight_rejections_fail_on_first_attempt(queue, monkeypatch, prepare, status):
+    monkeypatch.setattr(worker_module, "prepare_report", prepare)
+    job = queue.enqueue("https://example.com/report")
+
+    outcome = ExtractionWorker(queue, heartbeat_seconds=60, worker_id="worker-1").process(queue.claim("worker-1"))
+
+    assert outcome["status"] == status
+    assert queue.get(job["_id"])["status"] == status and queue.get(job["_id"])["attempts"] == 1